@@ -3,18 +3,221 @@
 #
 # See LICENSE file for full license.
 
+import importlib
 import inspect
 import json
 import re
 import types
-from typing import Any, NoReturn, Optional, TypeVar, Union
+from json.encoder import encode_basestring_ascii
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 __version__ = "1.0.4"
 
 valid_names = re.compile(r"^[a-zA-Z0-9]+$")
 
 
+def __getattr__(name: str) -> types.ModuleType:
+    # Import service modules (awacs.s3, awacs.ec2, ...) on first access so
+    # only the services actually used are loaded.
+    if not name.startswith("_"):
+        try:
+            return importlib.import_module("%s.%s" % (__name__, name))
+        except ModuleNotFoundError as exc:
+            if exc.name != "%s.%s" % (__name__, name):
+                raise
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+class ValidationError(ValueError):
+    """All the problems found by AWSObject.validate_all()."""
+
+    def __init__(self, errors: List[str]) -> None:
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+# Checks (and possibly converts) a value assigned to a property, see
+# AWSObject.__setattr__.
+Validator = Callable[["AWSObject", str, Any], Any]
+
+# Whether values of a type are AWS helper functions, see is_helper_type()
+_helper_types: Dict[type, bool] = {}
+
+
+def is_helper_type(value_type: type) -> bool:
+    """Check for AWSHelperFn, including the ones from other libraries.
+
+    AWS helper functions from other libraries like cloudtools/troposphere
+    are recognized by the name of one of their base classes.
+    """
+    try:
+        return _helper_types[value_type]
+    except KeyError:
+        result = _helper_types[value_type] = "AWSHelperFn" in [
+            c.__name__ for c in inspect.getmro(value_type)
+        ]
+        return result
+
+
+def _compile_validator(expected_type: Any) -> Validator:
+    # If it's a function, call it...
+    if isinstance(expected_type, types.FunctionType):
+
+        def validate_function(obj: "AWSObject", name: str, value: Any) -> Any:
+            return expected_type(value)
+
+        return validate_function
+
+    # If it's a list of types, check against those types...
+    elif isinstance(expected_type, list):
+        item_types = tuple(expected_type)
+
+        def validate_list(obj: "AWSObject", name: str, value: Any) -> Any:
+            # If we're expecting a list, then make sure it is a list
+            if not isinstance(value, list):
+                obj._raise_type(name, value, expected_type)
+
+            # Iterate over the list and make sure it matches our
+            # type checks
+            for v in value:
+                if not isinstance(v, item_types):
+                    obj._raise_type(name, v, expected_type)
+            return value
+
+        return validate_list
+
+    # Single type so check the type of the object and compare against
+    # what we were expecting. Special case AWS helper functions and its
+    # sub classes.
+    else:
+
+        def validate_type(obj: "AWSObject", name: str, value: Any) -> Any:
+            if isinstance(value, expected_type) or is_helper_type(type(value)):
+                return value
+            obj._raise_type(name, value, expected_type)
+
+        return validate_type
+
+
+def _compile_validators(props: dict) -> Dict[str, Validator]:
+    return {name: _compile_validator(prop[0]) for name, prop in props.items()}
+
+
+# Converts the properties of an AWSObject to plain data, see
+# AWSObject.to_dict().
+Serializer = Callable[[dict], dict]
+
+
+def _compile_converter(expected_type: Any) -> Callable[[Any], Any]:
+    if isinstance(expected_type, list) and expected_type:
+        if not all(isinstance(t, type) for t in expected_type):
+            return json_data
+
+        elif all(issubclass(t, AWSHelperFn) for t in expected_type):
+
+            def convert_helpers(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return json_data(value)
+                return [
+                    v._json_data() if isinstance(v, AWSHelperFn) else json_data(v)
+                    for v in value
+                ]
+
+            return convert_helpers
+
+        elif all(issubclass(t, AWSObject) for t in expected_type):
+
+            def convert_objects(value: Any) -> Any:
+                if not isinstance(value, list):
+                    return json_data(value)
+                return [
+                    v._repr_data() if isinstance(v, AWSObject) else json_data(v)
+                    for v in value
+                ]
+
+            return convert_objects
+
+    return json_data
+
+
+def _compile_serializer(props: dict) -> Serializer:
+    converters = {name: _compile_converter(prop[0]) for name, prop in props.items()}
+
+    def serialize(properties: dict) -> dict:
+        return {k: converters.get(k, json_data)(v) for k, v in properties.items()}
+
+    return serialize
+
+
+# Encodes plain data to a JSON string given the indent and sort_keys
+# arguments of to_json().
+JSONBackend = Callable[[Any, Optional[int], bool], str]
+
+
+def json_dumps(data: Any, indent: Optional[int], sort_keys: bool) -> str:
+    return json.dumps(data, cls=awsencode, indent=indent, sort_keys=sort_keys)
+
+
+json_backend: JSONBackend = json_dumps
+
+
+def set_json_backend(backend: Optional[JSONBackend]) -> None:
+    """Set the function used by to_json() to encode plain data to JSON.
+
+    The backend is called with the data, indent and sort_keys, so a faster
+    JSON library can be plugged in, e.g. for orjson:
+
+        def orjson_backend(data, indent, sort_keys):
+            option = orjson.OPT_INDENT_2 if indent else 0
+            if sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return orjson.dumps(data, option=option).decode()
+
+    Passing None restores the default backend using the json module.
+    """
+    global json_backend
+    json_backend = backend or json_dumps
+
+
+AWSObjectT = TypeVar("AWSObjectT", bound="AWSObject")
+
+# Snapshot of the properties of an AWSObject and the versions of the objects
+# it contains, see AWSObject._cached().
+CacheState = Tuple[List[Tuple[str, Any, Any]], List[Tuple[Any, int]]]
+
+
 class AWSObject:
+    # Validators, required property names and serializer for the props of
+    # the class, compiled once per class by __init_subclass__.
+    _validators: Dict[str, Validator] = {}
+    _required: Tuple[str, ...] = ()
+    _serialize: Serializer = staticmethod(_compile_serializer({}))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "props" in cls.__dict__:
+            cls._compile(cls.__dict__["props"])
+
+    @classmethod
+    def _compile(cls, props: dict) -> None:
+        cls._validators = _compile_validators(props)
+        cls._required = tuple(k for k, v in props.items() if v[1])
+        cls._serialize = staticmethod(_compile_serializer(props))
+
     def __init__(
         self,
         name: Optional[str],
@@ -23,10 +226,18 @@ class AWSObject:
         props: dict = None,
         **kwargs: Any
     ) -> None:
+        # Serialized forms of this object, see _cached()
+        self._cache: Dict[Any, Any] = {}
+        self._version = 0
+
         self.name = name
         self.props = props or {}
         # Cache the keys for validity checks
         self.propnames = self.props.keys()
+        if self.props is not getattr(self.__class__, "props", None):
+            self._validators = _compile_validators(self.props)
+            self._required = tuple(k for k, v in self.props.items() if v[1])
+            self._serialize = _compile_serializer(self.props)
 
         # unset/None is also legal
         if name and not valid_names.match(name):
@@ -46,6 +257,19 @@ class AWSObject:
         for k, v in kwargs.items():
             self.__setattr__(k, v)
 
+    @classmethod
+    def construct(cls: Type[AWSObjectT], *args: Any, **kwargs: Any) -> AWSObjectT:
+        """Create an object without checking the properties it is given.
+
+        This is meant for building many objects from trusted data, e.g.
+        policies which were already validated when they were stored. Use
+        validate_all() to check the whole object tree in one pass afterwards.
+        """
+        obj = cls(*args)
+        obj.properties.update(kwargs)
+        obj._reset_cache()
+        return obj
+
     def __getattr__(self, name: str) -> Any:
         try:
             return self.properties.__getitem__(name)
@@ -55,40 +279,11 @@ class AWSObject:
     def __setattr__(self, name: str, value: Any) -> Any:
         if "_AWSObject__initialized" not in self.__dict__:
             return dict.__setattr__(self, name, value)
-        elif name in self.propnames:
-            # Check the type of the object and compare against what we were
-            # expecting.
-            expected_type = self.props[name][0]
-
-            # If it's a function, call it...
-            if isinstance(expected_type, types.FunctionType):
-                value = expected_type(value)
-                return self.properties.__setitem__(name, value)
-
-            # If it's a list of types, check against those types...
-            elif isinstance(expected_type, list):
-                # If we're expecting a list, then make sure it is a list
-                if not isinstance(value, list):
-                    self._raise_type(name, value, expected_type)
-
-                # Iterate over the list and make sure it matches our
-                # type checks
-                for v in value:
-                    if not isinstance(v, tuple(expected_type)):
-                        self._raise_type(name, v, expected_type)
-                # Validated so assign it
-                return self.properties.__setitem__(name, value)
-
-            # Single type so check the type of the object and compare against
-            # what we were expecting. Special case AWS helper functions and its
-            # sub classes. Also handles AWS helper functions from other
-            # libraries like cloudtools/troposphere.
-            elif isinstance(value, expected_type) or "AWSHelperFn" in [
-                c.__name__ for c in inspect.getmro(type(value))
-            ]:
-                return self.properties.__setitem__(name, value)
-            else:
-                self._raise_type(name, value, expected_type)
+        validator = self._validators.get(name)
+        if validator is not None:
+            # Check the type of the object against what we were expecting
+            self.properties[name] = validator(self, name, value)
+            return self._reset_cache()
 
         full_class_name = "%s.%s" % (self.__class__.__module__, self.__class__.__name__)
         raise AttributeError(
@@ -101,6 +296,51 @@ class AWSObject:
     def validate(self) -> None:
         pass
 
+    def validate_all(self) -> None:
+        """Check this object and all the objects it contains.
+
+        Unlike the checks done on assignment this reports every problem
+        found, raising a ValidationError listing all of them.
+        """
+        errors: List[str] = []
+        self._collect_errors(self.__class__.__name__, errors)
+        if errors:
+            raise ValidationError(errors)
+
+    def _collect_errors(self, path: str, errors: List[str]) -> None:
+        for name, value in self.properties.items():
+            prop_path = "%s.%s" % (path, name)
+            validator = self._validators.get(name)
+            if validator is None:
+                errors.append("%s: unsupported attribute" % (prop_path,))
+            elif isinstance(value, list) and isinstance(self.props[name][0], list):
+                # Check the items one by one to report each wrong one
+                for i, v in enumerate(value):
+                    try:
+                        validator(self, name, [v])
+                    except (TypeError, ValueError) as exc:
+                        errors.append("%s[%d]: %s" % (prop_path, i, exc))
+            else:
+                try:
+                    validator(self, name, value)
+                except (TypeError, ValueError) as exc:
+                    errors.append("%s: %s" % (prop_path, exc))
+
+            if isinstance(value, AWSObject):
+                value._collect_errors(prop_path, errors)
+            elif isinstance(value, list):
+                for i, v in enumerate(value):
+                    if isinstance(v, AWSObject):
+                        v._collect_errors("%s[%d]" % (prop_path, i), errors)
+
+        for k, v in self.props.items():
+            if v[1] and k not in self.properties:
+                errors.append("%s: %s is required" % (path, k))
+        try:
+            self.validate()
+        except (TypeError, ValueError) as exc:
+            errors.append("%s: %s" % (path, exc))
+
     def JSONrepr(self) -> dict:
         for k, v in self.props.items():
             if v[1] and k not in self.properties:
@@ -108,13 +348,194 @@ class AWSObject:
         self.validate()
         return self.resource
 
-    def to_json(self, indent: int = 4, sort_keys: bool = True) -> str:
-        p = self.properties
-        return json.dumps(p, cls=awsencode, indent=indent, sort_keys=sort_keys)
+    def to_dict(self) -> dict:
+        """Return the properties as plain dicts, lists and strings.
+
+        This is the data to_json() encodes, converted in a single pass by the
+        serializer compiled for each class. The converted data is cached, the
+        result is a copy of it which can be changed freely.
+        """
+        return _copy_data(self._properties_data())
+
+    def to_json(
+        self,
+        indent: Optional[int] = 4,
+        sort_keys: bool = True,
+        backend: JSONBackend = None,
+    ) -> str:
+        backend = backend or json_backend
+        cache = self._cached()
+        key = ("json", backend, indent, sort_keys)
+        try:
+            return cache[key]
+        except KeyError:
+            p = self._properties_data(cache)
+            result = cache[key] = backend(p, indent, sort_keys)
+            return result
+
+    def serialized_size(self, minified: bool = True) -> int:
+        """Return the length of the JSON encoding without encoding it.
+
+        With minified, this is the length of the compact encoding without any
+        whitespace, which is what IAM counts against its policy size limits.
+        Sizes are cached for each object, so after a change only the changed
+        objects are measured again. Otherwise this is len(self.to_json()).
+        """
+        if not minified:
+            return len(self.to_json())
+        return self._properties_size(self._cached())
+
+    def iter_json(
+        self, indent: Optional[int] = 4, sort_keys: bool = True, chunk_size: int = 65536
+    ) -> Iterator[str]:
+        """Encode to JSON in chunks of about chunk_size characters.
+
+        The output is the same as to_json() with the default backend, without
+        ever building the whole document as one string.
+        """
+        return iter_json(self._properties_data(), indent, sort_keys, chunk_size)
+
+    def dump(
+        self, fp: IO[str], indent: Optional[int] = 4, sort_keys: bool = True
+    ) -> None:
+        """Write the JSON encoding to a file object, see iter_json()."""
+        for chunk in self.iter_json(indent, sort_keys):
+            fp.write(chunk)
+
+    def invalidate(self) -> None:
+        """Drop the cached serialized forms of this object.
+
+        Changes are detected on assignment, in the lists and dicts held
+        directly by the properties of this object or the objects it contains
+        and anywhere in the helpers, e.g. the conditions of a Condition, so
+        this is only needed after changing values nested deeper in a dict.
+        """
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        self._cache.clear()
+        self.__dict__["_version"] += 1
+
+    def _cached(self) -> Dict[Any, Any]:
+        """Return the cache, emptied if the object changed since it was filled.
+
+        The cache holds a shallow snapshot of the properties and the version
+        of each contained AWSObject and helper. Comparing them detects changes made on
+        this object and anywhere below it without re-encoding anything.
+        """
+        cache = self._cache
+        if cache and not self._unchanged(cache["state"]):
+            self._reset_cache()
+        if not cache:
+            cache["state"] = self._state()
+        return cache
+
+    def _state(self) -> CacheState:
+        props: List[Tuple[str, Any, Any]] = []
+        children: List[Tuple[Any, int]] = []
+        for name, value in self.properties.items():
+            if isinstance(value, list):
+                props.append((name, value, list(value)))
+                children.extend((v, v._version) for v in value if _versioned(v))
+            elif isinstance(value, dict):
+                props.append((name, value, dict(value)))
+            else:
+                props.append((name, value, None))
+                if _versioned(value):
+                    children.append((value, value._version))
+        return props, children
+
+    def _unchanged(self, state: CacheState) -> bool:
+        props, children = state
+        properties = self.properties
+        if len(props) != len(properties):
+            return False
+        for name, value, items in props:
+            current = properties.get(name)
+            if current is not value or (items is not None and items != current):
+                return False
+        for child, version in children:
+            # Checking the child may reset its cache and bump its version
+            child._cached()
+            if child._version != version:
+                return False
+        return True
+
+    def _properties_data(self, cache: Dict[Any, Any] = None) -> dict:
+        """Return the cached data of to_dict(), which must not be changed."""
+        if cache is None:
+            cache = self._cached()
+        try:
+            return cache["properties"]
+        except KeyError:
+            data = cache["properties"] = self._serialize(self.properties)
+            return data
+
+    def _properties_size(self, cache: Dict[Any, Any]) -> int:
+        try:
+            return cache["size"]
+        except KeyError:
+            result = cache["size"] = json_size(self.properties)
+            return result
+
+    def _repr_size(self) -> int:
+        """Return the compact JSON length of JSONrepr(), cached."""
+        cache = self._cached()
+        try:
+            return cache["repr_size"]
+        except KeyError:
+            data = self._repr_data()
+            if data is cache.get("properties"):
+                size = self._properties_size(cache)
+            elif type(self).JSONrepr is AWSObject.JSONrepr:
+                # The properties wrapped in a dict with the dictname key
+                (key,) = data
+                size = json_size(key) + 3 + self._properties_size(cache)
+            else:
+                size = json_size(data)
+            cache["repr_size"] = size
+            return size
+
+    def _repr_data(self) -> Any:
+        """Return JSONrepr() converted to JSON data, cached."""
+        cache = self._cached()
+        try:
+            return cache["repr"]
+        except KeyError:
+            if type(self).JSONrepr is AWSObject.JSONrepr:
+                # Same checks as JSONrepr() without going through its result
+                for k in self._required:
+                    if k not in self.properties:
+                        raise ValueError(
+                            "Resource %s required in type %s" % (k, type(self))
+                        )
+                self.validate()
+                data = self._properties_data(cache)
+                if self.resource is not self.properties:
+                    data = {k: data for k in self.resource}
+            else:
+                r = self.JSONrepr()
+                if r is self.properties:
+                    data = self._properties_data(cache)
+                else:
+                    data = json_data(r)
+            cache["repr"] = data
+            return data
+
+    def _canonical(self) -> Any:
+        """Return the canonical form compared by __eq__, cached."""
+        cache = self._cached()
+        try:
+            return cache["canonical"]
+        except KeyError:
+            result = cache["canonical"] = canonical(self.properties)
+            return result
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
-            return self.to_json() == other.to_json()
+            return self._canonical() == other._canonical()
         else:
             return False
 
@@ -122,7 +543,12 @@ class AWSObject:
         return not self == other
 
     def __hash__(self) -> int:
-        return hash(self.to_json())
+        cache = self._cached()
+        try:
+            return cache["hash"]
+        except KeyError:
+            result = cache["hash"] = hash(self._canonical())
+            return result
 
 
 class AWSProperty(AWSObject):
@@ -140,19 +566,97 @@ T = TypeVar("T")
 
 
 class AWSHelperFn:
+    __slots__ = ()
+
+    # Bumped whenever the helper changes, so the AWSObjects holding it know
+    # their own cache is stale, see AWSObject._state().
+    _version = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            # Helpers are values, drop what was cached for the old one
+            self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        cache = getattr(self, "_cache", None)
+        if cache:
+            cache.clear()
+        self.__dict__["_version"] = self._version + 1
+
+    def _cached(self) -> Dict[Any, Any]:
+        """Return the cache, emptied if the helper changed since it was filled.
+
+        Assignments reset the cache directly. The snapshot of the attributes
+        also catches changes made in place, e.g. appending to a list of
+        principals.
+        """
+        try:
+            cache = self.__dict__.setdefault("_cache", {})
+        except AttributeError:
+            # Slotted subclass, nowhere to cache
+            return {}
+        state = _snapshot(
+            [(k, v) for k, v in self.__dict__.items() if not k.startswith("_")]
+        )
+        if cache and cache["state"] != state:
+            self._reset_cache()
+        if not cache:
+            cache["state"] = state
+        return cache
+
     def getdata(self, data: Union[AWSObject, T]) -> Union[str, None, T]:
         if isinstance(data, AWSObject):
             return data.name
         else:
             return data
 
-    def to_json(self, indent: int = 4, sort_keys: bool = True) -> str:
-        p = self
-        return json.dumps(p, cls=awsencode, indent=indent, sort_keys=sort_keys)
+    def to_json(
+        self,
+        indent: Optional[int] = 4,
+        sort_keys: bool = True,
+        backend: JSONBackend = None,
+    ) -> str:
+        backend = backend or json_backend
+        cache = self._cached()
+        key = ("json", backend, indent, sort_keys)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = backend(self._json_data(), indent, sort_keys)
+            return result
+
+    def iter_json(
+        self, indent: Optional[int] = 4, sort_keys: bool = True, chunk_size: int = 65536
+    ) -> Iterator[str]:
+        """Encode to JSON in chunks of about chunk_size characters."""
+        return iter_json(self._json_data(), indent, sort_keys, chunk_size)
+
+    def _json_data(self) -> Any:
+        return json_data(self.JSONrepr())  # type: ignore[attr-defined]
+
+    def _json_size(self) -> int:
+        cache = self._cached()
+        try:
+            return cache["size"]
+        except KeyError:
+            result = cache["size"] = json_size(self._json_data())
+            return result
+
+    def _canonical(self) -> Any:
+        """Return the canonical form compared by __eq__, cached."""
+        cache = self._cached()
+        try:
+            return cache["canonical"]
+        except KeyError:
+            result = cache["canonical"] = canonical(self._json_data())
+            return result
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, self.__class__):
-            return self.to_json() == other.to_json()
+            return self._canonical() == other._canonical()
         else:
             return False
 
@@ -160,7 +664,173 @@ class AWSHelperFn:
         return not self == other
 
     def __hash__(self) -> int:
-        return hash(self.to_json())
+        cache = self._cached()
+        try:
+            return cache["hash"]
+        except KeyError:
+            result = cache["hash"] = hash(self._canonical())
+            return result
+
+
+def _versioned(value: Any) -> bool:
+    """Return whether value is an object whose changes bump its _version."""
+    return isinstance(value, AWSObject) or (
+        isinstance(value, AWSHelperFn) and hasattr(value, "__dict__")
+    )
+
+
+class _Version:
+    """A contained object and its version, equal while the object is unchanged."""
+
+    __slots__ = ("obj", "version")
+
+    def __init__(self, obj: Any) -> None:
+        # Checking the object may reset its cache and bump its version
+        obj._cached()
+        self.obj = obj
+        self.version = obj._version
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, _Version)
+            and other.obj is self.obj
+            and other.version == self.version
+        )
+
+
+def _snapshot(value: Any) -> Any:
+    """Return a deep copy of value which compares equal until value changes."""
+    if _versioned(value):
+        return _Version(value)
+    elif isinstance(value, (list, tuple)):
+        return type(value), [_snapshot(v) for v in value]
+    elif isinstance(value, dict):
+        return dict, [(k, _snapshot(v)) for k, v in value.items()]
+    elif isinstance(value, str):
+        return value
+    else:
+        # Tagged with the type so a change from True to 1 is seen
+        return type(value), value
+
+
+def _copy_data(value: Any) -> Any:
+    """Copy the dicts and lists of JSON data, sharing the other values."""
+    if isinstance(value, dict):
+        return {k: _copy_data(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy_data(v) for v in value]
+    return value
+
+
+def json_data(value: Any) -> Any:
+    """Convert a value to the plain data json encodes it as.
+
+    AWSObjects reuse the data cached for them, so only the parts of an
+    object tree which changed since it was last serialized are converted.
+    """
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, AWSObject):
+        return value._repr_data()
+    elif isinstance(value, AWSHelperFn):
+        return value._json_data()
+    elif isinstance(value, (list, tuple)):
+        return [json_data(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: json_data(v) for k, v in value.items()}
+    elif hasattr(value, "JSONrepr"):
+        return json_data(value.JSONrepr())
+    return value
+
+
+def iter_json(
+    data: Any, indent: Optional[int], sort_keys: bool, chunk_size: int
+) -> Iterator[str]:
+    encoder = json.JSONEncoder(indent=indent, sort_keys=sort_keys)
+    chunk: List[str] = []
+    size = 0
+    for fragment in encoder.iterencode(data):
+        chunk.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield "".join(chunk)
+
+
+def dump_many(
+    objects: Iterable[AWSObject], fp: IO[str], sort_keys: bool = True
+) -> None:
+    """Write objects as JSON Lines, one compact JSON document per line.
+
+    Only one document is encoded at a time, so the objects can be produced
+    by a generator to keep memory use bounded.
+    """
+    for obj in objects:
+        fp.write(obj.to_json(indent=None, sort_keys=sort_keys))
+        fp.write("\n")
+
+
+def json_size(value: Any) -> int:
+    """Return the length of the compact JSON encoding of a value.
+
+    This matches json.dumps(value, separators=(",", ":")) and uses the sizes
+    cached by AWSObjects and helpers.
+    """
+    if isinstance(value, str):
+        return len(encode_basestring_ascii(value))
+    elif isinstance(value, AWSObject):
+        return value._repr_size()
+    elif isinstance(value, AWSHelperFn):
+        return value._json_size()
+    elif isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        # Brackets and commas
+        return 1 + len(value) + sum([json_size(v) for v in value])
+    elif isinstance(value, dict):
+        if not value:
+            return 2
+        # Braces, commas and colons
+        return (
+            1
+            + 2 * len(value)
+            + sum([_key_size(k) + json_size(v) for k, v in value.items()])
+        )
+    elif hasattr(value, "JSONrepr"):
+        return json_size(value.JSONrepr())
+    return len(json.dumps(value))
+
+
+def _key_size(key: Any) -> int:
+    if isinstance(key, str):
+        return len(encode_basestring_ascii(key))
+    # Keys like numbers are converted to strings
+    return len(json.dumps({key: 0}, separators=(",", ":"))) - 4
+
+
+def canonical(value: Any) -> Any:
+    """Convert a value to a hashable form of the JSON it is encoded as.
+
+    Lists become tuples and dicts become tuples of their items sorted by key,
+    tagged with dict. Other values than strings are tagged with their type,
+    so True, 1 and 1.0 stay apart. Values which encode to the same JSON (with
+    sorted keys) have the same canonical form, which is cached by AWSObjects
+    and helpers.
+    """
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, (AWSObject, AWSHelperFn)):
+        return value._canonical()
+    elif isinstance(value, (list, tuple)):
+        return tuple([canonical(v) for v in value])
+    elif isinstance(value, dict):
+        return (dict, tuple(sorted([(k, canonical(v)) for k, v in value.items()])))
+    elif hasattr(value, "JSONrepr"):
+        return canonical(value.JSONrepr())
+    return type(value), value
 
 
 class awsencode(json.JSONEncoder):
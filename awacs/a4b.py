@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,83 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ApproveSkill = Action("ApproveSkill")
-AssociateContactWithAddressBook = Action("AssociateContactWithAddressBook")
-AssociateDeviceWithRoom = Action("AssociateDeviceWithRoom")
-AssociateSkillGroupWithRoom = Action("AssociateSkillGroupWithRoom")
-AssociateSkillWithSkillGroup = Action("AssociateSkillWithSkillGroup")
-AssociateSkillWithUsers = Action("AssociateSkillWithUsers")
-CompleteRegistration = Action("CompleteRegistration")
-CreateAddressBook = Action("CreateAddressBook")
-CreateBusinessReportSchedule = Action("CreateBusinessReportSchedule")
-CreateConferenceProvider = Action("CreateConferenceProvider")
-CreateContact = Action("CreateContact")
-CreateProfile = Action("CreateProfile")
-CreateRoom = Action("CreateRoom")
-CreateSkillGroup = Action("CreateSkillGroup")
-CreateUser = Action("CreateUser")
-DeleteAddressBook = Action("DeleteAddressBook")
-DeleteBusinessReportSchedule = Action("DeleteBusinessReportSchedule")
-DeleteConferenceProvider = Action("DeleteConferenceProvider")
-DeleteContact = Action("DeleteContact")
-DeleteDevice = Action("DeleteDevice")
-DeleteProfile = Action("DeleteProfile")
-DeleteRoom = Action("DeleteRoom")
-DeleteRoomSkillParameter = Action("DeleteRoomSkillParameter")
-DeleteSkillAuthorization = Action("DeleteSkillAuthorization")
-DeleteSkillGroup = Action("DeleteSkillGroup")
-DeleteUser = Action("DeleteUser")
-DisassociateContactFromAddressBook = Action("DisassociateContactFromAddressBook")
-DisassociateDeviceFromRoom = Action("DisassociateDeviceFromRoom")
-DisassociateSkillFromSkillGroup = Action("DisassociateSkillFromSkillGroup")
-DisassociateSkillFromUsers = Action("DisassociateSkillFromUsers")
-DisassociateSkillGroupFromRoom = Action("DisassociateSkillGroupFromRoom")
-ForgetSmartHomeAppliances = Action("ForgetSmartHomeAppliances")
-GetAddressBook = Action("GetAddressBook")
-GetConferencePreference = Action("GetConferencePreference")
-GetConferenceProvider = Action("GetConferenceProvider")
-GetContact = Action("GetContact")
-GetDevice = Action("GetDevice")
-GetNetworkProfile = Action("GetNetworkProfile")
-GetProfile = Action("GetProfile")
-GetRoom = Action("GetRoom")
-GetRoomSkillParameter = Action("GetRoomSkillParameter")
-GetSkillGroup = Action("GetSkillGroup")
-ListBusinessReportSchedules = Action("ListBusinessReportSchedules")
-ListConferenceProviders = Action("ListConferenceProviders")
-ListDeviceEvents = Action("ListDeviceEvents")
-ListSkills = Action("ListSkills")
-ListSkillsStoreCategories = Action("ListSkillsStoreCategories")
-ListSkillsStoreSkillsByCategory = Action("ListSkillsStoreSkillsByCategory")
-ListSmartHomeAppliances = Action("ListSmartHomeAppliances")
-ListTags = Action("ListTags")
-PutConferencePreference = Action("PutConferencePreference")
-PutDeviceSetupEvents = Action("PutDeviceSetupEvents")
-PutRoomSkillParameter = Action("PutRoomSkillParameter")
-PutSkillAuthorization = Action("PutSkillAuthorization")
-RegisterAVSDevice = Action("RegisterAVSDevice")
-RegisterDevice = Action("RegisterDevice")
-RejectSkill = Action("RejectSkill")
-ResolveRoom = Action("ResolveRoom")
-RevokeInvitation = Action("RevokeInvitation")
-SearchAddressBooks = Action("SearchAddressBooks")
-SearchContacts = Action("SearchContacts")
-SearchDevices = Action("SearchDevices")
-SearchNetworkProfiles = Action("SearchNetworkProfiles")
-SearchProfiles = Action("SearchProfiles")
-SearchRooms = Action("SearchRooms")
-SearchSkillGroups = Action("SearchSkillGroups")
-SearchUsers = Action("SearchUsers")
-SendInvitation = Action("SendInvitation")
-StartDeviceSync = Action("StartDeviceSync")
-StartSmartHomeApplianceDiscovery = Action("StartSmartHomeApplianceDiscovery")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAddressBook = Action("UpdateAddressBook")
-UpdateBusinessReportSchedule = Action("UpdateBusinessReportSchedule")
-UpdateConferenceProvider = Action("UpdateConferenceProvider")
-UpdateContact = Action("UpdateContact")
-UpdateDevice = Action("UpdateDevice")
-UpdateProfile = Action("UpdateProfile")
-UpdateRoom = Action("UpdateRoom")
-UpdateSkillGroup = Action("UpdateSkillGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ApplyArchiveRule = Action("ApplyArchiveRule")
-CreateAccessPreview = Action("CreateAccessPreview")
-CreateAnalyzer = Action("CreateAnalyzer")
-CreateArchiveRule = Action("CreateArchiveRule")
-DeleteAnalyzer = Action("DeleteAnalyzer")
-DeleteArchiveRule = Action("DeleteArchiveRule")
-GetAccessPreview = Action("GetAccessPreview")
-GetAnalyzedResource = Action("GetAnalyzedResource")
-GetAnalyzer = Action("GetAnalyzer")
-GetArchiveRule = Action("GetArchiveRule")
-GetFinding = Action("GetFinding")
-ListAccessPreviewFindings = Action("ListAccessPreviewFindings")
-ListAccessPreviews = Action("ListAccessPreviews")
-ListAnalyzedResources = Action("ListAnalyzedResources")
-ListAnalyzers = Action("ListAnalyzers")
-ListArchiveRules = Action("ListArchiveRules")
-ListFindings = Action("ListFindings")
-ListTagsForResource = Action("ListTagsForResource")
-StartResourceScan = Action("StartResourceScan")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateArchiveRule = Action("UpdateArchiveRule")
-UpdateFindings = Action("UpdateFindings")
-ValidatePolicy = Action("ValidatePolicy")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,28 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateCertificateAuthority = Action("CreateCertificateAuthority")
-CreateCertificateAuthorityAuditReport = Action("CreateCertificateAuthorityAuditReport")
-CreatePermission = Action("CreatePermission")
-DeleteCertificateAuthority = Action("DeleteCertificateAuthority")
-DeletePermission = Action("DeletePermission")
-DeletePolicy = Action("DeletePolicy")
-DescribeCertificateAuthority = Action("DescribeCertificateAuthority")
-DescribeCertificateAuthorityAuditReport = Action(
-    "DescribeCertificateAuthorityAuditReport"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-GetCertificate = Action("GetCertificate")
-GetCertificateAuthorityCertificate = Action("GetCertificateAuthorityCertificate")
-GetCertificateAuthorityCsr = Action("GetCertificateAuthorityCsr")
-GetPolicy = Action("GetPolicy")
-ImportCertificateAuthorityCertificate = Action("ImportCertificateAuthorityCertificate")
-IssueCertificate = Action("IssueCertificate")
-ListCertificateAuthorities = Action("ListCertificateAuthorities")
-ListPermissions = Action("ListPermissions")
-ListTags = Action("ListTags")
-PutPolicy = Action("PutPolicy")
-RestoreCertificateAuthority = Action("RestoreCertificateAuthority")
-RevokeCertificate = Action("RevokeCertificate")
-TagCertificateAuthority = Action("TagCertificateAuthority")
-UntagCertificateAuthority = Action("UntagCertificateAuthority")
-UpdateCertificateAuthority = Action("UpdateCertificateAuthority")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
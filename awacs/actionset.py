@@ -0,0 +1,183 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Sets of catalog actions as bitsets.
+
+An ActionSet holds a set of catalog actions as a Python integer whose bit i
+is set for the action with catalog index i, see catalog.action_index(). Set
+operations are bitwise operations on the whole set at once, so combining
+the actions of many statements is cheap in memory and CPU.
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List, Union
+
+from . import catalog
+from .aws import Action, _as_list
+
+
+@lru_cache(maxsize=65536)
+def action_bits(pattern: str) -> int:
+    """Return the bitset of the catalog actions an action pattern covers."""
+    bits = 0
+    for action in catalog.expand_actions(pattern):
+        bits |= 1 << catalog.action_index(action)
+    return bits
+
+
+@lru_cache(maxsize=None)
+def all_bits() -> int:
+    """Return the bitset of every catalog action."""
+    return (1 << len(catalog.action_names())) - 1
+
+
+def statement_bits(data: dict) -> int:
+    """Return the bitset of the actions covered by the data of a statement."""
+    bits = 0
+    for pattern in _as_list(data.get("Action", data.get("NotAction", []))):
+        bits |= action_bits(pattern)
+    if "NotAction" in data and "Action" not in data:
+        bits = all_bits() & ~bits
+    return bits
+
+
+class ActionSet:
+    """An immutable set of catalog actions.
+
+    It is created from Actions and action patterns like "s3:Get*", matched
+    against the catalog as expand_actions() does, or from the Action or
+    NotAction of a Statement. Actions which are not in the catalog can not
+    be members.
+    """
+
+    __slots__ = ("bits",)
+
+    bits: int
+
+    def __init__(self, actions: Iterable[Union[Action, str]] = ()) -> None:
+        bits = 0
+        for action in actions:
+            if not isinstance(action, str):
+                action = action.JSONrepr()
+            bits |= action_bits(action)
+        object.__setattr__(self, "bits", bits)
+
+    @classmethod
+    def from_bits(cls, bits: int) -> "ActionSet":
+        """Create the set of the actions whose catalog index bits are set."""
+        action_set = cls.__new__(cls)
+        object.__setattr__(action_set, "bits", bits & all_bits())
+        return action_set
+
+    @classmethod
+    def from_statement(cls, statement: Any) -> "ActionSet":
+        """Create the set of actions covered by a Statement or its data.
+
+        For a NotAction statement this is the complement of its actions.
+        """
+        if not isinstance(statement, dict):
+            statement = statement._properties_data()
+        return cls.from_bits(statement_bits(statement))
+
+    @classmethod
+    def all(cls) -> "ActionSet":
+        """Return the set of every catalog action."""
+        return cls.from_bits(all_bits())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("'%s' object is immutable" % (type(self).__name__,))
+
+    def __reduce__(self) -> Any:
+        return (ActionSet.from_bits, (self.bits,))
+
+    def names(self) -> List[str]:
+        """Return the "prefix:Action" names of the actions, in index order."""
+        names = catalog.action_names()
+        return [names[i] for i in self._indexes()]
+
+    def _indexes(self) -> Iterator[int]:
+        for i, bit in enumerate(reversed(bin(self.bits)[2:])):
+            if bit == "1":
+                yield i
+
+    def __iter__(self) -> Iterator[Action]:
+        names = catalog.action_names()
+        for i in self._indexes():
+            yield Action.from_string(names[i])
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __contains__(self, action: Union[Action, str]) -> bool:
+        """Return whether an action, or all the actions of a pattern, are in.
+
+        A pattern covering no catalog action is not contained.
+        """
+        if not isinstance(action, str):
+            action = action.JSONrepr()
+        bits = action_bits(action)
+        return bits != 0 and bits & self.bits == bits
+
+    def __or__(self, other: "ActionSet") -> "ActionSet":
+        return ActionSet.from_bits(self.bits | other.bits)
+
+    def __and__(self, other: "ActionSet") -> "ActionSet":
+        return ActionSet.from_bits(self.bits & other.bits)
+
+    def __sub__(self, other: "ActionSet") -> "ActionSet":
+        return ActionSet.from_bits(self.bits & ~other.bits)
+
+    def __xor__(self, other: "ActionSet") -> "ActionSet":
+        return ActionSet.from_bits(self.bits ^ other.bits)
+
+    def __invert__(self) -> "ActionSet":
+        """Return the complement in the catalog, e.g. for a NotAction."""
+        return ActionSet.from_bits(~self.bits)
+
+    union = __or__
+    intersection = __and__
+    difference = __sub__
+    symmetric_difference = __xor__
+    complement = __invert__
+
+    def issubset(self, other: "ActionSet") -> bool:
+        return self.bits & ~other.bits == 0
+
+    def issuperset(self, other: "ActionSet") -> bool:
+        return other.bits & ~self.bits == 0
+
+    def isdisjoint(self, other: "ActionSet") -> bool:
+        return self.bits & other.bits == 0
+
+    __le__ = issubset
+    __ge__ = issuperset
+
+    def __lt__(self, other: "ActionSet") -> bool:
+        return self.bits != other.bits and self.issubset(other)
+
+    def __gt__(self, other: "ActionSet") -> bool:
+        return self.bits != other.bits and self.issuperset(other)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ActionSet):
+            return self.bits == other.bits
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        if isinstance(other, ActionSet):
+            return self.bits != other.bits
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __repr__(self) -> str:
+        names = self.names()
+        if len(names) > 5:
+            names[5:] = ["... %d more" % (len(names) - 5,)]
+        return "<ActionSet %s>" % (", ".join(names),)
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,39 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApp = Action("CreateApp")
-CreateBackendEnvironment = Action("CreateBackendEnvironment")
-CreateBranch = Action("CreateBranch")
-CreateDeployment = Action("CreateDeployment")
-CreateDomainAssociation = Action("CreateDomainAssociation")
-CreateWebHook = Action("CreateWebHook")
-DeleteApp = Action("DeleteApp")
-DeleteBackendEnvironment = Action("DeleteBackendEnvironment")
-DeleteBranch = Action("DeleteBranch")
-DeleteDomainAssociation = Action("DeleteDomainAssociation")
-DeleteJob = Action("DeleteJob")
-DeleteWebHook = Action("DeleteWebHook")
-GenerateAccessLogs = Action("GenerateAccessLogs")
-GetApp = Action("GetApp")
-GetArtifactUrl = Action("GetArtifactUrl")
-GetBackendEnvironment = Action("GetBackendEnvironment")
-GetBranch = Action("GetBranch")
-GetDomainAssociation = Action("GetDomainAssociation")
-GetJob = Action("GetJob")
-GetWebHook = Action("GetWebHook")
-ListApps = Action("ListApps")
-ListArtifacts = Action("ListArtifacts")
-ListBackendEnvironments = Action("ListBackendEnvironments")
-ListBranches = Action("ListBranches")
-ListDomainAssociations = Action("ListDomainAssociations")
-ListJobs = Action("ListJobs")
-ListWebHooks = Action("ListWebHooks")
-StartDeployment = Action("StartDeployment")
-StartJob = Action("StartJob")
-StopJob = Action("StopJob")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApp = Action("UpdateApp")
-UpdateBranch = Action("UpdateBranch")
-UpdateDomainAssociation = Action("UpdateDomainAssociation")
-UpdateWebHook = Action("UpdateWebHook")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
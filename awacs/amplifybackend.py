@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CloneBackend = Action("CloneBackend")
-CreateBackend = Action("CreateBackend")
-CreateBackendAPI = Action("CreateBackendAPI")
-CreateBackendAuth = Action("CreateBackendAuth")
-CreateBackendConfig = Action("CreateBackendConfig")
-CreateToken = Action("CreateToken")
-DeleteBackend = Action("DeleteBackend")
-DeleteBackendAPI = Action("DeleteBackendAPI")
-DeleteBackendAuth = Action("DeleteBackendAuth")
-DeleteToken = Action("DeleteToken")
-GenerateBackendAPIModels = Action("GenerateBackendAPIModels")
-GetBackend = Action("GetBackend")
-GetBackendAPI = Action("GetBackendAPI")
-GetBackendAPIModels = Action("GetBackendAPIModels")
-GetBackendAuth = Action("GetBackendAuth")
-GetBackendJob = Action("GetBackendJob")
-GetToken = Action("GetToken")
-ListBackendJobs = Action("ListBackendJobs")
-RemoveAllBackends = Action("RemoveAllBackends")
-RemoveBackendConfig = Action("RemoveBackendConfig")
-UpdateBackendAPI = Action("UpdateBackendAPI")
-UpdateBackendAuth = Action("UpdateBackendAuth")
-UpdateBackendConfig = Action("UpdateBackendConfig")
-UpdateBackendJob = Action("UpdateBackendJob")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -0,0 +1,631 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Semantic comparison of policies.
+
+equivalent() and subsumes() compare what policies allow rather than how
+they are written, so statement order, wildcards versus expanded actions or
+statements split in several parts do not matter.
+
+A policy is normalized into statements of an ActionSet, resource patterns
+and a guard: the normalized conditions and principal the statement depends
+on. Guards are compared syntactically and treated as independent facts.
+The catalog actions are partitioned into blocks covered by the same
+statements, and for each block the guards of each allowing statement are
+checked, alone and with those of each denying statement: the resources
+allowed by one policy and not the other are searched with an automaton
+built from the resource patterns. A difference comes with a counterexample
+request.
+
+canonicalize() is the textual counterpart: a policy written in a single
+deterministic way, whose fingerprint() is a stable content hash. diff()
+compares the canonical statements of two versions of a policy.
+"""
+
+import hashlib
+import json
+from collections import deque
+from itertools import chain, count
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from . import _copy_data, catalog
+from .actionset import all_bits, statement_bits
+from .aws import Deny, Policy, PolicyDocument, _as_list
+from .evaluation import PolicyLike
+
+# A normalized condition entry or principal a statement depends on
+Guard = Tuple[Any, ...]
+
+
+class NormalizedStatement(NamedTuple):
+    deny: bool
+    # Bitset of the covered catalog actions, see ActionSet
+    actions: int
+    # Resource patterns and whether they are a NotResource
+    resources: Tuple[str, ...]
+    not_resource: bool
+    guards: FrozenSet[Guard]
+
+
+class Counterexample(NamedTuple):
+    """A request allowed by one policy and not by the other."""
+
+    action: str
+    resource: str
+    # Normalized conditions and principals assumed to hold for the request
+    guards: Tuple[Guard, ...]
+    # Which policy allows the request, 0 for the first and 1 for the second
+    allowed_by: int
+
+
+class Comparison:
+    """The result of equivalent() or subsumes(), true if the check holds."""
+
+    __slots__ = ("counterexample",)
+
+    def __init__(self, counterexample: Optional[Counterexample]) -> None:
+        self.counterexample = counterexample
+
+    def __bool__(self) -> bool:
+        return self.counterexample is None
+
+    def __repr__(self) -> str:
+        if self.counterexample is None:
+            return "<Comparison holds>"
+        return "<Comparison fails: %r>" % (self.counterexample,)
+
+
+def normalize_condition(condition: Dict[str, Any]) -> FrozenSet[Guard]:
+    """Return the normalized entries of the data of a Condition.
+
+    Each (operator, key, values) entry becomes a guard with the key
+    lowercased, as condition keys are case insensitive, and the values as a
+    sorted tuple of unique strings, booleans written as JSON.
+    """
+    guards = set()
+    for operator, entries in condition.items():
+        for key, values in entries.items():
+            guards.add(("Condition", operator, key.lower(), _normalize_values(values)))
+    return frozenset(guards)
+
+
+def _normalize_values(values: Any) -> Tuple[str, ...]:
+    normalized = set()
+    for value in _as_list(values):
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        normalized.add(str(value))
+    return tuple(sorted(normalized))
+
+
+def _normalize_principal(element: str, principal: Any) -> Guard:
+    if principal == "*":
+        return (element, "*")
+    return (
+        element,
+        tuple(sorted((k, _normalize_values(v)) for k, v in principal.items())),
+    )
+
+
+def normalize(policy: PolicyLike) -> List[NormalizedStatement]:
+    """Return the statements of a policy in normalized form."""
+    data = policy if isinstance(policy, dict) else policy._properties_data()
+    statements = []
+    for statement in _as_list(data.get("Statement", [])):
+        guards = set(normalize_condition(statement.get("Condition", {})))
+        for element in ("Principal", "NotPrincipal"):
+            if element in statement:
+                guards.add(_normalize_principal(element, statement[element]))
+        if "NotResource" in statement:
+            resources = _as_list(statement["NotResource"])
+            not_resource = True
+        else:
+            resources = _as_list(statement.get("Resource", "*"))
+            not_resource = False
+        statements.append(
+            NormalizedStatement(
+                deny=statement.get("Effect") == Deny,
+                actions=statement_bits(statement),
+                resources=tuple(sorted(set(resources))),
+                not_resource=not_resource,
+                guards=frozenset(guards),
+            )
+        )
+    return statements
+
+
+def canonicalize(policy: PolicyLike) -> Policy:
+    """Return the policy written in a canonical form.
+
+    Actions are deduplicated ignoring case, catalog actions being spelled as
+    in the catalog, and sorted ignoring case. Resources, principals and
+    condition values are deduplicated and sorted, condition values as the
+    strings of normalize_condition(). Every element which may hold several
+    values is a list, even of one value. Duplicate statements are removed
+    and the others sorted by their compact JSON encoding with sorted keys.
+    """
+    # The canonical data is cached on the policy, the result gets a copy
+    data = _copy_data(_canonical_data(policy))
+    cls = PolicyDocument if isinstance(policy, dict) else type(policy)
+    return cls.from_dict(data)
+
+
+def fingerprint(policy: PolicyLike) -> str:
+    """Return a stable 128-bit hash of the canonical form, in hexadecimal.
+
+    Policies with the same canonical form have the same fingerprint, across
+    processes and versions of Python.
+    """
+    if isinstance(policy, dict):
+        return _fingerprint(_canonical_data(policy))
+    cache = policy._cached()
+    try:
+        return cache["fingerprint"]
+    except KeyError:
+        result = cache["fingerprint"] = _fingerprint(_canonical_data(policy))
+        return result
+
+
+def _fingerprint(data: Any) -> str:
+    return hashlib.blake2b(_json(data).encode(), digest_size=16).hexdigest()
+
+
+def _json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+def _canonical_data(policy: PolicyLike) -> dict:
+    if isinstance(policy, dict):
+        data = policy
+    else:
+        cache = policy._cached()
+        try:
+            return cache["canonical_data"]
+        except KeyError:
+            data = policy._properties_data(cache)
+    statements = {}
+    for statement in _as_list(data.get("Statement", [])):
+        statement = canonical_statement(statement)
+        statements[_json(statement)] = statement
+    result = dict(data, Statement=[statements[k] for k in sorted(statements)])
+    if not isinstance(policy, dict):
+        cache["canonical_data"] = result
+    return result
+
+
+def canonical_statement(statement: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the data of a statement in canonical form, see canonicalize()."""
+    result = dict(statement)
+    for key in ("Action", "NotAction"):
+        if key in result:
+            result[key] = _canonical_actions(_as_list(result[key]))
+    for key in ("Resource", "NotResource"):
+        if key in result:
+            result[key] = _sorted_unique(_as_list(result[key]))
+    for key in ("Principal", "NotPrincipal"):
+        if key in result and result[key] != "*":
+            result[key] = {
+                k: _sorted_unique(_as_list(v)) for k, v in result[key].items()
+            }
+    if "Condition" in result:
+        result["Condition"] = {
+            operator: {k: list(_normalize_values(v)) for k, v in entries.items()}
+            for operator, entries in result["Condition"].items()
+        }
+    return result
+
+
+def _canonical_actions(actions: List[Any]) -> List[str]:
+    names = catalog.action_names()
+    spellings: Dict[str, str] = {}
+    for action in actions:
+        service, _, name = action.partition(":")
+        action = "%s:%s" % (service.lower(), name) if name else action
+        try:
+            action = names[catalog.action_index(action)]
+        except KeyError:
+            pass
+        lowered = action.lower()
+        # The same spelling for actions differing only in case
+        if lowered not in spellings or action < spellings[lowered]:
+            spellings[lowered] = action
+    return [spellings[k] for k in sorted(spellings)]
+
+
+def _sorted_unique(values: List[Any]) -> List[Any]:
+    # Values like the intrinsic functions of CloudFormation are sorted by
+    # their JSON encoding, after the strings.
+    unique = {_json(v): v for v in values}
+    return [
+        unique[k]
+        for k in sorted(unique, key=lambda k: (not isinstance(unique[k], str), k))
+    ]
+
+
+# A condition entry of a canonical statement: operator, key and values
+ConditionEntry = Tuple[str, str, Tuple[str, ...]]
+
+
+class StatementDiff(NamedTuple):
+    """The changes between two versions of a statement, in canonical form."""
+
+    old: Dict[str, Any]
+    new: Dict[str, Any]
+    # The elements which differ, e.g. ("Action", "Condition")
+    elements: Tuple[str, ...]
+    added_actions: Tuple[str, ...]
+    removed_actions: Tuple[str, ...]
+    added_resources: Tuple[Any, ...]
+    removed_resources: Tuple[Any, ...]
+    added_conditions: Tuple[ConditionEntry, ...]
+    removed_conditions: Tuple[ConditionEntry, ...]
+
+
+class PolicyDiff(NamedTuple):
+    """The result of diff(), true if the policies differ."""
+
+    added: Tuple[Dict[str, Any], ...]
+    removed: Tuple[Dict[str, Any], ...]
+    changed: Tuple[StatementDiff, ...]
+    # The elements of the policies other than Statement which differ
+    elements: Tuple[str, ...] = ()
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.elements)
+
+
+def diff(old: PolicyLike, new: PolicyLike) -> PolicyDiff:
+    """Compare two versions of a policy statement by statement.
+
+    Statements are compared in canonical form, see canonicalize(), so
+    changes of order or spelling are not reported. Statements equal in both
+    versions are matched first, then statements with the same Sid, then
+    statements differing in only one of their actions, resources or
+    conditions, matched by hashing the other parts. The other statements
+    are added or removed. Each step is a lookup in a dict, so the time is
+    about linear in the size of the policies.
+    """
+    old_data = _canonical_data(old)
+    new_data = _canonical_data(new)
+    elements = tuple(
+        sorted(
+            k
+            for k in set(old_data) | set(new_data)
+            if k != "Statement" and old_data.get(k) != new_data.get(k)
+        )
+    )
+    old_left = _statement_keys(old_data["Statement"])
+    new_left = _statement_keys(new_data["Statement"])
+    for key in set(old_left) & set(new_left):
+        del old_left[key]
+        del new_left[key]
+
+    pairs = []
+    for shape in (_sid_shape, _actions_shape, _resources_shape, _conditions_shape):
+        candidates: Dict[Any, Deque[str]] = {}
+        for key, statement in old_left.items():
+            candidates.setdefault(shape(statement), deque()).append(key)
+        candidates.pop(None, None)
+        for key, statement in list(new_left.items()):
+            matching = candidates.get(shape(statement))
+            if matching:
+                pairs.append((old_left.pop(matching.popleft()), statement))
+                del new_left[key]
+    return PolicyDiff(
+        added=tuple(new_left.values()),
+        removed=tuple(old_left.values()),
+        changed=tuple(_statement_diff(a, b) for a, b in pairs),
+        elements=elements,
+    )
+
+
+def _statement_keys(statements: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    # The canonical statements are unique, so their JSON identifies them
+    return {_json(s): s for s in statements}
+
+
+# Shapes of statements: the parts expected to stay the same when the others
+# change, None if the statement can not be matched this way.
+
+
+def _sid_shape(statement: Dict[str, Any]) -> Any:
+    return statement.get("Sid")
+
+
+def _shape(statement: Dict[str, Any], changing: Tuple[str, ...]) -> str:
+    return _json({k: v for k, v in statement.items() if k not in changing})
+
+
+def _actions_shape(statement: Dict[str, Any]) -> str:
+    return _shape(statement, ("Sid", "Action", "NotAction"))
+
+
+def _resources_shape(statement: Dict[str, Any]) -> str:
+    return _shape(statement, ("Sid", "Resource", "NotResource"))
+
+
+def _conditions_shape(statement: Dict[str, Any]) -> str:
+    return _shape(statement, ("Sid", "Condition"))
+
+
+def _statement_diff(old: Dict[str, Any], new: Dict[str, Any]) -> StatementDiff:
+    elements = tuple(sorted(k for k in set(old) | set(new) if old.get(k) != new.get(k)))
+
+    def values(statement: Dict[str, Any], keys: Tuple[str, str]) -> List[Any]:
+        return statement.get(keys[0], statement.get(keys[1], []))
+
+    def changes(keys: Tuple[str, str]) -> Tuple[Tuple[Any, ...], Tuple[Any, ...]]:
+        old_values = {_json(v): v for v in values(old, keys)}
+        new_values = {_json(v): v for v in values(new, keys)}
+        return (
+            tuple(v for k, v in new_values.items() if k not in old_values),
+            tuple(v for k, v in old_values.items() if k not in new_values),
+        )
+
+    added_actions, removed_actions = changes(("Action", "NotAction"))
+    added_resources, removed_resources = changes(("Resource", "NotResource"))
+    old_conditions = set(_condition_entries(old))
+    new_conditions = set(_condition_entries(new))
+    return StatementDiff(
+        old=old,
+        new=new,
+        elements=elements,
+        added_actions=added_actions,
+        removed_actions=removed_actions,
+        added_resources=added_resources,
+        removed_resources=removed_resources,
+        added_conditions=tuple(sorted(new_conditions - old_conditions)),
+        removed_conditions=tuple(sorted(old_conditions - new_conditions)),
+    )
+
+
+def _condition_entries(statement: Dict[str, Any]) -> Iterator[ConditionEntry]:
+    for operator, entries in statement.get("Condition", {}).items():
+        for key, values in entries.items():
+            yield (operator, key, tuple(values))
+
+
+def subsumes(a: PolicyLike, b: PolicyLike) -> Comparison:
+    """Check that policy a allows every request that policy b allows.
+
+    If not, the counterexample is a request b allows and a does not.
+    """
+    return Comparison(_find_difference(normalize(a), normalize(b), False))
+
+
+def equivalent(a: PolicyLike, b: PolicyLike) -> Comparison:
+    """Check that two policies allow exactly the same requests.
+
+    If not, the counterexample is a request only one of them allows.
+    """
+    return Comparison(_find_difference(normalize(a), normalize(b), True))
+
+
+def _find_difference(
+    a: List[NormalizedStatement], b: List[NormalizedStatement], both: bool
+) -> Optional[Counterexample]:
+    guards = sorted(set().union(*(s.guards for s in a + b)), key=repr)
+    searches: Dict[Any, Optional[str]] = {}
+    # Every statement covers the whole block or none of it, and only the
+    # statements covering a block decide the requests for its actions.
+    for block in _action_blocks(a + b):
+        block_a = [s for s in a if s.actions & block]
+        block_b = [s for s in b if s.actions & block]
+        for holding in _holding_sets(block_a, block_b, both):
+            covering_a = [s for s in block_a if s.guards <= holding]
+            covering_b = [s for s in block_b if s.guards <= holding]
+            directions = [(covering_a, covering_b, 1)]
+            if both:
+                directions.append((covering_b, covering_a, 0))
+            for first, second, allowed_by in directions:
+                # A resource allowed by the second and not by the first
+                search = (_resource_key(first), _resource_key(second))
+                if search not in searches:
+                    searches[search] = _find_resource(first, second)
+                resource = searches[search]
+                if resource is not None:
+                    index = (block & -block).bit_length() - 1
+                    return Counterexample(
+                        action=catalog.action_names()[index],
+                        resource=resource,
+                        guards=tuple(g for g in guards if g in holding),
+                        allowed_by=allowed_by,
+                    )
+    return None
+
+
+def _holding_sets(
+    a: List[NormalizedStatement], b: List[NormalizedStatement], both: bool
+) -> Iterator[FrozenSet[Guard]]:
+    """Yield the sets of holding guards under which a and b may differ.
+
+    If b allows a request which a does not, it still does when only the
+    guards of the statement of b allowing it hold, and those of a statement
+    of a denying it if there is one: fewer guards only drop statements of b
+    denying the request and statements of a allowing it. So the guards of
+    each allowing statement are checked alone and with those of each denying
+    statement of the other policy, a number of sets quadratic at most.
+    """
+    directions = [(a, b)]
+    if both:
+        directions.append((b, a))
+    seen = set()
+    for first, second in directions:
+        denies = [s.guards for s in first if s.deny]
+        for statement in second:
+            if statement.deny:
+                continue
+            for holding in [statement.guards] + [statement.guards | d for d in denies]:
+                if holding not in seen:
+                    seen.add(holding)
+                    yield holding
+
+
+def _action_blocks(statements: List[NormalizedStatement]) -> List[int]:
+    """Partition the catalog actions into blocks covered by the same statements."""
+    blocks = [all_bits()]
+    for bits in {s.actions for s in statements}:
+        refined = []
+        for block in blocks:
+            inside = block & bits
+            if inside:
+                refined.append(inside)
+            if inside != block:
+                refined.append(block & ~bits)
+        blocks = refined
+    return blocks
+
+
+ResourceKey = Tuple[Tuple[bool, bool, Tuple[str, ...]], ...]
+
+
+def _resource_key(statements: List[NormalizedStatement]) -> ResourceKey:
+    return tuple(sorted({(s.deny, s.not_resource, s.resources) for s in statements}))
+
+
+# Resource search
+
+# Tokens of a resource pattern: a literal character, "?" or "*", the
+# wildcards carrying whether they can match a colon.
+Token = Tuple[str, str]
+
+
+def _tokens(pattern: str) -> Tuple[Token, ...]:
+    # As in arn_like(), wildcards in the first five segments of an ARN
+    # pattern do not match colons.
+    parts = pattern.split(":", 5)
+    if pattern == "*" or len(parts) < 6:
+        return tuple(_segment_tokens(pattern, True))
+    tokens: List[Token] = []
+    for i, part in enumerate(parts):
+        if i:
+            tokens.append(("c", ":"))
+        tokens.extend(_segment_tokens(part, i == 5))
+    return tuple(tokens)
+
+
+def _segment_tokens(segment: str, colons: bool) -> Iterator[Token]:
+    for char in segment:
+        if char in "*?":
+            yield (char, ":" if colons else "")
+        else:
+            yield ("c", char)
+
+
+class _Glob:
+    """Nondeterministic automaton of a pattern, states being token positions."""
+
+    def __init__(self, pattern: str) -> None:
+        self.tokens = _tokens(pattern)
+        self.end = len(self.tokens)
+        self.start = self.close({0})
+
+    def close(self, positions: Any) -> FrozenSet[int]:
+        # A star can match nothing
+        result = set(positions)
+        stack = list(positions)
+        while stack:
+            i = stack.pop()
+            if i < self.end and self.tokens[i][0] == "*" and i + 1 not in result:
+                result.add(i + 1)
+                stack.append(i + 1)
+        return frozenset(result)
+
+    def step(self, positions: FrozenSet[int], char: str) -> FrozenSet[int]:
+        following = set()
+        for i in positions:
+            if i == self.end:
+                continue
+            kind, value = self.tokens[i]
+            if kind == "c":
+                if value == char:
+                    following.add(i + 1)
+            elif char != ":" or value:
+                following.add(i if kind == "*" else i + 1)
+        return self.close(following)
+
+
+def _find_resource(
+    first: List[NormalizedStatement], second: List[NormalizedStatement]
+) -> Optional[str]:
+    """Return a resource allowed by the second statements, not by the first.
+
+    The automata of all the patterns run side by side on the characters of
+    the patterns and one other character, searching breadth first for a
+    string accepted by the combination of the statements.
+    """
+    patterns = sorted({p for s in first + second for p in s.resources})
+    index = {p: i for i, p in enumerate(patterns)}
+
+    def compile_statements(
+        statements: List[NormalizedStatement],
+    ) -> Callable[[Tuple[bool, ...]], bool]:
+        specs = [
+            (s.deny, s.not_resource, [index[p] for p in s.resources])
+            for s in statements
+        ]
+
+        def allowed(accepted: Tuple[bool, ...]) -> bool:
+            allow = False
+            for deny, not_resource, indexes in specs:
+                if any(accepted[i] for i in indexes) != not_resource:
+                    if deny:
+                        return False
+                    allow = True
+            return allow
+
+        return allowed
+
+    allowed_first = compile_statements(first)
+    allowed_second = compile_statements(second)
+
+    def found(accepted: Tuple[bool, ...]) -> bool:
+        return allowed_second(accepted) and not allowed_first(accepted)
+
+    globs = [_Glob(p) for p in patterns]
+    literals = {v for g in globs for kind, v in g.tokens if kind == "c"} | {":"}
+    # A character no pattern spells out, outside of their alphabet if needed
+    candidates = chain("xyz0123456789abcdefghijklmnopqrstuvw", map(chr, count(0x100)))
+    other = next(c for c in candidates if c not in literals)
+    alphabet = [other] + sorted(literals)
+
+    # Resources are not empty, so the search starts after one character.
+    # Each state is reached from its parent state, None for the start.
+    start = tuple(g.start for g in globs)
+    parents: Dict[Tuple[FrozenSet[int], ...], Any] = {}
+    queue: Deque[Tuple[FrozenSet[int], ...]] = deque()
+
+    def visit(state: Tuple[FrozenSet[int], ...], parent: Any) -> None:
+        for char in alphabet:
+            following = tuple(g.step(s, char) for g, s in zip(globs, state))
+            if following not in parents:
+                parents[following] = (parent, char)
+                queue.append(following)
+
+    visit(start, None)
+    while queue:
+        state = queue.popleft()
+        if found(tuple(g.end in s for g, s in zip(globs, state))):
+            chars = []
+            current: Any = state
+            while current is not None:
+                current, char = parents[current]
+                chars.append(char)
+            return "".join(reversed(chars))
+        # Once every automaton is dead the accepted patterns stay the same
+        if any(state):
+            visit(state, state)
+    return None
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApplication = Action("CreateApplication")
-CreateConfigurationProfile = Action("CreateConfigurationProfile")
-CreateDeploymentStrategy = Action("CreateDeploymentStrategy")
-CreateEnvironment = Action("CreateEnvironment")
-CreateHostedConfigurationVersion = Action("CreateHostedConfigurationVersion")
-DeleteApplication = Action("DeleteApplication")
-DeleteConfigurationProfile = Action("DeleteConfigurationProfile")
-DeleteDeploymentStrategy = Action("DeleteDeploymentStrategy")
-DeleteEnvironment = Action("DeleteEnvironment")
-DeleteHostedConfigurationVersion = Action("DeleteHostedConfigurationVersion")
-GetApplication = Action("GetApplication")
-GetConfiguration = Action("GetConfiguration")
-GetConfigurationProfile = Action("GetConfigurationProfile")
-GetDeployment = Action("GetDeployment")
-GetDeploymentStrategy = Action("GetDeploymentStrategy")
-GetEnvironment = Action("GetEnvironment")
-GetHostedConfigurationVersion = Action("GetHostedConfigurationVersion")
-ListApplications = Action("ListApplications")
-ListConfigurationProfiles = Action("ListConfigurationProfiles")
-ListDeploymentStrategies = Action("ListDeploymentStrategies")
-ListDeployments = Action("ListDeployments")
-ListEnvironments = Action("ListEnvironments")
-ListHostedConfigurationVersions = Action("ListHostedConfigurationVersions")
-ListTagsForResource = Action("ListTagsForResource")
-StartDeployment = Action("StartDeployment")
-StopDeployment = Action("StopDeployment")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApplication = Action("UpdateApplication")
-UpdateConfigurationProfile = Action("UpdateConfigurationProfile")
-UpdateDeploymentStrategy = Action("UpdateDeploymentStrategy")
-UpdateEnvironment = Action("UpdateEnvironment")
-ValidateConfiguration = Action("ValidateConfiguration")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
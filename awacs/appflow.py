@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateConnectorProfile = Action("CreateConnectorProfile")
-CreateFlow = Action("CreateFlow")
-DeleteConnectorProfile = Action("DeleteConnectorProfile")
-DeleteFlow = Action("DeleteFlow")
-DescribeConnectorEntity = Action("DescribeConnectorEntity")
-DescribeConnectorFields = Action("DescribeConnectorFields")
-DescribeConnectorProfiles = Action("DescribeConnectorProfiles")
-DescribeConnectors = Action("DescribeConnectors")
-DescribeFlow = Action("DescribeFlow")
-DescribeFlowExecution = Action("DescribeFlowExecution")
-DescribeFlowExecutionRecords = Action("DescribeFlowExecutionRecords")
-DescribeFlows = Action("DescribeFlows")
-ListConnectorEntities = Action("ListConnectorEntities")
-ListConnectorFields = Action("ListConnectorFields")
-ListFlows = Action("ListFlows")
-ListTagsForResource = Action("ListTagsForResource")
-RunFlow = Action("RunFlow")
-StartFlow = Action("StartFlow")
-StopFlow = Action("StopFlow")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateConnectorProfile = Action("UpdateConnectorProfile")
-UpdateFlow = Action("UpdateFlow")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
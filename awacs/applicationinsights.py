@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,32 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApplication = Action("CreateApplication")
-CreateComponent = Action("CreateComponent")
-CreateLogPattern = Action("CreateLogPattern")
-DeleteApplication = Action("DeleteApplication")
-DeleteComponent = Action("DeleteComponent")
-DeleteLogPattern = Action("DeleteLogPattern")
-DescribeApplication = Action("DescribeApplication")
-DescribeComponent = Action("DescribeComponent")
-DescribeComponentConfiguration = Action("DescribeComponentConfiguration")
-DescribeComponentConfigurationRecommendation = Action(
-    "DescribeComponentConfigurationRecommendation"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DescribeLogPattern = Action("DescribeLogPattern")
-DescribeObservation = Action("DescribeObservation")
-DescribeProblem = Action("DescribeProblem")
-DescribeProblemObservations = Action("DescribeProblemObservations")
-ListApplications = Action("ListApplications")
-ListComponents = Action("ListComponents")
-ListConfigurationHistory = Action("ListConfigurationHistory")
-ListLogPatternSets = Action("ListLogPatternSets")
-ListLogPatterns = Action("ListLogPatterns")
-ListProblems = Action("ListProblems")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApplication = Action("UpdateApplication")
-UpdateComponent = Action("UpdateComponent")
-UpdateComponentConfiguration = Action("UpdateComponentConfiguration")
-UpdateLogPattern = Action("UpdateLogPattern")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
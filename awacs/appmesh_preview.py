@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,39 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateGatewayRoute = Action("CreateGatewayRoute")
-CreateMesh = Action("CreateMesh")
-CreateRoute = Action("CreateRoute")
-CreateVirtualGateway = Action("CreateVirtualGateway")
-CreateVirtualNode = Action("CreateVirtualNode")
-CreateVirtualRouter = Action("CreateVirtualRouter")
-CreateVirtualService = Action("CreateVirtualService")
-DeleteGatewayRoute = Action("DeleteGatewayRoute")
-DeleteMesh = Action("DeleteMesh")
-DeleteRoute = Action("DeleteRoute")
-DeleteVirtualGateway = Action("DeleteVirtualGateway")
-DeleteVirtualNode = Action("DeleteVirtualNode")
-DeleteVirtualRouter = Action("DeleteVirtualRouter")
-DeleteVirtualService = Action("DeleteVirtualService")
-DescribeGatewayRoute = Action("DescribeGatewayRoute")
-DescribeMesh = Action("DescribeMesh")
-DescribeRoute = Action("DescribeRoute")
-DescribeVirtualGateway = Action("DescribeVirtualGateway")
-DescribeVirtualNode = Action("DescribeVirtualNode")
-DescribeVirtualRouter = Action("DescribeVirtualRouter")
-DescribeVirtualService = Action("DescribeVirtualService")
-ListGatewayRoutes = Action("ListGatewayRoutes")
-ListMeshes = Action("ListMeshes")
-ListRoutes = Action("ListRoutes")
-ListVirtualGateways = Action("ListVirtualGateways")
-ListVirtualNodes = Action("ListVirtualNodes")
-ListVirtualRouters = Action("ListVirtualRouters")
-ListVirtualServices = Action("ListVirtualServices")
-StreamAggregatedResources = Action("StreamAggregatedResources")
-UpdateGatewayRoute = Action("UpdateGatewayRoute")
-UpdateMesh = Action("UpdateMesh")
-UpdateRoute = Action("UpdateRoute")
-UpdateVirtualGateway = Action("UpdateVirtualGateway")
-UpdateVirtualNode = Action("UpdateVirtualNode")
-UpdateVirtualRouter = Action("UpdateVirtualRouter")
-UpdateVirtualService = Action("UpdateVirtualService")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
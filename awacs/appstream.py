@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,53 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateFleet = Action("AssociateFleet")
-BatchAssociateUserStack = Action("BatchAssociateUserStack")
-BatchDisassociateUserStack = Action("BatchDisassociateUserStack")
-CopyImage = Action("CopyImage")
-CreateDirectoryConfig = Action("CreateDirectoryConfig")
-CreateFleet = Action("CreateFleet")
-CreateImageBuilder = Action("CreateImageBuilder")
-CreateImageBuilderStreamingURL = Action("CreateImageBuilderStreamingURL")
-CreateStack = Action("CreateStack")
-CreateStreamingURL = Action("CreateStreamingURL")
-CreateUsageReportSubscription = Action("CreateUsageReportSubscription")
-CreateUser = Action("CreateUser")
-DeleteDirectoryConfig = Action("DeleteDirectoryConfig")
-DeleteFleet = Action("DeleteFleet")
-DeleteImage = Action("DeleteImage")
-DeleteImageBuilder = Action("DeleteImageBuilder")
-DeleteImagePermissions = Action("DeleteImagePermissions")
-DeleteStack = Action("DeleteStack")
-DeleteUsageReportSubscription = Action("DeleteUsageReportSubscription")
-DeleteUser = Action("DeleteUser")
-DescribeDirectoryConfigs = Action("DescribeDirectoryConfigs")
-DescribeFleets = Action("DescribeFleets")
-DescribeImageBuilders = Action("DescribeImageBuilders")
-DescribeImagePermissions = Action("DescribeImagePermissions")
-DescribeImages = Action("DescribeImages")
-DescribeSessions = Action("DescribeSessions")
-DescribeStacks = Action("DescribeStacks")
-DescribeUsageReportSubscriptions = Action("DescribeUsageReportSubscriptions")
-DescribeUserStackAssociations = Action("DescribeUserStackAssociations")
-DescribeUsers = Action("DescribeUsers")
-DisableUser = Action("DisableUser")
-DisassociateFleet = Action("DisassociateFleet")
-EnableUser = Action("EnableUser")
-ExpireSession = Action("ExpireSession")
-GetImageBuilders = Action("GetImageBuilders")
-GetParametersForThemeAssetUpload = Action("GetParametersForThemeAssetUpload")
-ListAssociatedFleets = Action("ListAssociatedFleets")
-ListAssociatedStacks = Action("ListAssociatedStacks")
-ListTagsForResource = Action("ListTagsForResource")
-StartFleet = Action("StartFleet")
-StartImageBuilder = Action("StartImageBuilder")
-StopFleet = Action("StopFleet")
-StopImageBuilder = Action("StopImageBuilder")
-Stream = Action("Stream")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDirectoryConfig = Action("UpdateDirectoryConfig")
-UpdateFleet = Action("UpdateFleet")
-UpdateImagePermissions = Action("UpdateImagePermissions")
-UpdateStack = Action("UpdateStack")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
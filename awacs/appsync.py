@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,41 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApiKey = Action("CreateApiKey")
-CreateDataSource = Action("CreateDataSource")
-CreateFunction = Action("CreateFunction")
-CreateGraphqlApi = Action("CreateGraphqlApi")
-CreateResolver = Action("CreateResolver")
-CreateType = Action("CreateType")
-DeleteApiKey = Action("DeleteApiKey")
-DeleteDataSource = Action("DeleteDataSource")
-DeleteFunction = Action("DeleteFunction")
-DeleteGraphqlApi = Action("DeleteGraphqlApi")
-DeleteResolver = Action("DeleteResolver")
-DeleteType = Action("DeleteType")
-GetDataSource = Action("GetDataSource")
-GetFunction = Action("GetFunction")
-GetGraphqlApi = Action("GetGraphqlApi")
-GetIntrospectionSchema = Action("GetIntrospectionSchema")
-GetResolver = Action("GetResolver")
-GetSchemaCreationStatus = Action("GetSchemaCreationStatus")
-GetType = Action("GetType")
-GraphQL = Action("GraphQL")
-ListApiKeys = Action("ListApiKeys")
-ListDataSources = Action("ListDataSources")
-ListFunctions = Action("ListFunctions")
-ListGraphqlApis = Action("ListGraphqlApis")
-ListResolvers = Action("ListResolvers")
-ListResolversByFunction = Action("ListResolversByFunction")
-ListTagsForResource = Action("ListTagsForResource")
-ListTypes = Action("ListTypes")
-SetWebACL = Action("SetWebACL")
-StartSchemaCreation = Action("StartSchemaCreation")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApiKey = Action("UpdateApiKey")
-UpdateDataSource = Action("UpdateDataSource")
-UpdateFunction = Action("UpdateFunction")
-UpdateGraphqlApi = Action("UpdateGraphqlApi")
-UpdateResolver = Action("UpdateResolver")
-UpdateType = Action("UpdateType")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
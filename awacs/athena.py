@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,48 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchGetNamedQuery = Action("BatchGetNamedQuery")
-BatchGetQueryExecution = Action("BatchGetQueryExecution")
-CancelQueryExecution = Action("CancelQueryExecution")
-CreateDataCatalog = Action("CreateDataCatalog")
-CreateNamedQuery = Action("CreateNamedQuery")
-CreatePreparedStatement = Action("CreatePreparedStatement")
-CreateWorkGroup = Action("CreateWorkGroup")
-DeleteDataCatalog = Action("DeleteDataCatalog")
-DeleteNamedQuery = Action("DeleteNamedQuery")
-DeletePreparedStatement = Action("DeletePreparedStatement")
-DeleteWorkGroup = Action("DeleteWorkGroup")
-GetCatalogs = Action("GetCatalogs")
-GetDataCatalog = Action("GetDataCatalog")
-GetDatabase = Action("GetDatabase")
-GetExecutionEngine = Action("GetExecutionEngine")
-GetExecutionEngines = Action("GetExecutionEngines")
-GetNamedQuery = Action("GetNamedQuery")
-GetNamespace = Action("GetNamespace")
-GetNamespaces = Action("GetNamespaces")
-GetPreparedStatement = Action("GetPreparedStatement")
-GetQueryExecution = Action("GetQueryExecution")
-GetQueryExecutions = Action("GetQueryExecutions")
-GetQueryResults = Action("GetQueryResults")
-GetQueryResultsStream = Action("GetQueryResultsStream")
-GetTable = Action("GetTable")
-GetTableMetadata = Action("GetTableMetadata")
-GetTables = Action("GetTables")
-GetWorkGroup = Action("GetWorkGroup")
-ListDataCatalogs = Action("ListDataCatalogs")
-ListDatabases = Action("ListDatabases")
-ListEngineVersions = Action("ListEngineVersions")
-ListNamedQueries = Action("ListNamedQueries")
-ListPreparedStatements = Action("ListPreparedStatements")
-ListQueryExecutions = Action("ListQueryExecutions")
-ListTableMetadata = Action("ListTableMetadata")
-ListTagsForResource = Action("ListTagsForResource")
-ListWorkGroups = Action("ListWorkGroups")
-RunQuery = Action("RunQuery")
-StartQueryExecution = Action("StartQueryExecution")
-StopQueryExecution = Action("StopQueryExecution")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDataCatalog = Action("UpdateDataCatalog")
-UpdatePreparedStatement = Action("UpdatePreparedStatement")
-UpdateWorkGroup = Action("UpdateWorkGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
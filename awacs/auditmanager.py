@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,64 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateAssessmentReportEvidenceFolder = Action(
-    "AssociateAssessmentReportEvidenceFolder"
-)
-BatchAssociateAssessmentReportEvidence = Action(
-    "BatchAssociateAssessmentReportEvidence"
-)
-BatchCreateDelegationByAssessment = Action("BatchCreateDelegationByAssessment")
-BatchDeleteDelegationByAssessment = Action("BatchDeleteDelegationByAssessment")
-BatchDisassociateAssessmentReportEvidence = Action(
-    "BatchDisassociateAssessmentReportEvidence"
-)
-BatchImportEvidenceToAssessmentControl = Action(
-    "BatchImportEvidenceToAssessmentControl"
-)
-CreateAssessment = Action("CreateAssessment")
-CreateAssessmentFramework = Action("CreateAssessmentFramework")
-CreateAssessmentReport = Action("CreateAssessmentReport")
-CreateControl = Action("CreateControl")
-DeleteAssessment = Action("DeleteAssessment")
-DeleteAssessmentFramework = Action("DeleteAssessmentFramework")
-DeleteAssessmentReport = Action("DeleteAssessmentReport")
-DeleteControl = Action("DeleteControl")
-DeregisterAccount = Action("DeregisterAccount")
-DeregisterOrganizationAdminAccount = Action("DeregisterOrganizationAdminAccount")
-DisassociateAssessmentReportEvidenceFolder = Action(
-    "DisassociateAssessmentReportEvidenceFolder"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-GetAccountStatus = Action("GetAccountStatus")
-GetAssessment = Action("GetAssessment")
-GetAssessmentFramework = Action("GetAssessmentFramework")
-GetAssessmentReportUrl = Action("GetAssessmentReportUrl")
-GetChangeLogs = Action("GetChangeLogs")
-GetControl = Action("GetControl")
-GetDelegations = Action("GetDelegations")
-GetEvidence = Action("GetEvidence")
-GetEvidenceByEvidenceFolder = Action("GetEvidenceByEvidenceFolder")
-GetEvidenceFolder = Action("GetEvidenceFolder")
-GetEvidenceFoldersByAssessment = Action("GetEvidenceFoldersByAssessment")
-GetEvidenceFoldersByAssessmentControl = Action("GetEvidenceFoldersByAssessmentControl")
-GetOrganizationAdminAccount = Action("GetOrganizationAdminAccount")
-GetServicesInScope = Action("GetServicesInScope")
-GetSettings = Action("GetSettings")
-ListAssessmentFrameworks = Action("ListAssessmentFrameworks")
-ListAssessmentReports = Action("ListAssessmentReports")
-ListAssessments = Action("ListAssessments")
-ListControls = Action("ListControls")
-ListKeywordsForDataSource = Action("ListKeywordsForDataSource")
-ListNotifications = Action("ListNotifications")
-ListTagsForResource = Action("ListTagsForResource")
-RegisterAccount = Action("RegisterAccount")
-RegisterOrganizationAdminAccount = Action("RegisterOrganizationAdminAccount")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAssessment = Action("UpdateAssessment")
-UpdateAssessmentControl = Action("UpdateAssessmentControl")
-UpdateAssessmentControlSetStatus = Action("UpdateAssessmentControlSetStatus")
-UpdateAssessmentFramework = Action("UpdateAssessmentFramework")
-UpdateAssessmentStatus = Action("UpdateAssessmentStatus")
-UpdateControl = Action("UpdateControl")
-UpdateSettings = Action("UpdateSettings")
-ValidateAssessmentReportIntegrity = Action("ValidateAssessmentReportIntegrity")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
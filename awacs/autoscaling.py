@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,60 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AttachInstances = Action("AttachInstances")
-AttachLoadBalancerTargetGroups = Action("AttachLoadBalancerTargetGroups")
-AttachLoadBalancers = Action("AttachLoadBalancers")
-BatchDeleteScheduledAction = Action("BatchDeleteScheduledAction")
-BatchPutScheduledUpdateGroupAction = Action("BatchPutScheduledUpdateGroupAction")
-CancelInstanceRefresh = Action("CancelInstanceRefresh")
-CompleteLifecycleAction = Action("CompleteLifecycleAction")
-CreateAutoScalingGroup = Action("CreateAutoScalingGroup")
-CreateLaunchConfiguration = Action("CreateLaunchConfiguration")
-CreateOrUpdateTags = Action("CreateOrUpdateTags")
-DeleteAutoScalingGroup = Action("DeleteAutoScalingGroup")
-DeleteLaunchConfiguration = Action("DeleteLaunchConfiguration")
-DeleteLifecycleHook = Action("DeleteLifecycleHook")
-DeleteNotificationConfiguration = Action("DeleteNotificationConfiguration")
-DeletePolicy = Action("DeletePolicy")
-DeleteScheduledAction = Action("DeleteScheduledAction")
-DeleteTags = Action("DeleteTags")
-DescribeAccountLimits = Action("DescribeAccountLimits")
-DescribeAdjustmentTypes = Action("DescribeAdjustmentTypes")
-DescribeAutoScalingGroups = Action("DescribeAutoScalingGroups")
-DescribeAutoScalingInstances = Action("DescribeAutoScalingInstances")
-DescribeAutoScalingNotificationTypes = Action("DescribeAutoScalingNotificationTypes")
-DescribeInstanceRefreshes = Action("DescribeInstanceRefreshes")
-DescribeLaunchConfigurations = Action("DescribeLaunchConfigurations")
-DescribeLifecycleHookTypes = Action("DescribeLifecycleHookTypes")
-DescribeLifecycleHooks = Action("DescribeLifecycleHooks")
-DescribeLoadBalancerTargetGroups = Action("DescribeLoadBalancerTargetGroups")
-DescribeLoadBalancers = Action("DescribeLoadBalancers")
-DescribeMetricCollectionTypes = Action("DescribeMetricCollectionTypes")
-DescribeNotificationConfigurations = Action("DescribeNotificationConfigurations")
-DescribePolicies = Action("DescribePolicies")
-DescribeScalingActivities = Action("DescribeScalingActivities")
-DescribeScalingProcessTypes = Action("DescribeScalingProcessTypes")
-DescribeScheduledActions = Action("DescribeScheduledActions")
-DescribeTags = Action("DescribeTags")
-DescribeTerminationPolicyTypes = Action("DescribeTerminationPolicyTypes")
-DetachInstances = Action("DetachInstances")
-DetachLoadBalancerTargetGroups = Action("DetachLoadBalancerTargetGroups")
-DetachLoadBalancers = Action("DetachLoadBalancers")
-DisableMetricsCollection = Action("DisableMetricsCollection")
-EnableMetricsCollection = Action("EnableMetricsCollection")
-EnterStandby = Action("EnterStandby")
-ExecutePolicy = Action("ExecutePolicy")
-ExitStandby = Action("ExitStandby")
-PutLifecycleHook = Action("PutLifecycleHook")
-PutNotificationConfiguration = Action("PutNotificationConfiguration")
-PutScalingPolicy = Action("PutScalingPolicy")
-PutScheduledUpdateGroupAction = Action("PutScheduledUpdateGroupAction")
-RecordLifecycleActionHeartbeat = Action("RecordLifecycleActionHeartbeat")
-ResumeProcesses = Action("ResumeProcesses")
-SetDesiredCapacity = Action("SetDesiredCapacity")
-SetInstanceHealth = Action("SetInstanceHealth")
-SetInstanceProtection = Action("SetInstanceProtection")
-StartInstanceRefresh = Action("StartInstanceRefresh")
-SuspendProcesses = Action("SuspendProcesses")
-TerminateInstanceInAutoScalingGroup = Action("TerminateInstanceInAutoScalingGroup")
-UpdateAutoScalingGroup = Action("UpdateAutoScalingGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
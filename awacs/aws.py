@@ -3,11 +3,15 @@
 #
 # See LICENSE file for full license.
 
+import importlib
+import json
 import warnings
 from abc import ABCMeta, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from json.encoder import encode_basestring_ascii
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union
 
-from . import AWSHelperFn, AWSProperty
+from . import AWSHelperFn, AWSProperty, _copy_data, catalog, json_data
+from .conditions import Context, ContextPredicate, compile_conditions
 
 try:
     from typing import Literal  # type: ignore[attr-defined]
@@ -45,19 +49,156 @@ username = "aws:username"
 VpcSourceIp = "aws:VpcSourceIp"
 
 
-class Action(AWSHelperFn):
+# Interned actions by (prefix, action) and the (prefix, action) pair created
+# by each distinct constructor call, see ActionMeta.
+_interned_actions: Dict[Tuple[str, Optional[str]], "Action"] = {}
+_action_calls: Dict[Tuple[Any, ...], Tuple[str, Optional[str]]] = {}
+
+
+class ActionMeta(type):
+    """Metaclass interning Action instances per (prefix, action) pair.
+
+    Constructing an action which already exists returns the existing object
+    instead of a new one. When both the generic and a service specific class
+    are used for the same action, e.g. Action("s3", "GetObject") and
+    s3.GetObject, the instance of the more specific class is kept. Subclasses
+    are slotted unless they define __slots__ themselves.
+    """
+
+    def __new__(
+        mcs, name: str, bases: Tuple[type, ...], namespace: Dict[str, Any]
+    ) -> "ActionMeta":
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace)
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        call = (cls, args, tuple(kwargs.items())) if kwargs else (cls,) + args
+        key = _action_calls.get(call)
+        if key is not None and isinstance(_interned_actions[key], cls):
+            return _interned_actions[key]
+
+        service_class = None
+        if cls is Action:
+            # Actions of known services are built with the class of their
+            # service module, so there is one instance whichever is used first
+            prefix = kwargs.get("prefix", args[0] if args else None)
+            service_class = _service_action_class(prefix)
+        if service_class is not None:
+            name = kwargs.get("action", args[1] if len(args) > 1 else None)
+            action = service_class(name)
+        else:
+            action = super().__call__(*args, **kwargs)
+        key = (action.prefix, action.action)
+        interned = _interned_actions.get(key)
+        if interned is None:
+            interned = _interned_actions[key] = action
+        elif not isinstance(interned, cls):
+            if isinstance(action, type(interned)):
+                # Keep the more specific class interned
+                _interned_actions[key] = action
+            # else an unrelated subclass, keep the first one interned
+            interned = action
+        _action_calls[call] = key
+        return interned
+
+
+def _service_action_class(prefix: Any) -> Any:
+    """Return the Action class of the module of a known service, or None."""
+    try:
+        module_name = catalog.module_name(prefix)
+    except (KeyError, TypeError):
+        return None
+    return importlib.import_module("awacs.%s" % (module_name,)).Action
+
+
+# Actions by their string, see Action.from_string()
+_parsed_actions: Dict[str, "Action"] = {}
+
+
+class Action(AWSHelperFn, metaclass=ActionMeta):
+    __slots__ = ("prefix", "action", "_data", "_hash")
+
+    prefix: str
+    action: Optional[str]
+    _data: str
+    _hash: int
+
     def __init__(self, prefix: str, action: str = None) -> None:
-        self.prefix = prefix
         if prefix == "*" and action:
             raise ValueError("Action not supported with wildcard prefix")
+        if prefix == "*" or not action:
+            data = prefix
         else:
-            self.action = action
+            data = "".join([prefix, ":", action])
+        object.__setattr__(self, "prefix", prefix)
+        object.__setattr__(self, "action", action)
+        object.__setattr__(self, "_data", data)
+        object.__setattr__(self, "_hash", hash(data))
+
+    @staticmethod
+    def from_string(value: str) -> "Action":
+        """Return the Action for a string like "s3:GetObject".
+
+        Actions of known services are created with the Action class of the
+        service module, so catalog actions are the interned constants of the
+        service module, e.g. s3.GetObject. Catalog actions are matched
+        ignoring case, other actions keep the case they are written in.
+        """
+        try:
+            return _parsed_actions[value]
+        except KeyError:
+            pass
+        try:
+            spelled = catalog.action_names()[catalog.action_index(value)]
+        except KeyError:
+            spelled = value
+        prefix, _, name = spelled.partition(":")
+        action = Action(prefix, name or None)
+        _parsed_actions[value] = action
+        return action
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("'%s' object is immutable" % (type(self).__name__,))
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("'%s' object is immutable" % (type(self).__name__,))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (Action, (self.prefix, self.action))
+
+    def __copy__(self) -> "Action":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Action":
+        return self
 
     def JSONrepr(self) -> str:
-        if self.prefix == "*" or not self.action:
-            return self.prefix
-        else:
-            return "".join([self.prefix, ":", self.action])
+        return self._data
+
+    def _canonical(self) -> str:
+        return self._data
+
+    def _json_data(self) -> str:
+        return self._data
+
+    def _json_size(self) -> int:
+        return len(encode_basestring_ascii(self._data))
+
+    def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, Action):
+            return self._data == other._data
+        return False
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return "<%s %s>" % (type(self).__name__, self._data)
 
 
 class BaseARN(AWSHelperFn):
@@ -134,6 +275,19 @@ class ConditionElement(AWSHelperFn, metaclass=ABCMeta):
     def condition(self) -> str:
         raise NotImplementedError
 
+    def _json_data(self) -> Any:
+        return json_data({self.condition: self.get_dict()})
+
+    def predicate(self) -> ContextPredicate:
+        """Return the compiled predicate of this element, see Condition."""
+        cache = self._cached()
+        try:
+            return cache["predicate"]
+        except KeyError:
+            predicate = compile_conditions(self._json_data())
+            cache["predicate"] = predicate
+            return predicate
+
 
 class Condition(AWSHelperFn):
     def __init__(
@@ -149,12 +303,58 @@ class Condition(AWSHelperFn):
         else:
             raise TypeError
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Condition":
+        """Create a Condition from its JSON data.
+
+        Each operator, e.g. "ForAnyValue:StringLike", becomes an instance of
+        the matching ConditionElement subclass.
+        """
+        conditions = []
+        for operator, values in data.items():
+            try:
+                element_class = _condition_types[operator]
+            except KeyError as exc:
+                raise ValueError("Unknown condition operator %s" % (operator,)) from exc
+            conditions.append(element_class(_copy_data(values)))
+        return cls(conditions)
+
     def JSONrepr(self) -> dict:
         d = {}
         for c in self.conditions:
             d[c.condition] = c.get_dict()
         return d
 
+    def predicate(self) -> ContextPredicate:
+        """Return the compiled predicate of this condition.
+
+        The predicate takes a mapping of lowercased condition keys to lists
+        of values and tells whether all the condition elements match it, see
+        awacs.conditions. It is compiled once and cached on this object.
+        """
+        cache = self._cached()
+        try:
+            return cache["predicate"]
+        except KeyError:
+            pass
+        predicates = [c.predicate() for c in self.conditions]
+
+        def predicate(context: Context) -> bool:
+            for p in predicates:
+                if not p(context):
+                    return False
+            return True
+
+        cache["predicate"] = predicate
+        return predicate
+
+    def matches(self, context: Mapping[str, Any]) -> bool:
+        """Return whether the condition matches the condition keys of a request.
+
+        The context maps condition keys to a value or a list of values.
+        """
+        return self.predicate()({k.lower(): _as_list(v) for k, v in context.items()})
+
 
 class Principal(AWSHelperFn):
     data: Union[Literal["*"], Dict[str, Any]]
@@ -174,6 +374,13 @@ class Principal(AWSHelperFn):
                 )
             self.data = {principal: resources}
 
+    @classmethod
+    def from_data(cls, data: Union[Literal["*"], Dict[str, Any]]) -> "Principal":
+        """Create a Principal from its JSON data, without any checks."""
+        principal = cls.__new__(cls)
+        principal.data = _copy_data(data)
+        return principal
+
     def JSONrepr(self) -> Union[Literal["*"], Dict[str, Any]]:
         return self.data
 
@@ -202,6 +409,35 @@ class Statement(AWSProperty):
         "Sid": (str, False),
     }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Statement":
+        """Create a Statement from its JSON data, see Policy.from_dict().
+
+        The lists and dicts of the data are copied, not shared with the
+        statement.
+        """
+        kwargs = dict(data)
+        for key in ("Action", "NotAction"):
+            if key in kwargs:
+                kwargs[key] = [Action.from_string(a) for a in _as_list(kwargs[key])]
+        for key in ("Resource", "NotResource"):
+            if key in kwargs:
+                kwargs[key] = list(_as_list(kwargs[key]))
+        for key in ("Principal", "NotPrincipal"):
+            if key in kwargs:
+                kwargs[key] = Principal.from_data(kwargs[key])
+        if "Condition" in kwargs:
+            kwargs["Condition"] = Condition.from_dict(kwargs["Condition"])
+        return cls.construct(**kwargs)
+
+
+def _as_list(value: Any) -> List[Any]:
+    # A single value is allowed in place of a list of one
+    return value if isinstance(value, list) else [value]
+
+
+PolicyT = TypeVar("PolicyT", bound="Policy")
+
 
 class Policy(AWSProperty):
     props = {
@@ -210,6 +446,34 @@ class Policy(AWSProperty):
         "Version": (str, False),
     }
 
+    @classmethod
+    def from_dict(cls: Type[PolicyT], data: dict) -> PolicyT:
+        """Create a Policy from the data of a JSON policy document.
+
+        The data is trusted, so the objects are created without the checks
+        done on assignment, see AWSObject.construct(). Single values given in
+        place of lists, e.g. "Action": "s3:GetObject", are turned into lists.
+        Actions are resolved to the constants of their service module and
+        conditions to the matching ConditionElement subclasses.
+        """
+        kwargs = dict(data)
+        if "Statement" in kwargs:
+            kwargs["Statement"] = [
+                Statement.from_dict(s) for s in _as_list(kwargs["Statement"])
+            ]
+        return cls.construct(**kwargs)
+
+    @classmethod
+    def from_json(cls: Type[PolicyT], s: Union[str, bytes]) -> PolicyT:
+        """Create a Policy from a JSON policy document, see from_dict()."""
+        return cls.from_dict(json.loads(s))
+
+    def fingerprint(self) -> str:
+        """Return a stable 128-bit hash of the content, see analysis.fingerprint()."""
+        from .analysis import fingerprint
+
+        return fingerprint(self)
+
     def JSONrepr(self) -> dict:
         return self.properties
 
@@ -249,6 +513,9 @@ _condition_strings = [
 
 _condition_qualifier_strings = ["ForAnyValue", "ForAllValues"]
 
+# ConditionElement subclasses by condition operator, see Condition.from_dict()
+_condition_types: Dict[str, Type[ConditionElement]] = {}
+
 
 def make_condition(type_name: str, condition_name: str) -> None:
     globals()[type_name] = type(
@@ -259,6 +526,8 @@ def make_condition(type_name: str, condition_name: str) -> None:
         (ConditionElement,),
         dict(condition=condition_name + "IfExists"),
     )
+    _condition_types[condition_name] = globals()[type_name]
+    _condition_types[condition_name + "IfExists"] = globals()[type_name + "IfExists"]
 
 
 # Create condition classes
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,59 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptAgreementApprovalRequest = Action("AcceptAgreementApprovalRequest")
-AssociateProductsWithPrivateMarketplace = Action(
-    "AssociateProductsWithPrivateMarketplace"
-)
-BatchMeterUsage = Action("BatchMeterUsage")
-CancelAgreementRequest = Action("CancelAgreementRequest")
-CancelChangeSet = Action("CancelChangeSet")
-CompleteTask = Action("CompleteTask")
-CreatePrivateMarketplace = Action("CreatePrivateMarketplace")
-CreatePrivateMarketplaceProfile = Action("CreatePrivateMarketplaceProfile")
-CreatePrivateMarketplaceRequests = Action("CreatePrivateMarketplaceRequests")
-DescribeAgreement = Action("DescribeAgreement")
-DescribeBuilds = Action("DescribeBuilds")
-DescribeChangeSet = Action("DescribeChangeSet")
-DescribeEntity = Action("DescribeEntity")
-DescribePrivateMarketplaceProducts = Action("DescribePrivateMarketplaceProducts")
-DescribePrivateMarketplaceProfile = Action("DescribePrivateMarketplaceProfile")
-DescribePrivateMarketplaceRequests = Action("DescribePrivateMarketplaceRequests")
-DescribePrivateMarketplaceSettings = Action("DescribePrivateMarketplaceSettings")
-DescribePrivateMarketplaceStatus = Action("DescribePrivateMarketplaceStatus")
-DescribeProcurementSystemConfiguration = Action(
-    "DescribeProcurementSystemConfiguration"
-)
-DescribeTask = Action("DescribeTask")
-DisassociateProductsFromPrivateMarketplace = Action(
-    "DisassociateProductsFromPrivateMarketplace"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-GetAgreementApprovalRequest = Action("GetAgreementApprovalRequest")
-GetAgreementRequest = Action("GetAgreementRequest")
-GetAgreementTerms = Action("GetAgreementTerms")
-GetEntitlements = Action("GetEntitlements")
-ListAgreementApprovalRequests = Action("ListAgreementApprovalRequests")
-ListAgreementRequests = Action("ListAgreementRequests")
-ListBuilds = Action("ListBuilds")
-ListChangeSets = Action("ListChangeSets")
-ListEntities = Action("ListEntities")
-ListPrivateMarketplaceProducts = Action("ListPrivateMarketplaceProducts")
-ListPrivateMarketplaceRequests = Action("ListPrivateMarketplaceRequests")
-ListTasks = Action("ListTasks")
-MeterUsage = Action("MeterUsage")
-PutProcurementSystemConfiguration = Action("PutProcurementSystemConfiguration")
-RegisterUsage = Action("RegisterUsage")
-RejectAgreementApprovalRequest = Action("RejectAgreementApprovalRequest")
-ResolveCustomer = Action("ResolveCustomer")
-SearchAgreements = Action("SearchAgreements")
-StartBuild = Action("StartBuild")
-StartChangeSet = Action("StartChangeSet")
-StartPrivateMarketplace = Action("StartPrivateMarketplace")
-StopPrivateMarketplace = Action("StopPrivateMarketplace")
-Subscribe = Action("Subscribe")
-Unsubscribe = Action("Unsubscribe")
-UpdateAgreementApprovalRequest = Action("UpdateAgreementApprovalRequest")
-UpdatePrivateMarketplaceProfile = Action("UpdatePrivateMarketplaceProfile")
-UpdatePrivateMarketplaceSettings = Action("UpdatePrivateMarketplaceSettings")
-UpdateTask = Action("UpdateTask")
-ViewSubscriptions = Action("ViewSubscriptions")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,64 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddLayerVersionPermission = Action("AddLayerVersionPermission")
-AddPermission = Action("AddPermission")
-CreateAlias = Action("CreateAlias")
-CreateCodeSigningConfig = Action("CreateCodeSigningConfig")
-CreateEventSourceMapping = Action("CreateEventSourceMapping")
-CreateFunction = Action("CreateFunction")
-DeleteAlias = Action("DeleteAlias")
-DeleteCodeSigningConfig = Action("DeleteCodeSigningConfig")
-DeleteEventSourceMapping = Action("DeleteEventSourceMapping")
-DeleteFunction = Action("DeleteFunction")
-DeleteFunctionCodeSigningConfig = Action("DeleteFunctionCodeSigningConfig")
-DeleteFunctionConcurrency = Action("DeleteFunctionConcurrency")
-DeleteFunctionEventInvokeConfig = Action("DeleteFunctionEventInvokeConfig")
-DeleteLayerVersion = Action("DeleteLayerVersion")
-DeleteProvisionedConcurrencyConfig = Action("DeleteProvisionedConcurrencyConfig")
-DisableReplication = Action("DisableReplication")
-EnableReplication = Action("EnableReplication")
-GetAccountSettings = Action("GetAccountSettings")
-GetAlias = Action("GetAlias")
-GetCodeSigningConfig = Action("GetCodeSigningConfig")
-GetEventSourceMapping = Action("GetEventSourceMapping")
-GetFunction = Action("GetFunction")
-GetFunctionCodeSigningConfig = Action("GetFunctionCodeSigningConfig")
-GetFunctionConcurrency = Action("GetFunctionConcurrency")
-GetFunctionConfiguration = Action("GetFunctionConfiguration")
-GetFunctionEventInvokeConfig = Action("GetFunctionEventInvokeConfig")
-GetLayerVersion = Action("GetLayerVersion")
-GetLayerVersionByArn = Action("GetLayerVersionByArn")
-GetLayerVersionPolicy = Action("GetLayerVersionPolicy")
-GetPolicy = Action("GetPolicy")
-GetProvisionedConcurrencyConfig = Action("GetProvisionedConcurrencyConfig")
-InvokeAsync = Action("InvokeAsync")
-InvokeFunction = Action("InvokeFunction")
-ListAliases = Action("ListAliases")
-ListCodeSigningConfigs = Action("ListCodeSigningConfigs")
-ListEventSourceMappings = Action("ListEventSourceMappings")
-ListFunctionEventInvokeConfigs = Action("ListFunctionEventInvokeConfigs")
-ListFunctions = Action("ListFunctions")
-ListFunctionsByCodeSigningConfig = Action("ListFunctionsByCodeSigningConfig")
-ListLayerVersions = Action("ListLayerVersions")
-ListLayers = Action("ListLayers")
-ListProvisionedConcurrencyConfigs = Action("ListProvisionedConcurrencyConfigs")
-ListTags = Action("ListTags")
-ListVersionsByFunction = Action("ListVersionsByFunction")
-PublishLayerVersion = Action("PublishLayerVersion")
-PublishVersion = Action("PublishVersion")
-PutFunctionCodeSigningConfig = Action("PutFunctionCodeSigningConfig")
-PutFunctionConcurrency = Action("PutFunctionConcurrency")
-PutFunctionEventInvokeConfig = Action("PutFunctionEventInvokeConfig")
-PutProvisionedConcurrencyConfig = Action("PutProvisionedConcurrencyConfig")
-RemoveLayerVersionPermission = Action("RemoveLayerVersionPermission")
-RemovePermission = Action("RemovePermission")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAlias = Action("UpdateAlias")
-UpdateCodeSigningConfig = Action("UpdateCodeSigningConfig")
-UpdateEventSourceMapping = Action("UpdateEventSourceMapping")
-UpdateFunctionCode = Action("UpdateFunctionCode")
-UpdateFunctionCodeSigningConfig = Action("UpdateFunctionCodeSigningConfig")
-UpdateFunctionConfiguration = Action("UpdateFunctionConfiguration")
-UpdateFunctionEventInvokeConfig = Action("UpdateFunctionEventInvokeConfig")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
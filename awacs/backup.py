@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,56 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CopyFromBackupVault = Action("CopyFromBackupVault")
-CopyIntoBackupVault = Action("CopyIntoBackupVault")
-CreateBackupPlan = Action("CreateBackupPlan")
-CreateBackupSelection = Action("CreateBackupSelection")
-CreateBackupVault = Action("CreateBackupVault")
-DeleteBackupPlan = Action("DeleteBackupPlan")
-DeleteBackupSelection = Action("DeleteBackupSelection")
-DeleteBackupVault = Action("DeleteBackupVault")
-DeleteBackupVaultAccessPolicy = Action("DeleteBackupVaultAccessPolicy")
-DeleteBackupVaultNotifications = Action("DeleteBackupVaultNotifications")
-DeleteRecoveryPoint = Action("DeleteRecoveryPoint")
-DescribeBackupJob = Action("DescribeBackupJob")
-DescribeBackupVault = Action("DescribeBackupVault")
-DescribeCopyJob = Action("DescribeCopyJob")
-DescribeGlobalSettings = Action("DescribeGlobalSettings")
-DescribeProtectedResource = Action("DescribeProtectedResource")
-DescribeRecoveryPoint = Action("DescribeRecoveryPoint")
-DescribeRegionSettings = Action("DescribeRegionSettings")
-DescribeRestoreJob = Action("DescribeRestoreJob")
-DisassociateRecoveryPoint = Action("DisassociateRecoveryPoint")
-ExportBackupPlanTemplate = Action("ExportBackupPlanTemplate")
-GetBackupPlan = Action("GetBackupPlan")
-GetBackupPlanFromJSON = Action("GetBackupPlanFromJSON")
-GetBackupPlanFromTemplate = Action("GetBackupPlanFromTemplate")
-GetBackupSelection = Action("GetBackupSelection")
-GetBackupVaultAccessPolicy = Action("GetBackupVaultAccessPolicy")
-GetBackupVaultNotifications = Action("GetBackupVaultNotifications")
-GetRecoveryPointRestoreMetadata = Action("GetRecoveryPointRestoreMetadata")
-GetSupportedResourceTypes = Action("GetSupportedResourceTypes")
-ListBackupJobs = Action("ListBackupJobs")
-ListBackupPlanTemplates = Action("ListBackupPlanTemplates")
-ListBackupPlanVersions = Action("ListBackupPlanVersions")
-ListBackupPlans = Action("ListBackupPlans")
-ListBackupSelections = Action("ListBackupSelections")
-ListBackupVaults = Action("ListBackupVaults")
-ListCopyJobs = Action("ListCopyJobs")
-ListProtectedResources = Action("ListProtectedResources")
-ListRecoveryPointsByBackupVault = Action("ListRecoveryPointsByBackupVault")
-ListRecoveryPointsByResource = Action("ListRecoveryPointsByResource")
-ListRestoreJobs = Action("ListRestoreJobs")
-ListTags = Action("ListTags")
-PutBackupVaultAccessPolicy = Action("PutBackupVaultAccessPolicy")
-PutBackupVaultNotifications = Action("PutBackupVaultNotifications")
-StartBackupJob = Action("StartBackupJob")
-StartCopyJob = Action("StartCopyJob")
-StartRestoreJob = Action("StartRestoreJob")
-StopBackupJob = Action("StopBackupJob")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateBackupPlan = Action("UpdateBackupPlan")
-UpdateGlobalSettings = Action("UpdateGlobalSettings")
-UpdateRecoveryPointLifecycle = Action("UpdateRecoveryPointLifecycle")
-UpdateRegionSettings = Action("UpdateRegionSettings")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
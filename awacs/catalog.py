@@ -0,0 +1,228 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Catalog of the IAM actions of every service known to awacs.
+
+The catalog is generated by scrape/scrape.py into catalog.json, a table of
+the sorted action names of each service indexed by service prefix. The
+service modules (awacs.s3, awacs.ec2, ...) build their Action constants from
+it, and tools can use it to list the actions of a service without importing
+the service module or to expand wildcard actions, see expand_actions().
+"""
+
+import json
+import pkgutil
+import re
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from os.path import commonprefix
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from .conditions import translate
+
+if TYPE_CHECKING:
+    from .aws import Action
+
+CATALOG = "catalog.json"
+
+
+@lru_cache(maxsize=None)
+def _load() -> Dict[str, Dict[str, Any]]:
+    data = pkgutil.get_data(__package__, CATALOG)
+    if data is None:
+        raise FileNotFoundError(CATALOG)
+    return json.loads(data)
+
+
+def prefixes() -> List[str]:
+    """Return the sorted service prefixes in the catalog."""
+    return sorted(_load())
+
+
+@lru_cache(maxsize=None)
+def actions(prefix: str) -> Tuple[str, ...]:
+    """Return the sorted action names of the service with the given prefix."""
+    return tuple(_load()[prefix]["actions"])
+
+
+def service_name(prefix: str) -> str:
+    """Return the service name, e.g. "Amazon S3" for "s3"."""
+    return _load()[prefix]["name"]
+
+
+def module_name(prefix: str) -> str:
+    """Return the name of the awacs module for a service prefix.
+
+    This is usually the prefix with dashes replaced by underscores, except
+    for names which are not valid module names, e.g. "awslambda" for "lambda".
+    """
+    return _load()[prefix]["module"]
+
+
+def expand_actions(pattern: Union[str, "Action"]) -> Tuple["Action", ...]:
+    """Return the catalog actions covered by an action pattern.
+
+    The pattern is an Action or a string like "s3:Get*", "ec2:Describe?*",
+    "s3:*" or "*", matched case insensitively with the * and ? wildcards as
+    IAM does. The service prefix may contain wildcards too. The actions are
+    the constants of their service module, sorted by service prefix and then
+    by name, ignoring case.
+    """
+    if not isinstance(pattern, str):
+        pattern = pattern.JSONrepr()
+    return _expand(pattern.lower())
+
+
+@lru_cache(maxsize=65536)
+def _expand(pattern: str) -> Tuple["Action", ...]:
+    from .aws import Action
+
+    if pattern == "*":
+        service_pattern, action_pattern = "*", "*"
+    else:
+        service_pattern, sep, action_pattern = pattern.partition(":")
+        if not sep:
+            raise ValueError("Invalid action pattern %r" % (pattern,))
+    if "*" in service_pattern or "?" in service_pattern:
+        services = [p for p in prefixes() if fnmatchcase(p, service_pattern)]
+    elif service_pattern in _load():
+        services = [service_pattern]
+    else:
+        services = []
+    return tuple(
+        Action.from_string("%s:%s" % (prefix, name))
+        for prefix in services
+        for name in _match(prefix, action_pattern)
+    )
+
+
+@lru_cache(maxsize=None)
+def _index(prefix: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    # The lowercased action names in sorted order and the names themselves,
+    # so the actions starting with a given prefix are a contiguous range.
+    names = sorted(actions(prefix), key=str.lower)
+    return tuple(name.lower() for name in names), tuple(names)
+
+
+def _match(prefix: str, pattern: str) -> Tuple[str, ...]:
+    """Return the action names of a service matching a lowercase pattern."""
+    lowered, names = _index(prefix)
+    literal = re.split(r"[*?]", pattern, 1)[0]
+    start = bisect_left(lowered, literal)
+    if literal == pattern:
+        if start < len(lowered) and lowered[start] == pattern:
+            return names[start : start + 1]
+        return ()
+    # All names starting with the literal part of the pattern
+    end = bisect_left(lowered, literal + "\x7f", start)
+    if pattern == literal + "*":
+        return names[start:end]
+    fullmatch = _compile(pattern)
+    return tuple(
+        names[i] for i in range(start, end) if fullmatch(lowered[i]) is not None
+    )
+
+
+class PrefixNode(NamedTuple):
+    """A node of the prefix trie of the actions of a service.
+
+    The actions under a node are those whose name starts with its prefix,
+    positions start to end of the names sorted ignoring case, and a
+    wildcard "short*" covers exactly those. The trie is compressed: a node
+    only branches or ends an action.
+    """
+
+    # The longest and shortest prefix selecting the actions of the node
+    prefix: str
+    short: str
+    start: int
+    end: int
+    # The name of the action equal to the prefix, if any
+    action: Optional[str]
+    children: Tuple["PrefixNode", ...]
+
+    @property
+    def size(self) -> int:
+        """The number of actions under the node."""
+        return self.end - self.start
+
+
+@lru_cache(maxsize=None)
+def prefix_trie(prefix: str) -> PrefixNode:
+    """Return the root of the prefix trie of the actions of a service."""
+    lowered, names = _index(prefix)
+    if not names:
+        return PrefixNode("", "", 0, 0, None, ())
+    return _trie_node(lowered, names, 0, len(names), "")
+
+
+def action_position(prefix: str, name: str) -> int:
+    """Return the position of an action in the prefix trie of its service.
+
+    This is its position among the actions of the service sorted ignoring
+    case, as PrefixNode.start and end. The prefix and name are matched
+    ignoring case. Raises KeyError for actions which are not in the catalog.
+    """
+    lowered = _index(prefix.lower())[0]
+    position = bisect_left(lowered, name.lower())
+    if position < len(lowered) and lowered[position] == name.lower():
+        return position
+    raise KeyError("%s:%s" % (prefix, name))
+
+
+def _trie_node(
+    lowered: Tuple[str, ...], names: Tuple[str, ...], start: int, end: int, short: str
+) -> PrefixNode:
+    # The names are sorted, so the common prefix of the range is the one of
+    # its first and last names, and the first name is the shortest.
+    depth = len(commonprefix([lowered[start], lowered[end - 1]]))
+    action = names[start] if len(lowered[start]) == depth else None
+    children = []
+    i = start if action is None else start + 1
+    while i < end:
+        j = bisect_left(lowered, lowered[i][: depth + 1] + "\x7f", i, end)
+        children.append(_trie_node(lowered, names, i, j, names[i][: depth + 1]))
+        i = j
+    return PrefixNode(names[start][:depth], short, start, end, action, tuple(children))
+
+
+@lru_cache(maxsize=4096)
+def _compile(pattern: str) -> Any:
+    return re.compile(translate(pattern), re.DOTALL).fullmatch
+
+
+@lru_cache(maxsize=None)
+def action_names() -> Tuple[str, ...]:
+    """Return every catalog action as a "prefix:Action" string.
+
+    The position of an action in this tuple is its catalog index, see
+    action_index().
+    """
+    return tuple("%s:%s" % (p, name) for p in prefixes() for name in actions(p))
+
+
+@lru_cache(maxsize=None)
+def _action_indexes() -> Tuple[Dict[str, int], Dict[str, int]]:
+    names = action_names()
+    exact = {name: i for i, name in enumerate(names)}
+    lowered: Dict[str, int] = {}
+    for i, name in enumerate(names):
+        lowered.setdefault(name.lower(), i)
+    return exact, lowered
+
+
+def action_index(action: Union[str, "Action"]) -> int:
+    """Return the catalog index of an action, matched ignoring case.
+
+    Raises KeyError for actions which are not in the catalog.
+    """
+    if not isinstance(action, str):
+        action = action.JSONrepr()
+    exact, lowered = _action_indexes()
+    try:
+        return exact[action]
+    except KeyError:
+        return lowered[action.lower()]
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,43 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateAnomalyMonitor = Action("CreateAnomalyMonitor")
-CreateAnomalySubscription = Action("CreateAnomalySubscription")
-CreateCostCategoryDefinition = Action("CreateCostCategoryDefinition")
-CreateNotificationSubscription = Action("CreateNotificationSubscription")
-CreateReport = Action("CreateReport")
-DeleteAnomalyMonitor = Action("DeleteAnomalyMonitor")
-DeleteAnomalySubscription = Action("DeleteAnomalySubscription")
-DeleteCostCategoryDefinition = Action("DeleteCostCategoryDefinition")
-DeleteNotificationSubscription = Action("DeleteNotificationSubscription")
-DeleteReport = Action("DeleteReport")
-DescribeCostCategoryDefinition = Action("DescribeCostCategoryDefinition")
-DescribeNotificationSubscription = Action("DescribeNotificationSubscription")
-DescribeReport = Action("DescribeReport")
-GetAnomalies = Action("GetAnomalies")
-GetAnomalyMonitors = Action("GetAnomalyMonitors")
-GetAnomalySubscriptions = Action("GetAnomalySubscriptions")
-GetCostAndUsage = Action("GetCostAndUsage")
-GetCostAndUsageWithResources = Action("GetCostAndUsageWithResources")
-GetCostCategories = Action("GetCostCategories")
-GetCostForecast = Action("GetCostForecast")
-GetDimensionValues = Action("GetDimensionValues")
-GetPreferences = Action("GetPreferences")
-GetReservationCoverage = Action("GetReservationCoverage")
-GetReservationPurchaseRecommendation = Action("GetReservationPurchaseRecommendation")
-GetReservationUtilization = Action("GetReservationUtilization")
-GetRightsizingRecommendation = Action("GetRightsizingRecommendation")
-GetSavingsPlansCoverage = Action("GetSavingsPlansCoverage")
-GetSavingsPlansPurchaseRecommendation = Action("GetSavingsPlansPurchaseRecommendation")
-GetSavingsPlansUtilization = Action("GetSavingsPlansUtilization")
-GetSavingsPlansUtilizationDetails = Action("GetSavingsPlansUtilizationDetails")
-GetTags = Action("GetTags")
-GetUsageForecast = Action("GetUsageForecast")
-ListCostCategoryDefinitions = Action("ListCostCategoryDefinitions")
-ProvideAnomalyFeedback = Action("ProvideAnomalyFeedback")
-UpdateAnomalyMonitor = Action("UpdateAnomalyMonitor")
-UpdateAnomalySubscription = Action("UpdateAnomalySubscription")
-UpdateCostCategoryDefinition = Action("UpdateCostCategoryDefinition")
-UpdateNotificationSubscription = Action("UpdateNotificationSubscription")
-UpdatePreferences = Action("UpdatePreferences")
-UpdateReport = Action("UpdateReport")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,65 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddFacetToObject = Action("AddFacetToObject")
-ApplySchema = Action("ApplySchema")
-AttachObject = Action("AttachObject")
-AttachPolicy = Action("AttachPolicy")
-AttachToIndex = Action("AttachToIndex")
-AttachTypedLink = Action("AttachTypedLink")
-BatchRead = Action("BatchRead")
-BatchWrite = Action("BatchWrite")
-CreateDirectory = Action("CreateDirectory")
-CreateFacet = Action("CreateFacet")
-CreateIndex = Action("CreateIndex")
-CreateObject = Action("CreateObject")
-CreateSchema = Action("CreateSchema")
-CreateTypedLinkFacet = Action("CreateTypedLinkFacet")
-DeleteDirectory = Action("DeleteDirectory")
-DeleteFacet = Action("DeleteFacet")
-DeleteObject = Action("DeleteObject")
-DeleteSchema = Action("DeleteSchema")
-DeleteTypedLinkFacet = Action("DeleteTypedLinkFacet")
-DetachFromIndex = Action("DetachFromIndex")
-DetachObject = Action("DetachObject")
-DetachPolicy = Action("DetachPolicy")
-DetachTypedLink = Action("DetachTypedLink")
-DisableDirectory = Action("DisableDirectory")
-EnableDirectory = Action("EnableDirectory")
-GetDirectory = Action("GetDirectory")
-GetFacet = Action("GetFacet")
-GetLinkAttributes = Action("GetLinkAttributes")
-GetObjectAttributes = Action("GetObjectAttributes")
-GetObjectInformation = Action("GetObjectInformation")
-GetSchemaAsJson = Action("GetSchemaAsJson")
-GetTypedLinkFacetInformation = Action("GetTypedLinkFacetInformation")
-ListAppliedSchemaArns = Action("ListAppliedSchemaArns")
-ListAttachedIndices = Action("ListAttachedIndices")
-ListDevelopmentSchemaArns = Action("ListDevelopmentSchemaArns")
-ListDirectories = Action("ListDirectories")
-ListFacetAttributes = Action("ListFacetAttributes")
-ListFacetNames = Action("ListFacetNames")
-ListIncomingTypedLinks = Action("ListIncomingTypedLinks")
-ListIndex = Action("ListIndex")
-ListObjectAttributes = Action("ListObjectAttributes")
-ListObjectChildren = Action("ListObjectChildren")
-ListObjectParentPaths = Action("ListObjectParentPaths")
-ListObjectParents = Action("ListObjectParents")
-ListObjectPolicies = Action("ListObjectPolicies")
-ListOutgoingTypedLinks = Action("ListOutgoingTypedLinks")
-ListPolicyAttachments = Action("ListPolicyAttachments")
-ListPublishedSchemaArns = Action("ListPublishedSchemaArns")
-ListTagsForResource = Action("ListTagsForResource")
-ListTypedLinkFacetAttributes = Action("ListTypedLinkFacetAttributes")
-ListTypedLinkFacetNames = Action("ListTypedLinkFacetNames")
-LookupPolicy = Action("LookupPolicy")
-PublishSchema = Action("PublishSchema")
-PutSchemaFromJson = Action("PutSchemaFromJson")
-RemoveFacetFromObject = Action("RemoveFacetFromObject")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateFacet = Action("UpdateFacet")
-UpdateLinkAttributes = Action("UpdateLinkAttributes")
-UpdateObjectAttributes = Action("UpdateObjectAttributes")
-UpdateSchema = Action("UpdateSchema")
-UpdateTypedLinkFacet = Action("UpdateTypedLinkFacet")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
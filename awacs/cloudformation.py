@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,61 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelUpdateStack = Action("CancelUpdateStack")
-ContinueUpdateRollback = Action("ContinueUpdateRollback")
-CreateChangeSet = Action("CreateChangeSet")
-CreateStack = Action("CreateStack")
-CreateStackInstances = Action("CreateStackInstances")
-CreateStackSet = Action("CreateStackSet")
-CreateUploadBucket = Action("CreateUploadBucket")
-DeleteChangeSet = Action("DeleteChangeSet")
-DeleteStack = Action("DeleteStack")
-DeleteStackInstances = Action("DeleteStackInstances")
-DeleteStackSet = Action("DeleteStackSet")
-DeregisterType = Action("DeregisterType")
-DescribeAccountLimits = Action("DescribeAccountLimits")
-DescribeChangeSet = Action("DescribeChangeSet")
-DescribeStackDriftDetectionStatus = Action("DescribeStackDriftDetectionStatus")
-DescribeStackEvents = Action("DescribeStackEvents")
-DescribeStackInstance = Action("DescribeStackInstance")
-DescribeStackResource = Action("DescribeStackResource")
-DescribeStackResourceDrifts = Action("DescribeStackResourceDrifts")
-DescribeStackResources = Action("DescribeStackResources")
-DescribeStackSet = Action("DescribeStackSet")
-DescribeStackSetOperation = Action("DescribeStackSetOperation")
-DescribeStacks = Action("DescribeStacks")
-DescribeType = Action("DescribeType")
-DescribeTypeRegistration = Action("DescribeTypeRegistration")
-DetectStackDrift = Action("DetectStackDrift")
-DetectStackResourceDrift = Action("DetectStackResourceDrift")
-DetectStackSetDrift = Action("DetectStackSetDrift")
-EstimateTemplateCost = Action("EstimateTemplateCost")
-ExecuteChangeSet = Action("ExecuteChangeSet")
-GetStackPolicy = Action("GetStackPolicy")
-GetTemplate = Action("GetTemplate")
-GetTemplateSummary = Action("GetTemplateSummary")
-ListChangeSets = Action("ListChangeSets")
-ListExports = Action("ListExports")
-ListImports = Action("ListImports")
-ListStackInstances = Action("ListStackInstances")
-ListStackResources = Action("ListStackResources")
-ListStackSetOperationResults = Action("ListStackSetOperationResults")
-ListStackSetOperations = Action("ListStackSetOperations")
-ListStackSets = Action("ListStackSets")
-ListStacks = Action("ListStacks")
-ListTypeRegistrations = Action("ListTypeRegistrations")
-ListTypeVersions = Action("ListTypeVersions")
-ListTypes = Action("ListTypes")
-PreviewStackUpdate = Action("PreviewStackUpdate")
-RegisterType = Action("RegisterType")
-SetStackPolicy = Action("SetStackPolicy")
-SetTypeDefaultVersion = Action("SetTypeDefaultVersion")
-SignalResource = Action("SignalResource")
-StopStackSetOperation = Action("StopStackSetOperation")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateStack = Action("UpdateStack")
-UpdateStackInstances = Action("UpdateStackInstances")
-UpdateStackSet = Action("UpdateStackSet")
-UpdateTerminationProtection = Action("UpdateTerminationProtection")
-ValidateTemplate = Action("ValidateTemplate")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
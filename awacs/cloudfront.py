@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,67 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateCachePolicy = Action("CreateCachePolicy")
-CreateCloudFrontOriginAccessIdentity = Action("CreateCloudFrontOriginAccessIdentity")
-CreateDistribution = Action("CreateDistribution")
-CreateDistributionWithTags = Action("CreateDistributionWithTags")
-CreateFieldLevelEncryptionConfig = Action("CreateFieldLevelEncryptionConfig")
-CreateFieldLevelEncryptionProfile = Action("CreateFieldLevelEncryptionProfile")
-CreateInvalidation = Action("CreateInvalidation")
-CreateOriginRequestPolicy = Action("CreateOriginRequestPolicy")
-CreatePublicKey = Action("CreatePublicKey")
-CreateStreamingDistribution = Action("CreateStreamingDistribution")
-CreateStreamingDistributionWithTags = Action("CreateStreamingDistributionWithTags")
-DeleteCachePolicy = Action("DeleteCachePolicy")
-DeleteCloudFrontOriginAccessIdentity = Action("DeleteCloudFrontOriginAccessIdentity")
-DeleteDistribution = Action("DeleteDistribution")
-DeleteFieldLevelEncryptionConfig = Action("DeleteFieldLevelEncryptionConfig")
-DeleteFieldLevelEncryptionProfile = Action("DeleteFieldLevelEncryptionProfile")
-DeleteOriginRequestPolicy = Action("DeleteOriginRequestPolicy")
-DeletePublicKey = Action("DeletePublicKey")
-DeleteStreamingDistribution = Action("DeleteStreamingDistribution")
-GetCachePolicy = Action("GetCachePolicy")
-GetCachePolicyConfig = Action("GetCachePolicyConfig")
-GetCloudFrontOriginAccessIdentity = Action("GetCloudFrontOriginAccessIdentity")
-GetCloudFrontOriginAccessIdentityConfig = Action(
-    "GetCloudFrontOriginAccessIdentityConfig"
-)
-GetDistribution = Action("GetDistribution")
-GetDistributionConfig = Action("GetDistributionConfig")
-GetFieldLevelEncryption = Action("GetFieldLevelEncryption")
-GetFieldLevelEncryptionConfig = Action("GetFieldLevelEncryptionConfig")
-GetFieldLevelEncryptionProfile = Action("GetFieldLevelEncryptionProfile")
-GetFieldLevelEncryptionProfileConfig = Action("GetFieldLevelEncryptionProfileConfig")
-GetInvalidation = Action("GetInvalidation")
-GetOriginRequestPolicy = Action("GetOriginRequestPolicy")
-GetOriginRequestPolicyConfig = Action("GetOriginRequestPolicyConfig")
-GetPublicKey = Action("GetPublicKey")
-GetPublicKeyConfig = Action("GetPublicKeyConfig")
-GetStreamingDistribution = Action("GetStreamingDistribution")
-GetStreamingDistributionConfig = Action("GetStreamingDistributionConfig")
-ListCachePolicies = Action("ListCachePolicies")
-ListCloudFrontOriginAccessIdentities = Action("ListCloudFrontOriginAccessIdentities")
-ListDistributions = Action("ListDistributions")
-ListDistributionsByCachePolicyId = Action("ListDistributionsByCachePolicyId")
-ListDistributionsByLambdaFunction = Action("ListDistributionsByLambdaFunction")
-ListDistributionsByOriginRequestPolicyId = Action(
-    "ListDistributionsByOriginRequestPolicyId"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ListDistributionsByWebACLId = Action("ListDistributionsByWebACLId")
-ListFieldLevelEncryptionConfigs = Action("ListFieldLevelEncryptionConfigs")
-ListFieldLevelEncryptionProfiles = Action("ListFieldLevelEncryptionProfiles")
-ListInvalidations = Action("ListInvalidations")
-ListOriginRequestPolicies = Action("ListOriginRequestPolicies")
-ListPublicKeys = Action("ListPublicKeys")
-ListStreamingDistributions = Action("ListStreamingDistributions")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateCachePolicy = Action("UpdateCachePolicy")
-UpdateCloudFrontOriginAccessIdentity = Action("UpdateCloudFrontOriginAccessIdentity")
-UpdateDistribution = Action("UpdateDistribution")
-UpdateFieldLevelEncryptionConfig = Action("UpdateFieldLevelEncryptionConfig")
-UpdateFieldLevelEncryptionProfile = Action("UpdateFieldLevelEncryptionProfile")
-UpdateOriginRequestPolicy = Action("UpdateOriginRequestPolicy")
-UpdatePublicKey = Action("UpdatePublicKey")
-UpdateStreamingDistribution = Action("UpdateStreamingDistribution")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,34 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTagsToResource = Action("AddTagsToResource")
-CopyBackupToRegion = Action("CopyBackupToRegion")
-CreateCluster = Action("CreateCluster")
-CreateHapg = Action("CreateHapg")
-CreateHsm = Action("CreateHsm")
-CreateLunaClient = Action("CreateLunaClient")
-DeleteBackup = Action("DeleteBackup")
-DeleteCluster = Action("DeleteCluster")
-DeleteHapg = Action("DeleteHapg")
-DeleteHsm = Action("DeleteHsm")
-DeleteLunaClient = Action("DeleteLunaClient")
-DescribeBackups = Action("DescribeBackups")
-DescribeClusters = Action("DescribeClusters")
-DescribeHapg = Action("DescribeHapg")
-DescribeHsm = Action("DescribeHsm")
-DescribeLunaClient = Action("DescribeLunaClient")
-GetConfig = Action("GetConfig")
-InitializeCluster = Action("InitializeCluster")
-ListAvailableZones = Action("ListAvailableZones")
-ListHapgs = Action("ListHapgs")
-ListHsms = Action("ListHsms")
-ListLunaClients = Action("ListLunaClients")
-ListTags = Action("ListTags")
-ListTagsForResource = Action("ListTagsForResource")
-ModifyHapg = Action("ModifyHapg")
-ModifyHsm = Action("ModifyHsm")
-ModifyLunaClient = Action("ModifyLunaClient")
-RemoveTagsFromResource = Action("RemoveTagsFromResource")
-RestoreBackup = Action("RestoreBackup")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
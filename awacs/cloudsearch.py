@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTags = Action("AddTags")
-BuildSuggesters = Action("BuildSuggesters")
-CreateDomain = Action("CreateDomain")
-DefineAnalysisScheme = Action("DefineAnalysisScheme")
-DefineExpression = Action("DefineExpression")
-DefineIndexField = Action("DefineIndexField")
-DefineIndexFields = Action("DefineIndexFields")
-DefineSuggester = Action("DefineSuggester")
-DeleteAnalysisScheme = Action("DeleteAnalysisScheme")
-DeleteDomain = Action("DeleteDomain")
-DeleteExpression = Action("DeleteExpression")
-DeleteIndexField = Action("DeleteIndexField")
-DeleteSuggester = Action("DeleteSuggester")
-DescribeAnalysisSchemes = Action("DescribeAnalysisSchemes")
-DescribeAvailabilityOptions = Action("DescribeAvailabilityOptions")
-DescribeDomainEndpointOptions = Action("DescribeDomainEndpointOptions")
-DescribeDomains = Action("DescribeDomains")
-DescribeExpressions = Action("DescribeExpressions")
-DescribeIndexFields = Action("DescribeIndexFields")
-DescribeScalingParameters = Action("DescribeScalingParameters")
-DescribeServiceAccessPolicies = Action("DescribeServiceAccessPolicies")
-DescribeSuggesters = Action("DescribeSuggesters")
-IndexDocuments = Action("IndexDocuments")
-ListDomainNames = Action("ListDomainNames")
-ListTags = Action("ListTags")
-RemoveTags = Action("RemoveTags")
-UpdateAvailabilityOptions = Action("UpdateAvailabilityOptions")
-UpdateDomainEndpointOptions = Action("UpdateDomainEndpointOptions")
-UpdateScalingParameters = Action("UpdateScalingParameters")
-UpdateServiceAccessPolicies = Action("UpdateServiceAccessPolicies")
-document = Action("document")
-search = Action("search")
-suggest = Action("suggest")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,39 +25,21 @@ class ARN(BaseARN):
         )
 
 
-DeleteAlarms = Action("DeleteAlarms")
-DeleteAnomalyDetector = Action("DeleteAnomalyDetector")
-DeleteDashboards = Action("DeleteDashboards")
-DeleteInsightRules = Action("DeleteInsightRules")
-DeleteMetricStream = Action("DeleteMetricStream")
-DescribeAlarmHistory = Action("DescribeAlarmHistory")
-DescribeAlarms = Action("DescribeAlarms")
-DescribeAlarmsForMetric = Action("DescribeAlarmsForMetric")
-DescribeAnomalyDetectors = Action("DescribeAnomalyDetectors")
-DescribeInsightRules = Action("DescribeInsightRules")
-DisableAlarmActions = Action("DisableAlarmActions")
-DisableInsightRules = Action("DisableInsightRules")
-EnableAlarmActions = Action("EnableAlarmActions")
-EnableInsightRules = Action("EnableInsightRules")
-GetDashboard = Action("GetDashboard")
-GetInsightRuleReport = Action("GetInsightRuleReport")
-GetMetricData = Action("GetMetricData")
-GetMetricStatistics = Action("GetMetricStatistics")
-GetMetricStream = Action("GetMetricStream")
-GetMetricWidgetImage = Action("GetMetricWidgetImage")
-ListDashboards = Action("ListDashboards")
-ListMetricStreams = Action("ListMetricStreams")
-ListMetrics = Action("ListMetrics")
-ListTagsForResource = Action("ListTagsForResource")
-PutAnomalyDetector = Action("PutAnomalyDetector")
-PutCompositeAlarm = Action("PutCompositeAlarm")
-PutDashboard = Action("PutDashboard")
-PutInsightRule = Action("PutInsightRule")
-PutMetricAlarm = Action("PutMetricAlarm")
-PutMetricData = Action("PutMetricData")
-PutMetricStream = Action("PutMetricStream")
-SetAlarmState = Action("SetAlarmState")
-StartMetricStreams = Action("StartMetricStreams")
-StopMetricStreams = Action("StopMetricStreams")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,41 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateExternalConnection = Action("AssociateExternalConnection")
-AssociateWithDownstreamRepository = Action("AssociateWithDownstreamRepository")
-CopyPackageVersions = Action("CopyPackageVersions")
-CreateDomain = Action("CreateDomain")
-CreateRepository = Action("CreateRepository")
-DeleteDomain = Action("DeleteDomain")
-DeleteDomainPermissionsPolicy = Action("DeleteDomainPermissionsPolicy")
-DeletePackageVersions = Action("DeletePackageVersions")
-DeleteRepository = Action("DeleteRepository")
-DeleteRepositoryPermissionsPolicy = Action("DeleteRepositoryPermissionsPolicy")
-DescribeDomain = Action("DescribeDomain")
-DescribePackageVersion = Action("DescribePackageVersion")
-DescribeRepository = Action("DescribeRepository")
-DisassociateExternalConnection = Action("DisassociateExternalConnection")
-DisposePackageVersions = Action("DisposePackageVersions")
-GetAuthorizationToken = Action("GetAuthorizationToken")
-GetDomainPermissionsPolicy = Action("GetDomainPermissionsPolicy")
-GetPackageVersionAsset = Action("GetPackageVersionAsset")
-GetPackageVersionReadme = Action("GetPackageVersionReadme")
-GetRepositoryEndpoint = Action("GetRepositoryEndpoint")
-GetRepositoryPermissionsPolicy = Action("GetRepositoryPermissionsPolicy")
-ListDomains = Action("ListDomains")
-ListPackageVersionAssets = Action("ListPackageVersionAssets")
-ListPackageVersionDependencies = Action("ListPackageVersionDependencies")
-ListPackageVersions = Action("ListPackageVersions")
-ListPackages = Action("ListPackages")
-ListRepositories = Action("ListRepositories")
-ListRepositoriesInDomain = Action("ListRepositoriesInDomain")
-ListTagsForResource = Action("ListTagsForResource")
-PublishPackageVersion = Action("PublishPackageVersion")
-PutDomainPermissionsPolicy = Action("PutDomainPermissionsPolicy")
-PutPackageMetadata = Action("PutPackageMetadata")
-PutRepositoryPermissionsPolicy = Action("PutRepositoryPermissionsPolicy")
-ReadFromRepository = Action("ReadFromRepository")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdatePackageVersionsStatus = Action("UpdatePackageVersionsStatus")
-UpdateRepository = Action("UpdateRepository")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,54 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchDeleteBuilds = Action("BatchDeleteBuilds")
-BatchGetBuildBatches = Action("BatchGetBuildBatches")
-BatchGetBuilds = Action("BatchGetBuilds")
-BatchGetProjects = Action("BatchGetProjects")
-BatchGetReportGroups = Action("BatchGetReportGroups")
-BatchGetReports = Action("BatchGetReports")
-BatchPutCodeCoverages = Action("BatchPutCodeCoverages")
-BatchPutTestCases = Action("BatchPutTestCases")
-CreateProject = Action("CreateProject")
-CreateReport = Action("CreateReport")
-CreateReportGroup = Action("CreateReportGroup")
-CreateWebhook = Action("CreateWebhook")
-DeleteBuildBatch = Action("DeleteBuildBatch")
-DeleteOAuthToken = Action("DeleteOAuthToken")
-DeleteProject = Action("DeleteProject")
-DeleteReport = Action("DeleteReport")
-DeleteReportGroup = Action("DeleteReportGroup")
-DeleteResourcePolicy = Action("DeleteResourcePolicy")
-DeleteSourceCredentials = Action("DeleteSourceCredentials")
-DeleteWebhook = Action("DeleteWebhook")
-DescribeCodeCoverages = Action("DescribeCodeCoverages")
-DescribeTestCases = Action("DescribeTestCases")
-GetResourcePolicy = Action("GetResourcePolicy")
-ImportSourceCredentials = Action("ImportSourceCredentials")
-InvalidateProjectCache = Action("InvalidateProjectCache")
-ListBuildBatches = Action("ListBuildBatches")
-ListBuildBatchesForProject = Action("ListBuildBatchesForProject")
-ListBuilds = Action("ListBuilds")
-ListBuildsForProject = Action("ListBuildsForProject")
-ListConnectedOAuthAccounts = Action("ListConnectedOAuthAccounts")
-ListCuratedEnvironmentImages = Action("ListCuratedEnvironmentImages")
-ListProjects = Action("ListProjects")
-ListReportGroups = Action("ListReportGroups")
-ListReports = Action("ListReports")
-ListReportsForReportGroup = Action("ListReportsForReportGroup")
-ListRepositories = Action("ListRepositories")
-ListSharedProjects = Action("ListSharedProjects")
-ListSharedReportGroups = Action("ListSharedReportGroups")
-ListSourceCredentials = Action("ListSourceCredentials")
-PersistOAuthToken = Action("PersistOAuthToken")
-PutResourcePolicy = Action("PutResourcePolicy")
-RetryBuild = Action("RetryBuild")
-RetryBuildBatch = Action("RetryBuildBatch")
-StartBuild = Action("StartBuild")
-StartBuildBatch = Action("StartBuildBatch")
-StopBuild = Action("StopBuild")
-StopBuildBatch = Action("StopBuildBatch")
-UpdateProject = Action("UpdateProject")
-UpdateReport = Action("UpdateReport")
-UpdateReportGroup = Action("UpdateReportGroup")
-UpdateWebhook = Action("UpdateWebhook")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
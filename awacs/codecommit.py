@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,103 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateApprovalRuleTemplateWithRepository = Action(
-    "AssociateApprovalRuleTemplateWithRepository"
-)
-BatchAssociateApprovalRuleTemplateWithRepositories = Action(
-    "BatchAssociateApprovalRuleTemplateWithRepositories"
-)
-BatchDescribeMergeConflicts = Action("BatchDescribeMergeConflicts")
-BatchDisassociateApprovalRuleTemplateFromRepositories = Action(
-    "BatchDisassociateApprovalRuleTemplateFromRepositories"
-)
-BatchGetCommits = Action("BatchGetCommits")
-BatchGetPullRequests = Action("BatchGetPullRequests")
-BatchGetRepositories = Action("BatchGetRepositories")
-CancelUploadArchive = Action("CancelUploadArchive")
-CreateApprovalRuleTemplate = Action("CreateApprovalRuleTemplate")
-CreateBranch = Action("CreateBranch")
-CreateCommit = Action("CreateCommit")
-CreatePullRequest = Action("CreatePullRequest")
-CreatePullRequestApprovalRule = Action("CreatePullRequestApprovalRule")
-CreateRepository = Action("CreateRepository")
-CreateUnreferencedMergeCommit = Action("CreateUnreferencedMergeCommit")
-DeleteApprovalRuleTemplate = Action("DeleteApprovalRuleTemplate")
-DeleteBranch = Action("DeleteBranch")
-DeleteCommentContent = Action("DeleteCommentContent")
-DeleteFile = Action("DeleteFile")
-DeletePullRequestApprovalRule = Action("DeletePullRequestApprovalRule")
-DeleteRepository = Action("DeleteRepository")
-DescribeMergeConflicts = Action("DescribeMergeConflicts")
-DescribePullRequestEvents = Action("DescribePullRequestEvents")
-DisassociateApprovalRuleTemplateFromRepository = Action(
-    "DisassociateApprovalRuleTemplateFromRepository"
-)
-EvaluatePullRequestApprovalRules = Action("EvaluatePullRequestApprovalRules")
-GetApprovalRuleTemplate = Action("GetApprovalRuleTemplate")
-GetBlob = Action("GetBlob")
-GetBranch = Action("GetBranch")
-GetComment = Action("GetComment")
-GetCommentReactions = Action("GetCommentReactions")
-GetCommentsForComparedCommit = Action("GetCommentsForComparedCommit")
-GetCommentsForPullRequest = Action("GetCommentsForPullRequest")
-GetCommit = Action("GetCommit")
-GetCommitHistory = Action("GetCommitHistory")
-GetCommitsFromMergeBase = Action("GetCommitsFromMergeBase")
-GetDifferences = Action("GetDifferences")
-GetFile = Action("GetFile")
-GetFolder = Action("GetFolder")
-GetMergeCommit = Action("GetMergeCommit")
-GetMergeConflicts = Action("GetMergeConflicts")
-GetMergeOptions = Action("GetMergeOptions")
-GetObjectIdentifier = Action("GetObjectIdentifier")
-GetPullRequest = Action("GetPullRequest")
-GetPullRequestApprovalStates = Action("GetPullRequestApprovalStates")
-GetPullRequestOverrideState = Action("GetPullRequestOverrideState")
-GetReferences = Action("GetReferences")
-GetRepository = Action("GetRepository")
-GetRepositoryTriggers = Action("GetRepositoryTriggers")
-GetTree = Action("GetTree")
-GetUploadArchiveStatus = Action("GetUploadArchiveStatus")
-GitPull = Action("GitPull")
-GitPush = Action("GitPush")
-ListApprovalRuleTemplates = Action("ListApprovalRuleTemplates")
-ListAssociatedApprovalRuleTemplatesForRepository = Action(
-    "ListAssociatedApprovalRuleTemplatesForRepository"
-)
-ListBranches = Action("ListBranches")
-ListPullRequests = Action("ListPullRequests")
-ListRepositories = Action("ListRepositories")
-ListRepositoriesForApprovalRuleTemplate = Action(
-    "ListRepositoriesForApprovalRuleTemplate"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ListTagsForResource = Action("ListTagsForResource")
-MergeBranchesByFastForward = Action("MergeBranchesByFastForward")
-MergeBranchesBySquash = Action("MergeBranchesBySquash")
-MergeBranchesByThreeWay = Action("MergeBranchesByThreeWay")
-MergePullRequestByFastForward = Action("MergePullRequestByFastForward")
-MergePullRequestBySquash = Action("MergePullRequestBySquash")
-MergePullRequestByThreeWay = Action("MergePullRequestByThreeWay")
-OverridePullRequestApprovalRules = Action("OverridePullRequestApprovalRules")
-PostCommentForComparedCommit = Action("PostCommentForComparedCommit")
-PostCommentForPullRequest = Action("PostCommentForPullRequest")
-PostCommentReply = Action("PostCommentReply")
-PutCommentReaction = Action("PutCommentReaction")
-PutFile = Action("PutFile")
-PutRepositoryTriggers = Action("PutRepositoryTriggers")
-TagResource = Action("TagResource")
-TestRepositoryTriggers = Action("TestRepositoryTriggers")
-UntagResource = Action("UntagResource")
-UpdateApprovalRuleTemplateContent = Action("UpdateApprovalRuleTemplateContent")
-UpdateApprovalRuleTemplateDescription = Action("UpdateApprovalRuleTemplateDescription")
-UpdateApprovalRuleTemplateName = Action("UpdateApprovalRuleTemplateName")
-UpdateComment = Action("UpdateComment")
-UpdateDefaultBranch = Action("UpdateDefaultBranch")
-UpdatePullRequestApprovalRuleContent = Action("UpdatePullRequestApprovalRuleContent")
-UpdatePullRequestApprovalState = Action("UpdatePullRequestApprovalState")
-UpdatePullRequestDescription = Action("UpdatePullRequestDescription")
-UpdatePullRequestStatus = Action("UpdatePullRequestStatus")
-UpdatePullRequestTitle = Action("UpdatePullRequestTitle")
-UpdateRepositoryDescription = Action("UpdateRepositoryDescription")
-UpdateRepositoryName = Action("UpdateRepositoryName")
-UploadArchive = Action("UploadArchive")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTagsToOnPremisesInstances = Action("AddTagsToOnPremisesInstances")
-BatchGetApplicationRevisions = Action("BatchGetApplicationRevisions")
-BatchGetApplications = Action("BatchGetApplications")
-BatchGetDeploymentGroups = Action("BatchGetDeploymentGroups")
-BatchGetDeploymentInstances = Action("BatchGetDeploymentInstances")
-BatchGetDeploymentTargets = Action("BatchGetDeploymentTargets")
-BatchGetDeployments = Action("BatchGetDeployments")
-BatchGetOnPremisesInstances = Action("BatchGetOnPremisesInstances")
-ContinueDeployment = Action("ContinueDeployment")
-CreateApplication = Action("CreateApplication")
-CreateCloudFormationDeployment = Action("CreateCloudFormationDeployment")
-CreateDeployment = Action("CreateDeployment")
-CreateDeploymentConfig = Action("CreateDeploymentConfig")
-CreateDeploymentGroup = Action("CreateDeploymentGroup")
-DeleteApplication = Action("DeleteApplication")
-DeleteDeploymentConfig = Action("DeleteDeploymentConfig")
-DeleteDeploymentGroup = Action("DeleteDeploymentGroup")
-DeleteGitHubAccountToken = Action("DeleteGitHubAccountToken")
-DeleteResourcesByExternalId = Action("DeleteResourcesByExternalId")
-DeregisterOnPremisesInstance = Action("DeregisterOnPremisesInstance")
-GetApplication = Action("GetApplication")
-GetApplicationRevision = Action("GetApplicationRevision")
-GetDeployment = Action("GetDeployment")
-GetDeploymentConfig = Action("GetDeploymentConfig")
-GetDeploymentGroup = Action("GetDeploymentGroup")
-GetDeploymentInstance = Action("GetDeploymentInstance")
-GetDeploymentTarget = Action("GetDeploymentTarget")
-GetOnPremisesInstance = Action("GetOnPremisesInstance")
-ListApplicationRevisions = Action("ListApplicationRevisions")
-ListApplications = Action("ListApplications")
-ListDeploymentConfigs = Action("ListDeploymentConfigs")
-ListDeploymentGroups = Action("ListDeploymentGroups")
-ListDeploymentInstances = Action("ListDeploymentInstances")
-ListDeploymentTargets = Action("ListDeploymentTargets")
-ListDeployments = Action("ListDeployments")
-ListGitHubAccountTokenNames = Action("ListGitHubAccountTokenNames")
-ListOnPremisesInstances = Action("ListOnPremisesInstances")
-ListTagsForResource = Action("ListTagsForResource")
-PutLifecycleEventHookExecutionStatus = Action("PutLifecycleEventHookExecutionStatus")
-RegisterApplicationRevision = Action("RegisterApplicationRevision")
-RegisterOnPremisesInstance = Action("RegisterOnPremisesInstance")
-RemoveTagsFromOnPremisesInstances = Action("RemoveTagsFromOnPremisesInstances")
-SkipWaitTimeForInstanceTermination = Action("SkipWaitTimeForInstanceTermination")
-StopDeployment = Action("StopDeployment")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApplication = Action("UpdateApplication")
-UpdateDeploymentGroup = Action("UpdateDeploymentGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,20 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateRepository = Action("AssociateRepository")
-CreateCodeReview = Action("CreateCodeReview")
-CreateConnectionToken = Action("CreateConnectionToken")
-DescribeCodeReview = Action("DescribeCodeReview")
-DescribeRecommendationFeedback = Action("DescribeRecommendationFeedback")
-DescribeRepositoryAssociation = Action("DescribeRepositoryAssociation")
-DisassociateRepository = Action("DisassociateRepository")
-GetMetricsData = Action("GetMetricsData")
-ListCodeReviews = Action("ListCodeReviews")
-ListRecommendationFeedback = Action("ListRecommendationFeedback")
-ListRecommendations = Action("ListRecommendations")
-ListRepositoryAssociations = Action("ListRepositoryAssociations")
-ListTagsForResource = Action("ListTagsForResource")
-ListThirdPartyRepositories = Action("ListThirdPartyRepositories")
-PutRecommendationFeedback = Action("PutRecommendationFeedback")
-TagResource = Action("TagResource")
-UnTagResource = Action("UnTagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
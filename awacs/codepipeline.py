@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,40 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcknowledgeJob = Action("AcknowledgeJob")
-AcknowledgeThirdPartyJob = Action("AcknowledgeThirdPartyJob")
-CreateCustomActionType = Action("CreateCustomActionType")
-CreatePipeline = Action("CreatePipeline")
-DeleteCustomActionType = Action("DeleteCustomActionType")
-DeletePipeline = Action("DeletePipeline")
-DeleteWebhook = Action("DeleteWebhook")
-DeregisterWebhookWithThirdParty = Action("DeregisterWebhookWithThirdParty")
-DisableStageTransition = Action("DisableStageTransition")
-EnableStageTransition = Action("EnableStageTransition")
-GetJobDetails = Action("GetJobDetails")
-GetPipeline = Action("GetPipeline")
-GetPipelineExecution = Action("GetPipelineExecution")
-GetPipelineState = Action("GetPipelineState")
-GetThirdPartyJobDetails = Action("GetThirdPartyJobDetails")
-ListActionExecutions = Action("ListActionExecutions")
-ListActionTypes = Action("ListActionTypes")
-ListPipelineExecutions = Action("ListPipelineExecutions")
-ListPipelines = Action("ListPipelines")
-ListTagsForResource = Action("ListTagsForResource")
-ListWebhooks = Action("ListWebhooks")
-PollForJobs = Action("PollForJobs")
-PollForThirdPartyJobs = Action("PollForThirdPartyJobs")
-PutActionRevision = Action("PutActionRevision")
-PutApprovalResult = Action("PutApprovalResult")
-PutJobFailureResult = Action("PutJobFailureResult")
-PutJobSuccessResult = Action("PutJobSuccessResult")
-PutThirdPartyJobFailureResult = Action("PutThirdPartyJobFailureResult")
-PutThirdPartyJobSuccessResult = Action("PutThirdPartyJobSuccessResult")
-PutWebhook = Action("PutWebhook")
-RegisterWebhookWithThirdParty = Action("RegisterWebhookWithThirdParty")
-RetryStageExecution = Action("RetryStageExecution")
-StartPipelineExecution = Action("StartPipelineExecution")
-StopPipelineExecution = Action("StopPipelineExecution")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdatePipeline = Action("UpdatePipeline")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,25 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateTeamMember = Action("AssociateTeamMember")
-CreateProject = Action("CreateProject")
-CreateUserProfile = Action("CreateUserProfile")
-DeleteExtendedAccess = Action("DeleteExtendedAccess")
-DeleteProject = Action("DeleteProject")
-DeleteUserProfile = Action("DeleteUserProfile")
-DescribeProject = Action("DescribeProject")
-DescribeUserProfile = Action("DescribeUserProfile")
-DisassociateTeamMember = Action("DisassociateTeamMember")
-GetExtendedAccess = Action("GetExtendedAccess")
-ListProjects = Action("ListProjects")
-ListResources = Action("ListResources")
-ListTagsForProject = Action("ListTagsForProject")
-ListTeamMembers = Action("ListTeamMembers")
-ListUserProfiles = Action("ListUserProfiles")
-PutExtendedAccess = Action("PutExtendedAccess")
-TagProject = Action("TagProject")
-UntagProject = Action("UntagProject")
-UpdateProject = Action("UpdateProject")
-UpdateTeamMember = Action("UpdateTeamMember")
-UpdateUserProfile = Action("UpdateUserProfile")
-VerifyServiceRole = Action("VerifyServiceRole")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
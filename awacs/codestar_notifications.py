@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,16 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateNotificationRule = Action("CreateNotificationRule")
-DeleteNotificationRule = Action("DeleteNotificationRule")
-DeleteTarget = Action("DeleteTarget")
-DescribeNotificationRule = Action("DescribeNotificationRule")
-ListEventTypes = Action("ListEventTypes")
-ListNotificationRules = Action("ListNotificationRules")
-ListTagsForResource = Action("ListTagsForResource")
-ListTargets = Action("ListTargets")
-Subscribe = Action("Subscribe")
-TagResource = Action("TagResource")
-Unsubscribe = Action("Unsubscribe")
-UntagResource = Action("UntagResource")
-UpdateNotificationRule = Action("UpdateNotificationRule")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
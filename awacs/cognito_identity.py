@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateIdentityPool = Action("CreateIdentityPool")
-DeleteIdentities = Action("DeleteIdentities")
-DeleteIdentityPool = Action("DeleteIdentityPool")
-DescribeIdentity = Action("DescribeIdentity")
-DescribeIdentityPool = Action("DescribeIdentityPool")
-GetCredentialsForIdentity = Action("GetCredentialsForIdentity")
-GetId = Action("GetId")
-GetIdentityPoolRoles = Action("GetIdentityPoolRoles")
-GetOpenIdToken = Action("GetOpenIdToken")
-GetOpenIdTokenForDeveloperIdentity = Action("GetOpenIdTokenForDeveloperIdentity")
-GetPrincipalTagAttributeMap = Action("GetPrincipalTagAttributeMap")
-ListIdentities = Action("ListIdentities")
-ListIdentityPools = Action("ListIdentityPools")
-ListTagsForResource = Action("ListTagsForResource")
-LookupDeveloperIdentity = Action("LookupDeveloperIdentity")
-MergeDeveloperIdentities = Action("MergeDeveloperIdentities")
-SetIdentityPoolRoles = Action("SetIdentityPoolRoles")
-SetPrincipalTagAttributeMap = Action("SetPrincipalTagAttributeMap")
-TagResource = Action("TagResource")
-UnlinkDeveloperIdentity = Action("UnlinkDeveloperIdentity")
-UnlinkIdentity = Action("UnlinkIdentity")
-UntagResource = Action("UntagResource")
-UpdateIdentityPool = Action("UpdateIdentityPool")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,22 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BulkPublish = Action("BulkPublish")
-DeleteDataset = Action("DeleteDataset")
-DescribeDataset = Action("DescribeDataset")
-DescribeIdentityPoolUsage = Action("DescribeIdentityPoolUsage")
-DescribeIdentityUsage = Action("DescribeIdentityUsage")
-GetBulkPublishDetails = Action("GetBulkPublishDetails")
-GetCognitoEvents = Action("GetCognitoEvents")
-GetIdentityPoolConfiguration = Action("GetIdentityPoolConfiguration")
-ListDatasets = Action("ListDatasets")
-ListIdentityPoolUsage = Action("ListIdentityPoolUsage")
-ListRecords = Action("ListRecords")
-QueryRecords = Action("QueryRecords")
-RegisterDevice = Action("RegisterDevice")
-SetCognitoEvents = Action("SetCognitoEvents")
-SetDatasetConfiguration = Action("SetDatasetConfiguration")
-SetIdentityPoolConfiguration = Action("SetIdentityPoolConfiguration")
-SubscribeToDataset = Action("SubscribeToDataset")
-UnsubscribeFromDataset = Action("UnsubscribeFromDataset")
-UpdateRecords = Action("UpdateRecords")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,64 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchDetectDominantLanguage = Action("BatchDetectDominantLanguage")
-BatchDetectEntities = Action("BatchDetectEntities")
-BatchDetectKeyPhrases = Action("BatchDetectKeyPhrases")
-BatchDetectSentiment = Action("BatchDetectSentiment")
-BatchDetectSyntax = Action("BatchDetectSyntax")
-ClassifyDocument = Action("ClassifyDocument")
-ContainsPiiEntities = Action("ContainsPiiEntities")
-CreateDocumentClassifier = Action("CreateDocumentClassifier")
-CreateEndpoint = Action("CreateEndpoint")
-CreateEntityRecognizer = Action("CreateEntityRecognizer")
-DeleteDocumentClassifier = Action("DeleteDocumentClassifier")
-DeleteEndpoint = Action("DeleteEndpoint")
-DeleteEntityRecognizer = Action("DeleteEntityRecognizer")
-DescribeDocumentClassificationJob = Action("DescribeDocumentClassificationJob")
-DescribeDocumentClassifier = Action("DescribeDocumentClassifier")
-DescribeDominantLanguageDetectionJob = Action("DescribeDominantLanguageDetectionJob")
-DescribeEndpoint = Action("DescribeEndpoint")
-DescribeEntitiesDetectionJob = Action("DescribeEntitiesDetectionJob")
-DescribeEntityRecognizer = Action("DescribeEntityRecognizer")
-DescribeEventsDetectionJob = Action("DescribeEventsDetectionJob")
-DescribeKeyPhrasesDetectionJob = Action("DescribeKeyPhrasesDetectionJob")
-DescribePiiEntitiesDetectionJob = Action("DescribePiiEntitiesDetectionJob")
-DescribeSentimentDetectionJob = Action("DescribeSentimentDetectionJob")
-DescribeTopicsDetectionJob = Action("DescribeTopicsDetectionJob")
-DetectDominantLanguage = Action("DetectDominantLanguage")
-DetectEntities = Action("DetectEntities")
-DetectKeyPhrases = Action("DetectKeyPhrases")
-DetectPiiEntities = Action("DetectPiiEntities")
-DetectSentiment = Action("DetectSentiment")
-DetectSyntax = Action("DetectSyntax")
-ListDocumentClassificationJobs = Action("ListDocumentClassificationJobs")
-ListDocumentClassifiers = Action("ListDocumentClassifiers")
-ListDominantLanguageDetectionJobs = Action("ListDominantLanguageDetectionJobs")
-ListEndpoints = Action("ListEndpoints")
-ListEntitiesDetectionJobs = Action("ListEntitiesDetectionJobs")
-ListEntityRecognizers = Action("ListEntityRecognizers")
-ListEventsDetectionJobs = Action("ListEventsDetectionJobs")
-ListKeyPhrasesDetectionJobs = Action("ListKeyPhrasesDetectionJobs")
-ListPiiEntitiesDetectionJobs = Action("ListPiiEntitiesDetectionJobs")
-ListSentimentDetectionJobs = Action("ListSentimentDetectionJobs")
-ListTagsForResource = Action("ListTagsForResource")
-ListTopicsDetectionJobs = Action("ListTopicsDetectionJobs")
-StartDocumentClassificationJob = Action("StartDocumentClassificationJob")
-StartDominantLanguageDetectionJob = Action("StartDominantLanguageDetectionJob")
-StartEntitiesDetectionJob = Action("StartEntitiesDetectionJob")
-StartEventsDetectionJob = Action("StartEventsDetectionJob")
-StartKeyPhrasesDetectionJob = Action("StartKeyPhrasesDetectionJob")
-StartPiiEntitiesDetectionJob = Action("StartPiiEntitiesDetectionJob")
-StartSentimentDetectionJob = Action("StartSentimentDetectionJob")
-StartTopicsDetectionJob = Action("StartTopicsDetectionJob")
-StopDominantLanguageDetectionJob = Action("StopDominantLanguageDetectionJob")
-StopEntitiesDetectionJob = Action("StopEntitiesDetectionJob")
-StopEventsDetectionJob = Action("StopEventsDetectionJob")
-StopKeyPhrasesDetectionJob = Action("StopKeyPhrasesDetectionJob")
-StopPiiEntitiesDetectionJob = Action("StopPiiEntitiesDetectionJob")
-StopSentimentDetectionJob = Action("StopSentimentDetectionJob")
-StopTrainingDocumentClassifier = Action("StopTrainingDocumentClassifier")
-StopTrainingEntityRecognizer = Action("StopTrainingEntityRecognizer")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateEndpoint = Action("UpdateEndpoint")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,24 +25,21 @@ class ARN(BaseARN):
         )
 
 
-DescribeEntitiesDetectionV2Job = Action("DescribeEntitiesDetectionV2Job")
-DescribeICD10CMInferenceJob = Action("DescribeICD10CMInferenceJob")
-DescribePHIDetectionJob = Action("DescribePHIDetectionJob")
-DescribeRxNormInferenceJob = Action("DescribeRxNormInferenceJob")
-DetectEntities = Action("DetectEntities")
-DetectEntitiesV2 = Action("DetectEntitiesV2")
-DetectPHI = Action("DetectPHI")
-InferICD10CM = Action("InferICD10CM")
-InferRxNorm = Action("InferRxNorm")
-ListEntitiesDetectionV2Jobs = Action("ListEntitiesDetectionV2Jobs")
-ListICD10CMInferenceJobs = Action("ListICD10CMInferenceJobs")
-ListPHIDetectionJobs = Action("ListPHIDetectionJobs")
-ListRxNormInferenceJobs = Action("ListRxNormInferenceJobs")
-StartEntitiesDetectionV2Job = Action("StartEntitiesDetectionV2Job")
-StartICD10CMInferenceJob = Action("StartICD10CMInferenceJob")
-StartPHIDetectionJob = Action("StartPHIDetectionJob")
-StartRxNormInferenceJob = Action("StartRxNormInferenceJob")
-StopEntitiesDetectionV2Job = Action("StopEntitiesDetectionV2Job")
-StopICD10CMInferenceJob = Action("StopICD10CMInferenceJob")
-StopPHIDetectionJob = Action("StopPHIDetectionJob")
-StopRxNormInferenceJob = Action("StopRxNormInferenceJob")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
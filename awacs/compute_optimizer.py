@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,14 +25,21 @@ class ARN(BaseARN):
         )
 
 
-DescribeRecommendationExportJobs = Action("DescribeRecommendationExportJobs")
-ExportAutoScalingGroupRecommendations = Action("ExportAutoScalingGroupRecommendations")
-ExportEC2InstanceRecommendations = Action("ExportEC2InstanceRecommendations")
-GetAutoScalingGroupRecommendations = Action("GetAutoScalingGroupRecommendations")
-GetEBSVolumeRecommendations = Action("GetEBSVolumeRecommendations")
-GetEC2InstanceRecommendations = Action("GetEC2InstanceRecommendations")
-GetEC2RecommendationProjectedMetrics = Action("GetEC2RecommendationProjectedMetrics")
-GetEnrollmentStatus = Action("GetEnrollmentStatus")
-GetLambdaFunctionRecommendations = Action("GetLambdaFunctionRecommendations")
-GetRecommendationSummaries = Action("GetRecommendationSummaries")
-UpdateEnrollmentStatus = Action("UpdateEnrollmentStatus")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -0,0 +1,359 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Predicates of the condition operators.
+
+compile_conditions() turns the data of a Condition block into a predicate of
+the context of a request, a mapping of lowercased condition keys to their
+list of values. The policy values are prepared once per operator: dates are
+parsed, CIDR blocks merged into sorted address intervals, globs compiled
+into a single regular expression and numeric limits reduced to the bound
+that decides the comparison. Condition.predicate() caches the result on the
+Condition object.
+"""
+
+import ipaddress
+import re
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# Lowercased condition keys of a request and their values
+Context = Mapping[str, List[Any]]
+ContextPredicate = Callable[[Context], bool]
+ValuePredicate = Callable[[Any], bool]
+
+
+def translate(pattern: str) -> str:
+    """Return the regular expression of a pattern with * and ? wildcards."""
+    return "".join(
+        ".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern
+    )
+
+
+@lru_cache(maxsize=4096)
+def glob(pattern: str, ignore_case: bool = False) -> Callable[[str], bool]:
+    """Return a predicate matching strings against a pattern with * and ?."""
+    if pattern == "*":
+        return lambda value: True
+    if "*" not in pattern and "?" not in pattern:
+        if ignore_case:
+            pattern = pattern.lower()
+            return lambda value: value.lower() == pattern
+        return pattern.__eq__
+    flags = re.DOTALL | (re.I if ignore_case else 0)
+    fullmatch = re.compile(translate(pattern), flags).fullmatch
+    return lambda value: fullmatch(value) is not None
+
+
+@lru_cache(maxsize=4096)
+def arn_like(pattern: str) -> Callable[[str], bool]:
+    """Return a predicate matching ARNs against an ARN pattern.
+
+    As in IAM, the first five segments of the ARN are matched separately,
+    so a wildcard in one of them does not match a colon.
+    """
+    parts = pattern.split(":", 5)
+    if len(parts) < 6:
+        return glob(pattern)
+    matchers = [glob(p) for p in parts]
+
+    def match(arn: str) -> bool:
+        segments = arn.split(":", 5)
+        if len(segments) < 6:
+            return False
+        for matcher, segment in zip(matchers, segments):
+            if not matcher(segment):
+                return False
+        return True
+
+    return match
+
+
+def compile_conditions(data: Mapping[str, Mapping[str, Any]]) -> ContextPredicate:
+    """Compile the data of a Condition into a predicate of a request context.
+
+    All the operators and keys of the condition must match.
+    """
+    predicates = [
+        compile_operator(operator, key, values)
+        for operator, conditions in data.items()
+        for key, values in conditions.items()
+    ]
+    if len(predicates) == 1:
+        return predicates[0]
+
+    def match(context: Context) -> bool:
+        for predicate in predicates:
+            if not predicate(context):
+                return False
+        return True
+
+    return match
+
+
+# Negated operators and the operator they negate
+_negated_operators = {
+    "ArnNotEquals": "ArnEquals",
+    "ArnNotLike": "ArnLike",
+    "DateNotEquals": "DateEquals",
+    "NotIpAddress": "IpAddress",
+    "NumericNotEquals": "NumericEquals",
+    "StringNotEquals": "StringEquals",
+    "StringNotEqualsIgnoreCase": "StringEqualsIgnoreCase",
+    "StringNotLike": "StringLike",
+}
+
+
+def compile_operator(operator: str, key: str, policy_values: Any) -> ContextPredicate:
+    """Compile one key of a condition operator, e.g. "ForAnyValue:StringLike".
+
+    A key missing from the context matches IfExists operators, negated
+    operators and ForAllValues, as in IAM.
+    """
+    qualifier, _, name = operator.rpartition(":")
+    if_exists = name.endswith("IfExists")
+    if if_exists:
+        name = name[: -len("IfExists")]
+    key = key.lower()
+    if not isinstance(policy_values, list):
+        policy_values = [policy_values]
+
+    if name == "Null":
+        expect_missing = str(policy_values[0]).lower() == "true"
+        return lambda context: (key not in context) == expect_missing
+
+    negate = name in _negated_operators
+    try:
+        factory = _operators[_negated_operators.get(name, name)]
+    except KeyError as exc:
+        raise ValueError("Unknown condition operator %s" % (operator,)) from exc
+    predicate = factory(policy_values)
+    if negate:
+        positive = predicate
+
+        def predicate(value: Any) -> bool:
+            return not positive(value)
+
+    if qualifier == "ForAllValues":
+
+        def match(context: Context) -> bool:
+            values = context.get(key)
+            if not values:
+                return True
+            for value in values:
+                if not predicate(value):
+                    return False
+            return True
+
+    elif qualifier == "ForAnyValue":
+
+        def match(context: Context) -> bool:
+            values = context.get(key)
+            if not values:
+                return if_exists
+            for value in values:
+                if predicate(value):
+                    return True
+            return False
+
+    elif negate:
+        # A negated operator matches if none of the values of the key
+        # matches the policy values
+        def match(context: Context) -> bool:
+            values = context.get(key)
+            if values is None:
+                return True
+            for value in values:
+                if not predicate(value):
+                    return False
+            return True
+
+    else:
+
+        def match(context: Context) -> bool:
+            values = context.get(key)
+            if values is None:
+                return if_exists
+            for value in values:
+                if predicate(value):
+                    return True
+            return False
+
+    return match
+
+
+def _string_equals(policy_values: List[Any]) -> ValuePredicate:
+    accepted = frozenset(str(v) for v in policy_values)
+    return lambda value: (value if type(value) is str else str(value)) in accepted
+
+
+def _string_equals_ignore_case(policy_values: List[Any]) -> ValuePredicate:
+    accepted = frozenset(str(v).lower() for v in policy_values)
+    return lambda value: str(value).lower() in accepted
+
+
+def _string_like(policy_values: List[Any]) -> ValuePredicate:
+    # Literal values are looked up in a set, the patterns are combined into
+    # one regular expression.
+    literals = set()
+    patterns = []
+    for value in policy_values:
+        value = str(value)
+        if value == "*":
+            return lambda value: True
+        if "*" in value or "?" in value:
+            patterns.append(translate(value))
+        else:
+            literals.add(value)
+    if not patterns:
+        return _string_equals(list(literals))
+    fullmatch = re.compile("|".join(patterns), re.DOTALL).fullmatch
+
+    def match(value: Any) -> bool:
+        value = value if type(value) is str else str(value)
+        return value in literals or fullmatch(value) is not None
+
+    return match
+
+
+def _arn_like(policy_values: List[Any]) -> ValuePredicate:
+    matchers = [arn_like(str(v)) for v in policy_values]
+
+    def match(value: Any) -> bool:
+        value = str(value)
+        for matcher in matchers:
+            if matcher(value):
+                return True
+        return False
+
+    return match
+
+
+def _bool(policy_values: List[Any]) -> ValuePredicate:
+    accepted = frozenset(str(v).lower() for v in policy_values)
+    return lambda value: str(value).lower() in accepted
+
+
+class AddressIntervals:
+    """Set of IP addresses given by CIDR blocks, as merged intervals.
+
+    The blocks of each IP version are merged into sorted, disjoint intervals
+    of addresses, so a lookup is a bisection instead of a test per block.
+    """
+
+    def __init__(self, cidrs: List[Any]) -> None:
+        blocks: Dict[int, List[Tuple[int, int]]] = {4: [], 6: []}
+        for cidr in cidrs:
+            network = ipaddress.ip_network(str(cidr), strict=False)
+            blocks[network.version].append(
+                (int(network.network_address), int(network.broadcast_address))
+            )
+        self.intervals: Dict[int, Tuple[List[int], List[int]]] = {}
+        for version, ranges in blocks.items():
+            starts: List[int] = []
+            ends: List[int] = []
+            for start, end in sorted(ranges):
+                if ends and start <= ends[-1] + 1:
+                    ends[-1] = max(ends[-1], end)
+                else:
+                    starts.append(start)
+                    ends.append(end)
+            self.intervals[version] = (starts, ends)
+
+    def __contains__(self, value: Any) -> bool:
+        address = _parse_address(str(value))
+        if address is None:
+            return False
+        starts, ends = self.intervals[address[0]]
+        i = bisect_right(starts, address[1]) - 1
+        return i >= 0 and address[1] <= ends[i]
+
+
+@lru_cache(maxsize=65536)
+def _parse_address(value: str) -> Optional[Tuple[int, int]]:
+    try:
+        address = ipaddress.ip_address(value.split("/")[0])
+    except ValueError:
+        return None
+    return address.version, int(address)
+
+
+def _ip_address(policy_values: List[Any]) -> ValuePredicate:
+    return AddressIntervals(policy_values).__contains__
+
+
+def parse_date(value: Any) -> float:
+    """Return the POSIX timestamp of an ISO 8601 date or epoch time value."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return _parse_date_string(str(value))
+
+
+@lru_cache(maxsize=65536)
+def _parse_date_string(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    date = datetime.fromisoformat(value)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
+
+
+def _comparison(
+    convert: Callable[[Any], float], comparison: str
+) -> Callable[[List[Any]], ValuePredicate]:
+    # Matching any of several limits is matching the loosest one, so the
+    # limits are reduced to a single bound, or a set for equality.
+    def factory(policy_values: List[Any]) -> ValuePredicate:
+        limits = [convert(v) for v in policy_values]
+        if comparison == "Equals":
+            accepted = frozenset(limits)
+            compare: Callable[[float], bool] = accepted.__contains__
+        elif comparison.startswith("LessThan"):
+            bound = max(limits)
+            compare = bound.__ge__ if comparison.endswith("Equals") else bound.__gt__
+        else:
+            bound = min(limits)
+            compare = bound.__le__ if comparison.endswith("Equals") else bound.__lt__
+
+        def match(value: Any) -> bool:
+            try:
+                return compare(convert(value))
+            except (TypeError, ValueError):
+                return False
+
+        return match
+
+    return factory
+
+
+_operators: Dict[str, Callable[[List[Any]], ValuePredicate]] = {
+    "ArnEquals": _arn_like,
+    "ArnLike": _arn_like,
+    "Bool": _bool,
+    "IpAddress": _ip_address,
+    "StringEquals": _string_equals,
+    "StringEqualsIgnoreCase": _string_equals_ignore_case,
+    "StringLike": _string_like,
+}
+for _comparison_name in (
+    "Equals",
+    "LessThan",
+    "LessThanEquals",
+    "GreaterThan",
+    "GreaterThanEquals",
+):
+    _operators["Numeric" + _comparison_name] = _comparison(float, _comparison_name)
+    _operators["Date" + _comparison_name] = _comparison(parse_date, _comparison_name)
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,73 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptQualificationRequest = Action("AcceptQualificationRequest")
-ApproveAssignment = Action("ApproveAssignment")
-ApproveRejectedAssignment = Action("ApproveRejectedAssignment")
-AssignQualification = Action("AssignQualification")
-AssociateQualificationWithWorker = Action("AssociateQualificationWithWorker")
-BlockWorker = Action("BlockWorker")
-ChangeHITTypeOfHIT = Action("ChangeHITTypeOfHIT")
-CreateAdditionalAssignmentsForHIT = Action("CreateAdditionalAssignmentsForHIT")
-CreateHIT = Action("CreateHIT")
-CreateHITType = Action("CreateHITType")
-CreateHITWithHITType = Action("CreateHITWithHITType")
-CreateQualificationType = Action("CreateQualificationType")
-CreateWorkerBlock = Action("CreateWorkerBlock")
-DeleteHIT = Action("DeleteHIT")
-DeleteQualificationType = Action("DeleteQualificationType")
-DeleteWorkerBlock = Action("DeleteWorkerBlock")
-DisableHIT = Action("DisableHIT")
-DisassociateQualificationFromWorker = Action("DisassociateQualificationFromWorker")
-DisposeHIT = Action("DisposeHIT")
-DisposeQualificationType = Action("DisposeQualificationType")
-ExtendHIT = Action("ExtendHIT")
-ForceExpireHIT = Action("ForceExpireHIT")
-GetAccountBalance = Action("GetAccountBalance")
-GetAssignment = Action("GetAssignment")
-GetAssignmentsForHIT = Action("GetAssignmentsForHIT")
-GetBlockedWorkers = Action("GetBlockedWorkers")
-GetBonusPayments = Action("GetBonusPayments")
-GetFileUploadURL = Action("GetFileUploadURL")
-GetHIT = Action("GetHIT")
-GetHITsForQualificationType = Action("GetHITsForQualificationType")
-GetQualificationRequests = Action("GetQualificationRequests")
-GetQualificationScore = Action("GetQualificationScore")
-GetQualificationType = Action("GetQualificationType")
-GetQualificationsForQualificationType = Action("GetQualificationsForQualificationType")
-GetRequesterStatistic = Action("GetRequesterStatistic")
-GetRequesterWorkerStatistic = Action("GetRequesterWorkerStatistic")
-GetReviewResultsForHIT = Action("GetReviewResultsForHIT")
-GetReviewableHITs = Action("GetReviewableHITs")
-GetTask = Action("GetTask")
-GrantBonus = Action("GrantBonus")
-GrantQualification = Action("GrantQualification")
-ListAssignmentsForHIT = Action("ListAssignmentsForHIT")
-ListBonusPayments = Action("ListBonusPayments")
-ListHITs = Action("ListHITs")
-ListHITsForQualificationType = Action("ListHITsForQualificationType")
-ListQualificationRequests = Action("ListQualificationRequests")
-ListQualificationTypes = Action("ListQualificationTypes")
-ListReviewPolicyResultsForHIT = Action("ListReviewPolicyResultsForHIT")
-ListReviewableHITs = Action("ListReviewableHITs")
-ListWorkerBlocks = Action("ListWorkerBlocks")
-ListWorkersWithQualificationType = Action("ListWorkersWithQualificationType")
-NotifyWorkers = Action("NotifyWorkers")
-PutTask = Action("PutTask")
-RegisterHITType = Action("RegisterHITType")
-RejectAssignment = Action("RejectAssignment")
-RejectQualificationRequest = Action("RejectQualificationRequest")
-RevokeQualification = Action("RevokeQualification")
-SearchHITs = Action("SearchHITs")
-SearchQualificationTypes = Action("SearchQualificationTypes")
-SendBonus = Action("SendBonus")
-SendTestEventNotification = Action("SendTestEventNotification")
-SetHITAsReviewing = Action("SetHITAsReviewing")
-SetHITTypeNotification = Action("SetHITTypeNotification")
-UnblockWorker = Action("UnblockWorker")
-UpdateExpirationForHIT = Action("UpdateExpirationForHIT")
-UpdateHITReviewStatus = Action("UpdateHITReviewStatus")
-UpdateHITTypeOfHIT = Action("UpdateHITTypeOfHIT")
-UpdateNotificationSettings = Action("UpdateNotificationSettings")
-UpdateQualificationScore = Action("UpdateQualificationScore")
-UpdateQualificationType = Action("UpdateQualificationType")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,42 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchDeleteRecipeVersion = Action("BatchDeleteRecipeVersion")
-CreateDataset = Action("CreateDataset")
-CreateProfileJob = Action("CreateProfileJob")
-CreateProject = Action("CreateProject")
-CreateRecipe = Action("CreateRecipe")
-CreateRecipeJob = Action("CreateRecipeJob")
-CreateSchedule = Action("CreateSchedule")
-DeleteDataset = Action("DeleteDataset")
-DeleteJob = Action("DeleteJob")
-DeleteProject = Action("DeleteProject")
-DeleteRecipeVersion = Action("DeleteRecipeVersion")
-DeleteSchedule = Action("DeleteSchedule")
-DescribeDataset = Action("DescribeDataset")
-DescribeJob = Action("DescribeJob")
-DescribeJobRun = Action("DescribeJobRun")
-DescribeProject = Action("DescribeProject")
-DescribeRecipe = Action("DescribeRecipe")
-DescribeSchedule = Action("DescribeSchedule")
-ListDatasets = Action("ListDatasets")
-ListJobRuns = Action("ListJobRuns")
-ListJobs = Action("ListJobs")
-ListProjects = Action("ListProjects")
-ListRecipeVersions = Action("ListRecipeVersions")
-ListRecipes = Action("ListRecipes")
-ListSchedules = Action("ListSchedules")
-ListTagsForResource = Action("ListTagsForResource")
-PublishRecipe = Action("PublishRecipe")
-SendProjectSessionAction = Action("SendProjectSessionAction")
-StartJobRun = Action("StartJobRun")
-StartProjectSession = Action("StartProjectSession")
-StopJobRun = Action("StopJobRun")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDataset = Action("UpdateDataset")
-UpdateProfileJob = Action("UpdateProfileJob")
-UpdateProject = Action("UpdateProject")
-UpdateRecipe = Action("UpdateRecipe")
-UpdateRecipeJob = Action("UpdateRecipeJob")
-UpdateSchedule = Action("UpdateSchedule")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
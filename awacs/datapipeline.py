@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,24 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ActivatePipeline = Action("ActivatePipeline")
-AddTags = Action("AddTags")
-CreatePipeline = Action("CreatePipeline")
-DeactivatePipeline = Action("DeactivatePipeline")
-DeletePipeline = Action("DeletePipeline")
-DescribeObjects = Action("DescribeObjects")
-DescribePipelines = Action("DescribePipelines")
-EvaluateExpression = Action("EvaluateExpression")
-GetAccountLimits = Action("GetAccountLimits")
-GetPipelineDefinition = Action("GetPipelineDefinition")
-ListPipelines = Action("ListPipelines")
-PollForTask = Action("PollForTask")
-PutAccountLimits = Action("PutAccountLimits")
-PutPipelineDefinition = Action("PutPipelineDefinition")
-QueryObjects = Action("QueryObjects")
-RemoveTags = Action("RemoveTags")
-ReportTaskProgress = Action("ReportTaskProgress")
-ReportTaskRunnerHeartbeat = Action("ReportTaskRunnerHeartbeat")
-SetStatus = Action("SetStatus")
-SetTaskStatus = Action("SetTaskStatus")
-ValidatePipelineDefinition = Action("ValidatePipelineDefinition")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,35 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelTaskExecution = Action("CancelTaskExecution")
-CreateAgent = Action("CreateAgent")
-CreateLocationEfs = Action("CreateLocationEfs")
-CreateLocationFsxWindows = Action("CreateLocationFsxWindows")
-CreateLocationNfs = Action("CreateLocationNfs")
-CreateLocationObjectStorage = Action("CreateLocationObjectStorage")
-CreateLocationS3 = Action("CreateLocationS3")
-CreateLocationSmb = Action("CreateLocationSmb")
-CreateTask = Action("CreateTask")
-DeleteAgent = Action("DeleteAgent")
-DeleteLocation = Action("DeleteLocation")
-DeleteTask = Action("DeleteTask")
-DescribeAgent = Action("DescribeAgent")
-DescribeLocationEfs = Action("DescribeLocationEfs")
-DescribeLocationFsxWindows = Action("DescribeLocationFsxWindows")
-DescribeLocationNfs = Action("DescribeLocationNfs")
-DescribeLocationObjectStorage = Action("DescribeLocationObjectStorage")
-DescribeLocationS3 = Action("DescribeLocationS3")
-DescribeLocationSmb = Action("DescribeLocationSmb")
-DescribeTask = Action("DescribeTask")
-DescribeTaskExecution = Action("DescribeTaskExecution")
-ListAgents = Action("ListAgents")
-ListLocations = Action("ListLocations")
-ListTagsForResource = Action("ListTagsForResource")
-ListTaskExecutions = Action("ListTaskExecutions")
-ListTasks = Action("ListTasks")
-StartTaskExecution = Action("StartTaskExecution")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAgent = Action("UpdateAgent")
-UpdateTask = Action("UpdateTask")
-UpdateTaskExecution = Action("UpdateTaskExecution")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,38 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchGetItem = Action("BatchGetItem")
-BatchWriteItem = Action("BatchWriteItem")
-ConditionCheckItem = Action("ConditionCheckItem")
-CreateCluster = Action("CreateCluster")
-CreateParameterGroup = Action("CreateParameterGroup")
-CreateSubnetGroup = Action("CreateSubnetGroup")
-DecreaseReplicationFactor = Action("DecreaseReplicationFactor")
-DefineAttributeList = Action("DefineAttributeList")
-DefineAttributeListId = Action("DefineAttributeListId")
-DefineKeySchema = Action("DefineKeySchema")
-DeleteCluster = Action("DeleteCluster")
-DeleteItem = Action("DeleteItem")
-DeleteParameterGroup = Action("DeleteParameterGroup")
-DeleteSubnetGroup = Action("DeleteSubnetGroup")
-DescribeClusters = Action("DescribeClusters")
-DescribeDefaultParameters = Action("DescribeDefaultParameters")
-DescribeEvents = Action("DescribeEvents")
-DescribeParameterGroups = Action("DescribeParameterGroups")
-DescribeParameters = Action("DescribeParameters")
-DescribeSubnetGroups = Action("DescribeSubnetGroups")
-DescribeTable = Action("DescribeTable")
-GetItem = Action("GetItem")
-IncreaseReplicationFactor = Action("IncreaseReplicationFactor")
-ListTables = Action("ListTables")
-ListTags = Action("ListTags")
-PutItem = Action("PutItem")
-Query = Action("Query")
-RebootNode = Action("RebootNode")
-Scan = Action("Scan")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateCluster = Action("UpdateCluster")
-UpdateItem = Action("UpdateItem")
-UpdateParameterGroup = Action("UpdateParameterGroup")
-UpdateSubnetGroup = Action("UpdateSubnetGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateServiceRoleToAccount = Action("AssociateServiceRoleToAccount")
-BatchGetDevice = Action("BatchGetDevice")
-BatchGetModel = Action("BatchGetModel")
-BatchGetProject = Action("BatchGetProject")
-CreateDeviceCertificates = Action("CreateDeviceCertificates")
-CreateModel = Action("CreateModel")
-CreateProject = Action("CreateProject")
-DeleteModel = Action("DeleteModel")
-DeleteProject = Action("DeleteProject")
-DeployProject = Action("DeployProject")
-DeregisterDevice = Action("DeregisterDevice")
-GetAssociatedResources = Action("GetAssociatedResources")
-GetDeploymentStatus = Action("GetDeploymentStatus")
-GetDevice = Action("GetDevice")
-GetModel = Action("GetModel")
-GetProject = Action("GetProject")
-ImportProjectFromTemplate = Action("ImportProjectFromTemplate")
-ListDeployments = Action("ListDeployments")
-ListDevices = Action("ListDevices")
-ListModels = Action("ListModels")
-ListProjects = Action("ListProjects")
-RegisterDevice = Action("RegisterDevice")
-RemoveProject = Action("RemoveProject")
-UpdateProject = Action("UpdateProject")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,31 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CloneReinforcementLearningModel = Action("CloneReinforcementLearningModel")
-CreateAccountResources = Action("CreateAccountResources")
-CreateLeaderboardSubmission = Action("CreateLeaderboardSubmission")
-CreateReinforcementLearningModel = Action("CreateReinforcementLearningModel")
-DeleteAccountResources = Action("DeleteAccountResources")
-DeleteModel = Action("DeleteModel")
-GetAccountResources = Action("GetAccountResources")
-GetAlias = Action("GetAlias")
-GetEvaluation = Action("GetEvaluation")
-GetLatestUserSubmission = Action("GetLatestUserSubmission")
-GetLeaderboard = Action("GetLeaderboard")
-GetModel = Action("GetModel")
-GetRankedUserSubmission = Action("GetRankedUserSubmission")
-GetTrack = Action("GetTrack")
-GetTrainingJob = Action("GetTrainingJob")
-ListEvaluations = Action("ListEvaluations")
-ListLeaderboardSubmissions = Action("ListLeaderboardSubmissions")
-ListLeaderboards = Action("ListLeaderboards")
-ListModels = Action("ListModels")
-ListTracks = Action("ListTracks")
-ListTrainingJobs = Action("ListTrainingJobs")
-SetAlias = Action("SetAlias")
-StartEvaluation = Action("StartEvaluation")
-StopEvaluation = Action("StopEvaluation")
-StopTrainingReinforcementLearningModel = Action(
-    "StopTrainingReinforcementLearningModel"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-TestRewardFunction = Action("TestRewardFunction")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
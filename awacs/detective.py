@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,23 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInvitation = Action("AcceptInvitation")
-CreateGraph = Action("CreateGraph")
-CreateMembers = Action("CreateMembers")
-DeleteGraph = Action("DeleteGraph")
-DeleteMembers = Action("DeleteMembers")
-DisassociateMembership = Action("DisassociateMembership")
-GetFreeTrialEligibility = Action("GetFreeTrialEligibility")
-GetGraphIngestState = Action("GetGraphIngestState")
-GetMembers = Action("GetMembers")
-GetPricingInformation = Action("GetPricingInformation")
-GetUsageInformation = Action("GetUsageInformation")
-ListGraphs = Action("ListGraphs")
-ListInvitations = Action("ListInvitations")
-ListMembers = Action("ListMembers")
-ListTagsForResource = Action("ListTagsForResource")
-RejectInvitation = Action("RejectInvitation")
-SearchGraph = Action("SearchGraph")
-StartMonitoringMember = Action("StartMonitoringMember")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
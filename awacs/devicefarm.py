@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,80 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateDevicePool = Action("CreateDevicePool")
-CreateInstanceProfile = Action("CreateInstanceProfile")
-CreateNetworkProfile = Action("CreateNetworkProfile")
-CreateProject = Action("CreateProject")
-CreateRemoteAccessSession = Action("CreateRemoteAccessSession")
-CreateTestGridProject = Action("CreateTestGridProject")
-CreateTestGridUrl = Action("CreateTestGridUrl")
-CreateUpload = Action("CreateUpload")
-CreateVPCEConfiguration = Action("CreateVPCEConfiguration")
-DeleteDevicePool = Action("DeleteDevicePool")
-DeleteInstanceProfile = Action("DeleteInstanceProfile")
-DeleteNetworkProfile = Action("DeleteNetworkProfile")
-DeleteProject = Action("DeleteProject")
-DeleteRemoteAccessSession = Action("DeleteRemoteAccessSession")
-DeleteRun = Action("DeleteRun")
-DeleteTestGridProject = Action("DeleteTestGridProject")
-DeleteUpload = Action("DeleteUpload")
-DeleteVPCEConfiguration = Action("DeleteVPCEConfiguration")
-GetAccountSettings = Action("GetAccountSettings")
-GetDevice = Action("GetDevice")
-GetDeviceInstance = Action("GetDeviceInstance")
-GetDevicePool = Action("GetDevicePool")
-GetDevicePoolCompatibility = Action("GetDevicePoolCompatibility")
-GetInstanceProfile = Action("GetInstanceProfile")
-GetJob = Action("GetJob")
-GetNetworkProfile = Action("GetNetworkProfile")
-GetOfferingStatus = Action("GetOfferingStatus")
-GetProject = Action("GetProject")
-GetRemoteAccessSession = Action("GetRemoteAccessSession")
-GetRun = Action("GetRun")
-GetSuite = Action("GetSuite")
-GetTest = Action("GetTest")
-GetTestGridProject = Action("GetTestGridProject")
-GetTestGridSession = Action("GetTestGridSession")
-GetUpload = Action("GetUpload")
-GetVPCEConfiguration = Action("GetVPCEConfiguration")
-InstallToRemoteAccessSession = Action("InstallToRemoteAccessSession")
-ListArtifacts = Action("ListArtifacts")
-ListDeviceInstances = Action("ListDeviceInstances")
-ListDevicePools = Action("ListDevicePools")
-ListDevices = Action("ListDevices")
-ListInstanceProfiles = Action("ListInstanceProfiles")
-ListJobs = Action("ListJobs")
-ListNetworkProfiles = Action("ListNetworkProfiles")
-ListOfferingPromotions = Action("ListOfferingPromotions")
-ListOfferingTransactions = Action("ListOfferingTransactions")
-ListOfferings = Action("ListOfferings")
-ListProjects = Action("ListProjects")
-ListRemoteAccessSessions = Action("ListRemoteAccessSessions")
-ListRuns = Action("ListRuns")
-ListSamples = Action("ListSamples")
-ListSuites = Action("ListSuites")
-ListTagsForResource = Action("ListTagsForResource")
-ListTestGridProjects = Action("ListTestGridProjects")
-ListTestGridSessionActions = Action("ListTestGridSessionActions")
-ListTestGridSessionArtifacts = Action("ListTestGridSessionArtifacts")
-ListTestGridSessions = Action("ListTestGridSessions")
-ListTests = Action("ListTests")
-ListUniqueProblems = Action("ListUniqueProblems")
-ListUploads = Action("ListUploads")
-ListVPCEConfigurations = Action("ListVPCEConfigurations")
-PurchaseOffering = Action("PurchaseOffering")
-RenewOffering = Action("RenewOffering")
-ScheduleRun = Action("ScheduleRun")
-StopJob = Action("StopJob")
-StopRemoteAccessSession = Action("StopRemoteAccessSession")
-StopRun = Action("StopRun")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDeviceInstance = Action("UpdateDeviceInstance")
-UpdateDevicePool = Action("UpdateDevicePool")
-UpdateInstanceProfile = Action("UpdateInstanceProfile")
-UpdateNetworkProfile = Action("UpdateNetworkProfile")
-UpdateProject = Action("UpdateProject")
-UpdateTestGridProject = Action("UpdateTestGridProject")
-UpdateUpload = Action("UpdateUpload")
-UpdateVPCEConfiguration = Action("UpdateVPCEConfiguration")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,71 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptDirectConnectGatewayAssociationProposal = Action(
-    "AcceptDirectConnectGatewayAssociationProposal"
-)
-AllocateConnectionOnInterconnect = Action("AllocateConnectionOnInterconnect")
-AllocateHostedConnection = Action("AllocateHostedConnection")
-AllocatePrivateVirtualInterface = Action("AllocatePrivateVirtualInterface")
-AllocatePublicVirtualInterface = Action("AllocatePublicVirtualInterface")
-AllocateTransitVirtualInterface = Action("AllocateTransitVirtualInterface")
-AssociateConnectionWithLag = Action("AssociateConnectionWithLag")
-AssociateHostedConnection = Action("AssociateHostedConnection")
-AssociateVirtualInterface = Action("AssociateVirtualInterface")
-ConfirmConnection = Action("ConfirmConnection")
-ConfirmPrivateVirtualInterface = Action("ConfirmPrivateVirtualInterface")
-ConfirmPublicVirtualInterface = Action("ConfirmPublicVirtualInterface")
-ConfirmTransitVirtualInterface = Action("ConfirmTransitVirtualInterface")
-CreateBGPPeer = Action("CreateBGPPeer")
-CreateConnection = Action("CreateConnection")
-CreateDirectConnectGateway = Action("CreateDirectConnectGateway")
-CreateDirectConnectGatewayAssociation = Action("CreateDirectConnectGatewayAssociation")
-CreateDirectConnectGatewayAssociationProposal = Action(
-    "CreateDirectConnectGatewayAssociationProposal"
-)
-CreateInterconnect = Action("CreateInterconnect")
-CreateLag = Action("CreateLag")
-CreatePrivateVirtualInterface = Action("CreatePrivateVirtualInterface")
-CreatePublicVirtualInterface = Action("CreatePublicVirtualInterface")
-CreateTransitVirtualInterface = Action("CreateTransitVirtualInterface")
-DeleteBGPPeer = Action("DeleteBGPPeer")
-DeleteConnection = Action("DeleteConnection")
-DeleteDirectConnectGateway = Action("DeleteDirectConnectGateway")
-DeleteDirectConnectGatewayAssociation = Action("DeleteDirectConnectGatewayAssociation")
-DeleteDirectConnectGatewayAssociationProposal = Action(
-    "DeleteDirectConnectGatewayAssociationProposal"
-)
-DeleteInterconnect = Action("DeleteInterconnect")
-DeleteLag = Action("DeleteLag")
-DeleteVirtualInterface = Action("DeleteVirtualInterface")
-DescribeConnectionLoa = Action("DescribeConnectionLoa")
-DescribeConnections = Action("DescribeConnections")
-DescribeConnectionsOnInterconnect = Action("DescribeConnectionsOnInterconnect")
-DescribeDirectConnectGatewayAssociationProposals = Action(
-    "DescribeDirectConnectGatewayAssociationProposals"
-)
-DescribeDirectConnectGatewayAssociations = Action(
-    "DescribeDirectConnectGatewayAssociations"
-)
-DescribeDirectConnectGatewayAttachments = Action(
-    "DescribeDirectConnectGatewayAttachments"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DescribeDirectConnectGateways = Action("DescribeDirectConnectGateways")
-DescribeHostedConnections = Action("DescribeHostedConnections")
-DescribeInterconnectLoa = Action("DescribeInterconnectLoa")
-DescribeInterconnects = Action("DescribeInterconnects")
-DescribeLags = Action("DescribeLags")
-DescribeLoa = Action("DescribeLoa")
-DescribeLocations = Action("DescribeLocations")
-DescribeTags = Action("DescribeTags")
-DescribeVirtualGateways = Action("DescribeVirtualGateways")
-DescribeVirtualInterfaces = Action("DescribeVirtualInterfaces")
-DisassociateConnectionFromLag = Action("DisassociateConnectionFromLag")
-ListVirtualInterfaceTestHistory = Action("ListVirtualInterfaceTestHistory")
-StartBgpFailoverTest = Action("StartBgpFailoverTest")
-StopBgpFailoverTest = Action("StopBgpFailoverTest")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDirectConnectGatewayAssociation = Action("UpdateDirectConnectGatewayAssociation")
-UpdateLag = Action("UpdateLag")
-UpdateVirtualInterfaceAttributes = Action("UpdateVirtualInterfaceAttributes")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
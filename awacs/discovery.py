@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,32 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateConfigurationItemsToApplication = Action(
-    "AssociateConfigurationItemsToApplication"
-)
-BatchDeleteImportData = Action("BatchDeleteImportData")
-CreateApplication = Action("CreateApplication")
-CreateTags = Action("CreateTags")
-DeleteApplications = Action("DeleteApplications")
-DeleteTags = Action("DeleteTags")
-DescribeAgents = Action("DescribeAgents")
-DescribeConfigurations = Action("DescribeConfigurations")
-DescribeContinuousExports = Action("DescribeContinuousExports")
-DescribeExportConfigurations = Action("DescribeExportConfigurations")
-DescribeExportTasks = Action("DescribeExportTasks")
-DescribeImportTasks = Action("DescribeImportTasks")
-DescribeTags = Action("DescribeTags")
-DisassociateConfigurationItemsFromApplication = Action(
-    "DisassociateConfigurationItemsFromApplication"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ExportConfigurations = Action("ExportConfigurations")
-GetDiscoverySummary = Action("GetDiscoverySummary")
-ListConfigurations = Action("ListConfigurations")
-ListServerNeighbors = Action("ListServerNeighbors")
-StartContinuousExport = Action("StartContinuousExport")
-StartDataCollectionByAgentIds = Action("StartDataCollectionByAgentIds")
-StartExportTask = Action("StartExportTask")
-StartImportTask = Action("StartImportTask")
-StopContinuousExport = Action("StopContinuousExport")
-StopDataCollectionByAgentIds = Action("StopDataCollectionByAgentIds")
-UpdateApplication = Action("UpdateApplication")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
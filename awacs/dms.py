@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,60 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTagsToResource = Action("AddTagsToResource")
-ApplyPendingMaintenanceAction = Action("ApplyPendingMaintenanceAction")
-CancelReplicationTaskAssessmentRun = Action("CancelReplicationTaskAssessmentRun")
-CreateEndpoint = Action("CreateEndpoint")
-CreateEventSubscription = Action("CreateEventSubscription")
-CreateReplicationInstance = Action("CreateReplicationInstance")
-CreateReplicationSubnetGroup = Action("CreateReplicationSubnetGroup")
-CreateReplicationTask = Action("CreateReplicationTask")
-DeleteCertificate = Action("DeleteCertificate")
-DeleteEndpoint = Action("DeleteEndpoint")
-DeleteEventSubscription = Action("DeleteEventSubscription")
-DeleteReplicationInstance = Action("DeleteReplicationInstance")
-DeleteReplicationSubnetGroup = Action("DeleteReplicationSubnetGroup")
-DeleteReplicationTask = Action("DeleteReplicationTask")
-DeleteReplicationTaskAssessmentRun = Action("DeleteReplicationTaskAssessmentRun")
-DescribeAccountAttributes = Action("DescribeAccountAttributes")
-DescribeApplicableIndividualAssessments = Action(
-    "DescribeApplicableIndividualAssessments"
-)
-DescribeCertificates = Action("DescribeCertificates")
-DescribeConnections = Action("DescribeConnections")
-DescribeEndpointTypes = Action("DescribeEndpointTypes")
-DescribeEndpoints = Action("DescribeEndpoints")
-DescribeEventCategories = Action("DescribeEventCategories")
-DescribeEventSubscriptions = Action("DescribeEventSubscriptions")
-DescribeEvents = Action("DescribeEvents")
-DescribeOrderableReplicationInstances = Action("DescribeOrderableReplicationInstances")
-DescribeRefreshSchemasStatus = Action("DescribeRefreshSchemasStatus")
-DescribeReplicationInstanceTaskLogs = Action("DescribeReplicationInstanceTaskLogs")
-DescribeReplicationInstances = Action("DescribeReplicationInstances")
-DescribeReplicationSubnetGroups = Action("DescribeReplicationSubnetGroups")
-DescribeReplicationTaskAssessmentResults = Action(
-    "DescribeReplicationTaskAssessmentResults"
-)
-DescribeReplicationTaskAssessmentRuns = Action("DescribeReplicationTaskAssessmentRuns")
-DescribeReplicationTaskIndividualAssessments = Action(
-    "DescribeReplicationTaskIndividualAssessments"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DescribeReplicationTasks = Action("DescribeReplicationTasks")
-DescribeSchemas = Action("DescribeSchemas")
-DescribeTableStatistics = Action("DescribeTableStatistics")
-ImportCertificate = Action("ImportCertificate")
-ListTagsForResource = Action("ListTagsForResource")
-ModifyEndpoint = Action("ModifyEndpoint")
-ModifyEventSubscription = Action("ModifyEventSubscription")
-ModifyReplicationInstance = Action("ModifyReplicationInstance")
-ModifyReplicationSubnetGroup = Action("ModifyReplicationSubnetGroup")
-ModifyReplicationTask = Action("ModifyReplicationTask")
-RebootReplicationInstance = Action("RebootReplicationInstance")
-RefreshSchemas = Action("RefreshSchemas")
-ReloadTables = Action("ReloadTables")
-RemoveTagsFromResource = Action("RemoveTagsFromResource")
-StartReplicationTask = Action("StartReplicationTask")
-StartReplicationTaskAssessment = Action("StartReplicationTaskAssessment")
-StartReplicationTaskAssessmentRun = Action("StartReplicationTaskAssessmentRun")
-StopReplicationTask = Action("StopReplicationTask")
-TestConnection = Action("TestConnection")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
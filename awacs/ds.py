@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,66 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptSharedDirectory = Action("AcceptSharedDirectory")
-AddIpRoutes = Action("AddIpRoutes")
-AddTagsToResource = Action("AddTagsToResource")
-AuthorizeApplication = Action("AuthorizeApplication")
-CancelSchemaExtension = Action("CancelSchemaExtension")
-CheckAlias = Action("CheckAlias")
-ConnectDirectory = Action("ConnectDirectory")
-CreateAlias = Action("CreateAlias")
-CreateComputer = Action("CreateComputer")
-CreateConditionalForwarder = Action("CreateConditionalForwarder")
-CreateDirectory = Action("CreateDirectory")
-CreateIdentityPoolDirectory = Action("CreateIdentityPoolDirectory")
-CreateLogSubscription = Action("CreateLogSubscription")
-CreateMicrosoftAD = Action("CreateMicrosoftAD")
-CreateSnapshot = Action("CreateSnapshot")
-CreateTrust = Action("CreateTrust")
-DeleteConditionalForwarder = Action("DeleteConditionalForwarder")
-DeleteDirectory = Action("DeleteDirectory")
-DeleteLogSubscription = Action("DeleteLogSubscription")
-DeleteSnapshot = Action("DeleteSnapshot")
-DeleteTrust = Action("DeleteTrust")
-DeregisterCertificate = Action("DeregisterCertificate")
-DeregisterEventTopic = Action("DeregisterEventTopic")
-DescribeCertificate = Action("DescribeCertificate")
-DescribeConditionalForwarders = Action("DescribeConditionalForwarders")
-DescribeDirectories = Action("DescribeDirectories")
-DescribeDomainControllers = Action("DescribeDomainControllers")
-DescribeEventTopics = Action("DescribeEventTopics")
-DescribeLDAPSSettings = Action("DescribeLDAPSSettings")
-DescribeSharedDirectories = Action("DescribeSharedDirectories")
-DescribeSnapshots = Action("DescribeSnapshots")
-DescribeTrusts = Action("DescribeTrusts")
-DisableLDAPS = Action("DisableLDAPS")
-DisableRadius = Action("DisableRadius")
-DisableSso = Action("DisableSso")
-EnableLDAPS = Action("EnableLDAPS")
-EnableRadius = Action("EnableRadius")
-EnableSso = Action("EnableSso")
-GetAuthorizedApplicationDetails = Action("GetAuthorizedApplicationDetails")
-GetDirectoryLimits = Action("GetDirectoryLimits")
-GetSnapshotLimits = Action("GetSnapshotLimits")
-ListAuthorizedApplications = Action("ListAuthorizedApplications")
-ListCertificates = Action("ListCertificates")
-ListIpRoutes = Action("ListIpRoutes")
-ListLogSubscriptions = Action("ListLogSubscriptions")
-ListSchemaExtensions = Action("ListSchemaExtensions")
-ListTagsForResource = Action("ListTagsForResource")
-RegisterCertificate = Action("RegisterCertificate")
-RegisterEventTopic = Action("RegisterEventTopic")
-RejectSharedDirectory = Action("RejectSharedDirectory")
-RemoveIpRoutes = Action("RemoveIpRoutes")
-RemoveTagsFromResource = Action("RemoveTagsFromResource")
-ResetUserPassword = Action("ResetUserPassword")
-RestoreFromSnapshot = Action("RestoreFromSnapshot")
-ShareDirectory = Action("ShareDirectory")
-StartSchemaExtension = Action("StartSchemaExtension")
-UnauthorizeApplication = Action("UnauthorizeApplication")
-UnshareDirectory = Action("UnshareDirectory")
-UpdateConditionalForwarder = Action("UpdateConditionalForwarder")
-UpdateNumberOfDomainControllers = Action("UpdateNumberOfDomainControllers")
-UpdateRadius = Action("UpdateRadius")
-UpdateTrust = Action("UpdateTrust")
-VerifyTrust = Action("VerifyTrust")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,61 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchGetItem = Action("BatchGetItem")
-BatchWriteItem = Action("BatchWriteItem")
-ConditionCheckItem = Action("ConditionCheckItem")
-CreateBackup = Action("CreateBackup")
-CreateGlobalTable = Action("CreateGlobalTable")
-CreateTable = Action("CreateTable")
-CreateTableReplica = Action("CreateTableReplica")
-DeleteBackup = Action("DeleteBackup")
-DeleteItem = Action("DeleteItem")
-DeleteTable = Action("DeleteTable")
-DeleteTableReplica = Action("DeleteTableReplica")
-DescribeBackup = Action("DescribeBackup")
-DescribeContinuousBackups = Action("DescribeContinuousBackups")
-DescribeContributorInsights = Action("DescribeContributorInsights")
-DescribeExport = Action("DescribeExport")
-DescribeGlobalTable = Action("DescribeGlobalTable")
-DescribeGlobalTableSettings = Action("DescribeGlobalTableSettings")
-DescribeKinesisStreamingDestination = Action("DescribeKinesisStreamingDestination")
-DescribeLimits = Action("DescribeLimits")
-DescribeReservedCapacity = Action("DescribeReservedCapacity")
-DescribeReservedCapacityOfferings = Action("DescribeReservedCapacityOfferings")
-DescribeStream = Action("DescribeStream")
-DescribeTable = Action("DescribeTable")
-DescribeTableReplicaAutoScaling = Action("DescribeTableReplicaAutoScaling")
-DescribeTimeToLive = Action("DescribeTimeToLive")
-DisableKinesisStreamingDestination = Action("DisableKinesisStreamingDestination")
-EnableKinesisStreamingDestination = Action("EnableKinesisStreamingDestination")
-ExportTableToPointInTime = Action("ExportTableToPointInTime")
-GetItem = Action("GetItem")
-GetRecords = Action("GetRecords")
-GetShardIterator = Action("GetShardIterator")
-ListBackups = Action("ListBackups")
-ListContributorInsights = Action("ListContributorInsights")
-ListExports = Action("ListExports")
-ListGlobalTables = Action("ListGlobalTables")
-ListStreams = Action("ListStreams")
-ListTables = Action("ListTables")
-ListTagsOfResource = Action("ListTagsOfResource")
-PartiQLDelete = Action("PartiQLDelete")
-PartiQLInsert = Action("PartiQLInsert")
-PartiQLSelect = Action("PartiQLSelect")
-PartiQLUpdate = Action("PartiQLUpdate")
-PurchaseReservedCapacityOfferings = Action("PurchaseReservedCapacityOfferings")
-PutItem = Action("PutItem")
-Query = Action("Query")
-RestoreTableFromBackup = Action("RestoreTableFromBackup")
-RestoreTableToPointInTime = Action("RestoreTableToPointInTime")
-Scan = Action("Scan")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateContinuousBackups = Action("UpdateContinuousBackups")
-UpdateContributorInsights = Action("UpdateContributorInsights")
-UpdateGlobalTable = Action("UpdateGlobalTable")
-UpdateGlobalTableSettings = Action("UpdateGlobalTableSettings")
-UpdateItem = Action("UpdateItem")
-UpdateTable = Action("UpdateTable")
-UpdateTableReplicaAutoScaling = Action("UpdateTableReplicaAutoScaling")
-UpdateTimeToLive = Action("UpdateTimeToLive")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,38 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchCheckLayerAvailability = Action("BatchCheckLayerAvailability")
-BatchDeleteImage = Action("BatchDeleteImage")
-BatchGetImage = Action("BatchGetImage")
-CompleteLayerUpload = Action("CompleteLayerUpload")
-CreateRepository = Action("CreateRepository")
-DeleteLifecyclePolicy = Action("DeleteLifecyclePolicy")
-DeleteRegistryPolicy = Action("DeleteRegistryPolicy")
-DeleteRepository = Action("DeleteRepository")
-DeleteRepositoryPolicy = Action("DeleteRepositoryPolicy")
-DescribeImageScanFindings = Action("DescribeImageScanFindings")
-DescribeImages = Action("DescribeImages")
-DescribeRegistry = Action("DescribeRegistry")
-DescribeRepositories = Action("DescribeRepositories")
-GetAuthorizationToken = Action("GetAuthorizationToken")
-GetDownloadUrlForLayer = Action("GetDownloadUrlForLayer")
-GetLifecyclePolicy = Action("GetLifecyclePolicy")
-GetLifecyclePolicyPreview = Action("GetLifecyclePolicyPreview")
-GetRegistryPolicy = Action("GetRegistryPolicy")
-GetRepositoryPolicy = Action("GetRepositoryPolicy")
-InitiateLayerUpload = Action("InitiateLayerUpload")
-ListImages = Action("ListImages")
-ListTagsForResource = Action("ListTagsForResource")
-PutImage = Action("PutImage")
-PutImageScanningConfiguration = Action("PutImageScanningConfiguration")
-PutImageTagMutability = Action("PutImageTagMutability")
-PutLifecyclePolicy = Action("PutLifecyclePolicy")
-PutRegistryPolicy = Action("PutRegistryPolicy")
-PutReplicationConfiguration = Action("PutReplicationConfiguration")
-ReplicateImage = Action("ReplicateImage")
-SetRepositoryPolicy = Action("SetRepositoryPolicy")
-StartImageScan = Action("StartImageScan")
-StartLifecyclePolicyPreview = Action("StartLifecyclePolicyPreview")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UploadLayerPart = Action("UploadLayerPart")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchCheckLayerAvailability = Action("BatchCheckLayerAvailability")
-BatchDeleteImage = Action("BatchDeleteImage")
-CompleteLayerUpload = Action("CompleteLayerUpload")
-CreateRepository = Action("CreateRepository")
-DeleteRepository = Action("DeleteRepository")
-DeleteRepositoryPolicy = Action("DeleteRepositoryPolicy")
-DescribeImageTags = Action("DescribeImageTags")
-DescribeImages = Action("DescribeImages")
-DescribeRegistries = Action("DescribeRegistries")
-DescribeRepositories = Action("DescribeRepositories")
-GetAuthorizationToken = Action("GetAuthorizationToken")
-GetRegistryCatalogData = Action("GetRegistryCatalogData")
-GetRepositoryCatalogData = Action("GetRepositoryCatalogData")
-GetRepositoryPolicy = Action("GetRepositoryPolicy")
-InitiateLayerUpload = Action("InitiateLayerUpload")
-ListTagsForResource = Action("ListTagsForResource")
-PutImage = Action("PutImage")
-PutRegistryCatalogData = Action("PutRegistryCatalogData")
-PutRepositoryCatalogData = Action("PutRepositoryCatalogData")
-SetRepositoryPolicy = Action("SetRepositoryPolicy")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UploadLayerPart = Action("UploadLayerPart")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
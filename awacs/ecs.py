@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,55 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateCapacityProvider = Action("CreateCapacityProvider")
-CreateCluster = Action("CreateCluster")
-CreateService = Action("CreateService")
-CreateTaskSet = Action("CreateTaskSet")
-DeleteAccountSetting = Action("DeleteAccountSetting")
-DeleteAccountSettings = Action("DeleteAccountSettings")
-DeleteAttributes = Action("DeleteAttributes")
-DeleteCapacityProvider = Action("DeleteCapacityProvider")
-DeleteCluster = Action("DeleteCluster")
-DeleteService = Action("DeleteService")
-DeleteTaskSet = Action("DeleteTaskSet")
-DeregisterContainerInstance = Action("DeregisterContainerInstance")
-DeregisterTaskDefinition = Action("DeregisterTaskDefinition")
-DescribeCapacityProviders = Action("DescribeCapacityProviders")
-DescribeClusters = Action("DescribeClusters")
-DescribeContainerInstances = Action("DescribeContainerInstances")
-DescribeServices = Action("DescribeServices")
-DescribeTaskDefinition = Action("DescribeTaskDefinition")
-DescribeTaskSets = Action("DescribeTaskSets")
-DescribeTasks = Action("DescribeTasks")
-DiscoverPollEndpoint = Action("DiscoverPollEndpoint")
-ListAccountSettings = Action("ListAccountSettings")
-ListAttributes = Action("ListAttributes")
-ListClusters = Action("ListClusters")
-ListContainerInstances = Action("ListContainerInstances")
-ListServices = Action("ListServices")
-ListTagsForResource = Action("ListTagsForResource")
-ListTaskDefinitionFamilies = Action("ListTaskDefinitionFamilies")
-ListTaskDefinitions = Action("ListTaskDefinitions")
-ListTasks = Action("ListTasks")
-Poll = Action("Poll")
-PutAccountSetting = Action("PutAccountSetting")
-PutAccountSettingDefault = Action("PutAccountSettingDefault")
-PutAttributes = Action("PutAttributes")
-PutClusterCapacityProviders = Action("PutClusterCapacityProviders")
-RegisterContainerInstance = Action("RegisterContainerInstance")
-RegisterTaskDefinition = Action("RegisterTaskDefinition")
-RunTask = Action("RunTask")
-StartTask = Action("StartTask")
-StartTelemetrySession = Action("StartTelemetrySession")
-StopTask = Action("StopTask")
-SubmitAttachmentStateChanges = Action("SubmitAttachmentStateChanges")
-SubmitContainerStateChange = Action("SubmitContainerStateChange")
-SubmitTaskStateChange = Action("SubmitTaskStateChange")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateClusterSettings = Action("UpdateClusterSettings")
-UpdateContainerAgent = Action("UpdateContainerAgent")
-UpdateContainerInstancesState = Action("UpdateContainerInstancesState")
-UpdateService = Action("UpdateService")
-UpdateServicePrimaryTaskSet = Action("UpdateServicePrimaryTaskSet")
-UpdateTaskSet = Action("UpdateTaskSet")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
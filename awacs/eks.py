@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AccessKubernetesApi = Action("AccessKubernetesApi")
-AssociateEncryptionConfig = Action("AssociateEncryptionConfig")
-AssociateIdentityProviderConfig = Action("AssociateIdentityProviderConfig")
-CreateAddon = Action("CreateAddon")
-CreateCluster = Action("CreateCluster")
-CreateFargateProfile = Action("CreateFargateProfile")
-CreateNodegroup = Action("CreateNodegroup")
-DeleteAddon = Action("DeleteAddon")
-DeleteCluster = Action("DeleteCluster")
-DeleteFargateProfile = Action("DeleteFargateProfile")
-DeleteNodegroup = Action("DeleteNodegroup")
-DescribeAddon = Action("DescribeAddon")
-DescribeAddonVersions = Action("DescribeAddonVersions")
-DescribeCluster = Action("DescribeCluster")
-DescribeFargateProfile = Action("DescribeFargateProfile")
-DescribeIdentityProviderConfig = Action("DescribeIdentityProviderConfig")
-DescribeNodegroup = Action("DescribeNodegroup")
-DescribeUpdate = Action("DescribeUpdate")
-DisassociateIdentityProviderConfig = Action("DisassociateIdentityProviderConfig")
-ListAddons = Action("ListAddons")
-ListClusters = Action("ListClusters")
-ListFargateProfiles = Action("ListFargateProfiles")
-ListIdentityProviderConfigs = Action("ListIdentityProviderConfigs")
-ListNodegroups = Action("ListNodegroups")
-ListTagsForResource = Action("ListTagsForResource")
-ListUpdates = Action("ListUpdates")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAddon = Action("UpdateAddon")
-UpdateClusterConfig = Action("UpdateClusterConfig")
-UpdateClusterVersion = Action("UpdateClusterVersion")
-UpdateNodegroupConfig = Action("UpdateNodegroupConfig")
-UpdateNodegroupVersion = Action("UpdateNodegroupVersion")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,76 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTagsToResource = Action("AddTagsToResource")
-AuthorizeCacheSecurityGroupIngress = Action("AuthorizeCacheSecurityGroupIngress")
-BatchApplyUpdateAction = Action("BatchApplyUpdateAction")
-BatchStopUpdateAction = Action("BatchStopUpdateAction")
-CompleteMigration = Action("CompleteMigration")
-CopySnapshot = Action("CopySnapshot")
-CreateCacheCluster = Action("CreateCacheCluster")
-CreateCacheParameterGroup = Action("CreateCacheParameterGroup")
-CreateCacheSecurityGroup = Action("CreateCacheSecurityGroup")
-CreateCacheSubnetGroup = Action("CreateCacheSubnetGroup")
-CreateGlobalReplicationGroup = Action("CreateGlobalReplicationGroup")
-CreateReplicationGroup = Action("CreateReplicationGroup")
-CreateSnapshot = Action("CreateSnapshot")
-CreateUser = Action("CreateUser")
-CreateUserGroup = Action("CreateUserGroup")
-DecreaseNodeGroupsInGlobalReplicationGroup = Action(
-    "DecreaseNodeGroupsInGlobalReplicationGroup"
-)
-DecreaseReplicaCount = Action("DecreaseReplicaCount")
-DeleteCacheCluster = Action("DeleteCacheCluster")
-DeleteCacheParameterGroup = Action("DeleteCacheParameterGroup")
-DeleteCacheSecurityGroup = Action("DeleteCacheSecurityGroup")
-DeleteCacheSubnetGroup = Action("DeleteCacheSubnetGroup")
-DeleteGlobalReplicationGroup = Action("DeleteGlobalReplicationGroup")
-DeleteReplicationGroup = Action("DeleteReplicationGroup")
-DeleteSnapshot = Action("DeleteSnapshot")
-DeleteUser = Action("DeleteUser")
-DeleteUserGroup = Action("DeleteUserGroup")
-DescribeCacheClusters = Action("DescribeCacheClusters")
-DescribeCacheEngineVersions = Action("DescribeCacheEngineVersions")
-DescribeCacheParameterGroups = Action("DescribeCacheParameterGroups")
-DescribeCacheParameters = Action("DescribeCacheParameters")
-DescribeCacheSecurityGroups = Action("DescribeCacheSecurityGroups")
-DescribeCacheSubnetGroups = Action("DescribeCacheSubnetGroups")
-DescribeEngineDefaultParameters = Action("DescribeEngineDefaultParameters")
-DescribeEvents = Action("DescribeEvents")
-DescribeGlobalReplicationGroups = Action("DescribeGlobalReplicationGroups")
-DescribeReplicationGroups = Action("DescribeReplicationGroups")
-DescribeReservedCacheNodes = Action("DescribeReservedCacheNodes")
-DescribeReservedCacheNodesOfferings = Action("DescribeReservedCacheNodesOfferings")
-DescribeServiceUpdates = Action("DescribeServiceUpdates")
-DescribeSnapshots = Action("DescribeSnapshots")
-DescribeUpdateActions = Action("DescribeUpdateActions")
-DescribeUserGroups = Action("DescribeUserGroups")
-DescribeUsers = Action("DescribeUsers")
-DisassociateGlobalReplicationGroup = Action("DisassociateGlobalReplicationGroup")
-FailoverGlobalReplicationGroup = Action("FailoverGlobalReplicationGroup")
-IncreaseNodeGroupsInGlobalReplicationGroup = Action(
-    "IncreaseNodeGroupsInGlobalReplicationGroup"
-)
-IncreaseReplicaCount = Action("IncreaseReplicaCount")
-ListAllowedNodeTypeModifications = Action("ListAllowedNodeTypeModifications")
-ListTagsForResource = Action("ListTagsForResource")
-ModifyCacheCluster = Action("ModifyCacheCluster")
-ModifyCacheParameterGroup = Action("ModifyCacheParameterGroup")
-ModifyCacheSubnetGroup = Action("ModifyCacheSubnetGroup")
-ModifyGlobalReplicationGroup = Action("ModifyGlobalReplicationGroup")
-ModifyReplicationGroup = Action("ModifyReplicationGroup")
-ModifyReplicationGroupShardConfiguration = Action(
-    "ModifyReplicationGroupShardConfiguration"
-)
-ModifyUser = Action("ModifyUser")
-ModifyUserGroup = Action("ModifyUserGroup")
-PurchaseReservedCacheNodesOffering = Action("PurchaseReservedCacheNodesOffering")
-RebalanceSlotsInGlobalReplicationGroup = Action(
-    "RebalanceSlotsInGlobalReplicationGroup"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-RebootCacheCluster = Action("RebootCacheCluster")
-RemoveTagsFromResource = Action("RemoveTagsFromResource")
-ResetCacheParameterGroup = Action("ResetCacheParameterGroup")
-RevokeCacheSecurityGroupIngress = Action("RevokeCacheSecurityGroupIngress")
-StartMigration = Action("StartMigration")
-TestFailover = Action("TestFailover")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,54 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AbortEnvironmentUpdate = Action("AbortEnvironmentUpdate")
-AddTags = Action("AddTags")
-ApplyEnvironmentManagedAction = Action("ApplyEnvironmentManagedAction")
-AssociateEnvironmentOperationsRole = Action("AssociateEnvironmentOperationsRole")
-CheckDNSAvailability = Action("CheckDNSAvailability")
-ComposeEnvironments = Action("ComposeEnvironments")
-CreateApplication = Action("CreateApplication")
-CreateApplicationVersion = Action("CreateApplicationVersion")
-CreateConfigurationTemplate = Action("CreateConfigurationTemplate")
-CreateEnvironment = Action("CreateEnvironment")
-CreatePlatformVersion = Action("CreatePlatformVersion")
-CreateStorageLocation = Action("CreateStorageLocation")
-DeleteApplication = Action("DeleteApplication")
-DeleteApplicationVersion = Action("DeleteApplicationVersion")
-DeleteConfigurationTemplate = Action("DeleteConfigurationTemplate")
-DeleteEnvironmentConfiguration = Action("DeleteEnvironmentConfiguration")
-DeletePlatformVersion = Action("DeletePlatformVersion")
-DescribeAccountAttributes = Action("DescribeAccountAttributes")
-DescribeApplicationVersions = Action("DescribeApplicationVersions")
-DescribeApplications = Action("DescribeApplications")
-DescribeConfigurationOptions = Action("DescribeConfigurationOptions")
-DescribeConfigurationSettings = Action("DescribeConfigurationSettings")
-DescribeEnvironmentHealth = Action("DescribeEnvironmentHealth")
-DescribeEnvironmentManagedActionHistory = Action(
-    "DescribeEnvironmentManagedActionHistory"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DescribeEnvironmentManagedActions = Action("DescribeEnvironmentManagedActions")
-DescribeEnvironmentResources = Action("DescribeEnvironmentResources")
-DescribeEnvironments = Action("DescribeEnvironments")
-DescribeEvents = Action("DescribeEvents")
-DescribeInstancesHealth = Action("DescribeInstancesHealth")
-DescribePlatformVersion = Action("DescribePlatformVersion")
-DisassociateEnvironmentOperationsRole = Action("DisassociateEnvironmentOperationsRole")
-ListAvailableSolutionStacks = Action("ListAvailableSolutionStacks")
-ListPlatformBranches = Action("ListPlatformBranches")
-ListPlatformVersions = Action("ListPlatformVersions")
-ListTagsForResource = Action("ListTagsForResource")
-PutInstanceStatistics = Action("PutInstanceStatistics")
-RebuildEnvironment = Action("RebuildEnvironment")
-RemoveTags = Action("RemoveTags")
-RequestEnvironmentInfo = Action("RequestEnvironmentInfo")
-RestartAppServer = Action("RestartAppServer")
-RetrieveEnvironmentInfo = Action("RetrieveEnvironmentInfo")
-SwapEnvironmentCNAMEs = Action("SwapEnvironmentCNAMEs")
-TerminateEnvironment = Action("TerminateEnvironment")
-UpdateApplication = Action("UpdateApplication")
-UpdateApplicationResourceLifecycle = Action("UpdateApplicationResourceLifecycle")
-UpdateApplicationVersion = Action("UpdateApplicationVersion")
-UpdateConfigurationTemplate = Action("UpdateConfigurationTemplate")
-UpdateEnvironment = Action("UpdateEnvironment")
-ValidateConfigurationSettings = Action("ValidateConfigurationSettings")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
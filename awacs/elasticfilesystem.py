@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,33 +25,21 @@ class ARN(BaseARN):
         )
 
 
-Backup = Action("Backup")
-ClientMount = Action("ClientMount")
-ClientRootAccess = Action("ClientRootAccess")
-ClientWrite = Action("ClientWrite")
-CreateAccessPoint = Action("CreateAccessPoint")
-CreateFileSystem = Action("CreateFileSystem")
-CreateMountTarget = Action("CreateMountTarget")
-CreateTags = Action("CreateTags")
-DeleteAccessPoint = Action("DeleteAccessPoint")
-DeleteFileSystem = Action("DeleteFileSystem")
-DeleteFileSystemPolicy = Action("DeleteFileSystemPolicy")
-DeleteMountTarget = Action("DeleteMountTarget")
-DeleteTags = Action("DeleteTags")
-DescribeAccessPoints = Action("DescribeAccessPoints")
-DescribeBackupPolicy = Action("DescribeBackupPolicy")
-DescribeFileSystemPolicy = Action("DescribeFileSystemPolicy")
-DescribeFileSystems = Action("DescribeFileSystems")
-DescribeLifecycleConfiguration = Action("DescribeLifecycleConfiguration")
-DescribeMountTargetSecurityGroups = Action("DescribeMountTargetSecurityGroups")
-DescribeMountTargets = Action("DescribeMountTargets")
-DescribeTags = Action("DescribeTags")
-ListTagsForResource = Action("ListTagsForResource")
-ModifyMountTargetSecurityGroups = Action("ModifyMountTargetSecurityGroups")
-PutBackupPolicy = Action("PutBackupPolicy")
-PutFileSystemPolicy = Action("PutFileSystemPolicy")
-PutLifecycleConfiguration = Action("PutLifecycleConfiguration")
-Restore = Action("Restore")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateFileSystem = Action("UpdateFileSystem")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
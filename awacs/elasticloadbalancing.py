@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,64 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddListenerCertificates = Action("AddListenerCertificates")
-AddTags = Action("AddTags")
-ApplySecurityGroupsToLoadBalancer = Action("ApplySecurityGroupsToLoadBalancer")
-AttachLoadBalancerToSubnets = Action("AttachLoadBalancerToSubnets")
-ConfigureHealthCheck = Action("ConfigureHealthCheck")
-CreateAppCookieStickinessPolicy = Action("CreateAppCookieStickinessPolicy")
-CreateLBCookieStickinessPolicy = Action("CreateLBCookieStickinessPolicy")
-CreateListener = Action("CreateListener")
-CreateLoadBalancer = Action("CreateLoadBalancer")
-CreateLoadBalancerListeners = Action("CreateLoadBalancerListeners")
-CreateLoadBalancerPolicy = Action("CreateLoadBalancerPolicy")
-CreateRule = Action("CreateRule")
-CreateTargetGroup = Action("CreateTargetGroup")
-DeleteListener = Action("DeleteListener")
-DeleteLoadBalancer = Action("DeleteLoadBalancer")
-DeleteLoadBalancerListeners = Action("DeleteLoadBalancerListeners")
-DeleteLoadBalancerPolicy = Action("DeleteLoadBalancerPolicy")
-DeleteRule = Action("DeleteRule")
-DeleteTargetGroup = Action("DeleteTargetGroup")
-DeregisterInstancesFromLoadBalancer = Action("DeregisterInstancesFromLoadBalancer")
-DeregisterTargets = Action("DeregisterTargets")
-DescribeAccountLimits = Action("DescribeAccountLimits")
-DescribeInstanceHealth = Action("DescribeInstanceHealth")
-DescribeListenerCertificates = Action("DescribeListenerCertificates")
-DescribeListeners = Action("DescribeListeners")
-DescribeLoadBalancerAttributes = Action("DescribeLoadBalancerAttributes")
-DescribeLoadBalancerPolicies = Action("DescribeLoadBalancerPolicies")
-DescribeLoadBalancerPolicyTypes = Action("DescribeLoadBalancerPolicyTypes")
-DescribeLoadBalancers = Action("DescribeLoadBalancers")
-DescribeRules = Action("DescribeRules")
-DescribeSSLPolicies = Action("DescribeSSLPolicies")
-DescribeTags = Action("DescribeTags")
-DescribeTargetGroupAttributes = Action("DescribeTargetGroupAttributes")
-DescribeTargetGroups = Action("DescribeTargetGroups")
-DescribeTargetHealth = Action("DescribeTargetHealth")
-DetachLoadBalancerFromSubnets = Action("DetachLoadBalancerFromSubnets")
-DisableAvailabilityZonesForLoadBalancer = Action(
-    "DisableAvailabilityZonesForLoadBalancer"
-)
-EnableAvailabilityZonesForLoadBalancer = Action(
-    "EnableAvailabilityZonesForLoadBalancer"
-)
-ModifyListener = Action("ModifyListener")
-ModifyLoadBalancerAttributes = Action("ModifyLoadBalancerAttributes")
-ModifyRule = Action("ModifyRule")
-ModifyTargetGroup = Action("ModifyTargetGroup")
-ModifyTargetGroupAttributes = Action("ModifyTargetGroupAttributes")
-RegisterInstancesWithLoadBalancer = Action("RegisterInstancesWithLoadBalancer")
-RegisterTargets = Action("RegisterTargets")
-RemoveListenerCertificates = Action("RemoveListenerCertificates")
-RemoveTags = Action("RemoveTags")
-SetIpAddressType = Action("SetIpAddressType")
-SetLoadBalancerListenerSSLCertificate = Action("SetLoadBalancerListenerSSLCertificate")
-SetLoadBalancerPoliciesForBackendServer = Action(
-    "SetLoadBalancerPoliciesForBackendServer"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-SetLoadBalancerPoliciesOfListener = Action("SetLoadBalancerPoliciesOfListener")
-SetRulePriorities = Action("SetRulePriorities")
-SetSecurityGroups = Action("SetSecurityGroups")
-SetSubnets = Action("SetSubnets")
-SetWebAcl = Action("SetWebAcl")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
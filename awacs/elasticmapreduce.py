@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,44 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddInstanceFleet = Action("AddInstanceFleet")
-AddInstanceGroups = Action("AddInstanceGroups")
-AddJobFlowSteps = Action("AddJobFlowSteps")
-AddTags = Action("AddTags")
-CancelSteps = Action("CancelSteps")
-CreateEditor = Action("CreateEditor")
-CreateSecurityConfiguration = Action("CreateSecurityConfiguration")
-DeleteEditor = Action("DeleteEditor")
-DeleteSecurityConfiguration = Action("DeleteSecurityConfiguration")
-DescribeCluster = Action("DescribeCluster")
-DescribeEditor = Action("DescribeEditor")
-DescribeJobFlows = Action("DescribeJobFlows")
-DescribeSecurityConfiguration = Action("DescribeSecurityConfiguration")
-DescribeStep = Action("DescribeStep")
-GetBlockPublicAccessConfiguration = Action("GetBlockPublicAccessConfiguration")
-GetManagedScalingPolicy = Action("GetManagedScalingPolicy")
-ListBootstrapActions = Action("ListBootstrapActions")
-ListClusters = Action("ListClusters")
-ListEditors = Action("ListEditors")
-ListInstanceFleets = Action("ListInstanceFleets")
-ListInstanceGroups = Action("ListInstanceGroups")
-ListInstances = Action("ListInstances")
-ListSecurityConfigurations = Action("ListSecurityConfigurations")
-ListSteps = Action("ListSteps")
-ModifyCluster = Action("ModifyCluster")
-ModifyInstanceFleet = Action("ModifyInstanceFleet")
-ModifyInstanceGroups = Action("ModifyInstanceGroups")
-OpenEditorInConsole = Action("OpenEditorInConsole")
-PutAutoScalingPolicy = Action("PutAutoScalingPolicy")
-PutBlockPublicAccessConfiguration = Action("PutBlockPublicAccessConfiguration")
-PutManagedScalingPolicy = Action("PutManagedScalingPolicy")
-RemoveAutoScalingPolicy = Action("RemoveAutoScalingPolicy")
-RemoveManagedScalingPolicy = Action("RemoveManagedScalingPolicy")
-RemoveTags = Action("RemoveTags")
-RunJobFlow = Action("RunJobFlow")
-SetTerminationProtection = Action("SetTerminationProtection")
-SetVisibleToAllUsers = Action("SetVisibleToAllUsers")
-StartEditor = Action("StartEditor")
-StopEditor = Action("StopEditor")
-TerminateJobFlows = Action("TerminateJobFlows")
-ViewEventsFromAllClustersInConsole = Action("ViewEventsFromAllClustersInConsole")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
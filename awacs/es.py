@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,63 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInboundCrossClusterSearchConnection = Action(
-    "AcceptInboundCrossClusterSearchConnection"
-)
-AddTags = Action("AddTags")
-CreateElasticsearchDomain = Action("CreateElasticsearchDomain")
-CreateElasticsearchServiceRole = Action("CreateElasticsearchServiceRole")
-CreateOutboundCrossClusterSearchConnection = Action(
-    "CreateOutboundCrossClusterSearchConnection"
-)
-DeleteElasticsearchDomain = Action("DeleteElasticsearchDomain")
-DeleteElasticsearchServiceRole = Action("DeleteElasticsearchServiceRole")
-DeleteInboundCrossClusterSearchConnection = Action(
-    "DeleteInboundCrossClusterSearchConnection"
-)
-DeleteOutboundCrossClusterSearchConnection = Action(
-    "DeleteOutboundCrossClusterSearchConnection"
-)
-DescribeElasticsearchDomain = Action("DescribeElasticsearchDomain")
-DescribeElasticsearchDomainConfig = Action("DescribeElasticsearchDomainConfig")
-DescribeElasticsearchDomains = Action("DescribeElasticsearchDomains")
-DescribeElasticsearchInstanceTypeLimits = Action(
-    "DescribeElasticsearchInstanceTypeLimits"
-)
-DescribeInboundCrossClusterSearchConnections = Action(
-    "DescribeInboundCrossClusterSearchConnections"
-)
-DescribeOutboundCrossClusterSearchConnections = Action(
-    "DescribeOutboundCrossClusterSearchConnections"
-)
-DescribeReservedElasticsearchInstanceOfferings = Action(
-    "DescribeReservedElasticsearchInstanceOfferings"
-)
-DescribeReservedElasticsearchInstances = Action(
-    "DescribeReservedElasticsearchInstances"
-)
-ESCrossClusterGet = Action("ESCrossClusterGet")
-ESHttpDelete = Action("ESHttpDelete")
-ESHttpGet = Action("ESHttpGet")
-ESHttpHead = Action("ESHttpHead")
-ESHttpPatch = Action("ESHttpPatch")
-ESHttpPost = Action("ESHttpPost")
-ESHttpPut = Action("ESHttpPut")
-GetCompatibleElasticsearchVersions = Action("GetCompatibleElasticsearchVersions")
-GetUpgradeHistory = Action("GetUpgradeHistory")
-GetUpgradeStatus = Action("GetUpgradeStatus")
-ListDomainNames = Action("ListDomainNames")
-ListElasticsearchInstanceTypeDetails = Action("ListElasticsearchInstanceTypeDetails")
-ListElasticsearchInstanceTypes = Action("ListElasticsearchInstanceTypes")
-ListElasticsearchVersions = Action("ListElasticsearchVersions")
-ListTags = Action("ListTags")
-PurchaseReservedElasticsearchInstance = Action("PurchaseReservedElasticsearchInstance")
-PurchaseReservedElasticsearchInstanceOffering = Action(
-    "PurchaseReservedElasticsearchInstanceOffering"
-)
-RejectInboundCrossClusterSearchConnection = Action(
-    "RejectInboundCrossClusterSearchConnection"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-RemoveTags = Action("RemoveTags")
-UpdateElasticsearchDomainConfig = Action("UpdateElasticsearchDomainConfig")
-UpgradeElasticsearchDomain = Action("UpgradeElasticsearchDomain")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -0,0 +1,582 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Evaluation of requests against policies.
+
+evaluate() decides whether a request is allowed, explicitly denied or
+implicitly denied by a set of policies, following the IAM policy evaluation
+logic for policies of a single account: an explicit Deny in any policy wins,
+otherwise an Allow in any policy allows the request. evaluate_layers() adds
+the roles of the policies in the decision: SCPs, identity and resource
+policies, permissions boundaries and session policies.
+
+Each Policy is compiled once into matcher closures, cached on the Policy
+until it changes. Checking a Policy for changes still walks its objects on
+every decision, so deciding many requests is fastest with the CompiledPolicy
+of compile_policy(), which these functions accept in place of a Policy.
+Policy variables such as ${aws:username} are not substituted.
+"""
+
+import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .aws import Action, Condition, Deny, Policy, Statement, _as_list
+from .conditions import ContextPredicate, compile_conditions, glob, translate
+
+# Decisions
+Allowed = "Allowed"
+ExplicitDeny = "ExplicitDeny"
+ImplicitDeny = "ImplicitDeny"
+
+
+class Request:
+    """A request to evaluate: an action on a resource with its context.
+
+    The action is an Action or a string like "s3:GetObject" and the resource
+    an ARN. The principal is a dict like {"AWS": "arn:aws:iam::...:user/x"},
+    or an ARN string for an AWS principal; it is only checked by statements
+    with a Principal or NotPrincipal. The context maps condition keys, e.g.
+    "aws:SourceIp", to a value or a list of values.
+    """
+
+    __slots__ = ("action", "resource", "principal", "context")
+
+    def __init__(
+        self,
+        action: Union[Action, str],
+        resource: str = "*",
+        principal: Union[str, Mapping[str, Any]] = None,
+        context: Mapping[str, Any] = None,
+    ) -> None:
+        if isinstance(action, Action):
+            action = action.JSONrepr()
+        self.action: str = action.lower()
+        self.resource: str = resource
+        self.principal: Optional[Dict[str, List[str]]] = None
+        if isinstance(principal, str):
+            principal = {"AWS": principal}
+        if principal is not None:
+            self.principal = {k: _as_list(v) for k, v in principal.items()}
+        # Condition keys are case insensitive
+        self.context: Dict[str, List[Any]] = {
+            k.lower(): _as_list(v) for k, v in (context or {}).items()
+        }
+
+
+Matcher = Callable[[Request], bool]
+
+# A Policy or the data of a policy document
+PolicyLike = Union[Policy, dict]
+
+
+class CompiledPolicy:
+    """A policy compiled into matcher closures, see compile_policy()."""
+
+    def __init__(self, policy: "PolicyLike") -> None:
+        self.deny: List[Matcher] = []
+        self.allow: List[Matcher] = []
+        if isinstance(policy, dict):
+            statements = policy.get("Statement", [])
+        else:
+            statements = policy.properties.get("Statement", [])
+        for statement in _as_list(statements):
+            matcher = compile_statement(statement)
+            if isinstance(statement, dict):
+                effect = statement.get("Effect")
+            else:
+                effect = statement.properties.get("Effect")
+            if effect == Deny:
+                self.deny.append(matcher)
+            else:
+                self.allow.append(matcher)
+
+    def evaluate(self, request: Request) -> str:
+        """Return Allowed, ExplicitDeny or ImplicitDeny for the request."""
+        for matcher in self.deny:
+            if matcher(request):
+                return ExplicitDeny
+        for matcher in self.allow:
+            if matcher(request):
+                return Allowed
+        return ImplicitDeny
+
+
+# A policy or its compiled form, accepted where policies are evaluated
+Evaluable = Union[PolicyLike, CompiledPolicy]
+
+
+def compile_policy(policy: Evaluable) -> CompiledPolicy:
+    """Return the compiled form of a Policy or of the data of a policy.
+
+    The compiled form of a Policy is cached on it until the policy changes.
+    A CompiledPolicy is returned as it is, it is not checked for changes.
+    """
+    if isinstance(policy, CompiledPolicy):
+        return policy
+    if isinstance(policy, dict):
+        return CompiledPolicy(policy)
+    cache = policy._cached()
+    try:
+        return cache["compiled"]
+    except KeyError:
+        compiled = cache["compiled"] = CompiledPolicy(policy)
+        return compiled
+
+
+def evaluate(
+    policies: Union[Evaluable, Iterable[Evaluable]],
+    action: Union[Action, str, Request],
+    resource: str = "*",
+    principal: Union[str, Mapping[str, Any]] = None,
+    context: Mapping[str, Any] = None,
+) -> str:
+    """Return Allowed, ExplicitDeny or ImplicitDeny for a request.
+
+    The request is given by its parts, see Request, or as a Request to
+    evaluate the same request against several sets of policies. Policies
+    are checked for changes on each call, pass their compile_policy() to
+    decide many requests against policies which do not change.
+    """
+    if isinstance(action, Request):
+        request = action
+    else:
+        request = Request(action, resource, principal, context)
+    return _decide([compile_policy(p) for p in _policy_list(policies)], request)
+
+
+def _policy_list(policies: Union[Evaluable, Iterable[Evaluable]]) -> List[Evaluable]:
+    if isinstance(policies, (Policy, dict, CompiledPolicy)):
+        return [policies]
+    return list(policies)
+
+
+def _decide(policies: Iterable[CompiledPolicy], request: Request) -> str:
+    decision = ImplicitDeny
+    for policy in policies:
+        result = policy.evaluate(request)
+        if result == ExplicitDeny:
+            return result
+        if result == Allowed:
+            decision = result
+    return decision
+
+
+# Roles of policies in a layered decision, see evaluate_layers()
+SCP = "SCP"
+IdentityPolicy = "IdentityPolicy"
+ResourcePolicy = "ResourcePolicy"
+PermissionsBoundary = "PermissionsBoundary"
+SessionPolicy = "SessionPolicy"
+
+_layer_roles = (SCP, IdentityPolicy, ResourcePolicy, PermissionsBoundary, SessionPolicy)
+
+Layer = Tuple[str, Union[Evaluable, Iterable[Evaluable]]]
+
+
+class ScpChain:
+    """The compiled service control policies of an OU path.
+
+    Each level of the path, from the root down to the account, has its own
+    SCPs and each level must allow a request. The policies, or their
+    compile_policy(), are compiled when the chain is created and not checked
+    for changes afterwards, see scp_chain().
+    """
+
+    def __init__(self, levels: Iterable[Union[Evaluable, Iterable[Evaluable]]]) -> None:
+        self.levels: List[List[CompiledPolicy]] = [
+            [compile_policy(p) for p in _policy_list(level)] for level in levels
+        ]
+
+    def evaluate(self, request: Request) -> str:
+        """Return Allowed if every level allows the request."""
+        decision = Allowed
+        for level in self.levels:
+            result = _decide(level, request)
+            if result == ExplicitDeny:
+                return result
+            if result != Allowed:
+                decision = result
+        return decision
+
+
+# SCP chains by OU, with the policies they were compiled from
+_scp_chains: Dict[Any, Tuple[List[List[Evaluable]], ScpChain]] = {}
+
+
+def scp_chain(
+    ou: Any, levels: Iterable[Union[Evaluable, Iterable[Evaluable]]]
+) -> ScpChain:
+    """Return the ScpChain of the levels of an OU path, cached per OU.
+
+    The chain is compiled again only when the SCPs given for the OU are not
+    the same objects as before. Call clear_scp_chains() after changing SCPs
+    in place.
+    """
+    policies = [_policy_list(level) for level in levels]
+    cached = _scp_chains.get(ou)
+    if cached is not None and _same_levels(cached[0], policies):
+        return cached[1]
+    chain = ScpChain(policies)
+    _scp_chains[ou] = (policies, chain)
+    return chain
+
+
+def clear_scp_chains() -> None:
+    """Drop the SCP chains cached by scp_chain()."""
+    _scp_chains.clear()
+
+
+def _same_levels(old: List[List[Evaluable]], new: List[List[Evaluable]]) -> bool:
+    return len(old) == len(new) and all(
+        len(a) == len(b) and all(x is y for x, y in zip(a, b)) for a, b in zip(old, new)
+    )
+
+
+def evaluate_layers(
+    layers: Iterable[Layer],
+    action: Union[Action, str, Request],
+    resource: str = "*",
+    principal: Union[str, Mapping[str, Any]] = None,
+    context: Mapping[str, Any] = None,
+    ou: Any = None,
+) -> str:
+    """Decide a request against policies with their roles in the decision.
+
+    The layers are (role, policies) pairs, the role being SCP,
+    IdentityPolicy, ResourcePolicy, PermissionsBoundary or SessionPolicy.
+    Each SCP layer is one level of the OU path, from the root down. An
+    explicit Deny in any layer denies the request, and the evaluation stops
+    at the first one. Otherwise the request must be allowed by every SCP
+    level, and then by a resource policy, or by the identity policies and
+    the permissions boundary and session policies when there are any.
+
+    Given the OU of the account, the compiled SCP levels are cached for it,
+    see scp_chain(). As with evaluate(), the policies may be given compiled.
+    """
+    if isinstance(action, Request):
+        request = action
+    else:
+        request = Request(action, resource, principal, context)
+
+    scps: List[Any] = []
+    compiled: Dict[str, List[CompiledPolicy]] = {}
+    for role, policies in layers:
+        if role not in _layer_roles:
+            raise ValueError("Unknown policy role %s" % (role,))
+        if role == SCP:
+            scps.append(policies)
+        else:
+            compiled.setdefault(role, []).extend(
+                compile_policy(p) for p in _policy_list(policies)
+            )
+
+    chain = scp_chain(ou, scps) if ou is not None else ScpChain(scps)
+    scp_decision = chain.evaluate(request)
+    if scp_decision == ExplicitDeny:
+        return scp_decision
+    decisions: Dict[str, str] = {}
+    for role, policy_list in compiled.items():
+        decision = decisions[role] = _decide(policy_list, request)
+        if decision == ExplicitDeny:
+            return decision
+    if scp_decision != Allowed:
+        return ImplicitDeny
+    if decisions.get(ResourcePolicy) == Allowed:
+        return Allowed
+    if decisions.get(IdentityPolicy) != Allowed:
+        return ImplicitDeny
+    for role in (PermissionsBoundary, SessionPolicy):
+        if decisions.get(role, Allowed) != Allowed:
+            return ImplicitDeny
+    return Allowed
+
+
+def compile_statement(statement: Union[Statement, dict]) -> Matcher:
+    """Compile a statement or its data into a matcher of the requests it covers.
+
+    The effect of the statement is not taken into account. The condition of
+    a Statement is compiled by Condition.predicate(), cached on the Condition.
+    """
+    condition = None
+    if isinstance(statement, dict):
+        data = statement
+    else:
+        data = statement._properties_data()
+        condition = statement.properties.get("Condition")
+    matchers: List[Matcher] = []
+    if "Action" in data:
+        matchers.append(_action_matcher(data["Action"], False))
+    elif "NotAction" in data:
+        matchers.append(_action_matcher(data["NotAction"], True))
+    if "Resource" in data:
+        matchers.append(_resource_matcher(data["Resource"], False))
+    elif "NotResource" in data:
+        matchers.append(_resource_matcher(data["NotResource"], True))
+    if "Principal" in data:
+        matchers.append(_principal_matcher(data["Principal"], False))
+    elif "NotPrincipal" in data:
+        matchers.append(_principal_matcher(data["NotPrincipal"], True))
+    if isinstance(condition, Condition):
+        matchers.append(_condition_matcher(condition.predicate()))
+    elif "Condition" in data:
+        matchers.append(_condition_matcher(compile_conditions(data["Condition"])))
+
+    if len(matchers) == 1:
+        return matchers[0]
+
+    def match(request: Request) -> bool:
+        for matcher in matchers:
+            if not matcher(request):
+                return False
+        return True
+
+    return match
+
+
+# Check of the rest of an ARN pattern on the segments of an ARN, see
+# ResourceMatcher
+ArnCheck = Callable[[List[str]], bool]
+
+
+class _PatternGroup:
+    """ARN patterns of a service and region indexed by the literal start of
+    their resource segment."""
+
+    __slots__ = ("lengths", "checks")
+
+    def __init__(self) -> None:
+        self.lengths: List[int] = []
+        self.checks: Dict[str, List[ArnCheck]] = {}
+
+    def add(self, literal: str, check: ArnCheck) -> None:
+        if len(literal) not in self.lengths:
+            self.lengths.append(len(literal))
+            self.lengths.sort()
+        self.checks.setdefault(literal, []).append(check)
+
+    def matches(self, segments: List[str]) -> bool:
+        resource = segments[5]
+        checks = self.checks
+        for length in self.lengths:
+            if length > len(resource):
+                break
+            for check in checks.get(resource[:length], ()):
+                if check(segments):
+                    return True
+        return False
+
+
+class ResourceMatcher:
+    """Match ARNs in bulk against the Resource or NotResource of a statement.
+
+    The patterns are strings or BaseARN objects. Patterns without wildcards
+    are looked up in a set. The others are pre-split into ARN segments and
+    grouped by service and region, then by the literal start of their
+    resource segment. An ARN is thus only matched against the glob tails of
+    the patterns of its service and region whose literal start it has.
+    """
+
+    def __init__(self, resources: Any, negate: bool = False) -> None:
+        self.negate = negate
+        self.match_all = False
+        self.exact: Set[str] = set()
+        # Patterns by service and region, None for wildcards in either
+        self.arns: Dict[Optional[str], Dict[Optional[str], _PatternGroup]] = {}
+        # Patterns which are not ARNs
+        self.other: List[Callable[[str], bool]] = []
+        for resource in _as_list(resources):
+            if not isinstance(resource, str):
+                resource = resource.JSONrepr()
+            if resource == "*":
+                self.match_all = True
+            elif not _has_wildcard(resource):
+                self.exact.add(resource)
+            else:
+                parts = resource.split(":", 5)
+                if len(parts) < 6:
+                    self.other.append(glob(resource))
+                    continue
+                service = None if _has_wildcard(parts[2]) else parts[2]
+                region = None if _has_wildcard(parts[3]) else parts[3]
+                regions = self.arns.setdefault(service, {})
+                group = regions.get(region)
+                if group is None:
+                    group = regions[region] = _PatternGroup()
+                literal = re.split(r"[*?]", parts[5], 1)[0]
+                group.add(literal, _arn_check(parts, len(literal)))
+
+    @classmethod
+    def from_statement(cls, statement: Any) -> "ResourceMatcher":
+        """Create the matcher of the Resource or NotResource of a statement.
+
+        The statement is a Statement or its data.
+        """
+        if not isinstance(statement, dict):
+            statement = statement._properties_data()
+        if "NotResource" in statement:
+            return cls(statement["NotResource"], negate=True)
+        return cls(statement.get("Resource", []))
+
+    def matches(self, arn: Any) -> bool:
+        """Return whether the statement covers the resource with this ARN."""
+        if not isinstance(arn, str):
+            arn = arn.JSONrepr()
+        if self.match_all or arn in self.exact:
+            return not self.negate
+        if self.arns:
+            segments = arn.split(":", 5)
+            if len(segments) == 6:
+                for service in (segments[2], None):
+                    regions = self.arns.get(service)
+                    if regions is None:
+                        continue
+                    for region in (segments[3], None):
+                        group = regions.get(region)
+                        if group is not None and group.matches(segments):
+                            return not self.negate
+        for match in self.other:
+            if match(arn):
+                return not self.negate
+        return self.negate
+
+    __call__ = matches
+
+    def filter(self, arns: Iterable[Any]) -> Iterator[Any]:
+        """Yield the ARNs covered by the statement, reading them lazily.
+
+        The ARNs can come from any iterable, e.g. a file or a NumPy array.
+        """
+        matches = self.matches
+        for arn in arns:
+            if matches(arn):
+                yield arn
+
+    def mask(self, arns: Iterable[Any]) -> List[bool]:
+        """Return whether the statement covers each of the ARNs."""
+        matches = self.matches
+        return [matches(arn) for arn in arns]
+
+
+def _has_wildcard(value: str) -> bool:
+    return "*" in value or "?" in value
+
+
+def _arn_check(parts: List[str], start: int) -> ArnCheck:
+    # The check of an ARN with the literal start of the resource segment of
+    # the pattern: the rest of that segment, then the other segments which
+    # are not literals already matched by the grouping.
+    tail = parts[5][start:]
+    match_tail = None if tail == "*" else glob(tail)
+    checks = [
+        (i, glob(part))
+        for i, part in enumerate(parts[:5])
+        if part != "*" and (_has_wildcard(part) or i not in (2, 3))
+    ]
+
+    def check(segments: List[str]) -> bool:
+        if match_tail is not None and not match_tail(segments[5][start:]):
+            return False
+        for i, match in checks:
+            if not match(segments[i]):
+                return False
+        return True
+
+    return check
+
+
+def _action_matcher(actions: Any, negate: bool) -> Matcher:
+    # Actions are matched case insensitively: literal actions by a set
+    # lookup, patterns by a single regular expression.
+    literals = set()
+    patterns = []
+    for action in _as_list(actions):
+        action = action.lower()
+        if action == "*":
+            return lambda request: not negate
+        if "*" in action or "?" in action:
+            patterns.append(action)
+        else:
+            literals.add(action)
+    match = _combined_glob(frozenset(literals), tuple(patterns))
+    if negate:
+        return lambda request: not match(request.action)
+    return lambda request: match(request.action)
+
+
+def _combined_glob(
+    literals: FrozenSet[str], patterns: Tuple[str, ...]
+) -> Callable[[str], bool]:
+    if not patterns:
+        return literals.__contains__
+    regex = re.compile("|".join(translate(p) for p in patterns), re.DOTALL).fullmatch
+    return lambda value: value in literals or regex(value) is not None
+
+
+def _resource_matcher(resources: Any, negate: bool) -> Matcher:
+    matcher = ResourceMatcher(resources, negate)
+    if matcher.match_all:
+        return lambda request: not negate
+    matches = matcher.matches
+    return lambda request: matches(request.resource)
+
+
+def _principal_matcher(principal: Any, negate: bool) -> Matcher:
+    if principal == "*":
+        return lambda request: request.principal is not None and not negate
+    accepted: Dict[str, Callable[[str], bool]] = {}
+    for principal_type, values in principal.items():
+        accepted[principal_type] = _principal_values(principal_type, values)
+
+    def match(request: Request) -> bool:
+        if request.principal is None:
+            return negate
+        for principal_type, values in request.principal.items():
+            matcher = accepted.get(principal_type)
+            if matcher is not None and any(matcher(v) for v in values):
+                return not negate
+        return negate
+
+    return match
+
+
+def _principal_values(principal_type: str, values: Any) -> Callable[[str], bool]:
+    values = _as_list(values)
+    if "*" in values:
+        return lambda value: True
+    names = set(values)
+    if principal_type != "AWS":
+        return names.__contains__
+    # An account, given by its ID or root user, covers the principals in it
+    accounts = set()
+    for value in values:
+        if value.isdigit():
+            accounts.add(value)
+        elif value.endswith(":root"):
+            accounts.add(value.split(":")[4])
+
+    def match(value: str) -> bool:
+        if value in names:
+            return True
+        segments = value.split(":")
+        return len(segments) > 4 and segments[4] in accounts
+
+    return match
+
+
+def _condition_matcher(predicate: ContextPredicate) -> Matcher:
+    return lambda request: predicate(request.context)
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,55 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ActivateEventSource = Action("ActivateEventSource")
-CancelReplay = Action("CancelReplay")
-CreateApiDestination = Action("CreateApiDestination")
-CreateArchive = Action("CreateArchive")
-CreateConnection = Action("CreateConnection")
-CreateEventBus = Action("CreateEventBus")
-CreatePartnerEventSource = Action("CreatePartnerEventSource")
-DeactivateEventSource = Action("DeactivateEventSource")
-DeauthorizeConnection = Action("DeauthorizeConnection")
-DeleteApiDestination = Action("DeleteApiDestination")
-DeleteArchive = Action("DeleteArchive")
-DeleteConnection = Action("DeleteConnection")
-DeleteEventBus = Action("DeleteEventBus")
-DeletePartnerEventSource = Action("DeletePartnerEventSource")
-DeleteRule = Action("DeleteRule")
-DescribeApiDestination = Action("DescribeApiDestination")
-DescribeArchive = Action("DescribeArchive")
-DescribeConnection = Action("DescribeConnection")
-DescribeEventBus = Action("DescribeEventBus")
-DescribeEventSource = Action("DescribeEventSource")
-DescribePartnerEventSource = Action("DescribePartnerEventSource")
-DescribeReplay = Action("DescribeReplay")
-DescribeRule = Action("DescribeRule")
-DisableRule = Action("DisableRule")
-EnableRule = Action("EnableRule")
-InvokeApiDestination = Action("InvokeApiDestination")
-ListApiDestinations = Action("ListApiDestinations")
-ListArchives = Action("ListArchives")
-ListConnections = Action("ListConnections")
-ListEventBuses = Action("ListEventBuses")
-ListEventSources = Action("ListEventSources")
-ListPartnerEventSourceAccounts = Action("ListPartnerEventSourceAccounts")
-ListPartnerEventSources = Action("ListPartnerEventSources")
-ListReplays = Action("ListReplays")
-ListRuleNamesByTarget = Action("ListRuleNamesByTarget")
-ListRules = Action("ListRules")
-ListTagsForResource = Action("ListTagsForResource")
-ListTargetsByRule = Action("ListTargetsByRule")
-PutEvents = Action("PutEvents")
-PutPartnerEvents = Action("PutPartnerEvents")
-PutPermission = Action("PutPermission")
-PutRule = Action("PutRule")
-PutTargets = Action("PutTargets")
-RemovePermission = Action("RemovePermission")
-RemoveTargets = Action("RemoveTargets")
-StartReplay = Action("StartReplay")
-TagResource = Action("TagResource")
-TestEventPattern = Action("TestEventPattern")
-UntagResource = Action("UntagResource")
-UpdateApiDestination = Action("UpdateApiDestination")
-UpdateArchive = Action("UpdateArchive")
-UpdateConnection = Action("UpdateConnection")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
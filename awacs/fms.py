@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,29 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateAdminAccount = Action("AssociateAdminAccount")
-DeleteAppsList = Action("DeleteAppsList")
-DeleteNotificationChannel = Action("DeleteNotificationChannel")
-DeletePolicy = Action("DeletePolicy")
-DeleteProtocolsList = Action("DeleteProtocolsList")
-DisassociateAdminAccount = Action("DisassociateAdminAccount")
-GetAdminAccount = Action("GetAdminAccount")
-GetAppsList = Action("GetAppsList")
-GetComplianceDetail = Action("GetComplianceDetail")
-GetNotificationChannel = Action("GetNotificationChannel")
-GetPolicy = Action("GetPolicy")
-GetProtectionStatus = Action("GetProtectionStatus")
-GetProtocolsList = Action("GetProtocolsList")
-GetViolationDetails = Action("GetViolationDetails")
-ListAppsLists = Action("ListAppsLists")
-ListComplianceStatus = Action("ListComplianceStatus")
-ListMemberAccounts = Action("ListMemberAccounts")
-ListPolicies = Action("ListPolicies")
-ListProtocolsLists = Action("ListProtocolsLists")
-ListTagsForResource = Action("ListTagsForResource")
-PutAppsList = Action("PutAppsList")
-PutNotificationChannel = Action("PutNotificationChannel")
-PutPolicy = Action("PutPolicy")
-PutProtocolsList = Action("PutProtocolsList")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,38 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateDataset = Action("CreateDataset")
-CreateDatasetGroup = Action("CreateDatasetGroup")
-CreateDatasetImportJob = Action("CreateDatasetImportJob")
-CreateForecast = Action("CreateForecast")
-CreateForecastExportJob = Action("CreateForecastExportJob")
-CreatePredictor = Action("CreatePredictor")
-CreatePredictorBacktestExportJob = Action("CreatePredictorBacktestExportJob")
-DeleteDataset = Action("DeleteDataset")
-DeleteDatasetGroup = Action("DeleteDatasetGroup")
-DeleteDatasetImportJob = Action("DeleteDatasetImportJob")
-DeleteForecast = Action("DeleteForecast")
-DeleteForecastExportJob = Action("DeleteForecastExportJob")
-DeletePredictor = Action("DeletePredictor")
-DeletePredictorBacktestExportJob = Action("DeletePredictorBacktestExportJob")
-DescribeDataset = Action("DescribeDataset")
-DescribeDatasetGroup = Action("DescribeDatasetGroup")
-DescribeDatasetImportJob = Action("DescribeDatasetImportJob")
-DescribeForecast = Action("DescribeForecast")
-DescribeForecastExportJob = Action("DescribeForecastExportJob")
-DescribePredictor = Action("DescribePredictor")
-DescribePredictorBacktestExportJob = Action("DescribePredictorBacktestExportJob")
-GetAccuracyMetrics = Action("GetAccuracyMetrics")
-ListDatasetGroups = Action("ListDatasetGroups")
-ListDatasetImportJobs = Action("ListDatasetImportJobs")
-ListDatasets = Action("ListDatasets")
-ListForecastExportJobs = Action("ListForecastExportJobs")
-ListForecasts = Action("ListForecasts")
-ListPredictorBacktestExportJobs = Action("ListPredictorBacktestExportJobs")
-ListPredictors = Action("ListPredictors")
-ListTagsForResource = Action("ListTagsForResource")
-QueryForecast = Action("QueryForecast")
-StopResource = Action("StopResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDatasetGroup = Action("UpdateDatasetGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,60 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchCreateVariable = Action("BatchCreateVariable")
-BatchGetVariable = Action("BatchGetVariable")
-CancelBatchPredictionJob = Action("CancelBatchPredictionJob")
-CreateBatchPredictionJob = Action("CreateBatchPredictionJob")
-CreateDetectorVersion = Action("CreateDetectorVersion")
-CreateModel = Action("CreateModel")
-CreateModelVersion = Action("CreateModelVersion")
-CreateRule = Action("CreateRule")
-CreateVariable = Action("CreateVariable")
-DeleteBatchPredictionJob = Action("DeleteBatchPredictionJob")
-DeleteDetector = Action("DeleteDetector")
-DeleteDetectorVersion = Action("DeleteDetectorVersion")
-DeleteEntityType = Action("DeleteEntityType")
-DeleteEvent = Action("DeleteEvent")
-DeleteEventType = Action("DeleteEventType")
-DeleteExternalModel = Action("DeleteExternalModel")
-DeleteLabel = Action("DeleteLabel")
-DeleteModel = Action("DeleteModel")
-DeleteModelVersion = Action("DeleteModelVersion")
-DeleteOutcome = Action("DeleteOutcome")
-DeleteRule = Action("DeleteRule")
-DeleteVariable = Action("DeleteVariable")
-DescribeDetector = Action("DescribeDetector")
-DescribeModelVersions = Action("DescribeModelVersions")
-GetBatchPredictionJobs = Action("GetBatchPredictionJobs")
-GetDetectorVersion = Action("GetDetectorVersion")
-GetDetectors = Action("GetDetectors")
-GetEntityTypes = Action("GetEntityTypes")
-GetEventPrediction = Action("GetEventPrediction")
-GetEventTypes = Action("GetEventTypes")
-GetExternalModels = Action("GetExternalModels")
-GetKMSEncryptionKey = Action("GetKMSEncryptionKey")
-GetLabels = Action("GetLabels")
-GetModelVersion = Action("GetModelVersion")
-GetModels = Action("GetModels")
-GetOutcomes = Action("GetOutcomes")
-GetRules = Action("GetRules")
-GetVariables = Action("GetVariables")
-ListTagsForResource = Action("ListTagsForResource")
-PutDetector = Action("PutDetector")
-PutEntityType = Action("PutEntityType")
-PutEventType = Action("PutEventType")
-PutExternalModel = Action("PutExternalModel")
-PutKMSEncryptionKey = Action("PutKMSEncryptionKey")
-PutLabel = Action("PutLabel")
-PutOutcome = Action("PutOutcome")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDetectorVersion = Action("UpdateDetectorVersion")
-UpdateDetectorVersionMetadata = Action("UpdateDetectorVersionMetadata")
-UpdateDetectorVersionStatus = Action("UpdateDetectorVersionStatus")
-UpdateModel = Action("UpdateModel")
-UpdateModelVersion = Action("UpdateModelVersion")
-UpdateModelVersionStatus = Action("UpdateModelVersionStatus")
-UpdateRuleMetadata = Action("UpdateRuleMetadata")
-UpdateRuleVersion = Action("UpdateRuleVersion")
-UpdateVariable = Action("UpdateVariable")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
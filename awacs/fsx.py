@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,23 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateFileGateway = Action("AssociateFileGateway")
-AssociateFileSystemAliases = Action("AssociateFileSystemAliases")
-CancelDataRepositoryTask = Action("CancelDataRepositoryTask")
-CreateBackup = Action("CreateBackup")
-CreateDataRepositoryTask = Action("CreateDataRepositoryTask")
-CreateFileSystem = Action("CreateFileSystem")
-CreateFileSystemFromBackup = Action("CreateFileSystemFromBackup")
-DeleteBackup = Action("DeleteBackup")
-DeleteFileSystem = Action("DeleteFileSystem")
-DescribeAssociatedFileGateways = Action("DescribeAssociatedFileGateways")
-DescribeBackups = Action("DescribeBackups")
-DescribeDataRepositoryTasks = Action("DescribeDataRepositoryTasks")
-DescribeFileSystemAliases = Action("DescribeFileSystemAliases")
-DescribeFileSystems = Action("DescribeFileSystems")
-DisassociateFileGateway = Action("DisassociateFileGateway")
-DisassociateFileSystemAliases = Action("DisassociateFileSystemAliases")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateFileSystem = Action("UpdateFileSystem")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,41 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateTrackerConsumer = Action("AssociateTrackerConsumer")
-BatchDeleteGeofence = Action("BatchDeleteGeofence")
-BatchEvaluateGeofences = Action("BatchEvaluateGeofences")
-BatchGetDevicePosition = Action("BatchGetDevicePosition")
-BatchPutGeofence = Action("BatchPutGeofence")
-BatchUpdateDevicePosition = Action("BatchUpdateDevicePosition")
-CreateGeofenceCollection = Action("CreateGeofenceCollection")
-CreateMap = Action("CreateMap")
-CreatePlaceIndex = Action("CreatePlaceIndex")
-CreateTracker = Action("CreateTracker")
-DeleteGeofenceCollection = Action("DeleteGeofenceCollection")
-DeleteMap = Action("DeleteMap")
-DeletePlaceIndex = Action("DeletePlaceIndex")
-DeleteTracker = Action("DeleteTracker")
-DescribeGeofenceCollection = Action("DescribeGeofenceCollection")
-DescribeMap = Action("DescribeMap")
-DescribePlaceIndex = Action("DescribePlaceIndex")
-DescribeTracker = Action("DescribeTracker")
-DisassociateTrackerConsumer = Action("DisassociateTrackerConsumer")
-GetDevicePosition = Action("GetDevicePosition")
-GetDevicePositionHistory = Action("GetDevicePositionHistory")
-GetGeofence = Action("GetGeofence")
-GetMapGlyphs = Action("GetMapGlyphs")
-GetMapSprites = Action("GetMapSprites")
-GetMapStyleDescriptor = Action("GetMapStyleDescriptor")
-GetMapTile = Action("GetMapTile")
-GetMapTileJson = Action("GetMapTileJson")
-ListGeofenceCollections = Action("ListGeofenceCollections")
-ListGeofences = Action("ListGeofences")
-ListMaps = Action("ListMaps")
-ListPlaceIndexes = Action("ListPlaceIndexes")
-ListTrackerConsumers = Action("ListTrackerConsumers")
-ListTrackers = Action("ListTrackers")
-PutGeofence = Action("PutGeofence")
-SearchPlaceIndexForPosition = Action("SearchPlaceIndexForPosition")
-SearchPlaceIndexForText = Action("SearchPlaceIndexForText")
-UpdateGeofenceCollection = Action("UpdateGeofenceCollection")
-UpdateTracker = Action("UpdateTracker")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AbortMultipartUpload = Action("AbortMultipartUpload")
-AbortVaultLock = Action("AbortVaultLock")
-AddTagsToVault = Action("AddTagsToVault")
-CompleteMultipartUpload = Action("CompleteMultipartUpload")
-CompleteVaultLock = Action("CompleteVaultLock")
-CreateVault = Action("CreateVault")
-DeleteArchive = Action("DeleteArchive")
-DeleteVault = Action("DeleteVault")
-DeleteVaultAccessPolicy = Action("DeleteVaultAccessPolicy")
-DeleteVaultNotifications = Action("DeleteVaultNotifications")
-DescribeJob = Action("DescribeJob")
-DescribeVault = Action("DescribeVault")
-GetDataRetrievalPolicy = Action("GetDataRetrievalPolicy")
-GetJobOutput = Action("GetJobOutput")
-GetVaultAccessPolicy = Action("GetVaultAccessPolicy")
-GetVaultLock = Action("GetVaultLock")
-GetVaultNotifications = Action("GetVaultNotifications")
-InitiateJob = Action("InitiateJob")
-InitiateMultipartUpload = Action("InitiateMultipartUpload")
-InitiateVaultLock = Action("InitiateVaultLock")
-ListJobs = Action("ListJobs")
-ListMultipartUploads = Action("ListMultipartUploads")
-ListParts = Action("ListParts")
-ListProvisionedCapacity = Action("ListProvisionedCapacity")
-ListTagsForVault = Action("ListTagsForVault")
-ListVaults = Action("ListVaults")
-PurchaseProvisionedCapacity = Action("PurchaseProvisionedCapacity")
-RemoveTagsFromVault = Action("RemoveTagsFromVault")
-SetDataRetrievalPolicy = Action("SetDataRetrievalPolicy")
-SetVaultAccessPolicy = Action("SetVaultAccessPolicy")
-SetVaultNotifications = Action("SetVaultNotifications")
-UploadArchive = Action("UploadArchive")
-UploadMultipartPart = Action("UploadMultipartPart")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,56 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddCustomRoutingEndpoints = Action("AddCustomRoutingEndpoints")
-AdvertiseByoipCidr = Action("AdvertiseByoipCidr")
-AllowCustomRoutingTraffic = Action("AllowCustomRoutingTraffic")
-CreateAccelerator = Action("CreateAccelerator")
-CreateCustomRoutingAccelerator = Action("CreateCustomRoutingAccelerator")
-CreateCustomRoutingEndpointGroup = Action("CreateCustomRoutingEndpointGroup")
-CreateCustomRoutingListener = Action("CreateCustomRoutingListener")
-CreateEndpointGroup = Action("CreateEndpointGroup")
-CreateListener = Action("CreateListener")
-DeleteAccelerator = Action("DeleteAccelerator")
-DeleteCustomRoutingAccelerator = Action("DeleteCustomRoutingAccelerator")
-DeleteCustomRoutingEndpointGroup = Action("DeleteCustomRoutingEndpointGroup")
-DeleteCustomRoutingListener = Action("DeleteCustomRoutingListener")
-DeleteEndpointGroup = Action("DeleteEndpointGroup")
-DeleteListener = Action("DeleteListener")
-DenyCustomRoutingTraffic = Action("DenyCustomRoutingTraffic")
-DeprovisionByoipCidr = Action("DeprovisionByoipCidr")
-DescribeAccelerator = Action("DescribeAccelerator")
-DescribeAcceleratorAttributes = Action("DescribeAcceleratorAttributes")
-DescribeCustomRoutingAccelerator = Action("DescribeCustomRoutingAccelerator")
-DescribeCustomRoutingAcceleratorAttributes = Action(
-    "DescribeCustomRoutingAcceleratorAttributes"
-)
-DescribeCustomRoutingEndpointGroup = Action("DescribeCustomRoutingEndpointGroup")
-DescribeCustomRoutingListener = Action("DescribeCustomRoutingListener")
-DescribeEndpointGroup = Action("DescribeEndpointGroup")
-DescribeListener = Action("DescribeListener")
-ListAccelerators = Action("ListAccelerators")
-ListByoipCidrs = Action("ListByoipCidrs")
-ListCustomRoutingAccelerators = Action("ListCustomRoutingAccelerators")
-ListCustomRoutingEndpointGroups = Action("ListCustomRoutingEndpointGroups")
-ListCustomRoutingListeners = Action("ListCustomRoutingListeners")
-ListCustomRoutingPortMappings = Action("ListCustomRoutingPortMappings")
-ListCustomRoutingPortMappingsByDestination = Action(
-    "ListCustomRoutingPortMappingsByDestination"
-)
-ListEndpointGroups = Action("ListEndpointGroups")
-ListListeners = Action("ListListeners")
-ListTagsForResource = Action("ListTagsForResource")
-ProvisionByoipCidr = Action("ProvisionByoipCidr")
-RemoveCustomRoutingEndpoints = Action("RemoveCustomRoutingEndpoints")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAccelerator = Action("UpdateAccelerator")
-UpdateAcceleratorAttributes = Action("UpdateAcceleratorAttributes")
-UpdateCustomRoutingAccelerator = Action("UpdateCustomRoutingAccelerator")
-UpdateCustomRoutingAcceleratorAttributes = Action(
-    "UpdateCustomRoutingAcceleratorAttributes"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-UpdateCustomRoutingListener = Action("UpdateCustomRoutingListener")
-UpdateEndpointGroup = Action("UpdateEndpointGroup")
-UpdateListener = Action("UpdateListener")
-WithdrawByoipCidr = Action("WithdrawByoipCidr")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
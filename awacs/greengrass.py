@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,109 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateRoleToGroup = Action("AssociateRoleToGroup")
-AssociateServiceRoleToAccount = Action("AssociateServiceRoleToAccount")
-CancelDeployment = Action("CancelDeployment")
-CreateComponentVersion = Action("CreateComponentVersion")
-CreateConnectorDefinition = Action("CreateConnectorDefinition")
-CreateConnectorDefinitionVersion = Action("CreateConnectorDefinitionVersion")
-CreateCoreDefinition = Action("CreateCoreDefinition")
-CreateCoreDefinitionVersion = Action("CreateCoreDefinitionVersion")
-CreateDeployment = Action("CreateDeployment")
-CreateDeviceDefinition = Action("CreateDeviceDefinition")
-CreateDeviceDefinitionVersion = Action("CreateDeviceDefinitionVersion")
-CreateFunctionDefinition = Action("CreateFunctionDefinition")
-CreateFunctionDefinitionVersion = Action("CreateFunctionDefinitionVersion")
-CreateGroup = Action("CreateGroup")
-CreateGroupCertificateAuthority = Action("CreateGroupCertificateAuthority")
-CreateGroupVersion = Action("CreateGroupVersion")
-CreateLoggerDefinition = Action("CreateLoggerDefinition")
-CreateLoggerDefinitionVersion = Action("CreateLoggerDefinitionVersion")
-CreateResourceDefinition = Action("CreateResourceDefinition")
-CreateResourceDefinitionVersion = Action("CreateResourceDefinitionVersion")
-CreateSoftwareUpdateJob = Action("CreateSoftwareUpdateJob")
-CreateSubscriptionDefinition = Action("CreateSubscriptionDefinition")
-CreateSubscriptionDefinitionVersion = Action("CreateSubscriptionDefinitionVersion")
-DeleteComponent = Action("DeleteComponent")
-DeleteConnectorDefinition = Action("DeleteConnectorDefinition")
-DeleteCoreDefinition = Action("DeleteCoreDefinition")
-DeleteCoreDevice = Action("DeleteCoreDevice")
-DeleteDeviceDefinition = Action("DeleteDeviceDefinition")
-DeleteFunctionDefinition = Action("DeleteFunctionDefinition")
-DeleteGroup = Action("DeleteGroup")
-DeleteLoggerDefinition = Action("DeleteLoggerDefinition")
-DeleteResourceDefinition = Action("DeleteResourceDefinition")
-DeleteSubscriptionDefinition = Action("DeleteSubscriptionDefinition")
-DescribeComponent = Action("DescribeComponent")
-DisassociateRoleFromGroup = Action("DisassociateRoleFromGroup")
-DisassociateServiceRoleFromAccount = Action("DisassociateServiceRoleFromAccount")
-Discover = Action("Discover")
-GetAssociatedRole = Action("GetAssociatedRole")
-GetBulkDeploymentStatus = Action("GetBulkDeploymentStatus")
-GetComponent = Action("GetComponent")
-GetConnectivityInfo = Action("GetConnectivityInfo")
-GetConnectorDefinition = Action("GetConnectorDefinition")
-GetConnectorDefinitionVersion = Action("GetConnectorDefinitionVersion")
-GetCoreDefinition = Action("GetCoreDefinition")
-GetCoreDefinitionVersion = Action("GetCoreDefinitionVersion")
-GetCoreDevice = Action("GetCoreDevice")
-GetDeployment = Action("GetDeployment")
-GetDeploymentStatus = Action("GetDeploymentStatus")
-GetDeviceDefinition = Action("GetDeviceDefinition")
-GetDeviceDefinitionVersion = Action("GetDeviceDefinitionVersion")
-GetFunctionDefinition = Action("GetFunctionDefinition")
-GetFunctionDefinitionVersion = Action("GetFunctionDefinitionVersion")
-GetGroup = Action("GetGroup")
-GetGroupCertificateAuthority = Action("GetGroupCertificateAuthority")
-GetGroupCertificateConfiguration = Action("GetGroupCertificateConfiguration")
-GetGroupVersion = Action("GetGroupVersion")
-GetLoggerDefinition = Action("GetLoggerDefinition")
-GetLoggerDefinitionVersion = Action("GetLoggerDefinitionVersion")
-GetResourceDefinition = Action("GetResourceDefinition")
-GetResourceDefinitionVersion = Action("GetResourceDefinitionVersion")
-GetServiceRoleForAccount = Action("GetServiceRoleForAccount")
-GetSubscriptionDefinition = Action("GetSubscriptionDefinition")
-GetSubscriptionDefinitionVersion = Action("GetSubscriptionDefinitionVersion")
-GetThingRuntimeConfiguration = Action("GetThingRuntimeConfiguration")
-ListBulkDeploymentDetailedReports = Action("ListBulkDeploymentDetailedReports")
-ListBulkDeployments = Action("ListBulkDeployments")
-ListComponentVersions = Action("ListComponentVersions")
-ListComponents = Action("ListComponents")
-ListConnectorDefinitionVersions = Action("ListConnectorDefinitionVersions")
-ListConnectorDefinitions = Action("ListConnectorDefinitions")
-ListCoreDefinitionVersions = Action("ListCoreDefinitionVersions")
-ListCoreDefinitions = Action("ListCoreDefinitions")
-ListCoreDevices = Action("ListCoreDevices")
-ListDeployments = Action("ListDeployments")
-ListDeviceDefinitionVersions = Action("ListDeviceDefinitionVersions")
-ListDeviceDefinitions = Action("ListDeviceDefinitions")
-ListEffectiveDeployments = Action("ListEffectiveDeployments")
-ListFunctionDefinitionVersions = Action("ListFunctionDefinitionVersions")
-ListFunctionDefinitions = Action("ListFunctionDefinitions")
-ListGroupCertificateAuthorities = Action("ListGroupCertificateAuthorities")
-ListGroupVersions = Action("ListGroupVersions")
-ListGroups = Action("ListGroups")
-ListInstalledComponents = Action("ListInstalledComponents")
-ListLoggerDefinitionVersions = Action("ListLoggerDefinitionVersions")
-ListLoggerDefinitions = Action("ListLoggerDefinitions")
-ListResourceDefinitionVersions = Action("ListResourceDefinitionVersions")
-ListResourceDefinitions = Action("ListResourceDefinitions")
-ListSubscriptionDefinitionVersions = Action("ListSubscriptionDefinitionVersions")
-ListSubscriptionDefinitions = Action("ListSubscriptionDefinitions")
-ListTagsForResource = Action("ListTagsForResource")
-ResetDeployments = Action("ResetDeployments")
-StartBulkDeployment = Action("StartBulkDeployment")
-StopBulkDeployment = Action("StopBulkDeployment")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateConnectivityInfo = Action("UpdateConnectivityInfo")
-UpdateConnectorDefinition = Action("UpdateConnectorDefinition")
-UpdateCoreDefinition = Action("UpdateCoreDefinition")
-UpdateDeviceDefinition = Action("UpdateDeviceDefinition")
-UpdateFunctionDefinition = Action("UpdateFunctionDefinition")
-UpdateGroup = Action("UpdateGroup")
-UpdateGroupCertificateConfiguration = Action("UpdateGroupCertificateConfiguration")
-UpdateLoggerDefinition = Action("UpdateLoggerDefinition")
-UpdateResourceDefinition = Action("UpdateResourceDefinition")
-UpdateSubscriptionDefinition = Action("UpdateSubscriptionDefinition")
-UpdateThingRuntimeConfiguration = Action("UpdateThingRuntimeConfiguration")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
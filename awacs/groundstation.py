@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,28 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelContact = Action("CancelContact")
-CreateConfig = Action("CreateConfig")
-CreateDataflowEndpointGroup = Action("CreateDataflowEndpointGroup")
-CreateMissionProfile = Action("CreateMissionProfile")
-DeleteConfig = Action("DeleteConfig")
-DeleteDataflowEndpointGroup = Action("DeleteDataflowEndpointGroup")
-DeleteMissionProfile = Action("DeleteMissionProfile")
-DescribeContact = Action("DescribeContact")
-GetConfig = Action("GetConfig")
-GetDataflowEndpointGroup = Action("GetDataflowEndpointGroup")
-GetMinuteUsage = Action("GetMinuteUsage")
-GetMissionProfile = Action("GetMissionProfile")
-GetSatellite = Action("GetSatellite")
-ListConfigs = Action("ListConfigs")
-ListContacts = Action("ListContacts")
-ListDataflowEndpointGroups = Action("ListDataflowEndpointGroups")
-ListGroundStations = Action("ListGroundStations")
-ListMissionProfiles = Action("ListMissionProfiles")
-ListSatellites = Action("ListSatellites")
-ListTagsForResource = Action("ListTagsForResource")
-ReserveContact = Action("ReserveContact")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateConfig = Action("UpdateConfig")
-UpdateMissionProfile = Action("UpdateMissionProfile")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,58 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInvitation = Action("AcceptInvitation")
-ArchiveFindings = Action("ArchiveFindings")
-CreateDetector = Action("CreateDetector")
-CreateFilter = Action("CreateFilter")
-CreateIPSet = Action("CreateIPSet")
-CreateMembers = Action("CreateMembers")
-CreatePublishingDestination = Action("CreatePublishingDestination")
-CreateSampleFindings = Action("CreateSampleFindings")
-CreateThreatIntelSet = Action("CreateThreatIntelSet")
-DeclineInvitations = Action("DeclineInvitations")
-DeleteDetector = Action("DeleteDetector")
-DeleteFilter = Action("DeleteFilter")
-DeleteIPSet = Action("DeleteIPSet")
-DeleteInvitations = Action("DeleteInvitations")
-DeleteMembers = Action("DeleteMembers")
-DeletePublishingDestination = Action("DeletePublishingDestination")
-DeleteThreatIntelSet = Action("DeleteThreatIntelSet")
-DescribeOrganizationConfiguration = Action("DescribeOrganizationConfiguration")
-DescribePublishingDestination = Action("DescribePublishingDestination")
-DisableOrganizationAdminAccount = Action("DisableOrganizationAdminAccount")
-DisassociateFromMasterAccount = Action("DisassociateFromMasterAccount")
-DisassociateMembers = Action("DisassociateMembers")
-EnableOrganizationAdminAccount = Action("EnableOrganizationAdminAccount")
-GetDetector = Action("GetDetector")
-GetFilter = Action("GetFilter")
-GetFindings = Action("GetFindings")
-GetFindingsStatistics = Action("GetFindingsStatistics")
-GetIPSet = Action("GetIPSet")
-GetInvitationsCount = Action("GetInvitationsCount")
-GetMasterAccount = Action("GetMasterAccount")
-GetMembers = Action("GetMembers")
-GetThreatIntelSet = Action("GetThreatIntelSet")
-InviteMembers = Action("InviteMembers")
-ListDetectors = Action("ListDetectors")
-ListFilters = Action("ListFilters")
-ListFindings = Action("ListFindings")
-ListIPSets = Action("ListIPSets")
-ListInvitations = Action("ListInvitations")
-ListMembers = Action("ListMembers")
-ListOrganizationAdminAccounts = Action("ListOrganizationAdminAccounts")
-ListPublishingDestinations = Action("ListPublishingDestinations")
-ListTagsForResource = Action("ListTagsForResource")
-ListThreatIntelSets = Action("ListThreatIntelSets")
-StartMonitoringMembers = Action("StartMonitoringMembers")
-StopMonitoringMembers = Action("StopMonitoringMembers")
-TagResource = Action("TagResource")
-UnarchiveFindings = Action("UnarchiveFindings")
-UntagResource = Action("UntagResource")
-UpdateDetector = Action("UpdateDetector")
-UpdateFilter = Action("UpdateFilter")
-UpdateFindingsFeedback = Action("UpdateFindingsFeedback")
-UpdateIPSet = Action("UpdateIPSet")
-UpdateOrganizationConfiguration = Action("UpdateOrganizationConfiguration")
-UpdatePublishingDestination = Action("UpdatePublishingDestination")
-UpdateThreatIntelSet = Action("UpdateThreatIntelSet")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
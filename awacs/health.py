@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-DescribeAffectedAccountsForOrganization = Action(
-    "DescribeAffectedAccountsForOrganization"
-)
-DescribeAffectedEntities = Action("DescribeAffectedEntities")
-DescribeAffectedEntitiesForOrganization = Action(
-    "DescribeAffectedEntitiesForOrganization"
-)
-DescribeEntityAggregates = Action("DescribeEntityAggregates")
-DescribeEventAggregates = Action("DescribeEventAggregates")
-DescribeEventDetails = Action("DescribeEventDetails")
-DescribeEventDetailsForOrganization = Action("DescribeEventDetailsForOrganization")
-DescribeEventTypes = Action("DescribeEventTypes")
-DescribeEvents = Action("DescribeEvents")
-DescribeEventsForOrganization = Action("DescribeEventsForOrganization")
-DescribeHealthServiceStatusForOrganization = Action(
-    "DescribeHealthServiceStatusForOrganization"
-)
-DisableHealthServiceAccessForOrganization = Action(
-    "DisableHealthServiceAccessForOrganization"
-)
-EnableHealthServiceAccessForOrganization = Action(
-    "EnableHealthServiceAccessForOrganization"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
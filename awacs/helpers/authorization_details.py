@@ -0,0 +1,265 @@
+import gzip
+import io
+import json
+import os
+import re
+import urllib.parse
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from awacs.aws import PolicyDocument
+
+# Top level lists of an account authorization details export and the kind of
+# the entries in each of them.
+DETAIL_LISTS = {
+    "UserDetailList": "user",
+    "GroupDetailList": "group",
+    "RoleDetailList": "role",
+    "Policies": "policy",
+}
+
+_whitespace = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+
+class IdentityDetails(NamedTuple):
+    """A user, group or role of an account authorization details export."""
+
+    kind: str
+    name: str
+    arn: str
+    # Inline policies by name
+    policies: Dict[str, PolicyDocument]
+    # ARNs of the attached managed policies
+    attached_policies: List[str]
+    # ARN of the permissions boundary, users and roles only
+    permissions_boundary: Optional[str]
+    # Names of the groups of a user
+    groups: List[str]
+    # Trust policy of a role
+    assume_role_policy: Optional[PolicyDocument]
+    # The entry as found in the export
+    detail: Dict[str, Any]
+
+
+class ManagedPolicyDetails(NamedTuple):
+    """A managed policy of an account authorization details export."""
+
+    name: str
+    arn: str
+    default_version_id: Optional[str]
+    # Policy versions by version id
+    versions: Dict[str, PolicyDocument]
+    # The entry as found in the export
+    detail: Dict[str, Any]
+
+    @property
+    def policy(self) -> Optional[PolicyDocument]:
+        """The default version of the policy."""
+        if self.default_version_id is None:
+            return None
+        return self.versions.get(self.default_version_id)
+
+
+Details = Union[IdentityDetails, ManagedPolicyDetails]
+
+
+def read_authorization_details(
+    source: Union[str, "os.PathLike[str]", IO[Any]], chunk_size: int = 65536
+) -> Iterator[Details]:
+    """Read the output of "aws iam get-account-authorization-details".
+
+    The source is a path or a file object, gzip compressed or not. Users,
+    groups, roles and managed policies are yielded one at a time with their
+    policies parsed into PolicyDocuments, reading the export incrementally so
+    memory use does not grow with its size. Several exports concatenated in
+    one file, e.g. the pages of a truncated listing, are read one after the
+    other.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            yield from read_authorization_details(fp, chunk_size)
+        return
+
+    with _text_stream(source) as text:
+        reader = _JSONReader(text, chunk_size)
+        for key, entry in reader.iter_lists(DETAIL_LISTS):
+            kind = DETAIL_LISTS[key]
+            if kind == "policy":
+                yield _managed_policy(entry)
+            else:
+                yield _identity(kind, entry)
+
+
+def parse_policy_document(document: Union[str, Dict[str, Any]]) -> PolicyDocument:
+    """Parse a policy document of an export.
+
+    The AWS CLI decodes policy documents, while the IAM API returns them as
+    URL encoded JSON strings, so both are accepted.
+    """
+    if isinstance(document, str):
+        return PolicyDocument.from_dict(json.loads(urllib.parse.unquote(document)))
+    return PolicyDocument.from_dict(document)
+
+
+def _identity(kind: str, entry: Dict[str, Any]) -> IdentityDetails:
+    name_key = "%sName" % (kind.capitalize(),)
+    policy_list = "%sPolicyList" % (kind.capitalize(),)
+    boundary = entry.get("PermissionsBoundary") or {}
+    assume_role_policy = entry.get("AssumeRolePolicyDocument")
+    return IdentityDetails(
+        kind=kind,
+        name=entry.get(name_key, ""),
+        arn=entry.get("Arn", ""),
+        policies={
+            p["PolicyName"]: parse_policy_document(p["PolicyDocument"])
+            for p in entry.get(policy_list) or []
+        },
+        attached_policies=[
+            p["PolicyArn"] for p in entry.get("AttachedManagedPolicies") or []
+        ],
+        permissions_boundary=boundary.get("PermissionsBoundaryArn"),
+        groups=list(entry.get("GroupList") or []),
+        assume_role_policy=(
+            parse_policy_document(assume_role_policy) if assume_role_policy else None
+        ),
+        detail=entry,
+    )
+
+
+def _managed_policy(entry: Dict[str, Any]) -> ManagedPolicyDetails:
+    return ManagedPolicyDetails(
+        name=entry.get("PolicyName", ""),
+        arn=entry.get("Arn", ""),
+        default_version_id=entry.get("DefaultVersionId"),
+        versions={
+            v["VersionId"]: parse_policy_document(v["Document"])
+            for v in entry.get("PolicyVersionList") or []
+        },
+        detail=entry,
+    )
+
+
+@contextmanager
+def _text_stream(fp: Any) -> Iterator[IO[str]]:
+    """Read a file object as text, leaving it open.
+
+    The wrappers around a binary file object are detached from it when done,
+    as closing them, or their garbage collection, would close it.
+    """
+    if isinstance(fp, io.TextIOBase):
+        yield fp  # type: ignore[misc]
+        return
+    buffered = None
+    if not hasattr(fp, "peek"):
+        fp = buffered = io.BufferedReader(fp)
+    compressed = None
+    if fp.peek(2)[:2] == b"\x1f\x8b":
+        # Closing a GzipFile leaves the file object it reads from open
+        fp = compressed = gzip.GzipFile(fileobj=fp, mode="rb")
+    text = io.TextIOWrapper(fp, encoding="utf-8")
+    try:
+        yield text
+    finally:
+        text.detach()
+        if compressed is not None:
+            compressed.close()
+        if buffered is not None:
+            buffered.detach()
+
+
+class _JSONReader:
+    """Read the top level lists of JSON documents one entry at a time.
+
+    Only the current entry is decoded with json.JSONDecoder.raw_decode(),
+    reading more of the stream until it is complete.
+    """
+
+    def __init__(self, fp: IO[str], chunk_size: int) -> None:
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def iter_lists(self, keys: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """Yield (key, entry) for the entries of the lists with the given keys.
+
+        Other values are decoded and skipped.
+        """
+        while self.peek():
+            self.expect("{")
+            if self.peek() == "}":
+                self.pos += 1
+                continue
+            while True:
+                key = self.value()
+                self.expect(":")
+                if key in keys and self.peek() == "[":
+                    self.pos += 1
+                    if self.peek() == "]":
+                        self.pos += 1
+                    else:
+                        while True:
+                            yield key, self.value()
+                            if self.separator("]"):
+                                break
+                else:
+                    self.value()
+                if self.separator("}"):
+                    break
+
+    def read(self, size: int) -> bool:
+        chunk = self.fp.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop what was consumed so the buffer holds one entry at most
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, "" at the end."""
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()  # type: ignore
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.read(self.chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(
+                "Expected %r in authorization details, found %r"
+                % (char, self.buf[self.pos : self.pos + 20])
+            )
+        self.pos += 1
+
+    def separator(self, end: str) -> bool:
+        """Consume a comma or the end of a list or object, True at the end."""
+        char = self.peek()
+        if char == end:
+            self.pos += 1
+            return True
+        self.expect(",")
+        return False
+
+    def value(self) -> Any:
+        self.peek()
+        size = self.chunk_size
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue after it
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            # Read more, doubling the size to not decode large entries over
+            # and over again
+            self.read(size)
+            size *= 2
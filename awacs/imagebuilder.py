@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelImageCreation = Action("CancelImageCreation")
-CreateComponent = Action("CreateComponent")
-CreateContainerRecipe = Action("CreateContainerRecipe")
-CreateDistributionConfiguration = Action("CreateDistributionConfiguration")
-CreateImage = Action("CreateImage")
-CreateImagePipeline = Action("CreateImagePipeline")
-CreateImageRecipe = Action("CreateImageRecipe")
-CreateInfrastructureConfiguration = Action("CreateInfrastructureConfiguration")
-DeleteComponent = Action("DeleteComponent")
-DeleteContainerRecipe = Action("DeleteContainerRecipe")
-DeleteDistributionConfiguration = Action("DeleteDistributionConfiguration")
-DeleteImage = Action("DeleteImage")
-DeleteImagePipeline = Action("DeleteImagePipeline")
-DeleteImageRecipe = Action("DeleteImageRecipe")
-DeleteInfrastructureConfiguration = Action("DeleteInfrastructureConfiguration")
-GetComponent = Action("GetComponent")
-GetComponentPolicy = Action("GetComponentPolicy")
-GetContainerRecipe = Action("GetContainerRecipe")
-GetContainerRecipePolicy = Action("GetContainerRecipePolicy")
-GetDistributionConfiguration = Action("GetDistributionConfiguration")
-GetImage = Action("GetImage")
-GetImagePipeline = Action("GetImagePipeline")
-GetImagePolicy = Action("GetImagePolicy")
-GetImageRecipe = Action("GetImageRecipe")
-GetImageRecipePolicy = Action("GetImageRecipePolicy")
-GetInfrastructureConfiguration = Action("GetInfrastructureConfiguration")
-ListComponentBuildVersions = Action("ListComponentBuildVersions")
-ListComponents = Action("ListComponents")
-ListContainerRecipes = Action("ListContainerRecipes")
-ListDistributionConfigurations = Action("ListDistributionConfigurations")
-ListImageBuildVersions = Action("ListImageBuildVersions")
-ListImagePackages = Action("ListImagePackages")
-ListImagePipelineImages = Action("ListImagePipelineImages")
-ListImagePipelines = Action("ListImagePipelines")
-ListImageRecipes = Action("ListImageRecipes")
-ListImages = Action("ListImages")
-ListInfrastructureConfigurations = Action("ListInfrastructureConfigurations")
-ListTagsForResource = Action("ListTagsForResource")
-PutComponentPolicy = Action("PutComponentPolicy")
-PutContainerRecipePolicy = Action("PutContainerRecipePolicy")
-PutImagePolicy = Action("PutImagePolicy")
-PutImageRecipePolicy = Action("PutImageRecipePolicy")
-StartImagePipelineExecution = Action("StartImagePipelineExecution")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDistributionConfiguration = Action("UpdateDistributionConfiguration")
-UpdateImagePipeline = Action("UpdateImagePipeline")
-UpdateInfrastructureConfiguration = Action("UpdateInfrastructureConfiguration")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,35 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddAttributesToFindings = Action("AddAttributesToFindings")
-CreateAssessmentTarget = Action("CreateAssessmentTarget")
-CreateAssessmentTemplate = Action("CreateAssessmentTemplate")
-CreateResourceGroup = Action("CreateResourceGroup")
-DeleteAssessmentRun = Action("DeleteAssessmentRun")
-DeleteAssessmentTarget = Action("DeleteAssessmentTarget")
-DeleteAssessmentTemplate = Action("DeleteAssessmentTemplate")
-DescribeAssessmentRuns = Action("DescribeAssessmentRuns")
-DescribeAssessmentTargets = Action("DescribeAssessmentTargets")
-DescribeAssessmentTemplates = Action("DescribeAssessmentTemplates")
-DescribeCrossAccountAccessRole = Action("DescribeCrossAccountAccessRole")
-DescribeFindings = Action("DescribeFindings")
-DescribeResourceGroups = Action("DescribeResourceGroups")
-DescribeRulesPackages = Action("DescribeRulesPackages")
-GetTelemetryMetadata = Action("GetTelemetryMetadata")
-ListAssessmentRunAgents = Action("ListAssessmentRunAgents")
-ListAssessmentRuns = Action("ListAssessmentRuns")
-ListAssessmentTargets = Action("ListAssessmentTargets")
-ListAssessmentTemplates = Action("ListAssessmentTemplates")
-ListEventSubscriptions = Action("ListEventSubscriptions")
-ListFindings = Action("ListFindings")
-ListRulesPackages = Action("ListRulesPackages")
-ListTagsForResource = Action("ListTagsForResource")
-PreviewAgents = Action("PreviewAgents")
-RegisterCrossAccountAccessRole = Action("RegisterCrossAccountAccessRole")
-RemoveAttributesFromFindings = Action("RemoveAttributesFromFindings")
-SetTagsForResource = Action("SetTagsForResource")
-StartAssessmentRun = Action("StartAssessmentRun")
-StopAssessmentRun = Action("StopAssessmentRun")
-SubscribeToEvent = Action("SubscribeToEvent")
-UnsubscribeFromEvent = Action("UnsubscribeFromEvent")
-UpdateAssessmentTarget = Action("UpdateAssessmentTarget")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,30 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateDeviceWithPlacement = Action("AssociateDeviceWithPlacement")
-ClaimDevicesByClaimCode = Action("ClaimDevicesByClaimCode")
-CreatePlacement = Action("CreatePlacement")
-CreateProject = Action("CreateProject")
-DeletePlacement = Action("DeletePlacement")
-DeleteProject = Action("DeleteProject")
-DescribeDevice = Action("DescribeDevice")
-DescribePlacement = Action("DescribePlacement")
-DescribeProject = Action("DescribeProject")
-DisassociateDeviceFromPlacement = Action("DisassociateDeviceFromPlacement")
-FinalizeDeviceClaim = Action("FinalizeDeviceClaim")
-GetDeviceMethods = Action("GetDeviceMethods")
-GetDevicesInPlacement = Action("GetDevicesInPlacement")
-InitializeDeviceClaim = Action("InitializeDeviceClaim")
-InitiateDeviceClaim = Action("InitiateDeviceClaim")
-InvokeDeviceMethod = Action("InvokeDeviceMethod")
-ListDeviceEvents = Action("ListDeviceEvents")
-ListDevices = Action("ListDevices")
-ListPlacements = Action("ListPlacements")
-ListProjects = Action("ListProjects")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UnclaimDevice = Action("UnclaimDevice")
-UntagResource = Action("UntagResource")
-UpdateDeviceState = Action("UpdateDeviceState")
-UpdatePlacement = Action("UpdatePlacement")
-UpdateProject = Action("UpdateProject")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
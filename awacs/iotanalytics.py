@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchPutMessage = Action("BatchPutMessage")
-CancelPipelineReprocessing = Action("CancelPipelineReprocessing")
-CreateChannel = Action("CreateChannel")
-CreateDataset = Action("CreateDataset")
-CreateDatasetContent = Action("CreateDatasetContent")
-CreateDatastore = Action("CreateDatastore")
-CreatePipeline = Action("CreatePipeline")
-DeleteChannel = Action("DeleteChannel")
-DeleteDataset = Action("DeleteDataset")
-DeleteDatasetContent = Action("DeleteDatasetContent")
-DeleteDatastore = Action("DeleteDatastore")
-DeletePipeline = Action("DeletePipeline")
-DescribeChannel = Action("DescribeChannel")
-DescribeDataset = Action("DescribeDataset")
-DescribeDatastore = Action("DescribeDatastore")
-DescribeLoggingOptions = Action("DescribeLoggingOptions")
-DescribePipeline = Action("DescribePipeline")
-GetDatasetContent = Action("GetDatasetContent")
-ListChannels = Action("ListChannels")
-ListDatasets = Action("ListDatasets")
-ListDatastores = Action("ListDatastores")
-ListPipelines = Action("ListPipelines")
-ListTagsForResource = Action("ListTagsForResource")
-PutLoggingOptions = Action("PutLoggingOptions")
-RunPipelineActivity = Action("RunPipelineActivity")
-SampleChannelData = Action("SampleChannelData")
-StartPipelineReprocessing = Action("StartPipelineReprocessing")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateChannel = Action("UpdateChannel")
-UpdateDataset = Action("UpdateDataset")
-UpdateDatastore = Action("UpdateDatastore")
-UpdatePipeline = Action("UpdatePipeline")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
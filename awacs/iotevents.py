@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,37 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchAcknowledgeAlarm = Action("BatchAcknowledgeAlarm")
-BatchDisableAlarm = Action("BatchDisableAlarm")
-BatchEnableAlarm = Action("BatchEnableAlarm")
-BatchPutMessage = Action("BatchPutMessage")
-BatchResetAlarm = Action("BatchResetAlarm")
-BatchSnoozeAlarm = Action("BatchSnoozeAlarm")
-BatchUpdateDetector = Action("BatchUpdateDetector")
-CreateAlarmModel = Action("CreateAlarmModel")
-CreateDetectorModel = Action("CreateDetectorModel")
-CreateInput = Action("CreateInput")
-DeleteAlarmModel = Action("DeleteAlarmModel")
-DeleteDetectorModel = Action("DeleteDetectorModel")
-DeleteInput = Action("DeleteInput")
-DescribeAlarm = Action("DescribeAlarm")
-DescribeAlarmModel = Action("DescribeAlarmModel")
-DescribeDetector = Action("DescribeDetector")
-DescribeDetectorModel = Action("DescribeDetectorModel")
-DescribeInput = Action("DescribeInput")
-DescribeLoggingOptions = Action("DescribeLoggingOptions")
-ListAlarmModelVersions = Action("ListAlarmModelVersions")
-ListAlarmModels = Action("ListAlarmModels")
-ListAlarms = Action("ListAlarms")
-ListDetectorModelVersions = Action("ListDetectorModelVersions")
-ListDetectorModels = Action("ListDetectorModels")
-ListDetectors = Action("ListDetectors")
-ListInputs = Action("ListInputs")
-ListTagsForResource = Action("ListTagsForResource")
-PutLoggingOptions = Action("PutLoggingOptions")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAlarmModel = Action("UpdateAlarmModel")
-UpdateDetectorModel = Action("UpdateDetectorModel")
-UpdateInput = Action("UpdateInput")
-UpdateInputRouting = Action("UpdateInputRouting")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,16 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApplication = Action("CreateApplication")
-CreateDashboard = Action("CreateDashboard")
-DeleteApplication = Action("DeleteApplication")
-DeleteDashboard = Action("DeleteDashboard")
-DescribeApplication = Action("DescribeApplication")
-DescribeDashboard = Action("DescribeDashboard")
-ListApplications = Action("ListApplications")
-ListDashboards = Action("ListDashboards")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApplication = Action("UpdateApplication")
-UpdateDashboard = Action("UpdateDashboard")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,38 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateEntityToThing = Action("AssociateEntityToThing")
-CreateFlowTemplate = Action("CreateFlowTemplate")
-CreateSystemInstance = Action("CreateSystemInstance")
-CreateSystemTemplate = Action("CreateSystemTemplate")
-DeleteFlowTemplate = Action("DeleteFlowTemplate")
-DeleteNamespace = Action("DeleteNamespace")
-DeleteSystemInstance = Action("DeleteSystemInstance")
-DeleteSystemTemplate = Action("DeleteSystemTemplate")
-DeploySystemInstance = Action("DeploySystemInstance")
-DeprecateFlowTemplate = Action("DeprecateFlowTemplate")
-DeprecateSystemTemplate = Action("DeprecateSystemTemplate")
-DescribeNamespace = Action("DescribeNamespace")
-DissociateEntityFromThing = Action("DissociateEntityFromThing")
-GetEntities = Action("GetEntities")
-GetFlowTemplate = Action("GetFlowTemplate")
-GetFlowTemplateRevisions = Action("GetFlowTemplateRevisions")
-GetNamespaceDeletionStatus = Action("GetNamespaceDeletionStatus")
-GetSystemInstance = Action("GetSystemInstance")
-GetSystemTemplate = Action("GetSystemTemplate")
-GetSystemTemplateRevisions = Action("GetSystemTemplateRevisions")
-GetUploadStatus = Action("GetUploadStatus")
-ListFlowExecutionMessages = Action("ListFlowExecutionMessages")
-ListTagsForResource = Action("ListTagsForResource")
-SearchEntities = Action("SearchEntities")
-SearchFlowExecutions = Action("SearchFlowExecutions")
-SearchFlowTemplates = Action("SearchFlowTemplates")
-SearchSystemInstances = Action("SearchSystemInstances")
-SearchSystemTemplates = Action("SearchSystemTemplates")
-SearchThings = Action("SearchThings")
-TagResource = Action("TagResource")
-UndeploySystemInstance = Action("UndeploySystemInstance")
-UntagResource = Action("UntagResource")
-UpdateFlowTemplate = Action("UpdateFlowTemplate")
-UpdateSystemTemplate = Action("UpdateSystemTemplate")
-UploadEntityDefinitions = Action("UploadEntityDefinitions")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
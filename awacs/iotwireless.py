@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,60 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateAwsAccountWithPartnerAccount = Action("AssociateAwsAccountWithPartnerAccount")
-AssociateWirelessDeviceWithThing = Action("AssociateWirelessDeviceWithThing")
-AssociateWirelessGatewayWithCertificate = Action(
-    "AssociateWirelessGatewayWithCertificate"
-)
-AssociateWirelessGatewayWithThing = Action("AssociateWirelessGatewayWithThing")
-CreateDestination = Action("CreateDestination")
-CreateDeviceProfile = Action("CreateDeviceProfile")
-CreateServiceProfile = Action("CreateServiceProfile")
-CreateWirelessDevice = Action("CreateWirelessDevice")
-CreateWirelessGateway = Action("CreateWirelessGateway")
-CreateWirelessGatewayTask = Action("CreateWirelessGatewayTask")
-CreateWirelessGatewayTaskDefinition = Action("CreateWirelessGatewayTaskDefinition")
-DeleteDestination = Action("DeleteDestination")
-DeleteDeviceProfile = Action("DeleteDeviceProfile")
-DeleteServiceProfile = Action("DeleteServiceProfile")
-DeleteWirelessDevice = Action("DeleteWirelessDevice")
-DeleteWirelessGateway = Action("DeleteWirelessGateway")
-DeleteWirelessGatewayTask = Action("DeleteWirelessGatewayTask")
-DeleteWirelessGatewayTaskDefinition = Action("DeleteWirelessGatewayTaskDefinition")
-DisassociateAwsAccountFromPartnerAccount = Action(
-    "DisassociateAwsAccountFromPartnerAccount"
-)
-DisassociateWirelessDeviceFromThing = Action("DisassociateWirelessDeviceFromThing")
-DisassociateWirelessGatewayFromCertificate = Action(
-    "DisassociateWirelessGatewayFromCertificate"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DisassociateWirelessGatewayFromThing = Action("DisassociateWirelessGatewayFromThing")
-GetDestination = Action("GetDestination")
-GetDeviceProfile = Action("GetDeviceProfile")
-GetPartnerAccount = Action("GetPartnerAccount")
-GetServiceEndpoint = Action("GetServiceEndpoint")
-GetServiceProfile = Action("GetServiceProfile")
-GetWirelessDevice = Action("GetWirelessDevice")
-GetWirelessDeviceStatistics = Action("GetWirelessDeviceStatistics")
-GetWirelessGateway = Action("GetWirelessGateway")
-GetWirelessGatewayCertificate = Action("GetWirelessGatewayCertificate")
-GetWirelessGatewayFirmwareInformation = Action("GetWirelessGatewayFirmwareInformation")
-GetWirelessGatewayStatistics = Action("GetWirelessGatewayStatistics")
-GetWirelessGatewayTask = Action("GetWirelessGatewayTask")
-GetWirelessGatewayTaskDefinition = Action("GetWirelessGatewayTaskDefinition")
-ListDestinations = Action("ListDestinations")
-ListDeviceProfiles = Action("ListDeviceProfiles")
-ListPartnerAccounts = Action("ListPartnerAccounts")
-ListServiceProfiles = Action("ListServiceProfiles")
-ListTagsForResource = Action("ListTagsForResource")
-ListWirelessDevices = Action("ListWirelessDevices")
-ListWirelessGatewayTaskDefinitions = Action("ListWirelessGatewayTaskDefinitions")
-ListWirelessGateways = Action("ListWirelessGateways")
-SendDataToWirelessDevice = Action("SendDataToWirelessDevice")
-TagResource = Action("TagResource")
-TestWirelessDevice = Action("TestWirelessDevice")
-UntagResource = Action("UntagResource")
-UpdateDestination = Action("UpdateDestination")
-UpdatePartnerAccount = Action("UpdatePartnerAccount")
-UpdateWirelessDevice = Action("UpdateWirelessDevice")
-UpdateWirelessGateway = Action("UpdateWirelessGateway")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
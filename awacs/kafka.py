@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,33 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchAssociateScramSecret = Action("BatchAssociateScramSecret")
-BatchDisassociateScramSecret = Action("BatchDisassociateScramSecret")
-CreateCluster = Action("CreateCluster")
-CreateConfiguration = Action("CreateConfiguration")
-DeleteCluster = Action("DeleteCluster")
-DeleteConfiguration = Action("DeleteConfiguration")
-DescribeCluster = Action("DescribeCluster")
-DescribeClusterOperation = Action("DescribeClusterOperation")
-DescribeConfiguration = Action("DescribeConfiguration")
-DescribeConfigurationRevision = Action("DescribeConfigurationRevision")
-GetBootstrapBrokers = Action("GetBootstrapBrokers")
-GetCompatibleKafkaVersions = Action("GetCompatibleKafkaVersions")
-ListClusterOperations = Action("ListClusterOperations")
-ListClusters = Action("ListClusters")
-ListConfigurationRevisions = Action("ListConfigurationRevisions")
-ListConfigurations = Action("ListConfigurations")
-ListKafkaVersions = Action("ListKafkaVersions")
-ListNodes = Action("ListNodes")
-ListScramSecrets = Action("ListScramSecrets")
-ListTagsForResource = Action("ListTagsForResource")
-RebootBroker = Action("RebootBroker")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateBrokerCount = Action("UpdateBrokerCount")
-UpdateBrokerStorage = Action("UpdateBrokerStorage")
-UpdateBrokerType = Action("UpdateBrokerType")
-UpdateClusterConfiguration = Action("UpdateClusterConfiguration")
-UpdateClusterKafkaVersion = Action("UpdateClusterKafkaVersion")
-UpdateConfiguration = Action("UpdateConfiguration")
-UpdateMonitoring = Action("UpdateMonitoring")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
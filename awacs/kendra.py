@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,32 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchDeleteDocument = Action("BatchDeleteDocument")
-BatchPutDocument = Action("BatchPutDocument")
-CreateDataSource = Action("CreateDataSource")
-CreateFaq = Action("CreateFaq")
-CreateIndex = Action("CreateIndex")
-CreateThesaurus = Action("CreateThesaurus")
-DeleteDataSource = Action("DeleteDataSource")
-DeleteFaq = Action("DeleteFaq")
-DeleteIndex = Action("DeleteIndex")
-DeleteThesaurus = Action("DeleteThesaurus")
-DescribeDataSource = Action("DescribeDataSource")
-DescribeFaq = Action("DescribeFaq")
-DescribeIndex = Action("DescribeIndex")
-DescribeThesaurus = Action("DescribeThesaurus")
-ListDataSourceSyncJobs = Action("ListDataSourceSyncJobs")
-ListDataSources = Action("ListDataSources")
-ListFaqs = Action("ListFaqs")
-ListIndices = Action("ListIndices")
-ListTagsForResource = Action("ListTagsForResource")
-ListThesauri = Action("ListThesauri")
-Query = Action("Query")
-StartDataSourceSyncJob = Action("StartDataSourceSyncJob")
-StopDataSourceSyncJob = Action("StopDataSourceSyncJob")
-SubmitFeedback = Action("SubmitFeedback")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDataSource = Action("UpdateDataSource")
-UpdateIndex = Action("UpdateIndex")
-UpdateThesaurus = Action("UpdateThesaurus")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,31 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTagsToStream = Action("AddTagsToStream")
-CreateStream = Action("CreateStream")
-DecreaseStreamRetentionPeriod = Action("DecreaseStreamRetentionPeriod")
-DeleteStream = Action("DeleteStream")
-DeregisterStreamConsumer = Action("DeregisterStreamConsumer")
-DescribeLimits = Action("DescribeLimits")
-DescribeStream = Action("DescribeStream")
-DescribeStreamConsumer = Action("DescribeStreamConsumer")
-DescribeStreamSummary = Action("DescribeStreamSummary")
-DisableEnhancedMonitoring = Action("DisableEnhancedMonitoring")
-EnableEnhancedMonitoring = Action("EnableEnhancedMonitoring")
-GetRecords = Action("GetRecords")
-GetShardIterator = Action("GetShardIterator")
-IncreaseStreamRetentionPeriod = Action("IncreaseStreamRetentionPeriod")
-ListShards = Action("ListShards")
-ListStreamConsumers = Action("ListStreamConsumers")
-ListStreams = Action("ListStreams")
-ListTagsForStream = Action("ListTagsForStream")
-MergeShards = Action("MergeShards")
-PutRecord = Action("PutRecord")
-PutRecords = Action("PutRecords")
-RegisterStreamConsumer = Action("RegisterStreamConsumer")
-RemoveTagsFromStream = Action("RemoveTagsFromStream")
-SplitShard = Action("SplitShard")
-StartStreamEncryption = Action("StartStreamEncryption")
-StopStreamEncryption = Action("StopStreamEncryption")
-SubscribeToShard = Action("SubscribeToShard")
-UpdateShardCount = Action("UpdateShardCount")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
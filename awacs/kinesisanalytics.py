@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,37 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddApplicationCloudWatchLoggingOption = Action("AddApplicationCloudWatchLoggingOption")
-AddApplicationInput = Action("AddApplicationInput")
-AddApplicationInputProcessingConfiguration = Action(
-    "AddApplicationInputProcessingConfiguration"
-)
-AddApplicationOutput = Action("AddApplicationOutput")
-AddApplicationReferenceDataSource = Action("AddApplicationReferenceDataSource")
-AddApplicationVpcConfiguration = Action("AddApplicationVpcConfiguration")
-CreateApplication = Action("CreateApplication")
-CreateApplicationPresignedUrl = Action("CreateApplicationPresignedUrl")
-CreateApplicationSnapshot = Action("CreateApplicationSnapshot")
-DeleteApplication = Action("DeleteApplication")
-DeleteApplicationCloudWatchLoggingOption = Action(
-    "DeleteApplicationCloudWatchLoggingOption"
-)
-DeleteApplicationInputProcessingConfiguration = Action(
-    "DeleteApplicationInputProcessingConfiguration"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DeleteApplicationOutput = Action("DeleteApplicationOutput")
-DeleteApplicationReferenceDataSource = Action("DeleteApplicationReferenceDataSource")
-DeleteApplicationSnapshot = Action("DeleteApplicationSnapshot")
-DeleteApplicationVpcConfiguration = Action("DeleteApplicationVpcConfiguration")
-DescribeApplication = Action("DescribeApplication")
-DescribeApplicationSnapshot = Action("DescribeApplicationSnapshot")
-DiscoverInputSchema = Action("DiscoverInputSchema")
-GetApplicationState = Action("GetApplicationState")
-ListApplicationSnapshots = Action("ListApplicationSnapshots")
-ListApplications = Action("ListApplications")
-ListTagsForResource = Action("ListTagsForResource")
-StartApplication = Action("StartApplication")
-StopApplication = Action("StopApplication")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApplication = Action("UpdateApplication")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
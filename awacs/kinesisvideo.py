@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,33 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ConnectAsMaster = Action("ConnectAsMaster")
-ConnectAsViewer = Action("ConnectAsViewer")
-CreateSignalingChannel = Action("CreateSignalingChannel")
-CreateStream = Action("CreateStream")
-DeleteSignalingChannel = Action("DeleteSignalingChannel")
-DeleteStream = Action("DeleteStream")
-DescribeSignalingChannel = Action("DescribeSignalingChannel")
-DescribeStream = Action("DescribeStream")
-GetClip = Action("GetClip")
-GetDASHStreamingSessionURL = Action("GetDASHStreamingSessionURL")
-GetDataEndpoint = Action("GetDataEndpoint")
-GetHLSStreamingSessionURL = Action("GetHLSStreamingSessionURL")
-GetIceServerConfig = Action("GetIceServerConfig")
-GetMedia = Action("GetMedia")
-GetMediaForFragmentList = Action("GetMediaForFragmentList")
-GetSignalingChannelEndpoint = Action("GetSignalingChannelEndpoint")
-ListFragments = Action("ListFragments")
-ListSignalingChannels = Action("ListSignalingChannels")
-ListStreams = Action("ListStreams")
-ListTagsForResource = Action("ListTagsForResource")
-ListTagsForStream = Action("ListTagsForStream")
-PutMedia = Action("PutMedia")
-SendAlexaOfferToMaster = Action("SendAlexaOfferToMaster")
-TagResource = Action("TagResource")
-TagStream = Action("TagStream")
-UntagResource = Action("UntagResource")
-UntagStream = Action("UntagStream")
-UpdateDataRetention = Action("UpdateDataRetention")
-UpdateSignalingChannel = Action("UpdateSignalingChannel")
-UpdateStream = Action("UpdateStream")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelKeyDeletion = Action("CancelKeyDeletion")
-ConnectCustomKeyStore = Action("ConnectCustomKeyStore")
-CreateAlias = Action("CreateAlias")
-CreateCustomKeyStore = Action("CreateCustomKeyStore")
-CreateGrant = Action("CreateGrant")
-CreateKey = Action("CreateKey")
-Decrypt = Action("Decrypt")
-DeleteAlias = Action("DeleteAlias")
-DeleteCustomKeyStore = Action("DeleteCustomKeyStore")
-DeleteImportedKeyMaterial = Action("DeleteImportedKeyMaterial")
-DescribeCustomKeyStores = Action("DescribeCustomKeyStores")
-DescribeKey = Action("DescribeKey")
-DisableKey = Action("DisableKey")
-DisableKeyRotation = Action("DisableKeyRotation")
-DisconnectCustomKeyStore = Action("DisconnectCustomKeyStore")
-EnableKey = Action("EnableKey")
-EnableKeyRotation = Action("EnableKeyRotation")
-Encrypt = Action("Encrypt")
-GenerateDataKey = Action("GenerateDataKey")
-GenerateDataKeyPair = Action("GenerateDataKeyPair")
-GenerateDataKeyPairWithoutPlaintext = Action("GenerateDataKeyPairWithoutPlaintext")
-GenerateDataKeyWithoutPlaintext = Action("GenerateDataKeyWithoutPlaintext")
-GenerateRandom = Action("GenerateRandom")
-GetKeyPolicy = Action("GetKeyPolicy")
-GetKeyRotationStatus = Action("GetKeyRotationStatus")
-GetParametersForImport = Action("GetParametersForImport")
-GetPublicKey = Action("GetPublicKey")
-ImportKeyMaterial = Action("ImportKeyMaterial")
-ListAliases = Action("ListAliases")
-ListGrants = Action("ListGrants")
-ListKeyPolicies = Action("ListKeyPolicies")
-ListKeys = Action("ListKeys")
-ListResourceTags = Action("ListResourceTags")
-ListRetirableGrants = Action("ListRetirableGrants")
-PutKeyPolicy = Action("PutKeyPolicy")
-ReEncrypt = Action("ReEncrypt")
-ReEncryptFrom = Action("ReEncryptFrom")
-ReEncryptTo = Action("ReEncryptTo")
-RetireGrant = Action("RetireGrant")
-RevokeGrant = Action("RevokeGrant")
-ScheduleKeyDeletion = Action("ScheduleKeyDeletion")
-Sign = Action("Sign")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAlias = Action("UpdateAlias")
-UpdateCustomKeyStore = Action("UpdateCustomKeyStore")
-UpdateKeyDescription = Action("UpdateKeyDescription")
-Verify = Action("Verify")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
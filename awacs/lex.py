@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,83 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BuildBotLocale = Action("BuildBotLocale")
-CreateBot = Action("CreateBot")
-CreateBotAlias = Action("CreateBotAlias")
-CreateBotChannel = Action("CreateBotChannel")
-CreateBotLocale = Action("CreateBotLocale")
-CreateBotVersion = Action("CreateBotVersion")
-CreateIntent = Action("CreateIntent")
-CreateIntentVersion = Action("CreateIntentVersion")
-CreateSlot = Action("CreateSlot")
-CreateSlotType = Action("CreateSlotType")
-CreateSlotTypeVersion = Action("CreateSlotTypeVersion")
-DeleteBot = Action("DeleteBot")
-DeleteBotAlias = Action("DeleteBotAlias")
-DeleteBotChannel = Action("DeleteBotChannel")
-DeleteBotChannelAssociation = Action("DeleteBotChannelAssociation")
-DeleteBotLocale = Action("DeleteBotLocale")
-DeleteBotVersion = Action("DeleteBotVersion")
-DeleteIntent = Action("DeleteIntent")
-DeleteIntentVersion = Action("DeleteIntentVersion")
-DeleteSession = Action("DeleteSession")
-DeleteSlot = Action("DeleteSlot")
-DeleteSlotType = Action("DeleteSlotType")
-DeleteSlotTypeVersion = Action("DeleteSlotTypeVersion")
-DeleteUtterances = Action("DeleteUtterances")
-DescribeBot = Action("DescribeBot")
-DescribeBotAlias = Action("DescribeBotAlias")
-DescribeBotChannel = Action("DescribeBotChannel")
-DescribeBotLocale = Action("DescribeBotLocale")
-DescribeBotVersion = Action("DescribeBotVersion")
-DescribeIntent = Action("DescribeIntent")
-DescribeSlot = Action("DescribeSlot")
-DescribeSlotType = Action("DescribeSlotType")
-GetBot = Action("GetBot")
-GetBotAlias = Action("GetBotAlias")
-GetBotAliases = Action("GetBotAliases")
-GetBotChannelAssociation = Action("GetBotChannelAssociation")
-GetBotChannelAssociations = Action("GetBotChannelAssociations")
-GetBotVersions = Action("GetBotVersions")
-GetBots = Action("GetBots")
-GetBuiltinIntent = Action("GetBuiltinIntent")
-GetBuiltinIntents = Action("GetBuiltinIntents")
-GetBuiltinSlotTypes = Action("GetBuiltinSlotTypes")
-GetExport = Action("GetExport")
-GetImport = Action("GetImport")
-GetIntent = Action("GetIntent")
-GetIntentVersions = Action("GetIntentVersions")
-GetIntents = Action("GetIntents")
-GetSession = Action("GetSession")
-GetSlotType = Action("GetSlotType")
-GetSlotTypeVersions = Action("GetSlotTypeVersions")
-GetSlotTypes = Action("GetSlotTypes")
-GetUtterancesView = Action("GetUtterancesView")
-ListBotAliases = Action("ListBotAliases")
-ListBotChannels = Action("ListBotChannels")
-ListBotLocales = Action("ListBotLocales")
-ListBotVersions = Action("ListBotVersions")
-ListBots = Action("ListBots")
-ListIntents = Action("ListIntents")
-ListSlotTypes = Action("ListSlotTypes")
-ListSlots = Action("ListSlots")
-ListTagsForResource = Action("ListTagsForResource")
-PostContent = Action("PostContent")
-PostText = Action("PostText")
-PutBot = Action("PutBot")
-PutBotAlias = Action("PutBotAlias")
-PutIntent = Action("PutIntent")
-PutSession = Action("PutSession")
-PutSlotType = Action("PutSlotType")
-RecognizeSpeech = Action("RecognizeSpeech")
-RecognizeText = Action("RecognizeText")
-StartConversation = Action("StartConversation")
-StartImport = Action("StartImport")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateBot = Action("UpdateBot")
-UpdateBotAlias = Action("UpdateBotAlias")
-UpdateBotLocale = Action("UpdateBotLocale")
-UpdateIntent = Action("UpdateIntent")
-UpdateSlot = Action("UpdateSlot")
-UpdateSlotType = Action("UpdateSlotType")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,49 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptGrant = Action("AcceptGrant")
-CheckInLicense = Action("CheckInLicense")
-CheckoutBorrowLicense = Action("CheckoutBorrowLicense")
-CheckoutLicense = Action("CheckoutLicense")
-CreateGrant = Action("CreateGrant")
-CreateGrantVersion = Action("CreateGrantVersion")
-CreateLicense = Action("CreateLicense")
-CreateLicenseConfiguration = Action("CreateLicenseConfiguration")
-CreateLicenseVersion = Action("CreateLicenseVersion")
-CreateToken = Action("CreateToken")
-DeleteGrant = Action("DeleteGrant")
-DeleteLicense = Action("DeleteLicense")
-DeleteLicenseConfiguration = Action("DeleteLicenseConfiguration")
-DeleteToken = Action("DeleteToken")
-ExtendLicenseConsumption = Action("ExtendLicenseConsumption")
-GetAccessToken = Action("GetAccessToken")
-GetGrant = Action("GetGrant")
-GetLicense = Action("GetLicense")
-GetLicenseConfiguration = Action("GetLicenseConfiguration")
-GetLicenseUsage = Action("GetLicenseUsage")
-GetServiceSettings = Action("GetServiceSettings")
-ListAssociationsForLicenseConfiguration = Action(
-    "ListAssociationsForLicenseConfiguration"
-)
-ListDistributedGrants = Action("ListDistributedGrants")
-ListFailuresForLicenseConfigurationOperations = Action(
-    "ListFailuresForLicenseConfigurationOperations"
-)
-ListLicenseConfigurations = Action("ListLicenseConfigurations")
-ListLicenseSpecificationsForResource = Action("ListLicenseSpecificationsForResource")
-ListLicenseVersions = Action("ListLicenseVersions")
-ListLicenses = Action("ListLicenses")
-ListReceivedGrants = Action("ListReceivedGrants")
-ListReceivedLicenses = Action("ListReceivedLicenses")
-ListResourceInventory = Action("ListResourceInventory")
-ListTagsForResource = Action("ListTagsForResource")
-ListTokens = Action("ListTokens")
-ListUsageForLicenseConfiguration = Action("ListUsageForLicenseConfiguration")
-RejectGrant = Action("RejectGrant")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateLicenseConfiguration = Action("UpdateLicenseConfiguration")
-UpdateLicenseSpecificationsForResource = Action(
-    "UpdateLicenseSpecificationsForResource"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-UpdateServiceSettings = Action("UpdateServiceSettings")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,106 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AllocateStaticIp = Action("AllocateStaticIp")
-AttachDisk = Action("AttachDisk")
-AttachInstancesToLoadBalancer = Action("AttachInstancesToLoadBalancer")
-AttachLoadBalancerTlsCertificate = Action("AttachLoadBalancerTlsCertificate")
-AttachStaticIp = Action("AttachStaticIp")
-CloseInstancePublicPorts = Action("CloseInstancePublicPorts")
-CopySnapshot = Action("CopySnapshot")
-CreateCloudFormationStack = Action("CreateCloudFormationStack")
-CreateDisk = Action("CreateDisk")
-CreateDiskFromSnapshot = Action("CreateDiskFromSnapshot")
-CreateDiskSnapshot = Action("CreateDiskSnapshot")
-CreateDomain = Action("CreateDomain")
-CreateDomainEntry = Action("CreateDomainEntry")
-CreateInstanceSnapshot = Action("CreateInstanceSnapshot")
-CreateInstances = Action("CreateInstances")
-CreateInstancesFromSnapshot = Action("CreateInstancesFromSnapshot")
-CreateKeyPair = Action("CreateKeyPair")
-CreateLoadBalancer = Action("CreateLoadBalancer")
-CreateLoadBalancerTlsCertificate = Action("CreateLoadBalancerTlsCertificate")
-CreateRelationalDatabase = Action("CreateRelationalDatabase")
-CreateRelationalDatabaseFromSnapshot = Action("CreateRelationalDatabaseFromSnapshot")
-CreateRelationalDatabaseSnapshot = Action("CreateRelationalDatabaseSnapshot")
-DeleteDisk = Action("DeleteDisk")
-DeleteDiskSnapshot = Action("DeleteDiskSnapshot")
-DeleteDomain = Action("DeleteDomain")
-DeleteDomainEntry = Action("DeleteDomainEntry")
-DeleteInstance = Action("DeleteInstance")
-DeleteInstanceSnapshot = Action("DeleteInstanceSnapshot")
-DeleteKeyPair = Action("DeleteKeyPair")
-DeleteKnownHostKeys = Action("DeleteKnownHostKeys")
-DeleteLoadBalancer = Action("DeleteLoadBalancer")
-DeleteLoadBalancerTlsCertificate = Action("DeleteLoadBalancerTlsCertificate")
-DeleteRelationalDatabase = Action("DeleteRelationalDatabase")
-DeleteRelationalDatabaseSnapshot = Action("DeleteRelationalDatabaseSnapshot")
-DetachDisk = Action("DetachDisk")
-DetachInstancesFromLoadBalancer = Action("DetachInstancesFromLoadBalancer")
-DetachStaticIp = Action("DetachStaticIp")
-DownloadDefaultKeyPair = Action("DownloadDefaultKeyPair")
-ExportSnapshot = Action("ExportSnapshot")
-GetActiveNames = Action("GetActiveNames")
-GetBlueprints = Action("GetBlueprints")
-GetBundles = Action("GetBundles")
-GetCloudFormationStackRecords = Action("GetCloudFormationStackRecords")
-GetDisk = Action("GetDisk")
-GetDiskSnapshot = Action("GetDiskSnapshot")
-GetDiskSnapshots = Action("GetDiskSnapshots")
-GetDisks = Action("GetDisks")
-GetDomain = Action("GetDomain")
-GetDomains = Action("GetDomains")
-GetExportSnapshotRecords = Action("GetExportSnapshotRecords")
-GetInstance = Action("GetInstance")
-GetInstanceAccessDetails = Action("GetInstanceAccessDetails")
-GetInstanceMetricData = Action("GetInstanceMetricData")
-GetInstancePortStates = Action("GetInstancePortStates")
-GetInstanceSnapshot = Action("GetInstanceSnapshot")
-GetInstanceSnapshots = Action("GetInstanceSnapshots")
-GetInstanceState = Action("GetInstanceState")
-GetInstances = Action("GetInstances")
-GetKeyPair = Action("GetKeyPair")
-GetKeyPairs = Action("GetKeyPairs")
-GetLoadBalancer = Action("GetLoadBalancer")
-GetLoadBalancerMetricData = Action("GetLoadBalancerMetricData")
-GetLoadBalancerTlsCertificates = Action("GetLoadBalancerTlsCertificates")
-GetLoadBalancers = Action("GetLoadBalancers")
-GetOperation = Action("GetOperation")
-GetOperations = Action("GetOperations")
-GetOperationsForResource = Action("GetOperationsForResource")
-GetRegions = Action("GetRegions")
-GetRelationalDatabase = Action("GetRelationalDatabase")
-GetRelationalDatabaseBlueprints = Action("GetRelationalDatabaseBlueprints")
-GetRelationalDatabaseBundles = Action("GetRelationalDatabaseBundles")
-GetRelationalDatabaseEvents = Action("GetRelationalDatabaseEvents")
-GetRelationalDatabaseLogEvents = Action("GetRelationalDatabaseLogEvents")
-GetRelationalDatabaseLogStreams = Action("GetRelationalDatabaseLogStreams")
-GetRelationalDatabaseMasterUserPassword = Action(
-    "GetRelationalDatabaseMasterUserPassword"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-GetRelationalDatabaseMetricData = Action("GetRelationalDatabaseMetricData")
-GetRelationalDatabaseParameters = Action("GetRelationalDatabaseParameters")
-GetRelationalDatabaseSnapshot = Action("GetRelationalDatabaseSnapshot")
-GetRelationalDatabaseSnapshots = Action("GetRelationalDatabaseSnapshots")
-GetRelationalDatabases = Action("GetRelationalDatabases")
-GetStaticIp = Action("GetStaticIp")
-GetStaticIps = Action("GetStaticIps")
-ImportKeyPair = Action("ImportKeyPair")
-IsVpcPeered = Action("IsVpcPeered")
-OpenInstancePublicPorts = Action("OpenInstancePublicPorts")
-PeerVpc = Action("PeerVpc")
-PutInstancePublicPorts = Action("PutInstancePublicPorts")
-RebootInstance = Action("RebootInstance")
-RebootRelationalDatabase = Action("RebootRelationalDatabase")
-ReleaseStaticIp = Action("ReleaseStaticIp")
-StartInstance = Action("StartInstance")
-StartRelationalDatabase = Action("StartRelationalDatabase")
-StopInstance = Action("StopInstance")
-StopRelationalDatabase = Action("StopRelationalDatabase")
-TagResource = Action("TagResource")
-UnpeerVpc = Action("UnpeerVpc")
-UntagResource = Action("UntagResource")
-UpdateDomainEntry = Action("UpdateDomainEntry")
-UpdateLoadBalancerAttribute = Action("UpdateLoadBalancerAttribute")
-UpdateRelationalDatabase = Action("UpdateRelationalDatabase")
-UpdateRelationalDatabaseParameters = Action("UpdateRelationalDatabaseParameters")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,47 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateKmsKey = Action("AssociateKmsKey")
-CancelExportTask = Action("CancelExportTask")
-CreateExportTask = Action("CreateExportTask")
-CreateLogDelivery = Action("CreateLogDelivery")
-CreateLogGroup = Action("CreateLogGroup")
-CreateLogStream = Action("CreateLogStream")
-DeleteDestination = Action("DeleteDestination")
-DeleteLogDelivery = Action("DeleteLogDelivery")
-DeleteLogGroup = Action("DeleteLogGroup")
-DeleteLogStream = Action("DeleteLogStream")
-DeleteMetricFilter = Action("DeleteMetricFilter")
-DeleteResourcePolicy = Action("DeleteResourcePolicy")
-DeleteRetentionPolicy = Action("DeleteRetentionPolicy")
-DeleteSubscriptionFilter = Action("DeleteSubscriptionFilter")
-DescribeDestinations = Action("DescribeDestinations")
-DescribeExportTasks = Action("DescribeExportTasks")
-DescribeLogGroups = Action("DescribeLogGroups")
-DescribeLogStreams = Action("DescribeLogStreams")
-DescribeMetricFilters = Action("DescribeMetricFilters")
-DescribeQueries = Action("DescribeQueries")
-DescribeResourcePolicies = Action("DescribeResourcePolicies")
-DescribeSubscriptionFilters = Action("DescribeSubscriptionFilters")
-DisassociateKmsKey = Action("DisassociateKmsKey")
-FilterLogEvents = Action("FilterLogEvents")
-GetLogDelivery = Action("GetLogDelivery")
-GetLogEvents = Action("GetLogEvents")
-GetLogGroupFields = Action("GetLogGroupFields")
-GetLogRecord = Action("GetLogRecord")
-GetQueryResults = Action("GetQueryResults")
-ListLogDeliveries = Action("ListLogDeliveries")
-ListTagsLogGroup = Action("ListTagsLogGroup")
-PutDestination = Action("PutDestination")
-PutDestinationPolicy = Action("PutDestinationPolicy")
-PutLogEvents = Action("PutLogEvents")
-PutMetricFilter = Action("PutMetricFilter")
-PutResourcePolicy = Action("PutResourcePolicy")
-PutRetentionPolicy = Action("PutRetentionPolicy")
-PutSubscriptionFilter = Action("PutSubscriptionFilter")
-StartQuery = Action("StartQuery")
-StopQuery = Action("StopQuery")
-TagLogGroup = Action("TagLogGroup")
-TestMetricFilter = Action("TestMetricFilter")
-UntagLogGroup = Action("UntagLogGroup")
-UpdateLogDelivery = Action("UpdateLogDelivery")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
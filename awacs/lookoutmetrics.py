@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,29 +25,21 @@ class ARN(BaseARN):
         )
 
 
-ActivateAnomalyDetector = Action("ActivateAnomalyDetector")
-BackTestAnomalyDetector = Action("BackTestAnomalyDetector")
-CreateAlert = Action("CreateAlert")
-CreateAnomalyDetector = Action("CreateAnomalyDetector")
-CreateMetricSet = Action("CreateMetricSet")
-DeleteAlert = Action("DeleteAlert")
-DeleteAnomalyDetector = Action("DeleteAnomalyDetector")
-DescribeAlert = Action("DescribeAlert")
-DescribeAnomalyDetectionExecutions = Action("DescribeAnomalyDetectionExecutions")
-DescribeAnomalyDetector = Action("DescribeAnomalyDetector")
-DescribeMetricSet = Action("DescribeMetricSet")
-GetAnomalyGroup = Action("GetAnomalyGroup")
-GetDataQualityMetrics = Action("GetDataQualityMetrics")
-GetFeedback = Action("GetFeedback")
-GetSampleData = Action("GetSampleData")
-ListAlerts = Action("ListAlerts")
-ListAnomalyDetectors = Action("ListAnomalyDetectors")
-ListAnomalyGroupSummaries = Action("ListAnomalyGroupSummaries")
-ListAnomalyGroupTimeSeries = Action("ListAnomalyGroupTimeSeries")
-ListMetricSets = Action("ListMetricSets")
-ListTagsForResource = Action("ListTagsForResource")
-PutFeedback = Action("PutFeedback")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAnomalyDetector = Action("UpdateAnomalyDetector")
-UpdateMetricSet = Action("UpdateMetricSet")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
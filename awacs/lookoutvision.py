@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,25 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateDataset = Action("CreateDataset")
-CreateModel = Action("CreateModel")
-CreateProject = Action("CreateProject")
-DeleteDataset = Action("DeleteDataset")
-DeleteModel = Action("DeleteModel")
-DeleteProject = Action("DeleteProject")
-DescribeDataset = Action("DescribeDataset")
-DescribeModel = Action("DescribeModel")
-DescribeProject = Action("DescribeProject")
-DescribeTrialDetection = Action("DescribeTrialDetection")
-DetectAnomalies = Action("DetectAnomalies")
-ListDatasetEntries = Action("ListDatasetEntries")
-ListModels = Action("ListModels")
-ListProjects = Action("ListProjects")
-ListTagsForResource = Action("ListTagsForResource")
-ListTrialDetections = Action("ListTrialDetections")
-StartModel = Action("StartModel")
-StartTrialDetection = Action("StartTrialDetection")
-StopModel = Action("StopModel")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDatasetEntries = Action("UpdateDatasetEntries")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
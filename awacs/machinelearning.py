@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,31 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddTags = Action("AddTags")
-CreateBatchPrediction = Action("CreateBatchPrediction")
-CreateDataSourceFromRDS = Action("CreateDataSourceFromRDS")
-CreateDataSourceFromRedshift = Action("CreateDataSourceFromRedshift")
-CreateDataSourceFromS3 = Action("CreateDataSourceFromS3")
-CreateEvaluation = Action("CreateEvaluation")
-CreateMLModel = Action("CreateMLModel")
-CreateRealtimeEndpoint = Action("CreateRealtimeEndpoint")
-DeleteBatchPrediction = Action("DeleteBatchPrediction")
-DeleteDataSource = Action("DeleteDataSource")
-DeleteEvaluation = Action("DeleteEvaluation")
-DeleteMLModel = Action("DeleteMLModel")
-DeleteRealtimeEndpoint = Action("DeleteRealtimeEndpoint")
-DeleteTags = Action("DeleteTags")
-DescribeBatchPredictions = Action("DescribeBatchPredictions")
-DescribeDataSources = Action("DescribeDataSources")
-DescribeEvaluations = Action("DescribeEvaluations")
-DescribeMLModels = Action("DescribeMLModels")
-DescribeTags = Action("DescribeTags")
-GetBatchPrediction = Action("GetBatchPrediction")
-GetDataSource = Action("GetDataSource")
-GetEvaluation = Action("GetEvaluation")
-GetMLModel = Action("GetMLModel")
-Predict = Action("Predict")
-UpdateBatchPrediction = Action("UpdateBatchPrediction")
-UpdateDataSource = Action("UpdateDataSource")
-UpdateEvaluation = Action("UpdateEvaluation")
-UpdateMLModel = Action("UpdateMLModel")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,57 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInvitation = Action("AcceptInvitation")
-ArchiveFindings = Action("ArchiveFindings")
-BatchGetCustomDataIdentifiers = Action("BatchGetCustomDataIdentifiers")
-CreateClassificationJob = Action("CreateClassificationJob")
-CreateCustomDataIdentifier = Action("CreateCustomDataIdentifier")
-CreateFindingsFilter = Action("CreateFindingsFilter")
-CreateInvitations = Action("CreateInvitations")
-CreateMember = Action("CreateMember")
-CreateSampleFindings = Action("CreateSampleFindings")
-DeclineInvitations = Action("DeclineInvitations")
-DeleteCustomDataIdentifier = Action("DeleteCustomDataIdentifier")
-DeleteFindingsFilter = Action("DeleteFindingsFilter")
-DeleteInvitations = Action("DeleteInvitations")
-DeleteMember = Action("DeleteMember")
-DescribeBuckets = Action("DescribeBuckets")
-DescribeClassificationJob = Action("DescribeClassificationJob")
-DescribeOrganizationConfiguration = Action("DescribeOrganizationConfiguration")
-DisableMacie = Action("DisableMacie")
-DisableOrganizationAdminAccount = Action("DisableOrganizationAdminAccount")
-DisassociateFromMasterAccount = Action("DisassociateFromMasterAccount")
-DisassociateMember = Action("DisassociateMember")
-EnableMacie = Action("EnableMacie")
-EnableOrganizationAdminAccount = Action("EnableOrganizationAdminAccount")
-GetBucketStatistics = Action("GetBucketStatistics")
-GetClassificationExportConfiguration = Action("GetClassificationExportConfiguration")
-GetCustomDataIdentifier = Action("GetCustomDataIdentifier")
-GetFindingStatistics = Action("GetFindingStatistics")
-GetFindings = Action("GetFindings")
-GetFindingsFilter = Action("GetFindingsFilter")
-GetInvitationsCount = Action("GetInvitationsCount")
-GetMacieSession = Action("GetMacieSession")
-GetMasterAccount = Action("GetMasterAccount")
-GetMember = Action("GetMember")
-GetUsageStatistics = Action("GetUsageStatistics")
-GetUsageTotals = Action("GetUsageTotals")
-ListClassificationJobs = Action("ListClassificationJobs")
-ListCustomDataIdentifiers = Action("ListCustomDataIdentifiers")
-ListFindings = Action("ListFindings")
-ListFindingsFilters = Action("ListFindingsFilters")
-ListInvitations = Action("ListInvitations")
-ListMembers = Action("ListMembers")
-ListOrganizationAdminAccounts = Action("ListOrganizationAdminAccounts")
-ListTagsForResource = Action("ListTagsForResource")
-ListTagsForResources = Action("ListTagsForResources")
-PutClassificationExportConfiguration = Action("PutClassificationExportConfiguration")
-TagResource = Action("TagResource")
-TestCustomDataIdentifier = Action("TestCustomDataIdentifier")
-UnarchiveFindings = Action("UnarchiveFindings")
-UntagResource = Action("UntagResource")
-UpdateClassificationJob = Action("UpdateClassificationJob")
-UpdateFindingsFilter = Action("UpdateFindingsFilter")
-UpdateMacieSession = Action("UpdateMacieSession")
-UpdateMemberSession = Action("UpdateMemberSession")
-UpdateOrganizationConfiguration = Action("UpdateOrganizationConfiguration")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
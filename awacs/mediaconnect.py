@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,17 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddFlowOutputs = Action("AddFlowOutputs")
-CreateFlow = Action("CreateFlow")
-DeleteFlow = Action("DeleteFlow")
-DescribeFlow = Action("DescribeFlow")
-GrantFlowEntitlements = Action("GrantFlowEntitlements")
-ListEntitlements = Action("ListEntitlements")
-ListFlows = Action("ListFlows")
-RemoveFlowOutput = Action("RemoveFlowOutput")
-RevokeFlowEntitlement = Action("RevokeFlowEntitlement")
-StartFlow = Action("StartFlow")
-StopFlow = Action("StopFlow")
-UpdateFlowEntitlement = Action("UpdateFlowEntitlement")
-UpdateFlowOutput = Action("UpdateFlowOutput")
-UpdateFlowSource = Action("UpdateFlowSource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
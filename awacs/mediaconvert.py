@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,29 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateCertificate = Action("AssociateCertificate")
-CancelJob = Action("CancelJob")
-CreateJob = Action("CreateJob")
-CreateJobTemplate = Action("CreateJobTemplate")
-CreatePreset = Action("CreatePreset")
-CreateQueue = Action("CreateQueue")
-DeleteJobTemplate = Action("DeleteJobTemplate")
-DeletePreset = Action("DeletePreset")
-DeleteQueue = Action("DeleteQueue")
-DescribeEndpoint = Action("DescribeEndpoint")
-DescribeEndpoints = Action("DescribeEndpoints")
-DisassociateCertificate = Action("DisassociateCertificate")
-GetJob = Action("GetJob")
-GetJobTemplate = Action("GetJobTemplate")
-GetPreset = Action("GetPreset")
-GetQueue = Action("GetQueue")
-ListJobTemplates = Action("ListJobTemplates")
-ListJobs = Action("ListJobs")
-ListPresets = Action("ListPresets")
-ListQueues = Action("ListQueues")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateJobTemplate = Action("UpdateJobTemplate")
-UpdatePreset = Action("UpdatePreset")
-UpdateQueue = Action("UpdateQueue")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
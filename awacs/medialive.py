@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,58 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInputDeviceTransfer = Action("AcceptInputDeviceTransfer")
-BatchDelete = Action("BatchDelete")
-BatchStart = Action("BatchStart")
-BatchStop = Action("BatchStop")
-BatchUpdateSchedule = Action("BatchUpdateSchedule")
-CancelInputDeviceTransfer = Action("CancelInputDeviceTransfer")
-CreateChannel = Action("CreateChannel")
-CreateInput = Action("CreateInput")
-CreateInputSecurityGroup = Action("CreateInputSecurityGroup")
-CreateMultiplex = Action("CreateMultiplex")
-CreateMultiplexProgram = Action("CreateMultiplexProgram")
-CreateTags = Action("CreateTags")
-DeleteChannel = Action("DeleteChannel")
-DeleteInput = Action("DeleteInput")
-DeleteInputSecurityGroup = Action("DeleteInputSecurityGroup")
-DeleteMultiplex = Action("DeleteMultiplex")
-DeleteMultiplexProgram = Action("DeleteMultiplexProgram")
-DeleteReservation = Action("DeleteReservation")
-DeleteSchedule = Action("DeleteSchedule")
-DeleteTags = Action("DeleteTags")
-DescribeChannel = Action("DescribeChannel")
-DescribeInput = Action("DescribeInput")
-DescribeInputDevice = Action("DescribeInputDevice")
-DescribeInputDeviceThumbnail = Action("DescribeInputDeviceThumbnail")
-DescribeInputSecurityGroup = Action("DescribeInputSecurityGroup")
-DescribeMultiplex = Action("DescribeMultiplex")
-DescribeMultiplexProgram = Action("DescribeMultiplexProgram")
-DescribeOffering = Action("DescribeOffering")
-DescribeReservation = Action("DescribeReservation")
-DescribeSchedule = Action("DescribeSchedule")
-ListChannels = Action("ListChannels")
-ListInputDeviceTransfers = Action("ListInputDeviceTransfers")
-ListInputDevices = Action("ListInputDevices")
-ListInputSecurityGroups = Action("ListInputSecurityGroups")
-ListInputs = Action("ListInputs")
-ListMultiplexPrograms = Action("ListMultiplexPrograms")
-ListMultiplexes = Action("ListMultiplexes")
-ListOfferings = Action("ListOfferings")
-ListReservations = Action("ListReservations")
-ListTagsForResource = Action("ListTagsForResource")
-PurchaseOffering = Action("PurchaseOffering")
-RejectInputDeviceTransfer = Action("RejectInputDeviceTransfer")
-StartChannel = Action("StartChannel")
-StartMultiplex = Action("StartMultiplex")
-StopChannel = Action("StopChannel")
-StopMultiplex = Action("StopMultiplex")
-TransferInputDevice = Action("TransferInputDevice")
-UpdateChannel = Action("UpdateChannel")
-UpdateChannelClass = Action("UpdateChannelClass")
-UpdateInput = Action("UpdateInput")
-UpdateInputDevice = Action("UpdateInputDevice")
-UpdateInputSecurityGroup = Action("UpdateInputSecurityGroup")
-UpdateMultiplex = Action("UpdateMultiplex")
-UpdateMultiplexProgram = Action("UpdateMultiplexProgram")
-UpdateReservation = Action("UpdateReservation")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,20 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateChannel = Action("CreateChannel")
-CreateHarvestJob = Action("CreateHarvestJob")
-CreateOriginEndpoint = Action("CreateOriginEndpoint")
-DeleteChannel = Action("DeleteChannel")
-DeleteOriginEndpoint = Action("DeleteOriginEndpoint")
-DescribeChannel = Action("DescribeChannel")
-DescribeHarvestJob = Action("DescribeHarvestJob")
-DescribeOriginEndpoint = Action("DescribeOriginEndpoint")
-ListChannels = Action("ListChannels")
-ListHarvestJobs = Action("ListHarvestJobs")
-ListOriginEndpoints = Action("ListOriginEndpoints")
-ListTagsForResource = Action("ListTagsForResource")
-RotateIngestEndpointCredentials = Action("RotateIngestEndpointCredentials")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateChannel = Action("UpdateChannel")
-UpdateOriginEndpoint = Action("UpdateOriginEndpoint")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
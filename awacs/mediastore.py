@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,29 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateContainer = Action("CreateContainer")
-DeleteContainer = Action("DeleteContainer")
-DeleteContainerPolicy = Action("DeleteContainerPolicy")
-DeleteCorsPolicy = Action("DeleteCorsPolicy")
-DeleteLifecyclePolicy = Action("DeleteLifecyclePolicy")
-DeleteMetricPolicy = Action("DeleteMetricPolicy")
-DeleteObject = Action("DeleteObject")
-DescribeContainer = Action("DescribeContainer")
-DescribeObject = Action("DescribeObject")
-GetContainerPolicy = Action("GetContainerPolicy")
-GetCorsPolicy = Action("GetCorsPolicy")
-GetLifecyclePolicy = Action("GetLifecyclePolicy")
-GetMetricPolicy = Action("GetMetricPolicy")
-GetObject = Action("GetObject")
-ListContainers = Action("ListContainers")
-ListItems = Action("ListItems")
-ListTagsForResource = Action("ListTagsForResource")
-PutContainerPolicy = Action("PutContainerPolicy")
-PutCorsPolicy = Action("PutCorsPolicy")
-PutLifecyclePolicy = Action("PutLifecyclePolicy")
-PutMetricPolicy = Action("PutMetricPolicy")
-PutObject = Action("PutObject")
-StartAccessLogging = Action("StartAccessLogging")
-StopAccessLogging = Action("StopAccessLogging")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateProject = Action("CreateProject")
-CreateServiceRole = Action("CreateServiceRole")
-DeleteProject = Action("DeleteProject")
-DeleteProjectSnapshot = Action("DeleteProjectSnapshot")
-DeployToStage = Action("DeployToStage")
-DescribeBundle = Action("DescribeBundle")
-ExportBundle = Action("ExportBundle")
-ExportProject = Action("ExportProject")
-GenerateProjectParameters = Action("GenerateProjectParameters")
-GetProject = Action("GetProject")
-GetProjectSnapshot = Action("GetProjectSnapshot")
-ImportProject = Action("ImportProject")
-InstallBundle = Action("InstallBundle")
-ListAvailableConnectors = Action("ListAvailableConnectors")
-ListAvailableFeatures = Action("ListAvailableFeatures")
-ListAvailableRegions = Action("ListAvailableRegions")
-ListBundles = Action("ListBundles")
-ListProjectSnapshots = Action("ListProjectSnapshots")
-ListProjects = Action("ListProjects")
-SynchronizeProject = Action("SynchronizeProject")
-UpdateProject = Action("UpdateProject")
-ValidateProject = Action("ValidateProject")
-VerifyServiceRole = Action("VerifyServiceRole")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
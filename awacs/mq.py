@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,25 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateBroker = Action("CreateBroker")
-CreateConfiguration = Action("CreateConfiguration")
-CreateTags = Action("CreateTags")
-CreateUser = Action("CreateUser")
-DeleteBroker = Action("DeleteBroker")
-DeleteTags = Action("DeleteTags")
-DeleteUser = Action("DeleteUser")
-DescribeBroker = Action("DescribeBroker")
-DescribeBrokerEngineTypes = Action("DescribeBrokerEngineTypes")
-DescribeBrokerInstanceOptions = Action("DescribeBrokerInstanceOptions")
-DescribeConfiguration = Action("DescribeConfiguration")
-DescribeConfigurationRevision = Action("DescribeConfigurationRevision")
-DescribeUser = Action("DescribeUser")
-ListBrokers = Action("ListBrokers")
-ListConfigurationRevisions = Action("ListConfigurationRevisions")
-ListConfigurations = Action("ListConfigurations")
-ListTags = Action("ListTags")
-ListUsers = Action("ListUsers")
-RebootBroker = Action("RebootBroker")
-UpdateBroker = Action("UpdateBroker")
-UpdateConfiguration = Action("UpdateConfiguration")
-UpdateUser = Action("UpdateUser")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
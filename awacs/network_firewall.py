@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,32 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateFirewallPolicy = Action("AssociateFirewallPolicy")
-AssociateSubnets = Action("AssociateSubnets")
-CreateFirewall = Action("CreateFirewall")
-CreateFirewallPolicy = Action("CreateFirewallPolicy")
-CreateRuleGroup = Action("CreateRuleGroup")
-DeleteFirewall = Action("DeleteFirewall")
-DeleteFirewallPolicy = Action("DeleteFirewallPolicy")
-DeleteResourcePolicy = Action("DeleteResourcePolicy")
-DeleteRuleGroup = Action("DeleteRuleGroup")
-DescribeFirewall = Action("DescribeFirewall")
-DescribeFirewallPolicy = Action("DescribeFirewallPolicy")
-DescribeLoggingConfiguration = Action("DescribeLoggingConfiguration")
-DescribeResourcePolicy = Action("DescribeResourcePolicy")
-DescribeRuleGroup = Action("DescribeRuleGroup")
-DisassociateSubnets = Action("DisassociateSubnets")
-ListFirewallPolicies = Action("ListFirewallPolicies")
-ListFirewalls = Action("ListFirewalls")
-ListRuleGroups = Action("ListRuleGroups")
-ListTagsForResource = Action("ListTagsForResource")
-PutResourcePolicy = Action("PutResourcePolicy")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateFirewallDeleteProtection = Action("UpdateFirewallDeleteProtection")
-UpdateFirewallDescription = Action("UpdateFirewallDescription")
-UpdateFirewallPolicy = Action("UpdateFirewallPolicy")
-UpdateFirewallPolicyChangeProtection = Action("UpdateFirewallPolicyChangeProtection")
-UpdateLoggingConfiguration = Action("UpdateLoggingConfiguration")
-UpdateRuleGroup = Action("UpdateRuleGroup")
-UpdateSubnetChangeProtection = Action("UpdateSubnetChangeProtection")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,40 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateCustomerGateway = Action("AssociateCustomerGateway")
-AssociateLink = Action("AssociateLink")
-AssociateTransitGatewayConnectPeer = Action("AssociateTransitGatewayConnectPeer")
-CreateConnection = Action("CreateConnection")
-CreateDevice = Action("CreateDevice")
-CreateGlobalNetwork = Action("CreateGlobalNetwork")
-CreateLink = Action("CreateLink")
-CreateSite = Action("CreateSite")
-DeleteConnection = Action("DeleteConnection")
-DeleteDevice = Action("DeleteDevice")
-DeleteGlobalNetwork = Action("DeleteGlobalNetwork")
-DeleteLink = Action("DeleteLink")
-DeleteSite = Action("DeleteSite")
-DeregisterTransitGateway = Action("DeregisterTransitGateway")
-DescribeGlobalNetworks = Action("DescribeGlobalNetworks")
-DisassociateCustomerGateway = Action("DisassociateCustomerGateway")
-DisassociateLink = Action("DisassociateLink")
-DisassociateTransitGatewayConnectPeer = Action("DisassociateTransitGatewayConnectPeer")
-GetConnections = Action("GetConnections")
-GetCustomerGatewayAssociations = Action("GetCustomerGatewayAssociations")
-GetDevices = Action("GetDevices")
-GetLinkAssociations = Action("GetLinkAssociations")
-GetLinks = Action("GetLinks")
-GetSites = Action("GetSites")
-GetTransitGatewayConnectPeerAssociations = Action(
-    "GetTransitGatewayConnectPeerAssociations"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-GetTransitGatewayRegistrations = Action("GetTransitGatewayRegistrations")
-ListTagsForResource = Action("ListTagsForResource")
-RegisterTransitGateway = Action("RegisterTransitGateway")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateConnection = Action("UpdateConnection")
-UpdateDevice = Action("UpdateDevice")
-UpdateGlobalNetwork = Action("UpdateGlobalNetwork")
-UpdateLink = Action("UpdateLink")
-UpdateSite = Action("UpdateSite")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -0,0 +1,531 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Rewriting policies to fit the IAM size limits.
+
+minimize() shrinks a policy without changing what it allows: statements
+differing only in their actions are merged, duplicate and covered actions
+and resources are removed, statements covered by a broader one are dropped
+and, optionally, action lists are compressed into wildcards covering exactly
+the same catalog actions. split() packs the statements of a policy which
+is still too large into several policies.
+
+Patterns are indexed by their literal prefix, so every step is linear in the
+number of actions and resources rather than comparing them pairwise.
+"""
+
+import re
+from bisect import bisect_left
+from itertools import combinations
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from . import canonical, catalog, json_size
+from .analysis import normalize_condition
+from .aws import Policy, PolicyDocument, _as_list
+from .conditions import arn_like, glob
+from .evaluation import PolicyLike
+
+T = TypeVar("T")
+
+# Maximum sizes of policies in characters, without whitespace
+MANAGED_POLICY_LIMIT = 6144
+ROLE_POLICY_LIMIT = 10240
+GROUP_POLICY_LIMIT = 5120
+USER_POLICY_LIMIT = 2048
+
+
+class Minimized(NamedTuple):
+    """The result of minimize()."""
+
+    policy: Policy
+    # Compact serialized size of the policy, see serialized_size()
+    size: int
+    limit: Any = None
+
+    @property
+    def fits(self) -> bool:
+        """Whether the policy fits the limit, always true without a limit."""
+        return self.limit is None or self.size <= self.limit
+
+
+def minimize(
+    policy: PolicyLike, limit: int = None, compress: bool = False, budget: int = 0
+) -> Minimized:
+    """Return an equivalent policy, as small as possible, and its size.
+
+    - Statements with the same Effect, Resource, Condition and Principal
+      are merged into one statement with all their actions. The Sid of the
+      first one is kept.
+    - Duplicate actions and resources are removed, as well as those covered
+      by a wildcard of the same statement. Actions are compared ignoring
+      case, as IAM does.
+    - Statements whose actions and resources are covered by another
+      statement with the same Effect and Principal and a subset of its
+      conditions are dropped.
+
+    With compress, or when the policy is still larger than limit, lists of
+    actions are then compressed into "Prefix*" wildcards covering exactly
+    the same actions of the catalog, see compress_actions(). Such wildcards
+    also cover the actions AWS adds later with the same prefix. A budget
+    lets the wildcards of each statement cover up to that many more catalog
+    actions, so the policy is then no longer equivalent.
+
+    A policy larger than limit is still returned, see Minimized.fits.
+    """
+    data = policy if isinstance(policy, dict) else policy._properties_data()
+    statements = _drop_subsumed(_merge(_as_list(data.get("Statement", []))))
+    result = _build(policy, data, statements)
+    size = result.serialized_size()
+    if compress or (limit is not None and size > limit):
+        for statement in statements:
+            if "Action" in statement:
+                statement["Action"] = _dedupe(
+                    compress_actions(statement["Action"], budget), True
+                )
+        result = _build(policy, data, _drop_subsumed(statements))
+        size = result.serialized_size()
+    return Minimized(result, size, limit)
+
+
+def _build(policy: PolicyLike, data: dict, statements: List[dict]) -> Policy:
+    cls = PolicyDocument if isinstance(policy, dict) else type(policy)
+    return cls.from_dict(dict(data, Statement=statements))
+
+
+def _merge(statements: List[dict]) -> List[dict]:
+    # Statements with a NotAction are kept apart, merging them would
+    # intersect the actions they allow.
+    merged: List[dict] = []
+    groups: Dict[Any, dict] = {}
+    for statement in statements:
+        statement = dict(statement)
+        if "Action" in statement and "NotAction" not in statement:
+            key = _merge_key(statement)
+            group = groups.get(key)
+            if group is not None:
+                group["Action"].extend(_as_list(statement["Action"]))
+                continue
+            statement["Action"] = list(_as_list(statement["Action"]))
+            groups[key] = statement
+        merged.append(statement)
+    for statement in merged:
+        for name in ("Action", "NotAction", "Resource", "NotResource"):
+            if name in statement:
+                statement[name] = _dedupe(
+                    _as_list(statement[name]), name.endswith("Action")
+                )
+    return merged
+
+
+def _merge_key(statement: dict) -> Tuple[Any, ...]:
+    resources = []
+    for key in ("Resource", "NotResource"):
+        if key in statement:
+            values = frozenset(canonical(r) for r in _as_list(statement[key]))
+            resources.append((key, values))
+    return (
+        statement.get("Effect"),
+        tuple(resources),
+        normalize_condition(statement.get("Condition", {})),
+        canonical(statement.get("Principal")),
+        canonical(statement.get("NotPrincipal")),
+    )
+
+
+def _dedupe(values: List[Any], ignore_case: bool) -> List[Any]:
+    """Remove the duplicate values and those covered by another value."""
+    index = _PatternIndex(ignore_case)
+    unique: List[Any] = []
+    for value in values:
+        if not index.exact.get(index.key(value)):
+            index.add(value, len(unique))
+            unique.append(value)
+    if not index.prefixes and not index.globs:
+        return unique
+    dropped: Set[int] = set()
+    for i, value in enumerate(unique):
+        # Only patterns can be covered by each other, and they are never
+        # covered both ways, so a value covered by a dropped one is still
+        # covered by what covers the latter.
+        for j in index.owners(value):
+            if j != i and j not in dropped:
+                dropped.add(i)
+                break
+    return [v for i, v in enumerate(unique) if i not in dropped]
+
+
+def _drop_subsumed(statements: List[dict]) -> List[dict]:
+    """Drop the statements covered by another one."""
+    buckets: Dict[Any, List[int]] = {}
+    for i, statement in enumerate(statements):
+        if "Action" in statement and "Resource" in statement:
+            key = (
+                statement.get("Effect"),
+                canonical(statement.get("Principal")),
+                canonical(statement.get("NotPrincipal")),
+            )
+            buckets.setdefault(key, []).append(i)
+    dropped: Set[int] = set()
+    for ids in buckets.values():
+        if len(ids) < 2:
+            continue
+        # The statements of the bucket grouped by their conditions, each group
+        # by the resource patterns covering a resource.
+        groups: Dict[FrozenSet[Any], _PatternIndex] = {}
+        guards = {}
+        for i in ids:
+            guards[i] = normalize_condition(statements[i].get("Condition", {}))
+            group = groups.get(guards[i])
+            if group is None:
+                group = groups[guards[i]] = _PatternIndex(False)
+            for resource in _as_list(statements[i]["Resource"]):
+                group.add(resource, i)
+        actions: Dict[int, _PatternIndex] = {}
+        for i in ids:
+            statement = statements[i]
+            # A statement with fewer conditions applies more often, so only
+            # the groups with a subset of the conditions may cover this one
+            candidates: Set[int] = set()
+            for group in _subset_values(groups, guards[i]):
+                owners = None
+                for resource in _as_list(statement["Resource"]):
+                    matching = group.owners(resource)
+                    owners = matching if owners is None else owners & matching
+                    if not owners:
+                        break
+                candidates |= owners or set()
+            for j in sorted(candidates):
+                if j == i or j in dropped:
+                    continue
+                if j not in actions:
+                    actions[j] = _PatternIndex(True)
+                    for action in _as_list(statements[j]["Action"]):
+                        actions[j].add(action, j)
+                covering = actions[j]
+                if all(covering.owners(a) for a in _as_list(statement["Action"])):
+                    dropped.add(i)
+                    break
+    return [s for i, s in enumerate(statements) if i not in dropped]
+
+
+def _subset_values(index: Dict[FrozenSet[Any], T], items: FrozenSet[Any]) -> List[T]:
+    """Return the values of the keys of index which are subsets of items."""
+    if 2 ** len(items) < len(index):
+        subsets = (
+            frozenset(c) for n in range(len(items) + 1) for c in combinations(items, n)
+        )
+        return [index[k] for k in subsets if k in index]
+    return [v for k, v in index.items() if k <= items]
+
+
+def compress_actions(actions: List[Any], budget: int = 0) -> List[Any]:
+    """Replace the catalog actions of a list with as few wildcards as possible.
+
+    The actions of each service are covered with the fewest "Prefix*"
+    patterns of its prefix trie, see catalog.prefix_trie(), matching only
+    actions of the list in the catalog. With a budget, the patterns may also
+    cover up to that many other catalog actions in total, when this saves
+    patterns. Patterns, actions which are not in the catalog and actions no
+    wildcard covers better are kept as they are.
+    """
+    result: List[Any] = []
+    # The service whose patterns take the place of an item of result
+    slots: Dict[int, str] = {}
+    # Positions of the actions of each service in its prefix trie, see
+    # catalog.action_position(), and their original values.
+    services: Dict[str, Dict[int, Any]] = {}
+    for action in actions:
+        value = action if isinstance(action, str) else action.JSONrepr()
+        service, _, name = value.lower().partition(":")
+        position = None
+        if not _has_wildcard(value):
+            try:
+                position = catalog.action_position(service, name)
+            except KeyError:
+                pass
+        if position is None:
+            result.append(action)
+            continue
+        if service not in services:
+            services[service] = {}
+            slots[len(result)] = service
+            result.append(None)
+        services[service].setdefault(position, action)
+
+    # The budget is shared by the services, as by the children of a node
+    covers: Cover = [(0, ())] * (budget + 1)
+    for service, selected in services.items():
+        trie = catalog.prefix_trie(service)
+        cover = _cover(trie, service, sorted(selected), selected, budget)
+        covers = _combine(covers, cover)
+    compressed: Dict[str, List[Any]] = {}
+    for service, pattern in covers[budget][1]:
+        compressed.setdefault(service, []).append(pattern)
+    output = []
+    for i, action in enumerate(result):
+        if i in slots:
+            output.extend(compressed[slots[i]])
+        else:
+            output.append(action)
+    return output
+
+
+# The fewest patterns covering the selected actions of a trie node, with
+# each allowance of other actions covered from 0 to the budget, as (number
+# of patterns, (service, pattern) pairs).
+Cover = List[Tuple[int, Tuple[Tuple[str, Any], ...]]]
+
+
+def _cover(
+    node: catalog.PrefixNode,
+    service: str,
+    positions: List[int],
+    selected: Dict[int, Any],
+    budget: int,
+) -> Cover:
+    count = bisect_left(positions, node.end) - bisect_left(positions, node.start)
+    if not count:
+        return [(0, ())] * (budget + 1)
+    if count == node.size:
+        if count == 1:
+            pattern = selected[node.start]
+        else:
+            pattern = "%s:%s*" % (service, node.short)
+        return [(1, ((service, pattern),))] * (budget + 1)
+    # The action of the node and the patterns of its children, or a
+    # wildcard covering other actions too if it is within the budget.
+    if node.action is not None and node.start in selected:
+        cover: Cover = [(1, ((service, selected[node.start]),))] * (budget + 1)
+    else:
+        cover = [(0, ())] * (budget + 1)
+    for child in node.children:
+        cover = _combine(cover, _cover(child, service, positions, selected, budget))
+    wildcard = (1, ((service, "%s:%s*" % (service, node.short)),))
+    for allowance in range(node.size - count, budget + 1):
+        if cover[allowance][0] > 1:
+            cover[allowance] = wildcard
+    return cover
+
+
+def _combine(first: Cover, second: Cover) -> Cover:
+    """Return the best covers of two sets of actions sharing the budget."""
+    count, patterns = second[0]
+    if second[-1][0] == count:
+        # The budget does not help the second set
+        return [(c + count, p + patterns) for c, p in first]
+    combined: Cover = []
+    for allowance in range(len(first)):
+        i = min(
+            range(allowance + 1),
+            key=lambda i: first[i][0] + second[allowance - i][0],
+        )
+        other = second[allowance - i]
+        combined.append((first[i][0] + other[0], first[i][1] + other[1]))
+    return combined
+
+
+def split(policy: PolicyLike, limit: int, max_parts: int = None) -> List[Policy]:
+    """Split a policy into as few policies as possible fitting the limit.
+
+    The statements are packed first-fit decreasing by compact serialized
+    size, see serialized_size(). A statement too large for any part is split
+    into statements with chunks of its actions and resources, the Sid of
+    which is numbered. The parts keep the Version and Id of the policy.
+
+    Raises ValueError if a statement with a single action and resource does
+    not fit, or if more than max_parts policies are needed.
+    """
+    if isinstance(policy, dict):
+        policy = PolicyDocument.from_dict(policy)
+    if policy.serialized_size() <= limit:
+        return [policy]
+    data = policy._properties_data()
+    # A part is this base with its statements, separated by commas
+    base = json_size(dict(data, Statement=[]))
+    capacity = limit - base + 1
+
+    # The size of each statement with its comma, and its position
+    items: List[Tuple[int, Tuple[int, int], dict]] = []
+    # Statement objects cache their size
+    for i, (statement, obj) in enumerate(zip(data["Statement"], policy.Statement)):
+        size = json_size(obj) + 1
+        if size <= capacity:
+            items.append((size, (i, 0), statement))
+        else:
+            for j, part in enumerate(_split_statement(statement, capacity)):
+                items.append((json_size(part) + 1, (i, j), part))
+    items.sort(key=lambda item: -item[0])
+
+    bins: List[List[Tuple[int, Tuple[int, int], dict]]] = []
+    free: List[int] = []
+    for item in items:
+        for i, room in enumerate(free):
+            if item[0] <= room:
+                break
+        else:
+            if max_parts is not None and len(bins) == max_parts:
+                raise ValueError(
+                    "Policy does not fit in %d parts of %d" % (max_parts, limit)
+                )
+            i = len(bins)
+            bins.append([])
+            free.append(capacity)
+        bins[i].append(item)
+        free[i] -= item[0]
+    # Statements keep their order in each part
+    return [
+        _build(policy, data, [item[2] for item in sorted(b, key=lambda x: x[1])])
+        for b in bins
+    ]
+
+
+def _split_statement(statement: dict, capacity: int) -> List[dict]:
+    """Split the Action and Resource of a statement into parts of a capacity.
+
+    Each part has a chunk of the actions and a chunk of the resources. The
+    size of the resource chunks is chosen for the fewest parts.
+    """
+    keys = [k for k in ("Action", "Resource") if k in statement]
+    lists = [_as_list(statement[k]) for k in keys]
+    # The part of the size of a part taken by its values: a list of values
+    # is the size of an empty list, minus one, plus the size of each value
+    # and a comma. Room is kept to number the Sid of the parts.
+    empty = json_size(dict(statement, **{k: [] for k in keys}))
+    room = capacity - 1 - empty + len(keys)
+    if "Sid" in statement:
+        count = 1
+        for values in lists:
+            count *= len(values)
+        room -= len(str(count))
+    weights = [[json_size(v) + 1 for v in values] for values in lists]
+
+    best = None
+    if len(keys) == 1:
+        best = _chunks(weights[0], room)
+        chunks = [[c] for c in best or ()]
+    else:
+        # Each number of resource chunks, with the least room holding them
+        # and the rest of the room for the actions. More resource chunks
+        # than the best number of parts can not do better.
+        for count in range(1, len(weights[1]) + 1):
+            if best is not None and count >= len(best):
+                break
+            resource_room = _chunk_room(weights[1], count)
+            action_chunks = _chunks(weights[0], room - resource_room)
+            if not action_chunks:
+                continue
+            resource_chunks = _chunks(weights[1], resource_room)
+            product = [[a, r] for a in action_chunks for r in resource_chunks]
+            if best is None or len(product) < len(best):
+                best = product
+        chunks = best or []
+    if best is None:
+        raise ValueError("Statement does not fit in a policy of the limit")
+    parts = [
+        dict(statement, **{k: [lists[n][i] for i in c[n]] for n, k in enumerate(keys)})
+        for c in chunks
+    ]
+    if "Sid" in statement and len(parts) > 1:
+        parts = [dict(p, Sid="%s%d" % (p["Sid"], i)) for i, p in enumerate(parts, 1)]
+    return parts
+
+
+def _chunk_room(weights: List[int], count: int) -> int:
+    """Return the least room splitting weights into count chunks at most."""
+    low, high = max(weights), sum(weights)
+    while low < high:
+        middle = (low + high) // 2
+        if len(_chunks(weights, middle)) <= count:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _chunks(weights: List[int], room: int) -> Any:
+    """Return consecutive chunks of indexes of weights within room, or None."""
+    chunks: List[List[int]] = []
+    used = room
+    for i, weight in enumerate(weights):
+        if weight > room:
+            return None
+        if used + weight > room:
+            chunks.append([])
+            used = 0
+        chunks[-1].append(i)
+        used += weight
+    return chunks
+
+
+def _has_wildcard(value: str) -> bool:
+    return "*" in value or "?" in value
+
+
+def _literal(pattern: str) -> str:
+    """Return the part of a pattern before its first wildcard."""
+    return re.split(r"[*?]", pattern, 1)[0]
+
+
+class _PatternIndex:
+    """Patterns indexed by owner, to find those covering a value.
+
+    Coverage is only decided when it is certain and cheap: a pattern covers
+    an equal value, a "prefix*" pattern covers the values and patterns
+    starting with its prefix and other patterns cover the values without
+    wildcards they match. Resources are matched as ARNs, see arn_like().
+    """
+
+    def __init__(self, ignore_case: bool) -> None:
+        self.ignore_case = ignore_case
+        self.exact: Dict[Any, Set[int]] = {}
+        self.prefixes: Dict[str, Set[int]] = {}
+        self.lengths: Set[int] = set()
+        self.globs: List[Tuple[Callable[[str], bool], int]] = []
+
+    def key(self, value: Any) -> Any:
+        if not isinstance(value, str):
+            if not hasattr(value, "JSONrepr"):
+                return canonical(value)
+            value = value.JSONrepr()
+        return value.lower() if self.ignore_case else value
+
+    def add(self, pattern: Any, owner: int) -> None:
+        key = self.key(pattern)
+        self.exact.setdefault(key, set()).add(owner)
+        if not isinstance(key, str) or not _has_wildcard(key):
+            return
+        literal = _literal(key)
+        if key == literal + "*":
+            self.prefixes.setdefault(literal, set()).add(owner)
+            self.lengths.add(len(literal))
+        else:
+            match = glob(key) if self.ignore_case else arn_like(key)
+            self.globs.append((match, owner))
+
+    def owners(self, value: Any) -> Set[int]:
+        """Return the owners of the patterns covering a value or pattern."""
+        key = self.key(value)
+        result = set(self.exact.get(key, ()))
+        if not isinstance(key, str):
+            return result
+        literal = _literal(key)
+        for length in self.lengths:
+            if length <= len(literal):
+                result |= self.prefixes.get(literal[:length], set())
+        if literal == key:
+            for match, owner in self.globs:
+                if match(key):
+                    result.add(owner)
+        return result
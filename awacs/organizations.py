@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,54 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptHandshake = Action("AcceptHandshake")
-AttachPolicy = Action("AttachPolicy")
-CancelHandshake = Action("CancelHandshake")
-CreateAccount = Action("CreateAccount")
-CreateGovCloudAccount = Action("CreateGovCloudAccount")
-CreateOrganization = Action("CreateOrganization")
-CreateOrganizationalUnit = Action("CreateOrganizationalUnit")
-CreatePolicy = Action("CreatePolicy")
-DeclineHandshake = Action("DeclineHandshake")
-DeleteOrganization = Action("DeleteOrganization")
-DeleteOrganizationalUnit = Action("DeleteOrganizationalUnit")
-DeletePolicy = Action("DeletePolicy")
-DeregisterDelegatedAdministrator = Action("DeregisterDelegatedAdministrator")
-DescribeAccount = Action("DescribeAccount")
-DescribeCreateAccountStatus = Action("DescribeCreateAccountStatus")
-DescribeEffectivePolicy = Action("DescribeEffectivePolicy")
-DescribeHandshake = Action("DescribeHandshake")
-DescribeOrganization = Action("DescribeOrganization")
-DescribeOrganizationalUnit = Action("DescribeOrganizationalUnit")
-DescribePolicy = Action("DescribePolicy")
-DetachPolicy = Action("DetachPolicy")
-DisableAWSServiceAccess = Action("DisableAWSServiceAccess")
-DisablePolicyType = Action("DisablePolicyType")
-EnableAWSServiceAccess = Action("EnableAWSServiceAccess")
-EnableAllFeatures = Action("EnableAllFeatures")
-EnablePolicyType = Action("EnablePolicyType")
-InviteAccountToOrganization = Action("InviteAccountToOrganization")
-LeaveOrganization = Action("LeaveOrganization")
-ListAWSServiceAccessForOrganization = Action("ListAWSServiceAccessForOrganization")
-ListAccounts = Action("ListAccounts")
-ListAccountsForParent = Action("ListAccountsForParent")
-ListChildren = Action("ListChildren")
-ListCreateAccountStatus = Action("ListCreateAccountStatus")
-ListDelegatedAdministrators = Action("ListDelegatedAdministrators")
-ListDelegatedServicesForAccount = Action("ListDelegatedServicesForAccount")
-ListHandshakesForAccount = Action("ListHandshakesForAccount")
-ListHandshakesForOrganization = Action("ListHandshakesForOrganization")
-ListOrganizationalUnitsForParent = Action("ListOrganizationalUnitsForParent")
-ListParents = Action("ListParents")
-ListPolicies = Action("ListPolicies")
-ListPoliciesForTarget = Action("ListPoliciesForTarget")
-ListRoots = Action("ListRoots")
-ListTagsForResource = Action("ListTagsForResource")
-ListTargetsForPolicy = Action("ListTargetsForPolicy")
-MoveAccount = Action("MoveAccount")
-RegisterDelegatedAdministrator = Action("RegisterDelegatedAdministrator")
-RemoveAccountFromOrganization = Action("RemoveAccountFromOrganization")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateOrganizationalUnit = Action("UpdateOrganizationalUnit")
-UpdatePolicy = Action("UpdatePolicy")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,45 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApp = Action("CreateApp")
-CreateAppDeployment = Action("CreateAppDeployment")
-CreateAppVersion = Action("CreateAppVersion")
-CreateDataSource = Action("CreateDataSource")
-CreateDeploymentConfiguration = Action("CreateDeploymentConfiguration")
-CreateDevice = Action("CreateDevice")
-CreateDeviceUpdate = Action("CreateDeviceUpdate")
-CreateInputs = Action("CreateInputs")
-CreateModel = Action("CreateModel")
-CreateStreams = Action("CreateStreams")
-DeleteApp = Action("DeleteApp")
-DeleteAppVersion = Action("DeleteAppVersion")
-DeleteDataSource = Action("DeleteDataSource")
-DeleteDevice = Action("DeleteDevice")
-DeleteModel = Action("DeleteModel")
-DescribeApp = Action("DescribeApp")
-DescribeAppDeployment = Action("DescribeAppDeployment")
-DescribeAppVersion = Action("DescribeAppVersion")
-DescribeDataSource = Action("DescribeDataSource")
-DescribeDevice = Action("DescribeDevice")
-DescribeDeviceUpdate = Action("DescribeDeviceUpdate")
-DescribeModel = Action("DescribeModel")
-DescribeSoftware = Action("DescribeSoftware")
-GetDeploymentConfiguration = Action("GetDeploymentConfiguration")
-GetInputs = Action("GetInputs")
-GetStreams = Action("GetStreams")
-GetWebSocketURL = Action("GetWebSocketURL")
-ListAppDeploymentOperations = Action("ListAppDeploymentOperations")
-ListAppVersions = Action("ListAppVersions")
-ListApps = Action("ListApps")
-ListDataSources = Action("ListDataSources")
-ListDeploymentConfigurations = Action("ListDeploymentConfigurations")
-ListDeviceUpdates = Action("ListDeviceUpdates")
-ListDevices = Action("ListDevices")
-ListModels = Action("ListModels")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateApp = Action("UpdateApp")
-UpdateAppConfiguration = Action("UpdateAppConfiguration")
-UpdateDataSource = Action("UpdateDataSource")
-UpdateDevice = Action("UpdateDevice")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateBatchInferenceJob = Action("CreateBatchInferenceJob")
-CreateCampaign = Action("CreateCampaign")
-CreateDataset = Action("CreateDataset")
-CreateDatasetGroup = Action("CreateDatasetGroup")
-CreateDatasetImportJob = Action("CreateDatasetImportJob")
-CreateEventTracker = Action("CreateEventTracker")
-CreateFilter = Action("CreateFilter")
-CreateSchema = Action("CreateSchema")
-CreateSolution = Action("CreateSolution")
-CreateSolutionVersion = Action("CreateSolutionVersion")
-DeleteCampaign = Action("DeleteCampaign")
-DeleteDataset = Action("DeleteDataset")
-DeleteDatasetGroup = Action("DeleteDatasetGroup")
-DeleteEventTracker = Action("DeleteEventTracker")
-DeleteFilter = Action("DeleteFilter")
-DeleteSchema = Action("DeleteSchema")
-DeleteSolution = Action("DeleteSolution")
-DescribeAlgorithm = Action("DescribeAlgorithm")
-DescribeBatchInferenceJob = Action("DescribeBatchInferenceJob")
-DescribeCampaign = Action("DescribeCampaign")
-DescribeDataset = Action("DescribeDataset")
-DescribeDatasetGroup = Action("DescribeDatasetGroup")
-DescribeDatasetImportJob = Action("DescribeDatasetImportJob")
-DescribeEventTracker = Action("DescribeEventTracker")
-DescribeFeatureTransformation = Action("DescribeFeatureTransformation")
-DescribeFilter = Action("DescribeFilter")
-DescribeRecipe = Action("DescribeRecipe")
-DescribeSchema = Action("DescribeSchema")
-DescribeSolution = Action("DescribeSolution")
-DescribeSolutionVersion = Action("DescribeSolutionVersion")
-GetPersonalizedRanking = Action("GetPersonalizedRanking")
-GetRecommendations = Action("GetRecommendations")
-GetSolutionMetrics = Action("GetSolutionMetrics")
-ListBatchInferenceJobs = Action("ListBatchInferenceJobs")
-ListCampaigns = Action("ListCampaigns")
-ListDatasetGroups = Action("ListDatasetGroups")
-ListDatasetImportJobs = Action("ListDatasetImportJobs")
-ListDatasets = Action("ListDatasets")
-ListEventTrackers = Action("ListEventTrackers")
-ListFilters = Action("ListFilters")
-ListRecipes = Action("ListRecipes")
-ListSchemas = Action("ListSchemas")
-ListSolutionVersions = Action("ListSolutionVersions")
-ListSolutions = Action("ListSolutions")
-PutEvents = Action("PutEvents")
-PutItems = Action("PutItems")
-PutUsers = Action("PutUsers")
-UpdateCampaign = Action("UpdateCampaign")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
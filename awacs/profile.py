@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,31 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddProfileKey = Action("AddProfileKey")
-CreateDomain = Action("CreateDomain")
-CreateProfile = Action("CreateProfile")
-DeleteDomain = Action("DeleteDomain")
-DeleteIntegration = Action("DeleteIntegration")
-DeleteProfile = Action("DeleteProfile")
-DeleteProfileKey = Action("DeleteProfileKey")
-DeleteProfileObject = Action("DeleteProfileObject")
-DeleteProfileObjectType = Action("DeleteProfileObjectType")
-GetDomain = Action("GetDomain")
-GetIntegration = Action("GetIntegration")
-GetProfileObjectType = Action("GetProfileObjectType")
-GetProfileObjectTypeTemplate = Action("GetProfileObjectTypeTemplate")
-ListAccountIntegrations = Action("ListAccountIntegrations")
-ListDomains = Action("ListDomains")
-ListIntegrations = Action("ListIntegrations")
-ListProfileObjectTypeTemplates = Action("ListProfileObjectTypeTemplates")
-ListProfileObjectTypes = Action("ListProfileObjectTypes")
-ListProfileObjects = Action("ListProfileObjects")
-ListTagsForResource = Action("ListTagsForResource")
-PutIntegration = Action("PutIntegration")
-PutProfileObject = Action("PutProfileObject")
-PutProfileObjectType = Action("PutProfileObjectType")
-SearchProfiles = Action("SearchProfiles")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDomain = Action("UpdateDomain")
-UpdateProfile = Action("UpdateProfile")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
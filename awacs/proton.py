@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,53 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateEnvironment = Action("CreateEnvironment")
-CreateEnvironmentTemplate = Action("CreateEnvironmentTemplate")
-CreateEnvironmentTemplateMajorVersion = Action("CreateEnvironmentTemplateMajorVersion")
-CreateEnvironmentTemplateMinorVersion = Action("CreateEnvironmentTemplateMinorVersion")
-CreateService = Action("CreateService")
-CreateServiceTemplate = Action("CreateServiceTemplate")
-CreateServiceTemplateMajorVersion = Action("CreateServiceTemplateMajorVersion")
-CreateServiceTemplateMinorVersion = Action("CreateServiceTemplateMinorVersion")
-DeleteAccountRoles = Action("DeleteAccountRoles")
-DeleteEnvironment = Action("DeleteEnvironment")
-DeleteEnvironmentTemplate = Action("DeleteEnvironmentTemplate")
-DeleteEnvironmentTemplateMajorVersion = Action("DeleteEnvironmentTemplateMajorVersion")
-DeleteEnvironmentTemplateMinorVersion = Action("DeleteEnvironmentTemplateMinorVersion")
-DeleteService = Action("DeleteService")
-DeleteServiceTemplate = Action("DeleteServiceTemplate")
-DeleteServiceTemplateMajorVersion = Action("DeleteServiceTemplateMajorVersion")
-DeleteServiceTemplateMinorVersion = Action("DeleteServiceTemplateMinorVersion")
-GetAccountRoles = Action("GetAccountRoles")
-GetEnvironment = Action("GetEnvironment")
-GetEnvironmentTemplate = Action("GetEnvironmentTemplate")
-GetEnvironmentTemplateMajorVersion = Action("GetEnvironmentTemplateMajorVersion")
-GetEnvironmentTemplateMinorVersion = Action("GetEnvironmentTemplateMinorVersion")
-GetService = Action("GetService")
-GetServiceInstance = Action("GetServiceInstance")
-GetServiceTemplate = Action("GetServiceTemplate")
-GetServiceTemplateMajorVersion = Action("GetServiceTemplateMajorVersion")
-GetServiceTemplateMinorVersion = Action("GetServiceTemplateMinorVersion")
-ListEnvironmentTemplateMajorVersions = Action("ListEnvironmentTemplateMajorVersions")
-ListEnvironmentTemplateMinorVersions = Action("ListEnvironmentTemplateMinorVersions")
-ListEnvironmentTemplates = Action("ListEnvironmentTemplates")
-ListEnvironments = Action("ListEnvironments")
-ListServiceInstances = Action("ListServiceInstances")
-ListServiceTemplateMajorVersions = Action("ListServiceTemplateMajorVersions")
-ListServiceTemplateMinorVersions = Action("ListServiceTemplateMinorVersions")
-ListServiceTemplates = Action("ListServiceTemplates")
-ListServices = Action("ListServices")
-ListTagsForResource = Action("ListTagsForResource")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAccountRoles = Action("UpdateAccountRoles")
-UpdateEnvironment = Action("UpdateEnvironment")
-UpdateEnvironmentTemplate = Action("UpdateEnvironmentTemplate")
-UpdateEnvironmentTemplateMajorVersion = Action("UpdateEnvironmentTemplateMajorVersion")
-UpdateEnvironmentTemplateMinorVersion = Action("UpdateEnvironmentTemplateMinorVersion")
-UpdateService = Action("UpdateService")
-UpdateServiceInstance = Action("UpdateServiceInstance")
-UpdateServicePipeline = Action("UpdateServicePipeline")
-UpdateServiceTemplate = Action("UpdateServiceTemplate")
-UpdateServiceTemplateMajorVersion = Action("UpdateServiceTemplateMajorVersion")
-UpdateServiceTemplateMinorVersion = Action("UpdateServiceTemplateMinorVersion")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptResourceShareInvitation = Action("AcceptResourceShareInvitation")
-AssociateResourceShare = Action("AssociateResourceShare")
-AssociateResourceSharePermission = Action("AssociateResourceSharePermission")
-CreateResourceShare = Action("CreateResourceShare")
-DeleteResourceShare = Action("DeleteResourceShare")
-DisassociateResourceShare = Action("DisassociateResourceShare")
-DisassociateResourceSharePermission = Action("DisassociateResourceSharePermission")
-EnableSharingWithAwsOrganization = Action("EnableSharingWithAwsOrganization")
-GetPermission = Action("GetPermission")
-GetResourcePolicies = Action("GetResourcePolicies")
-GetResourceShareAssociations = Action("GetResourceShareAssociations")
-GetResourceShareInvitations = Action("GetResourceShareInvitations")
-GetResourceShares = Action("GetResourceShares")
-ListPendingInvitationResources = Action("ListPendingInvitationResources")
-ListPermissions = Action("ListPermissions")
-ListPrincipals = Action("ListPrincipals")
-ListResourceSharePermissions = Action("ListResourceSharePermissions")
-ListResourceTypes = Action("ListResourceTypes")
-ListResources = Action("ListResources")
-PromoteResourceShareCreatedFromPolicy = Action("PromoteResourceShareCreatedFromPolicy")
-RejectResourceShareInvitation = Action("RejectResourceShareInvitation")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateResourceShare = Action("UpdateResourceShare")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CompareFaces = Action("CompareFaces")
-CreateCollection = Action("CreateCollection")
-CreateProject = Action("CreateProject")
-CreateProjectVersion = Action("CreateProjectVersion")
-CreateStreamProcessor = Action("CreateStreamProcessor")
-DeleteCollection = Action("DeleteCollection")
-DeleteFaces = Action("DeleteFaces")
-DeleteProject = Action("DeleteProject")
-DeleteProjectVersion = Action("DeleteProjectVersion")
-DeleteStreamProcessor = Action("DeleteStreamProcessor")
-DescribeCollection = Action("DescribeCollection")
-DescribeProjectVersions = Action("DescribeProjectVersions")
-DescribeProjects = Action("DescribeProjects")
-DescribeStreamProcessor = Action("DescribeStreamProcessor")
-DetectCustomLabels = Action("DetectCustomLabels")
-DetectFaces = Action("DetectFaces")
-DetectLabels = Action("DetectLabels")
-DetectModerationLabels = Action("DetectModerationLabels")
-DetectProtectiveEquipment = Action("DetectProtectiveEquipment")
-DetectText = Action("DetectText")
-GetCelebrityInfo = Action("GetCelebrityInfo")
-GetCelebrityRecognition = Action("GetCelebrityRecognition")
-GetContentModeration = Action("GetContentModeration")
-GetFaceDetection = Action("GetFaceDetection")
-GetFaceSearch = Action("GetFaceSearch")
-GetLabelDetection = Action("GetLabelDetection")
-GetPersonTracking = Action("GetPersonTracking")
-GetSegmentDetection = Action("GetSegmentDetection")
-GetTextDetection = Action("GetTextDetection")
-IndexFaces = Action("IndexFaces")
-ListCollections = Action("ListCollections")
-ListFaces = Action("ListFaces")
-ListStreamProcessors = Action("ListStreamProcessors")
-RecognizeCelebrities = Action("RecognizeCelebrities")
-SearchFaces = Action("SearchFaces")
-SearchFacesByImage = Action("SearchFacesByImage")
-StartCelebrityRecognition = Action("StartCelebrityRecognition")
-StartContentModeration = Action("StartContentModeration")
-StartFaceDetection = Action("StartFaceDetection")
-StartFaceSearch = Action("StartFaceSearch")
-StartLabelDetection = Action("StartLabelDetection")
-StartPersonTracking = Action("StartPersonTracking")
-StartProjectVersion = Action("StartProjectVersion")
-StartSegmentDetection = Action("StartSegmentDetection")
-StartStreamProcessor = Action("StartStreamProcessor")
-StartTextDetection = Action("StartTextDetection")
-StopProjectVersion = Action("StopProjectVersion")
-StopStreamProcessor = Action("StopStreamProcessor")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,19 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateGroup = Action("CreateGroup")
-DeleteGroup = Action("DeleteGroup")
-GetGroup = Action("GetGroup")
-GetGroupConfiguration = Action("GetGroupConfiguration")
-GetGroupQuery = Action("GetGroupQuery")
-GetTags = Action("GetTags")
-GroupResources = Action("GroupResources")
-ListGroupResources = Action("ListGroupResources")
-ListGroups = Action("ListGroups")
-PutGroupPolicy = Action("PutGroupPolicy")
-SearchResources = Action("SearchResources")
-Tag = Action("Tag")
-UngroupResources = Action("UngroupResources")
-Untag = Action("Untag")
-UpdateGroup = Action("UpdateGroup")
-UpdateGroupQuery = Action("UpdateGroupQuery")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,62 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchDeleteWorlds = Action("BatchDeleteWorlds")
-BatchDescribeSimulationJob = Action("BatchDescribeSimulationJob")
-CancelDeploymentJob = Action("CancelDeploymentJob")
-CancelSimulationJob = Action("CancelSimulationJob")
-CancelSimulationJobBatch = Action("CancelSimulationJobBatch")
-CancelWorldExportJob = Action("CancelWorldExportJob")
-CancelWorldGenerationJob = Action("CancelWorldGenerationJob")
-CreateDeploymentJob = Action("CreateDeploymentJob")
-CreateFleet = Action("CreateFleet")
-CreateRobot = Action("CreateRobot")
-CreateRobotApplication = Action("CreateRobotApplication")
-CreateRobotApplicationVersion = Action("CreateRobotApplicationVersion")
-CreateSimulationApplication = Action("CreateSimulationApplication")
-CreateSimulationApplicationVersion = Action("CreateSimulationApplicationVersion")
-CreateSimulationJob = Action("CreateSimulationJob")
-CreateWorldExportJob = Action("CreateWorldExportJob")
-CreateWorldGenerationJob = Action("CreateWorldGenerationJob")
-CreateWorldTemplate = Action("CreateWorldTemplate")
-DeleteFleet = Action("DeleteFleet")
-DeleteRobot = Action("DeleteRobot")
-DeleteRobotApplication = Action("DeleteRobotApplication")
-DeleteSimulationApplication = Action("DeleteSimulationApplication")
-DeleteWorldTemplate = Action("DeleteWorldTemplate")
-DeregisterRobot = Action("DeregisterRobot")
-DescribeDeploymentJob = Action("DescribeDeploymentJob")
-DescribeFleet = Action("DescribeFleet")
-DescribeRobot = Action("DescribeRobot")
-DescribeRobotApplication = Action("DescribeRobotApplication")
-DescribeSimulationApplication = Action("DescribeSimulationApplication")
-DescribeSimulationJob = Action("DescribeSimulationJob")
-DescribeSimulationJobBatch = Action("DescribeSimulationJobBatch")
-DescribeWorld = Action("DescribeWorld")
-DescribeWorldExportJob = Action("DescribeWorldExportJob")
-DescribeWorldGenerationJob = Action("DescribeWorldGenerationJob")
-DescribeWorldTemplate = Action("DescribeWorldTemplate")
-GetWorldTemplateBody = Action("GetWorldTemplateBody")
-ListDeploymentJobs = Action("ListDeploymentJobs")
-ListFleets = Action("ListFleets")
-ListRobotApplications = Action("ListRobotApplications")
-ListRobots = Action("ListRobots")
-ListSimulationApplications = Action("ListSimulationApplications")
-ListSimulationJobBatches = Action("ListSimulationJobBatches")
-ListSimulationJobs = Action("ListSimulationJobs")
-ListSupportedAvailabilityZones = Action("ListSupportedAvailabilityZones")
-ListTagsForResource = Action("ListTagsForResource")
-ListWorldExportJobs = Action("ListWorldExportJobs")
-ListWorldGenerationJobs = Action("ListWorldGenerationJobs")
-ListWorldTemplates = Action("ListWorldTemplates")
-ListWorlds = Action("ListWorlds")
-RegisterRobot = Action("RegisterRobot")
-RestartSimulationJob = Action("RestartSimulationJob")
-StartSimulationJobBatch = Action("StartSimulationJobBatch")
-SyncDeploymentJob = Action("SyncDeploymentJob")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateRobotApplication = Action("UpdateRobotApplication")
-UpdateRobotDeployment = Action("UpdateRobotDeployment")
-UpdateSimulationApplication = Action("UpdateSimulationApplication")
-UpdateWorldTemplate = Action("UpdateWorldTemplate")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,64 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateVPCWithHostedZone = Action("AssociateVPCWithHostedZone")
-ChangeResourceRecordSets = Action("ChangeResourceRecordSets")
-ChangeTagsForResource = Action("ChangeTagsForResource")
-CreateHealthCheck = Action("CreateHealthCheck")
-CreateHostedZone = Action("CreateHostedZone")
-CreateQueryLoggingConfig = Action("CreateQueryLoggingConfig")
-CreateReusableDelegationSet = Action("CreateReusableDelegationSet")
-CreateTrafficPolicy = Action("CreateTrafficPolicy")
-CreateTrafficPolicyInstance = Action("CreateTrafficPolicyInstance")
-CreateTrafficPolicyVersion = Action("CreateTrafficPolicyVersion")
-CreateVPCAssociationAuthorization = Action("CreateVPCAssociationAuthorization")
-DeleteHealthCheck = Action("DeleteHealthCheck")
-DeleteHostedZone = Action("DeleteHostedZone")
-DeleteQueryLoggingConfig = Action("DeleteQueryLoggingConfig")
-DeleteReusableDelegationSet = Action("DeleteReusableDelegationSet")
-DeleteTrafficPolicy = Action("DeleteTrafficPolicy")
-DeleteTrafficPolicyInstance = Action("DeleteTrafficPolicyInstance")
-DeleteVPCAssociationAuthorization = Action("DeleteVPCAssociationAuthorization")
-DisableDomainAutoRenew = Action("DisableDomainAutoRenew")
-DisassociateVPCFromHostedZone = Action("DisassociateVPCFromHostedZone")
-EnableDomainAutoRenew = Action("EnableDomainAutoRenew")
-GetAccountLimit = Action("GetAccountLimit")
-GetChange = Action("GetChange")
-GetCheckerIpRanges = Action("GetCheckerIpRanges")
-GetGeoLocation = Action("GetGeoLocation")
-GetHealthCheck = Action("GetHealthCheck")
-GetHealthCheckCount = Action("GetHealthCheckCount")
-GetHealthCheckLastFailureReason = Action("GetHealthCheckLastFailureReason")
-GetHealthCheckStatus = Action("GetHealthCheckStatus")
-GetHostedZone = Action("GetHostedZone")
-GetHostedZoneCount = Action("GetHostedZoneCount")
-GetHostedZoneLimit = Action("GetHostedZoneLimit")
-GetQueryLoggingConfig = Action("GetQueryLoggingConfig")
-GetReusableDelegationSet = Action("GetReusableDelegationSet")
-GetReusableDelegationSetLimit = Action("GetReusableDelegationSetLimit")
-GetTrafficPolicy = Action("GetTrafficPolicy")
-GetTrafficPolicyInstance = Action("GetTrafficPolicyInstance")
-GetTrafficPolicyInstanceCount = Action("GetTrafficPolicyInstanceCount")
-ListGeoLocations = Action("ListGeoLocations")
-ListHealthChecks = Action("ListHealthChecks")
-ListHostedZones = Action("ListHostedZones")
-ListHostedZonesByName = Action("ListHostedZonesByName")
-ListHostedZonesByVPC = Action("ListHostedZonesByVPC")
-ListQueryLoggingConfigs = Action("ListQueryLoggingConfigs")
-ListResourceRecordSets = Action("ListResourceRecordSets")
-ListReusableDelegationSets = Action("ListReusableDelegationSets")
-ListTagsForResource = Action("ListTagsForResource")
-ListTagsForResources = Action("ListTagsForResources")
-ListTrafficPolicies = Action("ListTrafficPolicies")
-ListTrafficPolicyInstances = Action("ListTrafficPolicyInstances")
-ListTrafficPolicyInstancesByHostedZone = Action(
-    "ListTrafficPolicyInstancesByHostedZone"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ListTrafficPolicyInstancesByPolicy = Action("ListTrafficPolicyInstancesByPolicy")
-ListTrafficPolicyVersions = Action("ListTrafficPolicyVersions")
-ListVPCAssociationAuthorizations = Action("ListVPCAssociationAuthorizations")
-TestDNSAnswer = Action("TestDNSAnswer")
-UpdateHealthCheck = Action("UpdateHealthCheck")
-UpdateHostedZoneComment = Action("UpdateHostedZoneComment")
-UpdateTrafficPolicyComment = Action("UpdateTrafficPolicyComment")
-UpdateTrafficPolicyInstance = Action("UpdateTrafficPolicyInstance")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,26 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CheckDomainAvailability = Action("CheckDomainAvailability")
-DeleteTagsForDomain = Action("DeleteTagsForDomain")
-DisableDomainAutoRenew = Action("DisableDomainAutoRenew")
-DisableDomainTransferLock = Action("DisableDomainTransferLock")
-EnableDomainAutoRenew = Action("EnableDomainAutoRenew")
-EnableDomainTransferLock = Action("EnableDomainTransferLock")
-GetContactReachabilityStatus = Action("GetContactReachabilityStatus")
-GetDomainDetail = Action("GetDomainDetail")
-GetDomainSuggestions = Action("GetDomainSuggestions")
-GetOperationDetail = Action("GetOperationDetail")
-ListDomains = Action("ListDomains")
-ListOperations = Action("ListOperations")
-ListTagsForDomain = Action("ListTagsForDomain")
-RegisterDomain = Action("RegisterDomain")
-RenewDomain = Action("RenewDomain")
-ResendContactReachabilityEmail = Action("ResendContactReachabilityEmail")
-RetrieveDomainAuthCode = Action("RetrieveDomainAuthCode")
-TransferDomain = Action("TransferDomain")
-UpdateDomainContact = Action("UpdateDomainContact")
-UpdateDomainContactPrivacy = Action("UpdateDomainContactPrivacy")
-UpdateDomainNameservers = Action("UpdateDomainNameservers")
-UpdateTagsForDomain = Action("UpdateTagsForDomain")
-ViewBilling = Action("ViewBilling")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
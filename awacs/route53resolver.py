@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,65 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateFirewallRuleGroup = Action("AssociateFirewallRuleGroup")
-AssociateResolverEndpointIpAddress = Action("AssociateResolverEndpointIpAddress")
-AssociateResolverQueryLogConfig = Action("AssociateResolverQueryLogConfig")
-AssociateResolverRule = Action("AssociateResolverRule")
-CreateFirewallDomainList = Action("CreateFirewallDomainList")
-CreateFirewallRule = Action("CreateFirewallRule")
-CreateFirewallRuleGroup = Action("CreateFirewallRuleGroup")
-CreateResolverEndpoint = Action("CreateResolverEndpoint")
-CreateResolverQueryLogConfig = Action("CreateResolverQueryLogConfig")
-CreateResolverRule = Action("CreateResolverRule")
-DeleteFirewallDomainList = Action("DeleteFirewallDomainList")
-DeleteFirewallRule = Action("DeleteFirewallRule")
-DeleteFirewallRuleGroup = Action("DeleteFirewallRuleGroup")
-DeleteResolverEndpoint = Action("DeleteResolverEndpoint")
-DeleteResolverQueryLogConfig = Action("DeleteResolverQueryLogConfig")
-DeleteResolverRule = Action("DeleteResolverRule")
-DisassociateFirewallRuleGroup = Action("DisassociateFirewallRuleGroup")
-DisassociateResolverEndpointIpAddress = Action("DisassociateResolverEndpointIpAddress")
-DisassociateResolverQueryLogConfig = Action("DisassociateResolverQueryLogConfig")
-DisassociateResolverRule = Action("DisassociateResolverRule")
-GetFirewallConfig = Action("GetFirewallConfig")
-GetFirewallDomainList = Action("GetFirewallDomainList")
-GetFirewallRuleGroup = Action("GetFirewallRuleGroup")
-GetFirewallRuleGroupAssociation = Action("GetFirewallRuleGroupAssociation")
-GetFirewallRuleGroupPolicy = Action("GetFirewallRuleGroupPolicy")
-GetResolverDnssecConfig = Action("GetResolverDnssecConfig")
-GetResolverEndpoint = Action("GetResolverEndpoint")
-GetResolverQueryLogConfig = Action("GetResolverQueryLogConfig")
-GetResolverQueryLogConfigAssociation = Action("GetResolverQueryLogConfigAssociation")
-GetResolverQueryLogConfigPolicy = Action("GetResolverQueryLogConfigPolicy")
-GetResolverRule = Action("GetResolverRule")
-GetResolverRuleAssociation = Action("GetResolverRuleAssociation")
-GetResolverRulePolicy = Action("GetResolverRulePolicy")
-ImportFirewallDomains = Action("ImportFirewallDomains")
-ListFirewallConfigs = Action("ListFirewallConfigs")
-ListFirewallDomainLists = Action("ListFirewallDomainLists")
-ListFirewallDomains = Action("ListFirewallDomains")
-ListFirewallRuleGroupAssociations = Action("ListFirewallRuleGroupAssociations")
-ListFirewallRuleGroups = Action("ListFirewallRuleGroups")
-ListFirewallRules = Action("ListFirewallRules")
-ListResolverDnssecConfigs = Action("ListResolverDnssecConfigs")
-ListResolverEndpointIpAddresses = Action("ListResolverEndpointIpAddresses")
-ListResolverEndpoints = Action("ListResolverEndpoints")
-ListResolverQueryLogConfigAssociations = Action(
-    "ListResolverQueryLogConfigAssociations"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ListResolverQueryLogConfigs = Action("ListResolverQueryLogConfigs")
-ListResolverRuleAssociations = Action("ListResolverRuleAssociations")
-ListResolverRules = Action("ListResolverRules")
-ListTagsForResource = Action("ListTagsForResource")
-PutFirewallRuleGroupPolicy = Action("PutFirewallRuleGroupPolicy")
-PutResolverQueryLogConfigPolicy = Action("PutResolverQueryLogConfigPolicy")
-PutResolverRulePolicy = Action("PutResolverRulePolicy")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateFirewallConfig = Action("UpdateFirewallConfig")
-UpdateFirewallDomains = Action("UpdateFirewallDomains")
-UpdateFirewallRule = Action("UpdateFirewallRule")
-UpdateFirewallRuleGroupAssociation = Action("UpdateFirewallRuleGroupAssociation")
-UpdateResolverDnssecConfig = Action("UpdateResolverDnssecConfig")
-UpdateResolverEndpoint = Action("UpdateResolverEndpoint")
-UpdateResolverRule = Action("UpdateResolverRule")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
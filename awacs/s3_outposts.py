@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,35 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AbortMultipartUpload = Action("AbortMultipartUpload")
-CreateAccessPoint = Action("CreateAccessPoint")
-CreateBucket = Action("CreateBucket")
-CreateEndpoint = Action("CreateEndpoint")
-DeleteAccessPoint = Action("DeleteAccessPoint")
-DeleteAccessPointPolicy = Action("DeleteAccessPointPolicy")
-DeleteBucket = Action("DeleteBucket")
-DeleteBucketPolicy = Action("DeleteBucketPolicy")
-DeleteEndpoint = Action("DeleteEndpoint")
-DeleteObject = Action("DeleteObject")
-DeleteObjectTagging = Action("DeleteObjectTagging")
-GetAccessPoint = Action("GetAccessPoint")
-GetAccessPointPolicy = Action("GetAccessPointPolicy")
-GetBucket = Action("GetBucket")
-GetBucketPolicy = Action("GetBucketPolicy")
-GetBucketTagging = Action("GetBucketTagging")
-GetLifecycleConfiguration = Action("GetLifecycleConfiguration")
-GetObject = Action("GetObject")
-GetObjectTagging = Action("GetObjectTagging")
-ListAccessPoints = Action("ListAccessPoints")
-ListBucket = Action("ListBucket")
-ListBucketMultipartUploads = Action("ListBucketMultipartUploads")
-ListEndpoints = Action("ListEndpoints")
-ListMultipartUploadParts = Action("ListMultipartUploadParts")
-ListRegionalBuckets = Action("ListRegionalBuckets")
-PutAccessPointPolicy = Action("PutAccessPointPolicy")
-PutBucketPolicy = Action("PutBucketPolicy")
-PutBucketTagging = Action("PutBucketTagging")
-PutLifecycleConfiguration = Action("PutLifecycleConfiguration")
-PutObject = Action("PutObject")
-PutObjectAcl = Action("PutObjectAcl")
-PutObjectTagging = Action("PutObjectTagging")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,34 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateDiscoverer = Action("CreateDiscoverer")
-CreateRegistry = Action("CreateRegistry")
-CreateSchema = Action("CreateSchema")
-DeleteDiscoverer = Action("DeleteDiscoverer")
-DeleteRegistry = Action("DeleteRegistry")
-DeleteResourcePolicy = Action("DeleteResourcePolicy")
-DeleteSchema = Action("DeleteSchema")
-DeleteSchemaVersion = Action("DeleteSchemaVersion")
-DescribeCodeBinding = Action("DescribeCodeBinding")
-DescribeDiscoverer = Action("DescribeDiscoverer")
-DescribeRegistry = Action("DescribeRegistry")
-DescribeSchema = Action("DescribeSchema")
-ExportSchema = Action("ExportSchema")
-GetCodeBindingSource = Action("GetCodeBindingSource")
-GetDiscoveredSchema = Action("GetDiscoveredSchema")
-GetResourcePolicy = Action("GetResourcePolicy")
-ListDiscoverers = Action("ListDiscoverers")
-ListRegistries = Action("ListRegistries")
-ListSchemaVersions = Action("ListSchemaVersions")
-ListSchemas = Action("ListSchemas")
-ListTagsForResource = Action("ListTagsForResource")
-PutCodeBinding = Action("PutCodeBinding")
-PutResourcePolicy = Action("PutResourcePolicy")
-SearchSchemas = Action("SearchSchemas")
-StartDiscoverer = Action("StartDiscoverer")
-StopDiscoverer = Action("StopDiscoverer")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateDiscoverer = Action("UpdateDiscoverer")
-UpdateRegistry = Action("UpdateRegistry")
-UpdateSchema = Action("UpdateSchema")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
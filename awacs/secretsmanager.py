@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,22 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelRotateSecret = Action("CancelRotateSecret")
-CreateSecret = Action("CreateSecret")
-DeleteResourcePolicy = Action("DeleteResourcePolicy")
-DeleteSecret = Action("DeleteSecret")
-DescribeSecret = Action("DescribeSecret")
-GetRandomPassword = Action("GetRandomPassword")
-GetResourcePolicy = Action("GetResourcePolicy")
-GetSecretValue = Action("GetSecretValue")
-ListSecretVersionIds = Action("ListSecretVersionIds")
-ListSecrets = Action("ListSecrets")
-PutResourcePolicy = Action("PutResourcePolicy")
-PutSecretValue = Action("PutSecretValue")
-RestoreSecret = Action("RestoreSecret")
-RotateSecret = Action("RotateSecret")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateSecret = Action("UpdateSecret")
-UpdateSecretVersionStage = Action("UpdateSecretVersionStage")
-ValidateResourcePolicy = Action("ValidateResourcePolicy")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,59 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AcceptInvitation = Action("AcceptInvitation")
-BatchDisableStandards = Action("BatchDisableStandards")
-BatchEnableStandards = Action("BatchEnableStandards")
-BatchImportFindings = Action("BatchImportFindings")
-BatchUpdateFindings = Action("BatchUpdateFindings")
-CreateActionTarget = Action("CreateActionTarget")
-CreateInsight = Action("CreateInsight")
-CreateMembers = Action("CreateMembers")
-DeclineInvitations = Action("DeclineInvitations")
-DeleteActionTarget = Action("DeleteActionTarget")
-DeleteInsight = Action("DeleteInsight")
-DeleteInvitations = Action("DeleteInvitations")
-DeleteMembers = Action("DeleteMembers")
-DescribeActionTargets = Action("DescribeActionTargets")
-DescribeHub = Action("DescribeHub")
-DescribeOrganizationConfiguration = Action("DescribeOrganizationConfiguration")
-DescribeProducts = Action("DescribeProducts")
-DescribeStandards = Action("DescribeStandards")
-DescribeStandardsControls = Action("DescribeStandardsControls")
-DisableImportFindingsForProduct = Action("DisableImportFindingsForProduct")
-DisableOrganizationAdminAccount = Action("DisableOrganizationAdminAccount")
-DisableSecurityHub = Action("DisableSecurityHub")
-DisassociateFromMasterAccount = Action("DisassociateFromMasterAccount")
-DisassociateMembers = Action("DisassociateMembers")
-EnableImportFindingsForProduct = Action("EnableImportFindingsForProduct")
-EnableOrganizationAdminAccount = Action("EnableOrganizationAdminAccount")
-EnableSecurityHub = Action("EnableSecurityHub")
-GetAdhocInsightResults = Action("GetAdhocInsightResults")
-GetEnabledStandards = Action("GetEnabledStandards")
-GetFindings = Action("GetFindings")
-GetFreeTrialEndDate = Action("GetFreeTrialEndDate")
-GetFreeTrialUsage = Action("GetFreeTrialUsage")
-GetInsightFindingTrend = Action("GetInsightFindingTrend")
-GetInsightResults = Action("GetInsightResults")
-GetInsights = Action("GetInsights")
-GetInvitationsCount = Action("GetInvitationsCount")
-GetMasterAccount = Action("GetMasterAccount")
-GetMembers = Action("GetMembers")
-GetUsage = Action("GetUsage")
-InviteMembers = Action("InviteMembers")
-ListEnabledProductsForImport = Action("ListEnabledProductsForImport")
-ListInvitations = Action("ListInvitations")
-ListMembers = Action("ListMembers")
-ListOrganizationAdminAccounts = Action("ListOrganizationAdminAccounts")
-ListProductSubscribers = Action("ListProductSubscribers")
-ListTagsForResource = Action("ListTagsForResource")
-SendFindingEvents = Action("SendFindingEvents")
-SendInsightEvents = Action("SendInsightEvents")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateActionTarget = Action("UpdateActionTarget")
-UpdateFindings = Action("UpdateFindings")
-UpdateInsight = Action("UpdateInsight")
-UpdateOrganizationConfiguration = Action("UpdateOrganizationConfiguration")
-UpdateSecurityHubConfiguration = Action("UpdateSecurityHubConfiguration")
-UpdateStandardsControl = Action("UpdateStandardsControl")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
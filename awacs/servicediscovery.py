@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateHttpNamespace = Action("CreateHttpNamespace")
-CreatePrivateDnsNamespace = Action("CreatePrivateDnsNamespace")
-CreatePublicDnsNamespace = Action("CreatePublicDnsNamespace")
-CreateService = Action("CreateService")
-DeleteNamespace = Action("DeleteNamespace")
-DeleteService = Action("DeleteService")
-DeregisterInstance = Action("DeregisterInstance")
-DiscoverInstances = Action("DiscoverInstances")
-GetInstance = Action("GetInstance")
-GetInstancesHealthStatus = Action("GetInstancesHealthStatus")
-GetNamespace = Action("GetNamespace")
-GetOperation = Action("GetOperation")
-GetService = Action("GetService")
-ListInstances = Action("ListInstances")
-ListNamespaces = Action("ListNamespaces")
-ListOperations = Action("ListOperations")
-ListServices = Action("ListServices")
-ListTagsForResource = Action("ListTagsForResource")
-RegisterInstance = Action("RegisterInstance")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateInstanceCustomHealthStatus = Action("UpdateInstanceCustomHealthStatus")
-UpdateInstanceHeartbeatStatus = Action("UpdateInstanceHeartbeatStatus")
-UpdateService = Action("UpdateService")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,153 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CloneReceiptRuleSet = Action("CloneReceiptRuleSet")
-CreateConfigurationSet = Action("CreateConfigurationSet")
-CreateConfigurationSetEventDestination = Action(
-    "CreateConfigurationSetEventDestination"
-)
-CreateConfigurationSetTrackingOptions = Action("CreateConfigurationSetTrackingOptions")
-CreateContact = Action("CreateContact")
-CreateContactList = Action("CreateContactList")
-CreateCustomVerificationEmailTemplate = Action("CreateCustomVerificationEmailTemplate")
-CreateDedicatedIpPool = Action("CreateDedicatedIpPool")
-CreateDeliverabilityTestReport = Action("CreateDeliverabilityTestReport")
-CreateEmailIdentity = Action("CreateEmailIdentity")
-CreateEmailIdentityPolicy = Action("CreateEmailIdentityPolicy")
-CreateEmailTemplate = Action("CreateEmailTemplate")
-CreateImportJob = Action("CreateImportJob")
-CreateReceiptFilter = Action("CreateReceiptFilter")
-CreateReceiptRule = Action("CreateReceiptRule")
-CreateReceiptRuleSet = Action("CreateReceiptRuleSet")
-CreateTemplate = Action("CreateTemplate")
-DeleteConfigurationSet = Action("DeleteConfigurationSet")
-DeleteConfigurationSetEventDestination = Action(
-    "DeleteConfigurationSetEventDestination"
-)
-DeleteConfigurationSetTrackingOptions = Action("DeleteConfigurationSetTrackingOptions")
-DeleteContact = Action("DeleteContact")
-DeleteContactList = Action("DeleteContactList")
-DeleteCustomVerificationEmailTemplate = Action("DeleteCustomVerificationEmailTemplate")
-DeleteDedicatedIpPool = Action("DeleteDedicatedIpPool")
-DeleteEmailIdentity = Action("DeleteEmailIdentity")
-DeleteEmailIdentityPolicy = Action("DeleteEmailIdentityPolicy")
-DeleteEmailTemplate = Action("DeleteEmailTemplate")
-DeleteIdentity = Action("DeleteIdentity")
-DeleteIdentityPolicy = Action("DeleteIdentityPolicy")
-DeleteReceiptFilter = Action("DeleteReceiptFilter")
-DeleteReceiptRule = Action("DeleteReceiptRule")
-DeleteReceiptRuleSet = Action("DeleteReceiptRuleSet")
-DeleteSuppressedDestination = Action("DeleteSuppressedDestination")
-DeleteTemplate = Action("DeleteTemplate")
-DeleteVerifiedEmailAddress = Action("DeleteVerifiedEmailAddress")
-DescribeActiveReceiptRuleSet = Action("DescribeActiveReceiptRuleSet")
-DescribeConfigurationSet = Action("DescribeConfigurationSet")
-DescribeReceiptRule = Action("DescribeReceiptRule")
-DescribeReceiptRuleSet = Action("DescribeReceiptRuleSet")
-GetAccount = Action("GetAccount")
-GetAccountSendingEnabled = Action("GetAccountSendingEnabled")
-GetBlacklistReports = Action("GetBlacklistReports")
-GetConfigurationSet = Action("GetConfigurationSet")
-GetConfigurationSetEventDestinations = Action("GetConfigurationSetEventDestinations")
-GetContact = Action("GetContact")
-GetContactList = Action("GetContactList")
-GetCustomVerificationEmailTemplate = Action("GetCustomVerificationEmailTemplate")
-GetDedicatedIp = Action("GetDedicatedIp")
-GetDedicatedIps = Action("GetDedicatedIps")
-GetDeliverabilityDashboardOptions = Action("GetDeliverabilityDashboardOptions")
-GetDeliverabilityTestReport = Action("GetDeliverabilityTestReport")
-GetDomainDeliverabilityCampaign = Action("GetDomainDeliverabilityCampaign")
-GetDomainStatisticsReport = Action("GetDomainStatisticsReport")
-GetEmailIdentity = Action("GetEmailIdentity")
-GetEmailIdentityPolicies = Action("GetEmailIdentityPolicies")
-GetEmailTemplate = Action("GetEmailTemplate")
-GetIdentityDkimAttributes = Action("GetIdentityDkimAttributes")
-GetIdentityMailFromDomainAttributes = Action("GetIdentityMailFromDomainAttributes")
-GetIdentityNotificationAttributes = Action("GetIdentityNotificationAttributes")
-GetIdentityPolicies = Action("GetIdentityPolicies")
-GetIdentityVerificationAttributes = Action("GetIdentityVerificationAttributes")
-GetImportJob = Action("GetImportJob")
-GetSendQuota = Action("GetSendQuota")
-GetSendStatistics = Action("GetSendStatistics")
-GetSuppressedDestination = Action("GetSuppressedDestination")
-GetTemplate = Action("GetTemplate")
-ListConfigurationSets = Action("ListConfigurationSets")
-ListContactLists = Action("ListContactLists")
-ListContacts = Action("ListContacts")
-ListCustomVerificationEmailTemplates = Action("ListCustomVerificationEmailTemplates")
-ListDedicatedIpPools = Action("ListDedicatedIpPools")
-ListDeliverabilityTestReports = Action("ListDeliverabilityTestReports")
-ListDomainDeliverabilityCampaigns = Action("ListDomainDeliverabilityCampaigns")
-ListEmailIdentities = Action("ListEmailIdentities")
-ListEmailTemplates = Action("ListEmailTemplates")
-ListIdentities = Action("ListIdentities")
-ListIdentityPolicies = Action("ListIdentityPolicies")
-ListImportJobs = Action("ListImportJobs")
-ListReceiptFilters = Action("ListReceiptFilters")
-ListReceiptRuleSets = Action("ListReceiptRuleSets")
-ListSuppressedDestinations = Action("ListSuppressedDestinations")
-ListTagsForResource = Action("ListTagsForResource")
-ListTemplates = Action("ListTemplates")
-ListVerifiedEmailAddresses = Action("ListVerifiedEmailAddresses")
-PutAccountDedicatedIpWarmupAttributes = Action("PutAccountDedicatedIpWarmupAttributes")
-PutAccountDetails = Action("PutAccountDetails")
-PutAccountSendingAttributes = Action("PutAccountSendingAttributes")
-PutAccountSuppressionAttributes = Action("PutAccountSuppressionAttributes")
-PutConfigurationSetDeliveryOptions = Action("PutConfigurationSetDeliveryOptions")
-PutConfigurationSetReputationOptions = Action("PutConfigurationSetReputationOptions")
-PutConfigurationSetSendingOptions = Action("PutConfigurationSetSendingOptions")
-PutConfigurationSetSuppressionOptions = Action("PutConfigurationSetSuppressionOptions")
-PutConfigurationSetTrackingOptions = Action("PutConfigurationSetTrackingOptions")
-PutDedicatedIpInPool = Action("PutDedicatedIpInPool")
-PutDedicatedIpWarmupAttributes = Action("PutDedicatedIpWarmupAttributes")
-PutDeliverabilityDashboardOption = Action("PutDeliverabilityDashboardOption")
-PutEmailIdentityConfigurationSetAttributes = Action(
-    "PutEmailIdentityConfigurationSetAttributes"
-)
-PutEmailIdentityDkimAttributes = Action("PutEmailIdentityDkimAttributes")
-PutEmailIdentityDkimSigningAttributes = Action("PutEmailIdentityDkimSigningAttributes")
-PutEmailIdentityFeedbackAttributes = Action("PutEmailIdentityFeedbackAttributes")
-PutEmailIdentityMailFromAttributes = Action("PutEmailIdentityMailFromAttributes")
-PutIdentityPolicy = Action("PutIdentityPolicy")
-PutSuppressedDestination = Action("PutSuppressedDestination")
-ReorderReceiptRuleSet = Action("ReorderReceiptRuleSet")
-SendBounce = Action("SendBounce")
-SendBulkEmail = Action("SendBulkEmail")
-SendBulkTemplatedEmail = Action("SendBulkTemplatedEmail")
-SendCustomVerificationEmail = Action("SendCustomVerificationEmail")
-SendEmail = Action("SendEmail")
-SendRawEmail = Action("SendRawEmail")
-SendTemplatedEmail = Action("SendTemplatedEmail")
-SetActiveReceiptRuleSet = Action("SetActiveReceiptRuleSet")
-SetIdentityDkimEnabled = Action("SetIdentityDkimEnabled")
-SetIdentityFeedbackForwardingEnabled = Action("SetIdentityFeedbackForwardingEnabled")
-SetIdentityHeadersInNotificationsEnabled = Action(
-    "SetIdentityHeadersInNotificationsEnabled"
-)
-SetIdentityMailFromDomain = Action("SetIdentityMailFromDomain")
-SetIdentityNotificationTopic = Action("SetIdentityNotificationTopic")
-SetReceiptRulePosition = Action("SetReceiptRulePosition")
-TagResource = Action("TagResource")
-TestRenderEmailTemplate = Action("TestRenderEmailTemplate")
-TestRenderTemplate = Action("TestRenderTemplate")
-UntagResource = Action("UntagResource")
-UpdateAccountSendingEnabled = Action("UpdateAccountSendingEnabled")
-UpdateConfigurationSetEventDestination = Action(
-    "UpdateConfigurationSetEventDestination"
-)
-UpdateConfigurationSetReputationMetricsEnabled = Action(
-    "UpdateConfigurationSetReputationMetricsEnabled"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-UpdateConfigurationSetSendingEnabled = Action("UpdateConfigurationSetSendingEnabled")
-UpdateConfigurationSetTrackingOptions = Action("UpdateConfigurationSetTrackingOptions")
-UpdateContact = Action("UpdateContact")
-UpdateContactList = Action("UpdateContactList")
-UpdateCustomVerificationEmailTemplate = Action("UpdateCustomVerificationEmailTemplate")
-UpdateEmailIdentityPolicy = Action("UpdateEmailIdentityPolicy")
-UpdateEmailTemplate = Action("UpdateEmailTemplate")
-UpdateReceiptRule = Action("UpdateReceiptRule")
-UpdateTemplate = Action("UpdateTemplate")
-VerifyDomainDkim = Action("VerifyDomainDkim")
-VerifyDomainIdentity = Action("VerifyDomainIdentity")
-VerifyEmailAddress = Action("VerifyEmailAddress")
-VerifyEmailIdentity = Action("VerifyEmailIdentity")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
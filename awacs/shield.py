@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,21 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateDRTLogBucket = Action("AssociateDRTLogBucket")
-AssociateDRTRole = Action("AssociateDRTRole")
-CreateProtection = Action("CreateProtection")
-CreateSubscription = Action("CreateSubscription")
-DeleteProtection = Action("DeleteProtection")
-DeleteSubscription = Action("DeleteSubscription")
-DescribeAttack = Action("DescribeAttack")
-DescribeDRTAccess = Action("DescribeDRTAccess")
-DescribeEmergencyContactSettings = Action("DescribeEmergencyContactSettings")
-DescribeProtection = Action("DescribeProtection")
-DescribeSubscription = Action("DescribeSubscription")
-DisassociateDRTLogBucket = Action("DisassociateDRTLogBucket")
-DisassociateDRTRole = Action("DisassociateDRTRole")
-GetSubscriptionState = Action("GetSubscriptionState")
-ListAttacks = Action("ListAttacks")
-ListProtections = Action("ListProtections")
-UpdateEmergencyContactSettings = Action("UpdateEmergencyContactSettings")
-UpdateSubscription = Action("UpdateSubscription")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
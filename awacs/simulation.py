@@ -0,0 +1,157 @@
+# Copyright (c) 2012-2021, Mark Peek <mark@peek.org>
+# All rights reserved.
+#
+# See LICENSE file for full license.
+
+"""Batch simulation of the actions allowed by sets of policies.
+
+Every catalog action has an index, see awacs.catalog.action_index(), and
+the actions covered by a statement are a bit-vector over these indexes, the
+bits of an ActionSet. The bit-vectors are Python integers, whose bitwise
+operators work on the whole vector at once, so no extra dependency is
+needed. Each Policy is compiled once into the allow and deny vectors of its
+statements, cached on the Policy.
+
+simulate() then answers "which actions does each role allow on this
+resource" with one OR per applicable statement and one AND NOT per role.
+The resulting ActionSets can be streamed to a file with dump_matrix(), or
+turned into a NumPy matrix with to_numpy() when NumPy is installed.
+"""
+
+from typing import (
+    IO,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Union,
+)
+
+from . import catalog
+from .actionset import ActionSet, statement_bits
+from .aws import Deny, _as_list
+from .evaluation import Matcher, PolicyLike, Request, compile_statement
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Roles and their policies, as a mapping or (name, policies) pairs
+Roles = Union[Mapping[Any, Iterable[PolicyLike]], Iterable[Tuple[Any, Any]]]
+
+# Rows of a matrix: ActionSets, bit-vectors or the pairs yielded by simulate()
+Rows = Iterable[Union[ActionSet, int, Tuple[Any, ActionSet]]]
+
+
+class PolicyCoverage:
+    """The statements of a policy as action bit-vectors, see coverage()."""
+
+    def __init__(self, policy: PolicyLike) -> None:
+        data = policy if isinstance(policy, dict) else policy._properties_data()
+        # (deny, actions, matcher of everything but the action)
+        self.statements: List[Tuple[bool, int, Matcher]] = []
+        for statement in _as_list(data.get("Statement", [])):
+            rest = {
+                k: v for k, v in statement.items() if k not in ("Action", "NotAction")
+            }
+            self.statements.append(
+                (
+                    statement.get("Effect") == Deny,
+                    statement_bits(statement),
+                    compile_statement(rest),
+                )
+            )
+
+    def actions(self, request: Request) -> Tuple[int, int]:
+        """Return the allowed and denied action bit-vectors for a request.
+
+        The action of the request is ignored.
+        """
+        allow = deny = 0
+        for is_deny, bits, matches in self.statements:
+            if matches(request):
+                if is_deny:
+                    deny |= bits
+                else:
+                    allow |= bits
+        return allow, deny
+
+
+def coverage(policy: PolicyLike) -> PolicyCoverage:
+    """Return the compiled coverage of a policy, cached on a Policy."""
+    if isinstance(policy, dict):
+        return PolicyCoverage(policy)
+    cache = policy._cached()
+    try:
+        return cache["coverage"]
+    except KeyError:
+        result = cache["coverage"] = PolicyCoverage(policy)
+        return result
+
+
+def simulate(
+    roles: Roles,
+    resource: str = "*",
+    principal: Union[str, Mapping[str, Any]] = None,
+    context: Mapping[str, Any] = None,
+) -> Iterator[Tuple[Any, ActionSet]]:
+    """Yield (role, ActionSet of the allowed actions) for each role.
+
+    An action is allowed for a role if a statement of one of its policies
+    allows it on the resource and none denies it, as evaluate() decides
+    for each action.
+    """
+    request = Request("*", resource, principal, context)
+    items = roles.items() if isinstance(roles, Mapping) else roles
+    for name, policies in items:
+        if isinstance(policies, dict) or not isinstance(policies, Iterable):
+            policies = [policies]
+        allow = deny = 0
+        for policy in policies:
+            policy_allow, policy_deny = coverage(policy).actions(request)
+            allow |= policy_allow
+            deny |= policy_deny
+        yield name, ActionSet.from_bits(allow & ~deny)
+
+
+def row_size() -> int:
+    """Return the size in bytes of a row written by dump_matrix()."""
+    return (len(catalog.action_names()) + 7) // 8
+
+
+def dump_matrix(rows: Rows, fp: IO[bytes]) -> int:
+    """Write ActionSets, or the (role, actions) pairs of simulate(), to a file.
+
+    Each row is written as row_size() bytes, the bit of the action with
+    index i being bit i % 8 of byte i // 8, the layout of
+    numpy.packbits(..., bitorder="little"). Returns the number of rows.
+    """
+    size = row_size()
+    count = 0
+    for row in rows:
+        fp.write(_row_bits(row).to_bytes(size, "little"))
+        count += 1
+    return count
+
+
+def to_numpy(rows: Rows) -> Any:
+    """Return a boolean NumPy matrix of ActionSets, one row per set.
+
+    The column of an action is its catalog index. Requires NumPy.
+    """
+    if numpy is None:
+        raise ImportError("to_numpy() requires NumPy")
+    size = row_size()
+    data = b"".join(_row_bits(row).to_bytes(size, "little") for row in rows)
+    packed = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, size)
+    matrix = numpy.unpackbits(packed, axis=1, bitorder="little")
+    return matrix[:, : len(catalog.action_names())].astype(bool)
+
+
+def _row_bits(row: Union[ActionSet, int, Tuple[Any, ActionSet]]) -> int:
+    if isinstance(row, tuple):
+        row = row[1]
+    return row if isinstance(row, int) else row.bits
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,41 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateApp = Action("CreateApp")
-CreateReplicationJob = Action("CreateReplicationJob")
-DeleteApp = Action("DeleteApp")
-DeleteAppLaunchConfiguration = Action("DeleteAppLaunchConfiguration")
-DeleteAppReplicationConfiguration = Action("DeleteAppReplicationConfiguration")
-DeleteAppValidationConfiguration = Action("DeleteAppValidationConfiguration")
-DeleteReplicationJob = Action("DeleteReplicationJob")
-DeleteServerCatalog = Action("DeleteServerCatalog")
-DisassociateConnector = Action("DisassociateConnector")
-DisassociateConnectors = Action("DisassociateConnectors")
-GenerateChangeSet = Action("GenerateChangeSet")
-GenerateTemplate = Action("GenerateTemplate")
-GetApp = Action("GetApp")
-GetAppLaunchConfiguration = Action("GetAppLaunchConfiguration")
-GetAppReplicationConfiguration = Action("GetAppReplicationConfiguration")
-GetAppValidationConfiguration = Action("GetAppValidationConfiguration")
-GetAppValidationOutput = Action("GetAppValidationOutput")
-GetConnectors = Action("GetConnectors")
-GetMessages = Action("GetMessages")
-GetReplicationJobs = Action("GetReplicationJobs")
-GetReplicationRuns = Action("GetReplicationRuns")
-GetServers = Action("GetServers")
-ImportAppCatalog = Action("ImportAppCatalog")
-ImportServerCatalog = Action("ImportServerCatalog")
-LaunchApp = Action("LaunchApp")
-ListApps = Action("ListApps")
-NotifyAppValidationOutput = Action("NotifyAppValidationOutput")
-PutAppLaunchConfiguration = Action("PutAppLaunchConfiguration")
-PutAppReplicationConfiguration = Action("PutAppReplicationConfiguration")
-PutAppValidationConfiguration = Action("PutAppValidationConfiguration")
-SendMessage = Action("SendMessage")
-StartAppReplication = Action("StartAppReplication")
-StartOnDemandAppReplication = Action("StartOnDemandAppReplication")
-StartOnDemandReplicationRun = Action("StartOnDemandReplicationRun")
-StopAppReplication = Action("StopAppReplication")
-TerminateApp = Action("TerminateApp")
-UpdateApp = Action("UpdateApp")
-UpdateReplicationJob = Action("UpdateReplicationJob")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
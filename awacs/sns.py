@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddPermission = Action("AddPermission")
-CheckIfPhoneNumberIsOptedOut = Action("CheckIfPhoneNumberIsOptedOut")
-ConfirmSubscription = Action("ConfirmSubscription")
-CreatePlatformApplication = Action("CreatePlatformApplication")
-CreatePlatformEndpoint = Action("CreatePlatformEndpoint")
-CreateTopic = Action("CreateTopic")
-DeleteEndpoint = Action("DeleteEndpoint")
-DeletePlatformApplication = Action("DeletePlatformApplication")
-DeleteTopic = Action("DeleteTopic")
-GetEndpointAttributes = Action("GetEndpointAttributes")
-GetPlatformApplicationAttributes = Action("GetPlatformApplicationAttributes")
-GetSMSAttributes = Action("GetSMSAttributes")
-GetSubscriptionAttributes = Action("GetSubscriptionAttributes")
-GetTopicAttributes = Action("GetTopicAttributes")
-ListEndpointsByPlatformApplication = Action("ListEndpointsByPlatformApplication")
-ListPhoneNumbersOptedOut = Action("ListPhoneNumbersOptedOut")
-ListPlatformApplications = Action("ListPlatformApplications")
-ListSubscriptions = Action("ListSubscriptions")
-ListSubscriptionsByTopic = Action("ListSubscriptionsByTopic")
-ListTagsForResource = Action("ListTagsForResource")
-ListTopics = Action("ListTopics")
-OptInPhoneNumber = Action("OptInPhoneNumber")
-Publish = Action("Publish")
-RemovePermission = Action("RemovePermission")
-SetEndpointAttributes = Action("SetEndpointAttributes")
-SetPlatformApplicationAttributes = Action("SetPlatformApplicationAttributes")
-SetSMSAttributes = Action("SetSMSAttributes")
-SetSubscriptionAttributes = Action("SetSubscriptionAttributes")
-SetTopicAttributes = Action("SetTopicAttributes")
-Subscribe = Action("Subscribe")
-TagResource = Action("TagResource")
-Unsubscribe = Action("Unsubscribe")
-UntagResource = Action("UntagResource")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
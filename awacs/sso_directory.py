@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,67 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddMemberToGroup = Action("AddMemberToGroup")
-CompleteVirtualMfaDeviceRegistration = Action("CompleteVirtualMfaDeviceRegistration")
-CompleteWebAuthnDeviceRegistration = Action("CompleteWebAuthnDeviceRegistration")
-CreateAlias = Action("CreateAlias")
-CreateBearerToken = Action("CreateBearerToken")
-CreateExternalIdPConfigurationForDirectory = Action(
-    "CreateExternalIdPConfigurationForDirectory"
-)
-CreateGroup = Action("CreateGroup")
-CreateProvisioningTenant = Action("CreateProvisioningTenant")
-CreateUser = Action("CreateUser")
-DeleteBearerToken = Action("DeleteBearerToken")
-DeleteExternalIdPCertificate = Action("DeleteExternalIdPCertificate")
-DeleteExternalIdPConfigurationForDirectory = Action(
-    "DeleteExternalIdPConfigurationForDirectory"
-)
-DeleteGroup = Action("DeleteGroup")
-DeleteMfaDeviceForUser = Action("DeleteMfaDeviceForUser")
-DeleteProvisioningTenant = Action("DeleteProvisioningTenant")
-DeleteUser = Action("DeleteUser")
-DescribeDirectory = Action("DescribeDirectory")
-DescribeGroup = Action("DescribeGroup")
-DescribeGroups = Action("DescribeGroups")
-DescribeProvisioningTenant = Action("DescribeProvisioningTenant")
-DescribeUser = Action("DescribeUser")
-DescribeUserByUniqueAttribute = Action("DescribeUserByUniqueAttribute")
-DescribeUsers = Action("DescribeUsers")
-DisableExternalIdPConfigurationForDirectory = Action(
-    "DisableExternalIdPConfigurationForDirectory"
-)
-DisableUser = Action("DisableUser")
-EnableExternalIdPConfigurationForDirectory = Action(
-    "EnableExternalIdPConfigurationForDirectory"
-)
-EnableUser = Action("EnableUser")
-GetAWSSPConfigurationForDirectory = Action("GetAWSSPConfigurationForDirectory")
-GetUserPoolInfo = Action("GetUserPoolInfo")
-ImportExternalIdPCertificate = Action("ImportExternalIdPCertificate")
-IsMemberInGroup = Action("IsMemberInGroup")
-ListBearerTokens = Action("ListBearerTokens")
-ListExternalIdPCertificates = Action("ListExternalIdPCertificates")
-ListExternalIdPConfigurationsForDirectory = Action(
-    "ListExternalIdPConfigurationsForDirectory"
-)
-ListGroupsForMember = Action("ListGroupsForMember")
-ListGroupsForUser = Action("ListGroupsForUser")
-ListMembersInGroup = Action("ListMembersInGroup")
-ListMfaDevicesForUser = Action("ListMfaDevicesForUser")
-ListProvisioningTenants = Action("ListProvisioningTenants")
-RemoveMemberFromGroup = Action("RemoveMemberFromGroup")
-SearchGroups = Action("SearchGroups")
-SearchUsers = Action("SearchUsers")
-StartVirtualMfaDeviceRegistration = Action("StartVirtualMfaDeviceRegistration")
-StartWebAuthnDeviceRegistration = Action("StartWebAuthnDeviceRegistration")
-UpdateExternalIdPConfigurationForDirectory = Action(
-    "UpdateExternalIdPConfigurationForDirectory"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-UpdateGroup = Action("UpdateGroup")
-UpdateGroupDisplayName = Action("UpdateGroupDisplayName")
-UpdateMfaDeviceForUser = Action("UpdateMfaDeviceForUser")
-UpdatePassword = Action("UpdatePassword")
-UpdateUser = Action("UpdateUser")
-UpdateUserName = Action("UpdateUserName")
-VerifyEmail = Action("VerifyEmail")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
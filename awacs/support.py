@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,27 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AddAttachmentsToSet = Action("AddAttachmentsToSet")
-AddCommunicationToCase = Action("AddCommunicationToCase")
-CreateCase = Action("CreateCase")
-DescribeAttachment = Action("DescribeAttachment")
-DescribeCaseAttributes = Action("DescribeCaseAttributes")
-DescribeCases = Action("DescribeCases")
-DescribeCommunications = Action("DescribeCommunications")
-DescribeIssueTypes = Action("DescribeIssueTypes")
-DescribeServices = Action("DescribeServices")
-DescribeSeverityLevels = Action("DescribeSeverityLevels")
-DescribeSupportLevel = Action("DescribeSupportLevel")
-DescribeTrustedAdvisorCheckRefreshStatuses = Action(
-    "DescribeTrustedAdvisorCheckRefreshStatuses"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-DescribeTrustedAdvisorCheckResult = Action("DescribeTrustedAdvisorCheckResult")
-DescribeTrustedAdvisorCheckSummaries = Action("DescribeTrustedAdvisorCheckSummaries")
-DescribeTrustedAdvisorChecks = Action("DescribeTrustedAdvisorChecks")
-InitiateCallForCase = Action("InitiateCallForCase")
-InitiateChatForCase = Action("InitiateChatForCase")
-PutCaseAttributes = Action("PutCaseAttributes")
-RateCaseCommunication = Action("RateCaseCommunication")
-RefreshTrustedAdvisorCheck = Action("RefreshTrustedAdvisorCheck")
-ResolveCase = Action("ResolveCase")
-SearchForCases = Action("SearchForCases")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,51 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CancelTimer = Action("CancelTimer")
-CancelWorkflowExecution = Action("CancelWorkflowExecution")
-CompleteWorkflowExecution = Action("CompleteWorkflowExecution")
-ContinueAsNewWorkflowExecution = Action("ContinueAsNewWorkflowExecution")
-CountClosedWorkflowExecutions = Action("CountClosedWorkflowExecutions")
-CountOpenWorkflowExecutions = Action("CountOpenWorkflowExecutions")
-CountPendingActivityTasks = Action("CountPendingActivityTasks")
-CountPendingDecisionTasks = Action("CountPendingDecisionTasks")
-DeprecateActivityType = Action("DeprecateActivityType")
-DeprecateDomain = Action("DeprecateDomain")
-DeprecateWorkflowType = Action("DeprecateWorkflowType")
-DescribeActivityType = Action("DescribeActivityType")
-DescribeDomain = Action("DescribeDomain")
-DescribeWorkflowExecution = Action("DescribeWorkflowExecution")
-DescribeWorkflowType = Action("DescribeWorkflowType")
-FailWorkflowExecution = Action("FailWorkflowExecution")
-GetWorkflowExecutionHistory = Action("GetWorkflowExecutionHistory")
-ListActivityTypes = Action("ListActivityTypes")
-ListClosedWorkflowExecutions = Action("ListClosedWorkflowExecutions")
-ListDomains = Action("ListDomains")
-ListOpenWorkflowExecutions = Action("ListOpenWorkflowExecutions")
-ListTagsForResource = Action("ListTagsForResource")
-ListWorkflowTypes = Action("ListWorkflowTypes")
-PollForActivityTask = Action("PollForActivityTask")
-PollForDecisionTask = Action("PollForDecisionTask")
-RecordActivityTaskHeartbeat = Action("RecordActivityTaskHeartbeat")
-RecordMarker = Action("RecordMarker")
-RegisterActivityType = Action("RegisterActivityType")
-RegisterDomain = Action("RegisterDomain")
-RegisterWorkflowType = Action("RegisterWorkflowType")
-RequestCancelActivityTask = Action("RequestCancelActivityTask")
-RequestCancelExternalWorkflowExecution = Action(
-    "RequestCancelExternalWorkflowExecution"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-RequestCancelWorkflowExecution = Action("RequestCancelWorkflowExecution")
-RespondActivityTaskCanceled = Action("RespondActivityTaskCanceled")
-RespondActivityTaskCompleted = Action("RespondActivityTaskCompleted")
-RespondActivityTaskFailed = Action("RespondActivityTaskFailed")
-RespondDecisionTaskCompleted = Action("RespondDecisionTaskCompleted")
-ScheduleActivityTask = Action("ScheduleActivityTask")
-SignalExternalWorkflowExecution = Action("SignalExternalWorkflowExecution")
-SignalWorkflowExecution = Action("SignalWorkflowExecution")
-StartChildWorkflowExecution = Action("StartChildWorkflowExecution")
-StartTimer = Action("StartTimer")
-StartWorkflowExecution = Action("StartWorkflowExecution")
-TagResource = Action("TagResource")
-TerminateWorkflowExecution = Action("TerminateWorkflowExecution")
-UntagResource = Action("UntagResource")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
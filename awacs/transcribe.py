@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,36 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateLanguageModel = Action("CreateLanguageModel")
-CreateMedicalVocabulary = Action("CreateMedicalVocabulary")
-CreateVocabulary = Action("CreateVocabulary")
-CreateVocabularyFilter = Action("CreateVocabularyFilter")
-DeleteLanguageModel = Action("DeleteLanguageModel")
-DeleteMedicalTranscriptionJob = Action("DeleteMedicalTranscriptionJob")
-DeleteMedicalVocabulary = Action("DeleteMedicalVocabulary")
-DeleteTranscriptionJob = Action("DeleteTranscriptionJob")
-DeleteVocabulary = Action("DeleteVocabulary")
-DeleteVocabularyFilter = Action("DeleteVocabularyFilter")
-DescribeLanguageModel = Action("DescribeLanguageModel")
-GetMedicalTranscriptionJob = Action("GetMedicalTranscriptionJob")
-GetMedicalVocabulary = Action("GetMedicalVocabulary")
-GetTranscriptionJob = Action("GetTranscriptionJob")
-GetVocabulary = Action("GetVocabulary")
-GetVocabularyFilter = Action("GetVocabularyFilter")
-ListLanguageModels = Action("ListLanguageModels")
-ListMedicalTranscriptionJobs = Action("ListMedicalTranscriptionJobs")
-ListMedicalVocabularies = Action("ListMedicalVocabularies")
-ListTranscriptionJobs = Action("ListTranscriptionJobs")
-ListVocabularies = Action("ListVocabularies")
-ListVocabularyFilters = Action("ListVocabularyFilters")
-StartMedicalStreamTranscription = Action("StartMedicalStreamTranscription")
-StartMedicalStreamTranscriptionWebSocket = Action(
-    "StartMedicalStreamTranscriptionWebSocket"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-StartMedicalTranscriptionJob = Action("StartMedicalTranscriptionJob")
-StartStreamTranscription = Action("StartStreamTranscription")
-StartStreamTranscriptionWebSocket = Action("StartStreamTranscriptionWebSocket")
-StartTranscriptionJob = Action("StartTranscriptionJob")
-UpdateMedicalVocabulary = Action("UpdateMedicalVocabulary")
-UpdateVocabulary = Action("UpdateVocabulary")
-UpdateVocabularyFilter = Action("UpdateVocabularyFilter")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,23 +25,21 @@ class ARN(BaseARN):
         )
 
 
-CreateServer = Action("CreateServer")
-CreateUser = Action("CreateUser")
-DeleteServer = Action("DeleteServer")
-DeleteSshPublicKey = Action("DeleteSshPublicKey")
-DeleteUser = Action("DeleteUser")
-DescribeSecurityPolicy = Action("DescribeSecurityPolicy")
-DescribeServer = Action("DescribeServer")
-DescribeUser = Action("DescribeUser")
-ImportSshPublicKey = Action("ImportSshPublicKey")
-ListSecurityPolicies = Action("ListSecurityPolicies")
-ListServers = Action("ListServers")
-ListTagsForResource = Action("ListTagsForResource")
-ListUsers = Action("ListUsers")
-StartServer = Action("StartServer")
-StopServer = Action("StopServer")
-TagResource = Action("TagResource")
-TestIdentityProvider = Action("TestIdentityProvider")
-UntagResource = Action("UntagResource")
-UpdateServer = Action("UpdateServer")
-UpdateUser = Action("UpdateUser")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
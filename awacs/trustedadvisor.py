@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,24 +25,21 @@ class ARN(BaseARN):
         )
 
 
-DescribeAccount = Action("DescribeAccount")
-DescribeAccountAccess = Action("DescribeAccountAccess")
-DescribeCheckItems = Action("DescribeCheckItems")
-DescribeCheckRefreshStatuses = Action("DescribeCheckRefreshStatuses")
-DescribeCheckSummaries = Action("DescribeCheckSummaries")
-DescribeChecks = Action("DescribeChecks")
-DescribeNotificationPreferences = Action("DescribeNotificationPreferences")
-DescribeOrganization = Action("DescribeOrganization")
-DescribeOrganizationAccounts = Action("DescribeOrganizationAccounts")
-DescribeReports = Action("DescribeReports")
-DescribeServiceMetadata = Action("DescribeServiceMetadata")
-ExcludeCheckItems = Action("ExcludeCheckItems")
-GenerateReport = Action("GenerateReport")
-IncludeCheckItems = Action("IncludeCheckItems")
-ListAccountsForParent = Action("ListAccountsForParent")
-ListOrganizationalUnitsForParent = Action("ListOrganizationalUnitsForParent")
-ListRoots = Action("ListRoots")
-RefreshCheck = Action("RefreshCheck")
-SetAccountAccess = Action("SetAccountAccess")
-SetOrganizationAccess = Action("SetOrganizationAccess")
-UpdateNotificationPreferences = Action("UpdateNotificationPreferences")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,84 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateWebACL = Action("AssociateWebACL")
-CreateByteMatchSet = Action("CreateByteMatchSet")
-CreateGeoMatchSet = Action("CreateGeoMatchSet")
-CreateIPSet = Action("CreateIPSet")
-CreateRateBasedRule = Action("CreateRateBasedRule")
-CreateRegexMatchSet = Action("CreateRegexMatchSet")
-CreateRegexPatternSet = Action("CreateRegexPatternSet")
-CreateRule = Action("CreateRule")
-CreateRuleGroup = Action("CreateRuleGroup")
-CreateSizeConstraintSet = Action("CreateSizeConstraintSet")
-CreateSqlInjectionMatchSet = Action("CreateSqlInjectionMatchSet")
-CreateWebACL = Action("CreateWebACL")
-CreateWebACLMigrationStack = Action("CreateWebACLMigrationStack")
-CreateXssMatchSet = Action("CreateXssMatchSet")
-DeleteByteMatchSet = Action("DeleteByteMatchSet")
-DeleteGeoMatchSet = Action("DeleteGeoMatchSet")
-DeleteIPSet = Action("DeleteIPSet")
-DeleteLoggingConfiguration = Action("DeleteLoggingConfiguration")
-DeletePermissionPolicy = Action("DeletePermissionPolicy")
-DeleteRateBasedRule = Action("DeleteRateBasedRule")
-DeleteRegexMatchSet = Action("DeleteRegexMatchSet")
-DeleteRegexPatternSet = Action("DeleteRegexPatternSet")
-DeleteRule = Action("DeleteRule")
-DeleteRuleGroup = Action("DeleteRuleGroup")
-DeleteSizeConstraintSet = Action("DeleteSizeConstraintSet")
-DeleteSqlInjectionMatchSet = Action("DeleteSqlInjectionMatchSet")
-DeleteWebACL = Action("DeleteWebACL")
-DeleteXssMatchSet = Action("DeleteXssMatchSet")
-DisassociateWebACL = Action("DisassociateWebACL")
-GetByteMatchSet = Action("GetByteMatchSet")
-GetChangeToken = Action("GetChangeToken")
-GetChangeTokenStatus = Action("GetChangeTokenStatus")
-GetGeoMatchSet = Action("GetGeoMatchSet")
-GetIPSet = Action("GetIPSet")
-GetLoggingConfiguration = Action("GetLoggingConfiguration")
-GetPermissionPolicy = Action("GetPermissionPolicy")
-GetRateBasedRule = Action("GetRateBasedRule")
-GetRateBasedRuleManagedKeys = Action("GetRateBasedRuleManagedKeys")
-GetRegexMatchSet = Action("GetRegexMatchSet")
-GetRegexPatternSet = Action("GetRegexPatternSet")
-GetRule = Action("GetRule")
-GetRuleGroup = Action("GetRuleGroup")
-GetSampledRequests = Action("GetSampledRequests")
-GetSizeConstraintSet = Action("GetSizeConstraintSet")
-GetSqlInjectionMatchSet = Action("GetSqlInjectionMatchSet")
-GetWebACL = Action("GetWebACL")
-GetWebACLForResource = Action("GetWebACLForResource")
-GetXssMatchSet = Action("GetXssMatchSet")
-ListActivatedRulesInRuleGroup = Action("ListActivatedRulesInRuleGroup")
-ListByteMatchSets = Action("ListByteMatchSets")
-ListGeoMatchSets = Action("ListGeoMatchSets")
-ListIPSets = Action("ListIPSets")
-ListLoggingConfigurations = Action("ListLoggingConfigurations")
-ListRateBasedRules = Action("ListRateBasedRules")
-ListRegexMatchSets = Action("ListRegexMatchSets")
-ListRegexPatternSets = Action("ListRegexPatternSets")
-ListResourcesForWebACL = Action("ListResourcesForWebACL")
-ListRuleGroups = Action("ListRuleGroups")
-ListRules = Action("ListRules")
-ListSizeConstraintSets = Action("ListSizeConstraintSets")
-ListSqlInjectionMatchSets = Action("ListSqlInjectionMatchSets")
-ListSubscribedRuleGroups = Action("ListSubscribedRuleGroups")
-ListTagsForResource = Action("ListTagsForResource")
-ListWebACLs = Action("ListWebACLs")
-ListXssMatchSets = Action("ListXssMatchSets")
-PutLoggingConfiguration = Action("PutLoggingConfiguration")
-PutPermissionPolicy = Action("PutPermissionPolicy")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateByteMatchSet = Action("UpdateByteMatchSet")
-UpdateGeoMatchSet = Action("UpdateGeoMatchSet")
-UpdateIPSet = Action("UpdateIPSet")
-UpdateRateBasedRule = Action("UpdateRateBasedRule")
-UpdateRegexMatchSet = Action("UpdateRegexMatchSet")
-UpdateRegexPatternSet = Action("UpdateRegexPatternSet")
-UpdateRule = Action("UpdateRule")
-UpdateRuleGroup = Action("UpdateRuleGroup")
-UpdateSizeConstraintSet = Action("UpdateSizeConstraintSet")
-UpdateSqlInjectionMatchSet = Action("UpdateSqlInjectionMatchSet")
-UpdateWebACL = Action("UpdateWebACL")
-UpdateXssMatchSet = Action("UpdateXssMatchSet")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,45 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateWebACL = Action("AssociateWebACL")
-CheckCapacity = Action("CheckCapacity")
-CreateIPSet = Action("CreateIPSet")
-CreateRegexPatternSet = Action("CreateRegexPatternSet")
-CreateRuleGroup = Action("CreateRuleGroup")
-CreateWebACL = Action("CreateWebACL")
-DeleteFirewallManagerRuleGroups = Action("DeleteFirewallManagerRuleGroups")
-DeleteIPSet = Action("DeleteIPSet")
-DeleteLoggingConfiguration = Action("DeleteLoggingConfiguration")
-DeletePermissionPolicy = Action("DeletePermissionPolicy")
-DeleteRegexPatternSet = Action("DeleteRegexPatternSet")
-DeleteRuleGroup = Action("DeleteRuleGroup")
-DeleteWebACL = Action("DeleteWebACL")
-DescribeManagedRuleGroup = Action("DescribeManagedRuleGroup")
-DisassociateFirewallManager = Action("DisassociateFirewallManager")
-DisassociateWebACL = Action("DisassociateWebACL")
-GetIPSet = Action("GetIPSet")
-GetLoggingConfiguration = Action("GetLoggingConfiguration")
-GetPermissionPolicy = Action("GetPermissionPolicy")
-GetRateBasedStatementManagedKeys = Action("GetRateBasedStatementManagedKeys")
-GetRegexPatternSet = Action("GetRegexPatternSet")
-GetRuleGroup = Action("GetRuleGroup")
-GetSampledRequests = Action("GetSampledRequests")
-GetWebACL = Action("GetWebACL")
-GetWebACLForResource = Action("GetWebACLForResource")
-ListAvailableManagedRuleGroups = Action("ListAvailableManagedRuleGroups")
-ListIPSets = Action("ListIPSets")
-ListLoggingConfigurations = Action("ListLoggingConfigurations")
-ListRegexPatternSets = Action("ListRegexPatternSets")
-ListResourcesForWebACL = Action("ListResourcesForWebACL")
-ListRuleGroups = Action("ListRuleGroups")
-ListTagsForResource = Action("ListTagsForResource")
-ListWebACLs = Action("ListWebACLs")
-PutFirewallManagerRuleGroups = Action("PutFirewallManagerRuleGroups")
-PutLoggingConfiguration = Action("PutLoggingConfiguration")
-PutPermissionPolicy = Action("PutPermissionPolicy")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateIPSet = Action("UpdateIPSet")
-UpdateRegexPatternSet = Action("UpdateRegexPatternSet")
-UpdateRuleGroup = Action("UpdateRuleGroup")
-UpdateWebACL = Action("UpdateWebACL")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,34 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateLenses = Action("AssociateLenses")
-CreateMilestone = Action("CreateMilestone")
-CreateWorkload = Action("CreateWorkload")
-CreateWorkloadShare = Action("CreateWorkloadShare")
-DeleteWorkload = Action("DeleteWorkload")
-DeleteWorkloadShare = Action("DeleteWorkloadShare")
-DisassociateLenses = Action("DisassociateLenses")
-GetAnswer = Action("GetAnswer")
-GetLensReview = Action("GetLensReview")
-GetLensReviewReport = Action("GetLensReviewReport")
-GetLensVersionDifference = Action("GetLensVersionDifference")
-GetMilestone = Action("GetMilestone")
-GetWorkload = Action("GetWorkload")
-ListAnswers = Action("ListAnswers")
-ListLensReviewImprovements = Action("ListLensReviewImprovements")
-ListLensReviews = Action("ListLensReviews")
-ListLenses = Action("ListLenses")
-ListMilestones = Action("ListMilestones")
-ListNotifications = Action("ListNotifications")
-ListShareInvitations = Action("ListShareInvitations")
-ListTagsForResource = Action("ListTagsForResource")
-ListWorkloadShares = Action("ListWorkloadShares")
-ListWorkloads = Action("ListWorkloads")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAnswer = Action("UpdateAnswer")
-UpdateLensReview = Action("UpdateLensReview")
-UpdateShareInvitation = Action("UpdateShareInvitation")
-UpdateWorkload = Action("UpdateWorkload")
-UpdateWorkloadShare = Action("UpdateWorkloadShare")
-UpgradeLensReview = Action("UpgradeLensReview")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,55 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AbortDocumentVersionUpload = Action("AbortDocumentVersionUpload")
-ActivateUser = Action("ActivateUser")
-AddResourcePermissions = Action("AddResourcePermissions")
-AddUserToGroup = Action("AddUserToGroup")
-CheckAlias = Action("CheckAlias")
-CreateComment = Action("CreateComment")
-CreateCustomMetadata = Action("CreateCustomMetadata")
-CreateFolder = Action("CreateFolder")
-CreateInstance = Action("CreateInstance")
-CreateLabels = Action("CreateLabels")
-CreateNotificationSubscription = Action("CreateNotificationSubscription")
-CreateUser = Action("CreateUser")
-DeactivateUser = Action("DeactivateUser")
-DeleteComment = Action("DeleteComment")
-DeleteCustomMetadata = Action("DeleteCustomMetadata")
-DeleteDocument = Action("DeleteDocument")
-DeleteFolder = Action("DeleteFolder")
-DeleteFolderContents = Action("DeleteFolderContents")
-DeleteInstance = Action("DeleteInstance")
-DeleteLabels = Action("DeleteLabels")
-DeleteNotificationSubscription = Action("DeleteNotificationSubscription")
-DeleteUser = Action("DeleteUser")
-DeregisterDirectory = Action("DeregisterDirectory")
-DescribeActivities = Action("DescribeActivities")
-DescribeAvailableDirectories = Action("DescribeAvailableDirectories")
-DescribeComments = Action("DescribeComments")
-DescribeDocumentVersions = Action("DescribeDocumentVersions")
-DescribeFolderContents = Action("DescribeFolderContents")
-DescribeGroups = Action("DescribeGroups")
-DescribeInstances = Action("DescribeInstances")
-DescribeNotificationSubscriptions = Action("DescribeNotificationSubscriptions")
-DescribeResourcePermissions = Action("DescribeResourcePermissions")
-DescribeRootFolders = Action("DescribeRootFolders")
-DescribeUsers = Action("DescribeUsers")
-DownloadDocumentVersion = Action("DownloadDocumentVersion")
-GetCurrentUser = Action("GetCurrentUser")
-GetDocument = Action("GetDocument")
-GetDocumentPath = Action("GetDocumentPath")
-GetDocumentVersion = Action("GetDocumentVersion")
-GetFolder = Action("GetFolder")
-GetFolderPath = Action("GetFolderPath")
-GetResources = Action("GetResources")
-InitiateDocumentVersionUpload = Action("InitiateDocumentVersionUpload")
-RegisterDirectory = Action("RegisterDirectory")
-RemoveAllResourcePermissions = Action("RemoveAllResourcePermissions")
-RemoveResourcePermission = Action("RemoveResourcePermission")
-RemoveUserFromGroup = Action("RemoveUserFromGroup")
-UpdateDocument = Action("UpdateDocument")
-UpdateDocumentVersion = Action("UpdateDocumentVersion")
-UpdateFolder = Action("UpdateFolder")
-UpdateInstanceAlias = Action("UpdateInstanceAlias")
-UpdateUser = Action("UpdateUser")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,41 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateDomain = Action("AssociateDomain")
-AssociateWebsiteAuthorizationProvider = Action("AssociateWebsiteAuthorizationProvider")
-AssociateWebsiteCertificateAuthority = Action("AssociateWebsiteCertificateAuthority")
-CreateFleet = Action("CreateFleet")
-DeleteFleet = Action("DeleteFleet")
-DescribeAuditStreamConfiguration = Action("DescribeAuditStreamConfiguration")
-DescribeCompanyNetworkConfiguration = Action("DescribeCompanyNetworkConfiguration")
-DescribeDevice = Action("DescribeDevice")
-DescribeDevicePolicyConfiguration = Action("DescribeDevicePolicyConfiguration")
-DescribeDomain = Action("DescribeDomain")
-DescribeFleetMetadata = Action("DescribeFleetMetadata")
-DescribeIdentityProviderConfiguration = Action("DescribeIdentityProviderConfiguration")
-DescribeWebsiteCertificateAuthority = Action("DescribeWebsiteCertificateAuthority")
-DisassociateDomain = Action("DisassociateDomain")
-DisassociateWebsiteAuthorizationProvider = Action(
-    "DisassociateWebsiteAuthorizationProvider"
-)
-DisassociateWebsiteCertificateAuthority = Action(
-    "DisassociateWebsiteCertificateAuthority"
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
 )
-ListDevices = Action("ListDevices")
-ListDomains = Action("ListDomains")
-ListFleets = Action("ListFleets")
-ListTagsForResource = Action("ListTagsForResource")
-ListWebsiteAuthorizationProviders = Action("ListWebsiteAuthorizationProviders")
-ListWebsiteCertificateAuthorities = Action("ListWebsiteCertificateAuthorities")
-RestoreDomainAccess = Action("RestoreDomainAccess")
-RevokeDomainAccess = Action("RevokeDomainAccess")
-SearchEntity = Action("SearchEntity")
-SignOutUser = Action("SignOutUser")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateAuditStreamConfiguration = Action("UpdateAuditStreamConfiguration")
-UpdateCompanyNetworkConfiguration = Action("UpdateCompanyNetworkConfiguration")
-UpdateDevicePolicyConfiguration = Action("UpdateDevicePolicyConfiguration")
-UpdateDomainMetadata = Action("UpdateDomainMetadata")
-UpdateFleetMetadata = Action("UpdateFleetMetadata")
-UpdateIdentityProviderConfiguration = Action("UpdateIdentityProviderConfiguration")
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
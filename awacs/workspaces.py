@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,35 +25,21 @@ class ARN(BaseARN):
         )
 
 
-AssociateIpGroups = Action("AssociateIpGroups")
-AuthorizeIpRules = Action("AuthorizeIpRules")
-CreateIpGroup = Action("CreateIpGroup")
-CreateTags = Action("CreateTags")
-CreateWorkspaces = Action("CreateWorkspaces")
-DeleteIpGroup = Action("DeleteIpGroup")
-DeleteTags = Action("DeleteTags")
-DeleteWorkspaceImage = Action("DeleteWorkspaceImage")
-DescribeAccount = Action("DescribeAccount")
-DescribeAccountModifications = Action("DescribeAccountModifications")
-DescribeClientProperties = Action("DescribeClientProperties")
-DescribeIpGroups = Action("DescribeIpGroups")
-DescribeTags = Action("DescribeTags")
-DescribeWorkspaceBundles = Action("DescribeWorkspaceBundles")
-DescribeWorkspaceDirectories = Action("DescribeWorkspaceDirectories")
-DescribeWorkspaceImages = Action("DescribeWorkspaceImages")
-DescribeWorkspaces = Action("DescribeWorkspaces")
-DescribeWorkspacesConnectionStatus = Action("DescribeWorkspacesConnectionStatus")
-DisassociateIpGroups = Action("DisassociateIpGroups")
-ImportWorkspaceImage = Action("ImportWorkspaceImage")
-ListAvailableManagementCidrRanges = Action("ListAvailableManagementCidrRanges")
-ModifyAccount = Action("ModifyAccount")
-ModifyClientProperties = Action("ModifyClientProperties")
-ModifyWorkspaceProperties = Action("ModifyWorkspaceProperties")
-ModifyWorkspaceState = Action("ModifyWorkspaceState")
-RebootWorkspaces = Action("RebootWorkspaces")
-RebuildWorkspaces = Action("RebuildWorkspaces")
-RevokeIpRules = Action("RevokeIpRules")
-StartWorkspaces = Action("StartWorkspaces")
-StopWorkspaces = Action("StopWorkspaces")
-TerminateWorkspaces = Action("TerminateWorkspaces")
-UpdateRulesOfIpGroup = Action("UpdateRulesOfIpGroup")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
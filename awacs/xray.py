@@ -3,6 +3,9 @@
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 
@@ -22,30 +25,21 @@ class ARN(BaseARN):
         )
 
 
-BatchGetTraces = Action("BatchGetTraces")
-CreateGroup = Action("CreateGroup")
-CreateSamplingRule = Action("CreateSamplingRule")
-DeleteGroup = Action("DeleteGroup")
-DeleteSamplingRule = Action("DeleteSamplingRule")
-GetEncryptionConfig = Action("GetEncryptionConfig")
-GetGroup = Action("GetGroup")
-GetGroups = Action("GetGroups")
-GetInsight = Action("GetInsight")
-GetInsightEvents = Action("GetInsightEvents")
-GetInsightImpactGraph = Action("GetInsightImpactGraph")
-GetInsightSummaries = Action("GetInsightSummaries")
-GetSamplingRules = Action("GetSamplingRules")
-GetSamplingStatisticSummaries = Action("GetSamplingStatisticSummaries")
-GetSamplingTargets = Action("GetSamplingTargets")
-GetServiceGraph = Action("GetServiceGraph")
-GetTimeSeriesServiceStatistics = Action("GetTimeSeriesServiceStatistics")
-GetTraceGraph = Action("GetTraceGraph")
-GetTraceSummaries = Action("GetTraceSummaries")
-ListTagsForResource = Action("ListTagsForResource")
-PutEncryptionConfig = Action("PutEncryptionConfig")
-PutTelemetryRecords = Action("PutTelemetryRecords")
-PutTraceSegments = Action("PutTraceSegments")
-TagResource = Action("TagResource")
-UntagResource = Action("UntagResource")
-UpdateGroup = Action("UpdateGroup")
-UpdateSamplingRule = Action("UpdateSamplingRule")
+_actions = frozenset(catalog.actions(prefix))
+
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+
+
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 import asyncio
-import importlib
+import json
 import sys
 import urllib.parse
 from pathlib import Path
-from typing import DefaultDict, Dict, List, Set, Tuple
+from typing import Any, DefaultDict, Dict, List, Set, Tuple
 
 import aiofiles
 import httpx
@@ -18,6 +18,9 @@ HEADER = """\
 #
 # See LICENSE file for full license.
 
+from typing import List
+
+from . import catalog
 from .aws import Action as BaseAction
 from .aws import BaseARN
 """
@@ -47,8 +50,42 @@ class ARN(BaseARN):
         super().__init__(service=prefix, resource=resource, region=region, account="")
 """
 
+EXPORTS = """\
+# The actions are not in the globals until first accessed
+__all__ = sorted(
+    _actions.union(["ARN", "Action", "BaseARN", "BaseAction", "prefix", "service_name"])
+)
+"""
+
+LAZY_ACTIONS = """\
+def __getattr__(name: str) -> Action:
+    if name in _actions:
+        # Build the action on first access and cache it in the module
+        action = globals()[name] = Action(name)
+        return action
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__() -> List[str]:
+    return sorted(_actions.union(globals()))
+"""
+
 BASEDIR = "awacs"
 
+CATALOG = "catalog.json"
+
+# Modules in BASEDIR that are not generated from a service prefix
+RESERVED_MODULES = {
+    "actionset",
+    "analysis",
+    "aws",
+    "catalog",
+    "conditions",
+    "evaluation",
+    "optimize",
+    "simulation",
+}
+
 IGNORED_SERVICE_ALIASES = {
     "Amazon API Gateway Management V2": "apigateway",
     "Amazon Kinesis Analytics V2": "kinesisanalytics",
@@ -95,38 +132,32 @@ async def main() -> None:
                 )
             service_names[service_prefix] = service_name
 
-    original_services_with_actions = await collect_existing_actions()
-    for service_prefix, actions in services_with_actions.items():
-        actions.update(original_services_with_actions.get(service_prefix) or set())
+    existing_catalog = await collect_existing_catalog()
+    for service_prefix, entry in existing_catalog.items():
+        services_with_actions[service_prefix].update(entry["actions"])
+        service_names.setdefault(service_prefix, entry["name"])
 
     await asyncio.gather(
         *(
-            write_service(service_prefix, service_names[service_prefix], actions)
-            for service_prefix, actions in services_with_actions.items()
+            write_service(service_prefix, service_names[service_prefix])
+            for service_prefix in services_with_actions
         )
     )
+    await write_catalog(services_with_actions, service_names)
 
 
-async def collect_existing_actions() -> Dict[str, Set[str]]:
+async def collect_existing_catalog() -> Dict[str, Dict[str, Any]]:
     # pylint: disable=import-outside-toplevel
     if "" in sys.path:
         sys.path.remove("")  # Import the installed awacs (that was processed by 2to3)
 
     import awacs
-    from awacs.aws import Action as BaseAction
 
-    services_with_actions: DefaultDict[str, Set[str]] = DefaultDict(set)
-
-    for path in (path.stem for path in Path(awacs.__file__).parent.glob("*.py")):
-        if path.startswith("__"):
-            continue
-        module = importlib.import_module(f"awacs.{path}")
-        for action in vars(module).values():
-            if not isinstance(action, BaseAction):
-                continue
-            services_with_actions[action.prefix].add(action.action)
-
-    return dict(services_with_actions)
+    catalog_path = Path(awacs.__file__).parent / CATALOG
+    if not catalog_path.exists():
+        return {}
+    async with aiofiles.open(catalog_path) as fp:
+        return json.loads(await fp.read())
 
 
 async def collect_service_info() -> List[httpx.Response]:
@@ -194,9 +225,7 @@ async def extract_actions(html: str) -> Tuple[str, str, Set[str]]:
     return service_name, service_prefix, actions
 
 
-async def write_service(
-    service_prefix: str, service_name: str, actions: Set[str]
-) -> None:
+async def write_service(service_prefix: str, service_name: str) -> None:
     content: List[str] = []
     content.append(HEADER)
 
@@ -207,24 +236,49 @@ async def write_service(
     content.append(CLASSES_S3 if service_prefix == "s3" else CLASSES)
     content.append("")
 
-    for action in sorted(actions):
-        action = action.strip()
-        # Handle action such as "ReEncrypt*"
-        if action[-1] == "*":
-            action = action[:-1]
-        action_string = '{action} = Action("{action}")'
-        content.append(action_string.format(action=action))
-
-    if content[-1] != "":
-        # Add a final newline
-        content.append("")
+    # Actions are read from the catalog and are created on first access by
+    # the module level __getattr__ in LAZY_ACTIONS.
+    content.append("_actions = frozenset(catalog.actions(prefix))")
+    content.append("")
+    content.append(EXPORTS)
+    content.append("")
+    content.append(LAZY_ACTIONS)
 
-    awacs_service = rename_service(service_prefix.replace("-", "_"))
-    filename = "".join([BASEDIR, "/", awacs_service, ".py"])
+    filename = "".join([BASEDIR, "/", module_name(service_prefix), ".py"])
     async with aiofiles.open(filename, "w") as fp:
         await fp.write("\n".join(content))
 
 
+async def write_catalog(
+    services_with_actions: Dict[str, Set[str]], service_names: Dict[str, str]
+) -> None:
+    entries: Dict[str, Dict[str, Any]] = {}
+    for service_prefix, actions in services_with_actions.items():
+        cleaned = set()
+        for action in actions:
+            action = action.strip()
+            # Handle action such as "ReEncrypt*"
+            if action[-1] == "*":
+                action = action[:-1]
+            cleaned.add(action)
+        entries[service_prefix] = {
+            "actions": sorted(cleaned),
+            "module": module_name(service_prefix),
+            "name": service_names[service_prefix],
+        }
+
+    filename = "".join([BASEDIR, "/", CATALOG])
+    async with aiofiles.open(filename, "w") as fp:
+        await fp.write(json.dumps(entries, indent=1, sort_keys=True) + "\n")
+
+
+def module_name(service_prefix: str) -> str:
+    name = rename_service(service_prefix.replace("-", "_"))
+    if name in RESERVED_MODULES:
+        raise ValueError(f"Service prefix {service_prefix!r} clashes with awacs.{name}")
+    return name
+
+
 async def _actions_from_table(table) -> Set[str]:
     actions = set()
     skip_next_lines = 0
@@ -0,0 +1,59 @@
+import pickle
+import unittest
+
+from awacs import catalog, ec2, s3
+from awacs.actionset import ActionSet
+from awacs.aws import Allow, Statement
+
+
+class TestActionSet(unittest.TestCase):
+    def test_create(self):
+        gets = ActionSet(["s3:Get*"])
+        self.assertEqual(len(catalog.expand_actions("s3:Get*")), len(gets))
+        self.assertEqual(gets, ActionSet([s3.Action("get*")]))
+        self.assertIn(s3.GetObject, gets)
+        self.assertIn("s3:getobject", gets)
+        self.assertIn("s3:GetObject*", gets)
+        self.assertNotIn(s3.PutObject, gets)
+        self.assertNotIn("s3:NotAnAction", gets)
+        self.assertEqual([s3.GetObject], list(ActionSet([s3.GetObject])))
+        self.assertEqual(["s3:GetObject"], ActionSet([s3.GetObject]).names())
+        self.assertFalse(ActionSet())
+        self.assertEqual(len(catalog.action_names()), len(ActionSet.all()))
+        self.assertEqual(ActionSet.all(), ActionSet(["*"]))
+
+    def test_operations(self):
+        s3_all = ActionSet(["s3:*"])
+        gets = ActionSet(["s3:Get*"])
+        puts = ActionSet(["s3:Put*"])
+        self.assertEqual(gets, (gets | puts) - puts)
+        self.assertEqual(gets, s3_all & gets)
+        self.assertEqual(gets | puts, gets ^ puts)
+        self.assertTrue(gets <= s3_all)
+        self.assertTrue(gets < s3_all)
+        self.assertFalse(s3_all < s3_all)
+        self.assertTrue(s3_all >= puts)
+        self.assertTrue(gets.isdisjoint(puts))
+        self.assertEqual(ActionSet.all(), s3_all | ~s3_all)
+        self.assertFalse(s3_all & ~s3_all)
+        self.assertEqual(gets.union(puts), gets | puts)
+        self.assertEqual(len({gets, ActionSet(["s3:Get*"])}), 1)
+
+    def test_from_statement(self):
+        statement = Statement(
+            Effect=Allow, Action=[s3.GetObject, ec2.Action("Describe*")]
+        )
+        actions = ActionSet.from_statement(statement)
+        self.assertIn(ec2.DescribeInstances, actions)
+        self.assertIn(s3.GetObject, actions)
+        self.assertEqual(1 + len(ActionSet(["ec2:Describe*"])), len(actions))
+
+        not_s3 = ActionSet.from_statement({"Effect": "Allow", "NotAction": "s3:*"})
+        self.assertEqual(~ActionSet(["s3:*"]), not_s3)
+        self.assertIn(ec2.RunInstances, not_s3)
+
+    def test_immutable(self):
+        actions = ActionSet(["s3:Get*"])
+        with self.assertRaises(AttributeError):
+            actions.bits = 0
+        self.assertEqual(actions, pickle.loads(pickle.dumps(actions)))
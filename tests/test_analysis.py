@@ -0,0 +1,325 @@
+import unittest
+from string import ascii_lowercase, digits
+
+from awacs import catalog
+from awacs.analysis import (
+    _holding_sets,
+    canonicalize,
+    diff,
+    equivalent,
+    fingerprint,
+    normalize,
+    subsumes,
+)
+from awacs.aws import Policy, PolicyDocument
+from awacs.evaluation import Allowed, evaluate
+
+
+def policy(*statements):
+    return Policy.from_dict({"Version": "2012-10-17", "Statement": list(statements)})
+
+
+def allow(actions, resources="*", **kwargs):
+    return dict(Effect="Allow", Action=actions, Resource=resources, **kwargs)
+
+
+def deny(actions, resources="*", **kwargs):
+    return dict(Effect="Deny", Action=actions, Resource=resources, **kwargs)
+
+
+class TestEquivalence(unittest.TestCase):
+    def check_counterexample(self, a, b, comparison):
+        example = comparison.counterexample
+        self.assertIsNotNone(example)
+        self.assertFalse(comparison)
+        if not example.guards:
+            decisions = [
+                evaluate(p, example.action, example.resource) == Allowed for p in (a, b)
+            ]
+            self.assertEqual(
+                [example.allowed_by == 0, example.allowed_by == 1], decisions
+            )
+
+    def test_textual_differences(self):
+        a = policy(
+            allow(["s3:GetObject", "s3:GetObjectAcl"], "arn:aws:s3:::bucket/*"),
+            allow("ec2:DescribeInstances"),
+        )
+        b = policy(
+            allow("ec2:describeinstances"),
+            allow("s3:GetObjectAcl", ["arn:aws:s3:::bucket/*"]),
+            allow("s3:GetObject", "arn:aws:s3:::bucket/*"),
+        )
+        self.assertTrue(equivalent(a, b))
+        self.assertTrue(subsumes(a, b))
+
+        # A wildcard and its expansion
+
+        gets = [x.JSONrepr() for x in catalog.expand_actions("s3:Get*")]
+        self.assertTrue(equivalent(policy(allow("s3:Get*")), policy(allow(gets))))
+
+    def test_actions(self):
+        a = policy(allow("s3:Get*"))
+        b = policy(allow("s3:*"))
+        self.assertTrue(subsumes(b, a))
+        comparison = subsumes(a, b)
+        self.check_counterexample(a, b, comparison)
+        self.assertFalse(comparison.counterexample.action.startswith("s3:Get"))
+        self.check_counterexample(a, b, equivalent(a, b))
+
+    def test_deny(self):
+        a = policy(allow("s3:*"), deny("s3:Delete*"))
+        b = policy(allow("s3:*"))
+        self.assertTrue(subsumes(b, a))
+        comparison = subsumes(a, b)
+        self.check_counterexample(a, b, comparison)
+        self.assertTrue(comparison.counterexample.action.startswith("s3:Delete"))
+        c = policy(allow("s3:*"), allow("s3:Delete*"), deny("s3:Delete*"))
+        self.assertTrue(equivalent(a, c))
+
+    def test_resources(self):
+        a = policy(allow("s3:GetObject", "arn:aws:s3:::bucket/*"))
+        b = policy(allow("s3:GetObject", "arn:aws:s3:::bucket/logs/*"))
+        self.assertTrue(subsumes(a, b))
+        comparison = subsumes(b, a)
+        self.check_counterexample(b, a, comparison)
+        self.assertTrue(
+            comparison.counterexample.resource.startswith("arn:aws:s3:::bucket/")
+        )
+
+        # Only resources matching both an allow and a deny pattern differ
+        c = policy(
+            allow("s3:GetObject", "arn:aws:s3:::bucket/a*"),
+            deny("s3:GetObject", "arn:aws:s3:::bucket/*b"),
+        )
+        d = policy(allow("s3:GetObject", "arn:aws:s3:::bucket/a*"))
+        comparison = equivalent(c, d)
+        self.check_counterexample(c, d, comparison)
+        resource = comparison.counterexample.resource
+        self.assertTrue(resource.startswith("arn:aws:s3:::bucket/a"))
+        self.assertTrue(resource.endswith("b"))
+
+        # Wildcards do not match colons in the first segments of an ARN
+        e = policy(allow("ec2:RunInstances", "arn:aws:ec2:*:123:*"))
+        f = policy(
+            allow("ec2:RunInstances", "arn:aws:ec2:*:123:*"),
+            deny("ec2:RunInstances", "arn:aws:ec2:*:456:*"),
+        )
+        self.assertTrue(equivalent(e, f))
+
+    def test_every_character(self):
+        resources = ["arn:aws:s3:::b-%s/*" % c for c in ascii_lowercase + digits]
+        a = policy(allow("s3:GetObject", resources))
+        b = policy(allow("s3:GetObject", resources[:-1]))
+        self.assertTrue(equivalent(a, a))
+        comparison = subsumes(b, a)
+        self.assertFalse(comparison)
+        self.assertTrue(
+            comparison.counterexample.resource.startswith("arn:aws:s3:::b-9/")
+        )
+
+    def test_not_resource(self):
+        a = policy(dict(Effect="Allow", Action="s3:*", NotResource="arn:aws:s3:::x"))
+        b = policy(allow("s3:*"), deny("s3:*", "arn:aws:s3:::x"))
+        self.assertTrue(equivalent(a, b))
+
+    def test_conditions(self):
+        condition = {"StringEquals": {"aws:RequestedRegion": ["us-east-1"]}}
+        same = {"StringEquals": {"AWS:requestedregion": "us-east-1"}}
+        a = policy(allow("s3:*", Condition=condition))
+        b = policy(allow("s3:*", Condition=same))
+        self.assertTrue(equivalent(a, b))
+
+        c = policy(allow("s3:*"))
+        self.assertTrue(subsumes(c, a))
+        comparison = subsumes(a, c)
+        self.assertFalse(comparison)
+        self.assertEqual((), comparison.counterexample.guards)
+
+        d = policy(allow("s3:*"), deny("s3:PutObject", Condition=condition))
+        comparison = subsumes(d, c)
+        self.assertFalse(comparison)
+        self.assertEqual(1, len(comparison.counterexample.guards))
+
+    def test_many_conditions(self):
+        # Conditional statements of a single action, whose guards have 2**40
+        # combinations
+        statements = [
+            allow(
+                "s3:GetObject",
+                "arn:aws:s3:::b%d/*" % i,
+                Condition={"StringEquals": {"aws:ResourceTag/t%d" % i: "v"}},
+            )
+            for i in range(40)
+        ]
+        secure = {"Bool": {"aws:SecureTransport": "false"}}
+        statements.append(deny("s3:*", "arn:aws:s3:::b0/*", Condition=secure))
+        a = policy(*statements)
+        b = policy(*reversed(statements))
+        holding = list(_holding_sets(normalize(a), normalize(b), True))
+        self.assertLessEqual(len(holding), 2 * len(statements))
+        self.assertTrue(equivalent(a, b))
+
+        c = policy(*statements[1:])
+        comparison = subsumes(c, a)
+        self.assertFalse(comparison)
+        example = comparison.counterexample
+        self.assertEqual("s3:GetObject", example.action)
+        self.assertTrue(example.resource.startswith("arn:aws:s3:::b0/"))
+        self.assertEqual(1, len(example.guards))
+
+
+class TestCanonicalize(unittest.TestCase):
+    def test_canonicalize(self):
+        a = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": ["S3:getobject", "s3:GetObject", "ec2:Describe*"],
+                    "Resource": "arn:aws:s3:::bucket/*",
+                    "Condition": {"Bool": {"aws:SecureTransport": True}},
+                },
+                {
+                    "Effect": "Deny",
+                    "Action": "s3:*",
+                    "Resource": ["arn:aws:s3:::b", "arn:aws:s3:::a"],
+                    "Principal": {"AWS": "123456789012"},
+                },
+            ],
+        }
+        b = {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Deny",
+                    "Action": ["s3:*"],
+                    "Resource": ["arn:aws:s3:::a", "arn:aws:s3:::b", "arn:aws:s3:::a"],
+                    "Principal": {"AWS": ["123456789012"]},
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": ["ec2:Describe*", "s3:GetObject"],
+                    "Resource": ["arn:aws:s3:::bucket/*"],
+                    "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+                },
+            ]
+            * 2,
+        }
+        canonical = canonicalize(a)
+        self.assertIsInstance(canonical, PolicyDocument)
+        self.assertEqual(
+            canonical.to_dict(),
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Action": ["ec2:Describe*", "s3:GetObject"],
+                        "Resource": ["arn:aws:s3:::bucket/*"],
+                        "Condition": {"Bool": {"aws:SecureTransport": ["true"]}},
+                    },
+                    {
+                        "Effect": "Deny",
+                        "Action": ["s3:*"],
+                        "Resource": ["arn:aws:s3:::a", "arn:aws:s3:::b"],
+                        "Principal": {"AWS": ["123456789012"]},
+                    },
+                ],
+            },
+        )
+        self.assertEqual(canonicalize(b).to_dict(), canonical.to_dict())
+        self.assertTrue(equivalent(a, canonical))
+
+        self.assertEqual(fingerprint(a), fingerprint(b))
+        self.assertEqual(len(fingerprint(a)), 32)
+        policy = Policy.from_dict(b)
+        self.assertEqual(policy.fingerprint(), fingerprint(a))
+        policy.Statement[0].Resource.append("arn:aws:s3:::c")
+        self.assertNotEqual(policy.fingerprint(), fingerprint(a))
+
+    def test_canonicalize_not_shared(self):
+        policy = Policy.from_dict(
+            {
+                "Statement": {
+                    "Effect": "Allow",
+                    "Principal": {"AWS": "arn:aws:iam::123456789012:root"},
+                    "Action": "s3:GetObject",
+                    "Resource": "*",
+                    "Condition": {"StringEquals": {"s3:prefix": "home/"}},
+                }
+            }
+        )
+        before = canonicalize(policy).to_dict()
+        statement = canonicalize(policy).Statement[0]
+        statement.Principal.data["AWS"].append("arn:aws:iam::111111111111:root")
+        statement.Condition.conditions[0].cond_dict["s3:prefix"].append("other/")
+        statement.Resource.append("arn:aws:s3:::bucket")
+        self.assertEqual(canonicalize(policy).to_dict(), before)
+        self.assertEqual(policy.fingerprint(), fingerprint(before))
+
+
+class TestDiff(unittest.TestCase):
+    def test_diff(self):
+        secure = {"Bool": {"aws:SecureTransport": "true"}}
+        old = {
+            "Version": "2012-10-17",
+            "Statement": [
+                allow(["s3:GetObject", "s3:PutObject"], "arn:aws:s3:::bucket/*"),
+                dict(allow("ec2:DescribeInstances"), Sid="Describe"),
+                allow("sqs:SendMessage", "arn:aws:sqs:*:123456789012:queue"),
+                allow("sns:Publish", "arn:aws:sns:*:123456789012:topic"),
+                allow("iam:PassRole", "*", Condition=secure),
+            ],
+        }
+        new = {
+            "Version": "2012-10-17",
+            "Statement": [
+                allow("iam:PassRole", "*"),
+                allow("sns:Publish", "arn:aws:sns:*:123456789012:topic"),
+                dict(allow("ec2:Describe*"), Sid="Describe"),
+                allow(["s3:GetObject", "s3:DeleteObject"], ["arn:aws:s3:::bucket/*"]),
+                allow("sqs:SendMessage", ["arn:aws:sqs:*:123456789012:other"]),
+                allow("kms:Decrypt"),
+            ],
+        }
+        result = diff(old, new)
+        self.assertTrue(result)
+        self.assertEqual(result.elements, ())
+        self.assertEqual([s["Action"] for s in result.added], [["kms:Decrypt"]])
+        self.assertEqual(result.removed, ())
+        changes = {c.new["Action"][0]: c for c in result.changed}
+        self.assertEqual(len(changes), 4)
+
+        s3_change = changes["s3:DeleteObject"]
+        self.assertEqual(s3_change.elements, ("Action",))
+        self.assertEqual(s3_change.added_actions, ("s3:DeleteObject",))
+        self.assertEqual(s3_change.removed_actions, ("s3:PutObject",))
+
+        describe = changes["ec2:Describe*"]
+        self.assertEqual(describe.added_actions, ("ec2:Describe*",))
+        self.assertEqual(describe.removed_actions, ("ec2:DescribeInstances",))
+
+        sqs = changes["sqs:SendMessage"]
+        self.assertEqual(sqs.elements, ("Resource",))
+        self.assertEqual(sqs.added_resources, ("arn:aws:sqs:*:123456789012:other",))
+        self.assertEqual(sqs.removed_resources, ("arn:aws:sqs:*:123456789012:queue",))
+        self.assertEqual(sqs.added_actions, ())
+
+        passrole = changes["iam:PassRole"]
+        self.assertEqual(passrole.elements, ("Condition",))
+        self.assertEqual(passrole.added_conditions, ())
+        self.assertEqual(
+            passrole.removed_conditions,
+            (("Bool", "aws:SecureTransport", ("true",)),),
+        )
+
+    def test_same(self):
+        old = policy(allow(["s3:GetObject", "s3:PutObject"]), allow("sqs:*"))
+        reordered = {
+            "Version": "2012-10-17",
+            "Statement": [allow("sqs:*"), allow(["s3:putobject", "s3:GetObject"])],
+        }
+        self.assertFalse(diff(old, reordered))
+        changed = diff(old, dict(reordered, Version="2008-10-17"))
+        self.assertEqual(changed.elements, ("Version",))
@@ -0,0 +1,168 @@
+import gc
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+import urllib.parse
+
+from awacs import s3, sts
+from awacs.aws import PolicyDocument
+from awacs.helpers.authorization_details import (
+    IdentityDetails,
+    ManagedPolicyDetails,
+    read_authorization_details,
+)
+
+POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [{"Effect": "Allow", "Action": "s3:GetObject", "Resource": "*"}],
+}
+
+TRUST_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Effect": "Allow",
+            "Principal": {"Service": "ec2.amazonaws.com"},
+            "Action": "sts:AssumeRole",
+        }
+    ],
+}
+
+EXPORT = {
+    "UserDetailList": [
+        {
+            "UserName": "alice",
+            "Arn": "arn:aws:iam::123456789012:user/alice",
+            "UserPolicyList": [{"PolicyName": "read", "PolicyDocument": POLICY}],
+            "GroupList": ["admins"],
+            "AttachedManagedPolicies": [
+                {
+                    "PolicyName": "ReadOnly",
+                    "PolicyArn": "arn:aws:iam::aws:policy/ReadOnlyAccess",
+                }
+            ],
+            "PermissionsBoundary": {
+                "PermissionsBoundaryType": "Policy",
+                "PermissionsBoundaryArn": "arn:aws:iam::123456789012:policy/b",
+            },
+        }
+    ],
+    "GroupDetailList": [
+        {
+            "GroupName": "admins",
+            "Arn": "arn:aws:iam::123456789012:group/admins",
+            "GroupPolicyList": [],
+            "AttachedManagedPolicies": [],
+        }
+    ],
+    "RoleDetailList": [
+        {
+            "RoleName": "web",
+            "Arn": "arn:aws:iam::123456789012:role/web",
+            "AssumeRolePolicyDocument": TRUST_POLICY,
+            "RolePolicyList": [
+                {
+                    "PolicyName": "encoded",
+                    "PolicyDocument": urllib.parse.quote(json.dumps(POLICY)),
+                }
+            ],
+            "AttachedManagedPolicies": [],
+        }
+    ],
+    "Policies": [
+        {
+            "PolicyName": "b",
+            "Arn": "arn:aws:iam::123456789012:policy/b",
+            "DefaultVersionId": "v2",
+            "AttachmentCount": 1,
+            "PolicyVersionList": [
+                {"Document": TRUST_POLICY, "VersionId": "v1"},
+                {"Document": POLICY, "VersionId": "v2"},
+            ],
+        }
+    ],
+    "IsTruncated": False,
+}
+
+
+class TestReadAuthorizationDetails(unittest.TestCase):
+    def check(self, details):
+        user, group, role, policy = details
+        expected = PolicyDocument.from_dict(POLICY)
+
+        self.assertIsInstance(user, IdentityDetails)
+        self.assertEqual(("user", "alice"), (user.kind, user.name))
+        self.assertEqual({"read": expected}, user.policies)
+        self.assertEqual(["admins"], user.groups)
+        self.assertEqual(
+            ["arn:aws:iam::aws:policy/ReadOnlyAccess"], user.attached_policies
+        )
+        self.assertEqual(
+            "arn:aws:iam::123456789012:policy/b", user.permissions_boundary
+        )
+        self.assertIsNone(user.assume_role_policy)
+        self.assertEqual(s3.GetObject, user.policies["read"].Statement[0].Action[0])
+
+        self.assertEqual(("group", "admins", {}), group[:2] + (group.policies,))
+
+        self.assertEqual("role", role.kind)
+        self.assertEqual({"encoded": expected}, role.policies)
+        self.assertEqual(sts.AssumeRole, role.assume_role_policy.Statement[0].Action[0])
+
+        self.assertIsInstance(policy, ManagedPolicyDetails)
+        self.assertEqual(["v1", "v2"], list(policy.versions))
+        self.assertEqual(expected, policy.policy)
+
+    def test_file_object(self):
+        data = json.dumps(EXPORT, indent=4).encode()
+        self.check(list(read_authorization_details(io.BytesIO(data))))
+        self.check(list(read_authorization_details(io.StringIO(data.decode()))))
+
+    def test_left_open(self):
+        data = json.dumps(EXPORT).encode()
+        for fp in (io.BytesIO(data), io.BytesIO(gzip.compress(data))):
+            self.check(list(read_authorization_details(fp)))
+            gc.collect()
+            self.assertFalse(fp.closed)
+
+            fp.seek(0)
+            details = read_authorization_details(fp)
+            next(details)
+            del details
+            gc.collect()
+            self.assertFalse(fp.closed)
+
+    def test_small_chunks(self):
+        data = json.dumps(EXPORT)
+        self.check(list(read_authorization_details(io.StringIO(data), chunk_size=7)))
+
+    def test_gzip_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "details.json.gz")
+            with gzip.open(path, "wt") as fp:
+                json.dump(EXPORT, fp)
+            self.check(list(read_authorization_details(path)))
+
+    def test_is_lazy(self):
+        data = json.dumps(EXPORT) + "{"
+        details = read_authorization_details(io.StringIO(data))
+        self.assertEqual("alice", next(details).name)
+
+    def test_concatenated_pages(self):
+        first = dict(EXPORT, IsTruncated=True, Marker="x", Policies=[])
+        second = {"UserDetailList": [], "Policies": EXPORT["Policies"]}
+        data = json.dumps(first) + "\n" + json.dumps(second)
+        kinds = [
+            getattr(d, "kind", "policy")
+            for d in read_authorization_details(io.StringIO(data))
+        ]
+        self.assertEqual(["user", "group", "role", "policy"], kinds)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            list(read_authorization_details(io.StringIO("[]")))
+        with self.assertRaises(ValueError):
+            list(read_authorization_details(io.StringIO('{"UserDetailList": [')))
@@ -1,6 +1,74 @@
+import copy
+import json
+import pickle
 import unittest
 
-from awacs.aws import BaseARN, Principal
+from awacs import s3
+from awacs.aws import (
+    Action,
+    BaseARN,
+    ForAnyValueStringLikeIfExists,
+    Policy,
+    PolicyDocument,
+    Principal,
+    StringEquals,
+)
+
+
+class TestAction(unittest.TestCase):
+    def test_interned(self):
+        self.assertIs(Action("s3", "GetObject"), Action("s3", "GetObject"))
+        self.assertIs(s3.Action("PutObject"), s3.PutObject)
+        self.assertIs(Action("s3", "PutObject"), s3.PutObject)
+        self.assertIsNot(Action("s3", "GetObject"), Action("s3", "PutObject"))
+
+    def test_interned_generic_first(self):
+        # The generic class is used before the constant is first accessed
+        action = Action("s3", "PutObjectRetention")
+        self.assertIsInstance(action, s3.Action)
+        self.assertIs(action, s3.PutObjectRetention)
+        self.assertIs(Action(prefix="s3", action="PutObjectRetention"), action)
+        self.assertIs(type(Action("not-a-service", "Action")), Action)
+
+    def test_from_string(self):
+        self.assertIs(Action.from_string("s3:GetObject"), s3.GetObject)
+        self.assertIs(Action.from_string("s3:getobject"), s3.GetObject)
+        self.assertIs(Action.from_string("S3:GETOBJECT"), s3.GetObject)
+        self.assertEqual(Action.from_string("s3:get*").JSONrepr(), "s3:get*")
+        self.assertEqual(
+            Action.from_string("custom:someAction").JSONrepr(), "custom:someAction"
+        )
+
+    def test_star_import(self):
+        namespace = {}
+        exec("from awacs.s3 import *", namespace)
+        self.assertIs(namespace["GetObject"], s3.GetObject)
+        self.assertIs(namespace["Action"], s3.Action)
+        self.assertEqual(namespace["prefix"], "s3")
+        for name in ("ARN", "service_name", "PutObjectRetention"):
+            self.assertIn(name, namespace)
+        self.assertNotIn("catalog", namespace)
+
+    def test_equality_across_classes(self):
+        self.assertEqual(Action("s3", "ListBucket"), s3.ListBucket)
+        self.assertEqual(s3.ListBucket, Action("s3", "ListBucket"))
+        self.assertEqual(hash(Action("s3", "ListBucket")), hash(s3.ListBucket))
+        self.assertNotEqual(Action("s3", "ListBucket"), "s3:ListBucket")
+
+    def test_immutable(self):
+        action = Action("s3", "GetObject")
+        self.assertFalse(hasattr(action, "__dict__"))
+        self.assertFalse(hasattr(s3.GetObject, "__dict__"))
+        with self.assertRaises(AttributeError):
+            action.action = "PutObject"
+        self.assertIs(copy.deepcopy(action), action)
+        self.assertEqual(pickle.loads(pickle.dumps(s3.GetObject)), s3.GetObject)
+
+    def test_wildcard(self):
+        self.assertEqual(Action("*").JSONrepr(), "*")
+        self.assertEqual(Action("s3", "*").JSONrepr(), "s3:*")
+        with self.assertRaises(ValueError):
+            Action("*", "GetObject")
 
 
 class TestPrincipal(unittest.TestCase):
@@ -46,3 +114,87 @@ class TestBaseARN(unittest.TestCase):
             arn.JSONrepr(),
             "arn:${AWS::Partition}:service:${AWS::Region}:account:resource",
         )
+
+
+class TestPolicyFromDict(unittest.TestCase):
+    def test_round_trip(self):
+        data = {
+            "Version": "2012-10-17",
+            "Id": "id",
+            "Statement": [
+                {
+                    "Sid": "1",
+                    "Effect": "Allow",
+                    "Principal": {"AWS": ["arn:aws:iam::123456789012:root"]},
+                    "Action": ["s3:GetObject", "s3:List*", "custom:Action"],
+                    "Resource": ["arn:aws:s3:::bucket/*"],
+                    "Condition": {
+                        "StringEquals": {"s3:prefix": ["", "home/"]},
+                        "ForAnyValue:StringLikeIfExists": {"aws:TagKeys": "a*"},
+                    },
+                },
+                {"Effect": "Deny", "NotAction": ["*"], "NotResource": ["*"]},
+            ],
+        }
+        policy = PolicyDocument.from_json(json.dumps(data))
+        self.assertIsInstance(policy, PolicyDocument)
+        self.assertEqual(policy.to_dict(), data)
+        policy.validate_all()
+
+        statement = policy.Statement[0]
+        self.assertIs(statement.Action[0], s3.GetObject)
+        self.assertIsInstance(statement.Action[1], s3.Action)
+        self.assertEqual(statement.Action[2], Action("custom", "Action"))
+        self.assertEqual(
+            [type(c) for c in statement.Condition.conditions],
+            [StringEquals, ForAnyValueStringLikeIfExists],
+        )
+
+    def test_not_shared(self):
+        data = {
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Principal": {"AWS": ["arn:aws:iam::123456789012:root"]},
+                    "Resource": ["*"],
+                    "Condition": {"StringEquals": {"s3:prefix": ["home/"]}},
+                }
+            ]
+        }
+        before = json.dumps(data)
+        statement = Policy.from_dict(data).Statement[0]
+        statement.Principal.data["AWS"].append("arn:aws:iam::111111111111:root")
+        statement.Condition.conditions[0].cond_dict["s3:prefix"].append("other/")
+        statement.Resource.append("arn:aws:s3:::bucket")
+        self.assertEqual(json.dumps(data), before)
+
+    def test_single_values(self):
+        policy = Policy.from_dict(
+            {
+                "Statement": {
+                    "Effect": "Allow",
+                    "Principal": "*",
+                    "Action": "s3:GetObject",
+                    "Resource": "*",
+                }
+            }
+        )
+        self.assertEqual(
+            policy.to_dict(),
+            {
+                "Statement": [
+                    {
+                        "Effect": "Allow",
+                        "Principal": "*",
+                        "Action": ["s3:GetObject"],
+                        "Resource": ["*"],
+                    }
+                ]
+            },
+        )
+
+    def test_unknown_condition(self):
+        with self.assertRaises(ValueError):
+            Policy.from_dict(
+                {"Statement": [{"Effect": "Allow", "Condition": {"Foo": {}}}]}
+            )
@@ -1,8 +1,16 @@
+import io
 import json
 import unittest
 
 import awacs
-from awacs.aws import Action, PolicyDocument
+from awacs.aws import (
+    Action,
+    Condition,
+    PolicyDocument,
+    Principal,
+    Statement,
+    StringEquals,
+)
 
 
 class AWSHelperFn:
@@ -66,8 +74,223 @@ class TestAWSProperty(unittest.TestCase):
                 "ExpectList is %s, expected %s" % (type(val), type(list())),
             )
 
+    def test_prop_value_type_mismatch_list_of_types(self):
+        with self.assertRaises(TypeError):
+            Statement(Effect="Allow", Action=["s3:GetObject"])
+        with self.assertRaises(TypeError):
+            PolicyDocument(Statement=Statement(Effect="Allow"))
+
+    def test_instance_props(self):
+        obj = awacs.AWSObject(None, props={"Name": (str, True)}, Name="name")
+        self.assertEqual(obj.Name, "name")
+        with self.assertRaises(TypeError):
+            obj.Name = 1
+        with self.assertRaises(AttributeError):
+            obj.Other = "other"
+
     def test_prop_value_type_expect_list(self):
         tests_values = [["val"], Action("s3", "*"), AWSHelperFnChild(key="val")]
 
         for val in tests_values:
             self.assertEqual(TypeValidationObject(ExpectList=val).ExpectList, val)
+
+
+class TestConstruct(unittest.TestCase):
+    def test_construct(self):
+        statement = Statement.construct(
+            Effect="Allow", Action=[Action("s3", "GetObject")], Resource=["*"]
+        )
+        self.assertEqual(
+            statement,
+            Statement(
+                Effect="Allow", Action=[Action("s3", "GetObject")], Resource=["*"]
+            ),
+        )
+        PolicyDocument.construct(Statement=[statement]).validate_all()
+
+    def test_validate_all(self):
+        policy = PolicyDocument.construct(
+            Statement=[
+                Statement.construct(Effect="Maybe", Action=["s3:GetObject", 1]),
+                Statement.construct(Action=[Action("s3", "GetObject")], Foo=1),
+            ],
+            Version=2012,
+        )
+        with self.assertRaises(awacs.ValidationError) as exc:
+            policy.validate_all()
+        self.assertEqual(
+            [error.split(":")[0] for error in exc.exception.errors],
+            [
+                "PolicyDocument.Statement[0].Effect",
+                "PolicyDocument.Statement[0].Action[0]",
+                "PolicyDocument.Statement[0].Action[1]",
+                "PolicyDocument.Statement[1].Foo",
+                "PolicyDocument.Statement[1]",
+                "PolicyDocument.Version",
+            ],
+        )
+
+
+class TestSerializationCache(unittest.TestCase):
+    def setUp(self):
+        self.statement = Statement(
+            Effect="Allow", Action=[Action("s3", "GetObject")], Resource=["*"]
+        )
+        self.policy = PolicyDocument(Statement=[self.statement])
+
+    def test_cached(self):
+        self.assertIs(self.policy.to_json(), self.policy.to_json())
+        self.assertIs(self.statement.to_json(), self.statement.to_json())
+
+    def test_assignment(self):
+        before = self.policy.to_json()
+        hash_before = hash(self.policy)
+        self.statement.Effect = "Deny"
+        self.assertNotEqual(self.policy.to_json(), before)
+        self.assertIn('"Deny"', self.policy.to_json())
+        self.assertNotEqual(hash(self.policy), hash_before)
+
+    def test_list_mutation(self):
+        self.policy.to_json()
+        self.statement.Action.append(Action("s3", "PutObject"))
+        self.assertIn("s3:PutObject", self.policy.to_json())
+        self.policy.Statement.append(Statement(Effect="Deny", Resource=["*"]))
+        self.assertIn('"Deny"', self.policy.to_json())
+
+    def test_helper_mutation(self):
+        principal = Principal("AWS", ["arn:aws:iam::123456789012:root"])
+        condition = Condition(StringEquals({"s3:prefix": "home/"}))
+        self.statement.Principal = principal
+        self.statement.Condition = condition
+        before = self.policy.to_json()
+        hash_before = hash(self.policy)
+
+        principal.data = {"AWS": "arn:aws:iam::111111111111:root"}
+        self.assertIn("111111111111", self.policy.to_json())
+        principal.data["AWS"] = ["arn:aws:iam::222222222222:root"]
+        self.assertIn("222222222222", self.policy.to_json())
+        principal.data["AWS"].append("arn:aws:iam::333333333333:root")
+        self.assertIn("333333333333", self.policy.to_json())
+
+        condition.conditions[0].cond_dict["s3:prefix"] = "other/"
+        self.assertIn("other/", self.policy.to_json())
+        condition.conditions = [StringEquals({"s3:prefix": "last/"})]
+        self.assertIn("last/", self.policy.to_json())
+        self.assertNotEqual(self.policy.to_json(), before)
+        self.assertNotEqual(hash(self.policy), hash_before)
+
+    def test_validation_not_cached(self):
+        self.policy.to_json()
+        self.policy.Statement.append(Statement(Resource=["*"]))
+        with self.assertRaises(ValueError):
+            self.policy.to_json()
+
+
+class TestToDict(unittest.TestCase):
+    def test_to_dict(self):
+        policy = PolicyDocument(
+            Version="2012-10-17",
+            Statement=[
+                Statement(
+                    Effect="Allow",
+                    Action=[Action("s3", "GetObject")],
+                    Resource=["*"],
+                )
+            ],
+        )
+        self.assertEqual(policy.to_dict(), json.loads(policy.to_json()))
+        self.assertEqual(policy.to_dict()["Statement"][0]["Action"], ["s3:GetObject"])
+
+    def test_copy(self):
+        statement = Statement(
+            Effect="Allow", Action=[Action("s3", "GetObject")], Resource=["*"]
+        )
+        policy = PolicyDocument(Statement=[statement])
+        before = policy.to_json()
+        data = policy.to_dict()
+        data["Statement"][0]["Resource"].append("other")
+        data["Statement"].append({})
+        statement.to_dict()["Effect"] = "Deny"
+        self.assertEqual(policy.to_json(), before)
+        self.assertEqual(policy.to_dict(), json.loads(before))
+        self.assertIsNot(policy.to_dict(), policy.to_dict())
+
+    def test_required(self):
+        policy = PolicyDocument(Statement=[Statement(Resource=["*"])])
+        with self.assertRaises(ValueError):
+            policy.to_dict()
+
+    def test_backend(self):
+        calls = []
+
+        def backend(data, indent, sort_keys):
+            calls.append((indent, sort_keys))
+            return json.dumps(data, indent=indent, sort_keys=sort_keys)
+
+        policy = PolicyDocument(Version="2012-10-17", Statement=[])
+        self.assertEqual(
+            policy.to_json(indent=None, backend=backend),
+            '{"Statement": [], "Version": "2012-10-17"}',
+        )
+        awacs.set_json_backend(backend)
+        try:
+            policy.to_json(indent=2, sort_keys=False)
+        finally:
+            awacs.set_json_backend(None)
+        self.assertEqual(calls, [(None, True), (2, False)])
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.policy = PolicyDocument(
+            Version="2012-10-17",
+            Statement=[
+                Statement(
+                    Effect="Allow",
+                    Action=[Action("s3", "GetObject")],
+                    Resource=["arn:aws:s3:::bucket/%d" % i for i in range(100)],
+                )
+            ],
+        )
+
+    def test_iter_json(self):
+        chunks = list(self.policy.iter_json(chunk_size=100))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), self.policy.to_json())
+        self.assertEqual(
+            "".join(Action("s3", "GetObject").iter_json()), '"s3:GetObject"'
+        )
+
+    def test_dump(self):
+        fp = io.StringIO()
+        self.policy.dump(fp, indent=None)
+        self.assertEqual(fp.getvalue(), self.policy.to_json(indent=None))
+
+    def test_dump_many(self):
+        fp = io.StringIO()
+        awacs.dump_many((self.policy for _ in range(3)), fp)
+        lines = fp.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        for line in lines:
+            self.assertEqual(json.loads(line), self.policy.to_dict())
+
+
+class TestSerializedSize(unittest.TestCase):
+    def assertSize(self, obj):
+        compact = json.dumps(obj.to_dict(), separators=(",", ":"))
+        self.assertEqual(obj.serialized_size(), len(compact))
+        self.assertEqual(obj.serialized_size(minified=False), len(obj.to_json()))
+
+    def test_serialized_size(self):
+        statement = Statement(
+            Sid='quote"andé',
+            Effect="Allow",
+            Action=[Action("s3", "GetObject"), Action("s3", "*")],
+            Resource=["*", 1, 2.5, True, None, {"key": [], "other": {}}],
+        )
+        policy = PolicyDocument(Version="2012-10-17", Statement=[statement])
+        self.assertSize(policy)
+        statement.Action.append(Action("s3", "PutObject"))
+        self.assertSize(policy)
+        policy.Statement = []
+        self.assertSize(policy)
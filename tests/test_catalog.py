@@ -0,0 +1,84 @@
+import unittest
+
+from awacs import awslambda, catalog, ec2, s3
+
+
+class TestCatalog(unittest.TestCase):
+    def test_prefixes(self):
+        prefixes = catalog.prefixes()
+        self.assertEqual(prefixes, sorted(prefixes))
+        self.assertIn("s3", prefixes)
+        self.assertIn("lambda", prefixes)
+
+    def test_actions(self):
+        actions = catalog.actions("s3")
+        self.assertEqual(list(actions), sorted(actions))
+        self.assertIn("GetObject", actions)
+        for name in actions:
+            self.assertEqual(getattr(s3, name).JSONrepr(), "s3:%s" % name)
+
+    def test_service(self):
+        self.assertEqual(catalog.service_name("s3"), s3.service_name)
+        self.assertEqual(catalog.module_name("lambda"), "awslambda")
+        self.assertEqual(awslambda.prefix, "lambda")
+
+    def test_unknown_prefix(self):
+        with self.assertRaises(KeyError):
+            catalog.actions("not-a-service")
+
+    def test_expand_actions(self):
+        expand = catalog.expand_actions
+        gets = expand("s3:Get*")
+        self.assertIn(s3.GetObject, gets)
+        self.assertTrue(all(a.action.startswith("Get") for a in gets))
+        self.assertEqual(gets, expand(s3.Action("get*")))
+        self.assertEqual(gets, expand("S3:GET*"))
+        self.assertEqual(len(catalog.actions("s3")), len(expand("s3:*")))
+        self.assertEqual((s3.GetObject,), expand("s3:getobject"))
+        self.assertEqual((), expand("s3:NotAnAction"))
+        self.assertEqual((), expand("not-a-service:*"))
+
+        self.assertEqual(
+            [a for a in expand("ec2:*") if a.action.startswith("Describe")],
+            list(expand("ec2:Describe*")),
+        )
+        self.assertIn(ec2.DescribeInstances, expand("ec2:Describe*Instances"))
+        self.assertNotIn(s3.GetObjectAcl, expand("s3:GetObject?"))
+        self.assertIn(s3.GetObjectAcl, expand("s*:GetObjectA??"))
+        total = sum(len(catalog.actions(p)) for p in catalog.prefixes())
+        self.assertEqual(total, len(expand("*")))
+
+        with self.assertRaises(ValueError):
+            expand("s3")
+
+    def test_prefix_trie(self):
+        root = catalog.prefix_trie("s3")
+        self.assertEqual(root.size, len(catalog.actions("s3")))
+        names = [a.action for a in catalog.expand_actions("s3:*")]
+
+        def check(node):
+            covered = [a.action for a in catalog.expand_actions("s3:%s*" % node.short)]
+            self.assertEqual(covered, names[node.start : node.end])
+            self.assertTrue(all(n.startswith(node.prefix) for n in covered))
+            if node.action is not None:
+                self.assertEqual(node.action, node.prefix)
+            self.assertEqual(
+                node.size,
+                (node.action is not None) + sum(c.size for c in node.children),
+            )
+            for child in node.children:
+                check(child)
+
+        check(root)
+
+    def test_action_position(self):
+        names = [a.action for a in catalog.expand_actions("s3:*")]
+        for i in (0, 10, len(names) - 1):
+            self.assertEqual(catalog.action_position("s3", names[i]), i)
+        self.assertEqual(
+            catalog.action_position("S3", "GETOBJECT"), names.index("GetObject")
+        )
+        with self.assertRaises(KeyError):
+            catalog.action_position("s3", "NotAnAction")
+        with self.assertRaises(KeyError):
+            catalog.action_position("not-a-service", "GetObject")
@@ -43,3 +43,64 @@ class TestConditions(unittest.TestCase):
             },
             json.loads(pd.to_json()),
         )
+
+
+class TestConditionPredicates(unittest.TestCase):
+    def test_matches(self):
+        c = aws.Condition(
+            [
+                aws.StringLike("s3:prefix", ["home/*", "public"]),
+                aws.IpAddress(
+                    "aws:SourceIp", ["10.0.0.0/16", "10.0.128.0/17", "2001:db8::/32"]
+                ),
+                aws.DateLessThan(aws.CurrentTime, "2020-01-01T00:00:00Z"),
+                aws.NumericLessThanEquals("s3:max-keys", ["10", "20"]),
+            ]
+        )
+        context = {
+            "s3:prefix": "home/x",
+            "aws:SourceIp": "10.0.200.1",
+            "aws:currenttime": "2019-12-31T23:59:59Z",
+            "s3:max-keys": 20,
+        }
+        self.assertTrue(c.matches(context))
+        for key, value in [
+            ("s3:prefix", "homex"),
+            ("aws:SourceIp", "10.1.0.1"),
+            ("aws:SourceIp", "2001:db9::1"),
+            ("aws:SourceIp", "not an address"),
+            ("aws:currenttime", "2020-01-01T00:00:00Z"),
+            ("s3:max-keys", 21),
+        ]:
+            self.assertFalse(c.matches(dict(context, **{key: value})), key)
+        self.assertTrue(c.matches(dict(context, **{"aws:SourceIp": "2001:db8::1"})))
+        self.assertTrue(c.matches(dict(context, **{"s3:prefix": "public"})))
+
+    def test_predicate_is_cached(self):
+        element = aws.NotIpAddress("aws:SourceIp", "192.168.0.0/24")
+        c = aws.Condition(element)
+        self.assertIs(c.predicate(), c.predicate())
+        self.assertIs(element.predicate(), element.predicate())
+        self.assertTrue(c.matches({"aws:SourceIp": "192.168.1.1"}))
+        self.assertFalse(c.matches({"aws:SourceIp": "192.168.0.1"}))
+
+        element.value = "192.168.0.0/16"
+        self.assertFalse(element.predicate()({"aws:sourceip": ["192.168.1.1"]}))
+
+    def test_every_operator_compiles(self):
+        values = {
+            "Arn": "arn:aws:iam::*:root",
+            "Bool": "true",
+            "Date": "2020-01-01",
+            "IpAddress": "10.0.0.0/8",
+            "NotIpAddress": "10.0.0.0/8",
+            "Null": "true",
+            "Numeric": "1",
+            "String": "a*",
+        }
+        for name, element_class in aws._condition_types.items():
+            base = name.rpartition(":")[2]
+            value = next(v for k, v in values.items() if base.startswith(k))
+            predicate = aws.Condition(element_class("k", value)).predicate()
+            self.assertIn(predicate({}), (True, False), name)
+            self.assertIn(predicate({"k": ["a"]}), (True, False), name)
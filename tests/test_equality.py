@@ -3,7 +3,9 @@ import unittest
 from awacs import ec2, iam, s3
 from awacs.aws import (
     Action,
+    Bool,
     Condition,
+    NumericEquals,
     PolicyDocument,
     Statement,
     StringEquals,
@@ -28,6 +30,24 @@ class TestEquality(unittest.TestCase):
             Condition(StringEquals("s3:prefix", ["home/${aws:username}/*"])),
         )
 
+    def test_condition_element_equality(self):
+        self.assertEqualWithHash(Bool({"k": "true"}), Bool({"k": "true"}))
+        self.assertEqualWithHash(Bool("k", "true"), Bool({"k": "true"}))
+        self.assertNotEqualWithHash(Bool({"k": "true"}), Bool({"k": "false"}))
+        self.assertNotEqualWithHash(Bool({"k": "1"}), NumericEquals({"k": "1"}))
+        self.assertEqual(len({Bool({"k": "true"}), Bool({"k": "true"})}), 1)
+
+    def test_scalar_types(self):
+        self.assertNotEqualWithHash(
+            Condition(Bool({"k": True})), Condition(Bool({"k": 1}))
+        )
+        self.assertNotEqualWithHash(
+            Condition(NumericEquals({"k": 1})), Condition(NumericEquals({"k": 1.0}))
+        )
+        self.assertNotEqualWithHash(
+            Condition(NumericEquals({"k": 1})), Condition(NumericEquals({"k": "1"}))
+        )
+
     def test_arn_equality(self):
         self.assertEqualWithHash(s3.ARN("myBucket"), s3.ARN("myBucket"))
 
@@ -126,6 +146,29 @@ class TestEquality(unittest.TestCase):
         self.assertEqualWithHash(one, one_again)
         self.assertNotEqualWithHash(one, two)
 
+    def test_json_equivalent(self):
+        self.assertEqualWithHash(
+            Statement(Effect="Allow", Action=[s3.GetObject], Resource=[s3.ARN("b")]),
+            Statement(
+                Resource=["arn:aws:s3:::b"], Action=[s3.GetObject], Effect="Allow"
+            ),
+        )
+        self.assertNotEqualWithHash(
+            Statement(Effect="Allow", Resource=["*"]),
+            Statement(Effect="Allow", Resource=[["*"]]),
+        )
+        self.assertNotEqualWithHash(
+            Statement(Effect="Allow", Resource=[["a", "b"]]),
+            Statement(Effect="Allow", Resource=[{"a": "b"}]),
+        )
+
+    def test_dedupe(self):
+        statements = [
+            Statement(Effect="Allow", Action=[s3.GetObject], Resource=[str(i % 3)])
+            for i in range(30)
+        ]
+        self.assertEqual(len(set(statements)), 3)
+
     def assertEqualWithHash(self, one, two):
         self.assertTrue(one == two)
         self.assertEqual(hash(one), hash(two))
@@ -0,0 +1,333 @@
+import unittest
+
+from awacs import ec2, iam, s3
+from awacs.aws import (
+    Allow,
+    Condition,
+    Deny,
+    IpAddress,
+    Policy,
+    Principal,
+    Statement,
+    StringEquals,
+)
+from awacs.evaluation import (
+    SCP,
+    Allowed,
+    ExplicitDeny,
+    IdentityPolicy,
+    ImplicitDeny,
+    PermissionsBoundary,
+    Request,
+    ResourceMatcher,
+    ResourcePolicy,
+    SessionPolicy,
+    compile_policy,
+    evaluate,
+    evaluate_layers,
+    scp_chain,
+)
+
+BUCKET = "arn:aws:s3:::bucket"
+OBJECT = "arn:aws:s3:::bucket/key"
+
+
+def decide(statement, *args, **kwargs):
+    return evaluate(Policy.from_dict({"Statement": statement}), *args, **kwargs)
+
+
+class TestEvaluate(unittest.TestCase):
+    def test_actions(self):
+        policy = Policy(
+            Statement=[
+                Statement(Effect=Allow, Action=[s3.Action("Get*")], Resource=["*"]),
+                Statement(Effect=Deny, Action=[s3.GetObjectAcl], Resource=["*"]),
+            ]
+        )
+        self.assertEqual(Allowed, evaluate(policy, s3.GetObject, OBJECT))
+        self.assertEqual(Allowed, evaluate(policy, "S3:getobject", OBJECT))
+        self.assertEqual(ExplicitDeny, evaluate(policy, s3.GetObjectAcl, OBJECT))
+        self.assertEqual(ImplicitDeny, evaluate(policy, s3.PutObject, OBJECT))
+        self.assertEqual(ImplicitDeny, evaluate([], s3.GetObject, OBJECT))
+
+    def test_not_action(self):
+        statement = {"Effect": "Allow", "NotAction": "s3:*", "Resource": "*"}
+        self.assertEqual(Allowed, decide(statement, ec2.RunInstances))
+        self.assertEqual(ImplicitDeny, decide(statement, s3.GetObject))
+
+    def test_resources(self):
+        statement = {
+            "Effect": "Allow",
+            "Action": "s3:*",
+            "Resource": ["arn:aws:s3:::bucket/*", "arn:aws:ec2:*:123:instance/*"],
+        }
+        self.assertEqual(Allowed, decide(statement, s3.GetObject, OBJECT))
+        self.assertEqual(ImplicitDeny, decide(statement, s3.ListBucket, BUCKET))
+        self.assertEqual(
+            Allowed,
+            decide(statement, "s3:X", "arn:aws:ec2:us-east-1:123:instance/i-1"),
+        )
+        # A wildcard does not match across segments
+        self.assertEqual(
+            ImplicitDeny, decide(statement, "s3:X", "arn:aws:ec2:a:b:123:instance/i")
+        )
+
+        statement = {"Effect": "Allow", "Action": "*", "NotResource": BUCKET}
+        self.assertEqual(Allowed, decide(statement, s3.GetObject, OBJECT))
+        self.assertEqual(ImplicitDeny, decide(statement, s3.ListBucket, BUCKET))
+
+    def test_principals(self):
+        policy = Policy(
+            Statement=[
+                Statement(
+                    Effect=Allow,
+                    Action=[s3.GetObject],
+                    Resource=[OBJECT],
+                    Principal=Principal("AWS", ["123456789012"]),
+                )
+            ]
+        )
+        alice = "arn:aws:iam::123456789012:user/alice"
+        bob = "arn:aws:iam::210987654321:user/bob"
+        self.assertEqual(Allowed, evaluate(policy, s3.GetObject, OBJECT, alice))
+        self.assertEqual(ImplicitDeny, evaluate(policy, s3.GetObject, OBJECT, bob))
+        self.assertEqual(ImplicitDeny, evaluate(policy, s3.GetObject, OBJECT))
+
+        statement = {
+            "Effect": "Deny",
+            "Action": "*",
+            "Resource": "*",
+            "NotPrincipal": {"AWS": alice},
+        }
+        self.assertEqual(ImplicitDeny, decide(statement, s3.GetObject, OBJECT, alice))
+        self.assertEqual(ExplicitDeny, decide(statement, s3.GetObject, OBJECT, bob))
+
+        statement = dict(statement, Effect="Allow", Principal="*")
+        del statement["NotPrincipal"]
+        service = {"Service": "ec2.amazonaws.com"}
+        self.assertEqual(Allowed, decide(statement, s3.GetObject, OBJECT, service))
+
+    def test_conditions(self):
+        policy = Policy(
+            Statement=[
+                Statement(
+                    Effect=Allow,
+                    Action=[s3.GetObject],
+                    Resource=["*"],
+                    Condition=Condition(
+                        [
+                            StringEquals("s3:prefix", ["home/"]),
+                            IpAddress("aws:SourceIp", "10.0.0.0/8"),
+                        ]
+                    ),
+                )
+            ]
+        )
+        context = {"s3:prefix": "home/", "aws:SourceIp": "10.1.2.3"}
+        self.assertEqual(Allowed, evaluate(policy, s3.GetObject, context=context))
+        context["AWS:SourceIp"] = "192.168.0.1"
+        self.assertEqual(ImplicitDeny, evaluate(policy, s3.GetObject, context=context))
+        self.assertEqual(ImplicitDeny, evaluate(policy, s3.GetObject))
+
+    def check_condition(self, condition, context, expected):
+        statement = {
+            "Effect": "Allow",
+            "Action": "*",
+            "Resource": "*",
+            "Condition": condition,
+        }
+        decision = decide(statement, s3.GetObject, context=context)
+        self.assertEqual(expected, decision == Allowed, (condition, context))
+
+    def test_condition_operators(self):
+        t = "aws:CurrentTime"
+        for condition, context, expected in [
+            ({"StringNotEquals": {"k": "a"}}, {"k": "b"}, True),
+            ({"StringNotEquals": {"k": "a"}}, {}, True),
+            ({"StringNotEquals": {"k": ["a", "b"]}}, {"k": "b"}, False),
+            ({"StringEqualsIgnoreCase": {"k": "A"}}, {"k": "a"}, True),
+            ({"StringLike": {"k": "home/*"}}, {"k": "home/x"}, True),
+            ({"StringLike": {"k": "home/?"}}, {"k": "home/xy"}, False),
+            ({"StringEqualsIfExists": {"k": "a"}}, {}, True),
+            ({"StringEqualsIfExists": {"k": "a"}}, {"k": "b"}, False),
+            ({"NumericLessThan": {"k": "10"}}, {"k": 9}, True),
+            ({"NumericLessThan": {"k": "10"}}, {"k": "x"}, False),
+            ({"NumericGreaterThanEquals": {"k": "10"}}, {"k": "10"}, True),
+            ({"DateLessThan": {t: "2020-01-01T00:00:00Z"}}, {t: "2019-06-01"}, True),
+            ({"DateGreaterThan": {t: "2020-01-01T00:00:00Z"}}, {t: 0}, False),
+            (
+                {"Bool": {"aws:SecureTransport": "true"}},
+                {"aws:SecureTransport": True},
+                True,
+            ),
+            ({"Null": {"k": "true"}}, {}, True),
+            ({"Null": {"k": "false"}}, {}, False),
+            ({"NotIpAddress": {"ip": "10.0.0.0/8"}}, {"ip": "11.0.0.1"}, True),
+            ({"IpAddress": {"ip": "2001:db8::/32"}}, {"ip": "2001:db8::1"}, True),
+            (
+                {"ArnLike": {"arn": "arn:aws:iam::*:role/*"}},
+                {"arn": "arn:aws:iam::1:role/r"},
+                True,
+            ),
+            (
+                {"ArnNotEquals": {"arn": "arn:aws:iam::1:root"}},
+                {"arn": "arn:aws:iam::1:root"},
+                False,
+            ),
+            ({"ForAnyValue:StringEquals": {"k": ["a", "b"]}}, {"k": ["c", "b"]}, True),
+            ({"ForAnyValue:StringEquals": {"k": ["a", "b"]}}, {}, False),
+            (
+                {"ForAllValues:StringEquals": {"k": ["a", "b"]}},
+                {"k": ["c", "b"]},
+                False,
+            ),
+            ({"ForAllValues:StringEquals": {"k": ["a", "b"]}}, {"k": ["a", "b"]}, True),
+            ({"ForAllValues:StringEquals": {"k": ["a", "b"]}}, {}, True),
+            ({"ForAnyValue:StringNotLike": {"k": "a*"}}, {"k": ["ab", "c"]}, True),
+        ]:
+            self.check_condition(condition, context, expected)
+
+    def test_unknown_operator(self):
+        with self.assertRaises(ValueError):
+            compile_policy(
+                {
+                    "Statement": {
+                        "Effect": "Allow",
+                        "Action": "*",
+                        "Condition": {"Foo": {"k": "v"}},
+                    }
+                }
+            )
+
+    def test_compiled_policy_is_cached(self):
+        statement = Statement(Effect=Allow, Action=[s3.GetObject], Resource=["*"])
+        policy = Policy(Statement=[statement])
+        compiled = compile_policy(policy)
+        self.assertIs(compiled, compile_policy(policy))
+        request = Request(s3.PutObject)
+        self.assertEqual(ImplicitDeny, evaluate(policy, request))
+
+        statement.Action.append(s3.PutObject)
+        self.assertIsNot(compiled, compile_policy(policy))
+        self.assertEqual(Allowed, evaluate(policy, request))
+
+    def test_compiled_policies(self):
+        allow_get = compile_policy(
+            Policy(Statement=[Statement(Effect=Allow, Action=[s3.GetObject])])
+        )
+        deny_all = compile_policy({"Statement": [{"Effect": Deny, "Action": "*"}]})
+        self.assertIs(allow_get, compile_policy(allow_get))
+        self.assertEqual(Allowed, evaluate(allow_get, s3.GetObject))
+        self.assertEqual(ImplicitDeny, evaluate(allow_get, s3.PutObject))
+        self.assertEqual(ExplicitDeny, evaluate([allow_get, deny_all], s3.GetObject))
+
+
+class TestResourceMatcher(unittest.TestCase):
+    def test_matches(self):
+        matcher = ResourceMatcher(
+            [
+                s3.ARN("bucket/logs/*"),
+                "arn:aws:s3:::other",
+                "arn:aws:ec2:us-east-1:123:instance/*",
+                "arn:aws:ec2:*:123:volume/vol-?",
+                "arn:aws:*:*:123:*",
+                iam.ARN("role/app-*-prod", account="456"),
+            ]
+        )
+        for arn, expected in [
+            ("arn:aws:s3:::bucket/logs/2021/x", True),
+            ("arn:aws:s3:::bucket/data/x", False),
+            ("arn:aws:s3:::other", True),
+            ("arn:aws:s3:::other/x", False),
+            ("arn:aws:ec2:us-east-1:123:instance/i-1", True),
+            ("arn:aws:ec2:us-west-2:999:instance/i-1", False),
+            ("arn:aws:ec2:eu-west-1:999:volume/vol-1", False),
+            ("arn:aws:ec2:eu-west-1:123:volume/vol-12", True),
+            ("arn:aws:iam::456:role/app-web-prod", True),
+            ("arn:aws:iam::456:role/app-web-dev", False),
+            ("arn:aws-cn:iam::456:role/app-web-prod", False),
+            ("not-an-arn", False),
+        ]:
+            self.assertEqual(expected, matcher.matches(arn), arn)
+
+    def test_from_statement(self):
+        statement = Statement(Effect=Allow, Action=[s3.GetObject], Resource=["*"])
+        matcher = ResourceMatcher.from_statement(statement)
+        self.assertTrue(matcher.matches("anything"))
+
+        matcher = ResourceMatcher.from_statement(
+            {"Effect": "Deny", "NotResource": ["arn:aws:s3:::bucket/*"]}
+        )
+        arns = ["arn:aws:s3:::bucket/a", "arn:aws:s3:::other/b"]
+        self.assertEqual(["arn:aws:s3:::other/b"], list(matcher.filter(iter(arns))))
+        self.assertEqual([False, True], matcher.mask(arns))
+
+
+def allow(*actions):
+    return Policy.from_dict(
+        {"Statement": {"Effect": "Allow", "Action": list(actions), "Resource": "*"}}
+    )
+
+
+def deny(*actions):
+    return Policy.from_dict(
+        {"Statement": {"Effect": "Deny", "Action": list(actions), "Resource": "*"}}
+    )
+
+
+class TestEvaluateLayers(unittest.TestCase):
+    def test_layers(self):
+        full = allow("*")
+        layers = [
+            (SCP, full),
+            (SCP, [allow("s3:*"), allow("ec2:*")]),
+            (IdentityPolicy, allow("s3:*", "ec2:*", "iam:*")),
+            (PermissionsBoundary, allow("s3:*", "iam:*")),
+        ]
+        self.assertEqual(Allowed, evaluate_layers(layers, s3.GetObject))
+        # Not allowed by the SCPs of the second level
+        self.assertEqual(ImplicitDeny, evaluate_layers(layers, iam.ListRoles))
+        # Not allowed by the permissions boundary
+        self.assertEqual(ImplicitDeny, evaluate_layers(layers, ec2.RunInstances))
+
+        session = layers + [(SessionPolicy, allow("s3:Get*"))]
+        self.assertEqual(Allowed, evaluate_layers(session, s3.GetObject))
+        self.assertEqual(ImplicitDeny, evaluate_layers(session, s3.PutObject))
+
+        denied = layers + [(SCP, [full, deny("s3:PutObject")])]
+        self.assertEqual(ExplicitDeny, evaluate_layers(denied, s3.PutObject))
+        self.assertEqual(Allowed, evaluate_layers(denied, s3.GetObject))
+
+        # A resource policy allows without an identity policy
+        resource = [(SCP, full), (ResourcePolicy, allow("s3:GetObject"))]
+        self.assertEqual(Allowed, evaluate_layers(resource, s3.GetObject))
+        self.assertEqual(ImplicitDeny, evaluate_layers(resource, s3.PutObject))
+        self.assertEqual(
+            ImplicitDeny, evaluate_layers([(SCP, [])] + resource, s3.GetObject)
+        )
+
+        with self.assertRaises(ValueError):
+            evaluate_layers([("Unknown", full)], s3.GetObject)
+
+    def test_compiled_layers(self):
+        layers = [
+            (SCP, compile_policy(allow("s3:*"))),
+            (SCP, [compile_policy(allow("s3:Get*"))]),
+            (IdentityPolicy, compile_policy(allow("*"))),
+        ]
+        self.assertEqual(Allowed, evaluate_layers(layers, s3.GetObject))
+        self.assertEqual(ImplicitDeny, evaluate_layers(layers, s3.PutObject))
+        self.assertEqual(ImplicitDeny, evaluate_layers(layers, ec2.RunInstances))
+        chain = scp_chain("ou-compiled", [layers[0][1], layers[1][1]])
+        self.assertEqual(Allowed, chain.evaluate(Request(s3.GetObject)))
+
+    def test_scp_chain_is_cached_per_ou(self):
+        root, ou = allow("*"), allow("s3:*")
+        chain = scp_chain("ou-1", [root, [ou]])
+        self.assertIs(chain, scp_chain("ou-1", [[root], ou]))
+        self.assertIsNot(chain, scp_chain("ou-1", [root, allow("s3:*")]))
+
+        layers = [(SCP, root), (SCP, ou), (IdentityPolicy, allow("*"))]
+        request = Request(ec2.RunInstances)
+        self.assertEqual(ImplicitDeny, evaluate_layers(layers, request, ou="ou-2"))
+        self.assertEqual(Allowed, evaluate_layers(layers, s3.GetObject, ou="ou-2"))
@@ -0,0 +1,242 @@
+import unittest
+
+from awacs import catalog, s3
+from awacs.actionset import ActionSet
+from awacs.analysis import equivalent
+from awacs.aws import Policy, PolicyDocument
+from awacs.optimize import (
+    MANAGED_POLICY_LIMIT,
+    USER_POLICY_LIMIT,
+    compress_actions,
+    minimize,
+    split,
+)
+
+BUCKET = "arn:aws:s3:::bucket/*"
+
+
+def statement(actions, resources="*", effect="Allow", **kwargs):
+    return dict(Effect=effect, Action=actions, Resource=resources, **kwargs)
+
+
+class TestMinimize(unittest.TestCase):
+    def check(self, data, **kwargs):
+        result = minimize(data, **kwargs)
+        self.assertTrue(equivalent(data, result.policy))
+        self.assertEqual(result.size, result.policy.serialized_size())
+        return result
+
+    def test_merge(self):
+        data = {
+            "Version": "2012-10-17",
+            "Statement": [
+                statement("s3:GetObject", BUCKET, Sid="First"),
+                statement(["s3:PutObject", "s3:getobject"], [BUCKET, BUCKET]),
+                statement("s3:ListBucket", "arn:aws:s3:::bucket"),
+                statement("s3:DeleteObject", BUCKET, effect="Deny"),
+            ],
+        }
+        result = self.check(data)
+        self.assertIsInstance(result.policy, PolicyDocument)
+        self.assertEqual(
+            result.policy.to_dict(),
+            {
+                "Version": "2012-10-17",
+                "Statement": [
+                    statement(["s3:GetObject", "s3:PutObject"], [BUCKET], Sid="First"),
+                    statement(["s3:ListBucket"], ["arn:aws:s3:::bucket"]),
+                    statement(["s3:DeleteObject"], [BUCKET], effect="Deny"),
+                ],
+            },
+        )
+
+    def test_covered(self):
+        secure = {"Bool": {"aws:SecureTransport": "true"}}
+        data = {
+            "Statement": [
+                statement(["s3:Get*", "s3:GetObject", "s3:GetObjectAcl"], BUCKET),
+                statement("s3:GetObject*", ["arn:aws:s3:::bucket/key", BUCKET]),
+                statement("s3:GetObject", BUCKET, Condition=secure),
+                # More conditions than the other ones, but another resource
+                statement("s3:GetObject", "arn:aws:s3:::other/*", Condition=secure),
+                statement("s3:*", "arn:aws:s3:::bucket/*", effect="Deny"),
+                statement("s3:PutObject", "arn:aws:s3:::bucket/a*", effect="Deny"),
+            ]
+        }
+        result = self.check(data)
+        self.assertEqual(
+            result.policy.to_dict()["Statement"],
+            [
+                statement(["s3:Get*"], [BUCKET]),
+                statement(["s3:GetObject"], ["arn:aws:s3:::other/*"], Condition=secure),
+                statement(["s3:*"], [BUCKET], effect="Deny"),
+            ],
+        )
+
+    def test_covered_by_fewer_conditions(self):
+        def tagged(*keys):
+            return {"StringEquals": {"aws:ResourceTag/%s" % k: "v" for k in keys}}
+
+        data = {
+            "Statement": [
+                statement("s3:GetObject", Condition=tagged("a", "b")),
+                statement("s3:PutObject", Condition=tagged("a", "b", "c")),
+                statement("s3:Get*", Condition=tagged("a")),
+                statement("s3:Put*", Condition=tagged("b", "c")),
+                statement("s3:DeleteObject", Condition=tagged("a", "d")),
+            ]
+            + [statement("s3:ListBucket", Condition=tagged(i)) for i in range(200)]
+        }
+        result = self.check(data)
+        self.assertEqual(
+            [s.to_dict()["Action"] for s in result.policy.Statement[:3]],
+            [["s3:Get*"], ["s3:Put*"], ["s3:DeleteObject"]],
+        )
+        self.assertEqual(len(result.policy.Statement), 203)
+
+    def test_kept_apart(self):
+        data = {
+            "Statement": [
+                {"Effect": "Allow", "NotAction": "s3:*", "Resource": "*"},
+                {"Effect": "Allow", "NotAction": "ec2:*", "Resource": "*"},
+                statement("s3:GetObject", Principal={"AWS": "123456789012"}),
+                statement("s3:GetObject", Principal="*"),
+            ]
+        }
+        result = self.check(data)
+        self.assertEqual(len(result.policy.Statement), 4)
+
+    def test_compress(self):
+        gets = [a.JSONrepr() for a in catalog.expand_actions("s3:Get*")]
+        data = {"Statement": [statement(gets + ["s3:PutObject", "not-known:Action"])]}
+        result = self.check(data)
+        self.assertEqual(len(result.policy.Statement[0].Action), len(gets) + 2)
+
+        compressed = self.check(data, compress=True)
+        self.assertLess(compressed.size, result.size)
+        actions = compressed.policy.Statement[0].Action
+        self.assertIn(s3.PutObject, actions)
+        self.assertIn(s3.Action("G*"), actions)
+
+        # Compression is only needed above the limit
+        self.assertEqual(minimize(data, limit=result.size).size, result.size)
+        over = minimize(data, limit=result.size - 1)
+        self.assertEqual(over.size, compressed.size)
+        self.assertTrue(over.fits)
+        self.assertFalse(minimize(data, limit=10).fits)
+
+    def test_policy(self):
+        policy = Policy.from_dict({"Statement": [statement("s3:GetObject")] * 3})
+        result = minimize(policy)
+        self.assertIsInstance(result.policy, Policy)
+        self.assertEqual(len(result.policy.Statement), 1)
+        self.assertTrue(result.fits)
+
+    def test_not_shared(self):
+        principal = {"AWS": ["arn:aws:iam::123456789012:root"]}
+        policy = Policy.from_dict(
+            {"Statement": [statement("s3:GetObject", Principal=principal)]}
+        )
+        before = policy.to_dict()
+        result = minimize(policy).policy
+        result.Statement[0].Principal.data["AWS"].append("arn:aws:iam::1:root")
+        result.Statement[0].Resource.append("arn:aws:s3:::bucket")
+        self.assertEqual(policy.to_dict(), before)
+
+
+class TestCompressActions(unittest.TestCase):
+    def test_compress_actions(self):
+        actions = catalog.expand_actions("s3:GetObject*")
+        compressed = compress_actions(list(actions))
+        self.assertEqual(ActionSet(compressed), ActionSet(actions))
+        self.assertLess(len(compressed), len(actions))
+        self.assertTrue(all(isinstance(a, str) for a in compressed))
+
+        # Actions no wildcard covers exactly are kept as they are
+        self.assertEqual(
+            compress_actions([s3.GetObject, "s3:Get*", "*"]),
+            [s3.GetObject, "s3:Get*", "*"],
+        )
+        everything = [a.JSONrepr() for a in catalog.expand_actions("iam:*")]
+        self.assertEqual(compress_actions(everything), ["iam:*"])
+
+    def test_budget(self):
+        gets = [a.JSONrepr() for a in catalog.expand_actions("s3:Get*")]
+        # All but the last two actions starting with Get
+        actions = gets[:-2] + ["ec2:DescribeInstances"]
+        exact = compress_actions(actions)
+        self.assertEqual(ActionSet(exact), ActionSet(actions))
+        self.assertGreater(len(exact), 2)
+
+        loose = compress_actions(actions, budget=2)
+        self.assertEqual(loose, ["s3:G*", "ec2:DescribeInstances"])
+        self.assertEqual(ActionSet(loose) - ActionSet(actions), ActionSet(gets[-2:]))
+        for budget in range(4):
+            over = ActionSet(compress_actions(actions, budget)) - ActionSet(actions)
+            self.assertLessEqual(len(over), budget)
+
+
+class TestSplit(unittest.TestCase):
+    def check(self, data, limit, **kwargs):
+        parts = split(data, limit, **kwargs)
+        for part in parts:
+            self.assertLessEqual(part.serialized_size(), limit)
+            self.assertEqual(part.Version, "2012-10-17")
+        merged = {"Statement": [s for p in parts for s in p.to_dict()["Statement"]]}
+        self.assertTrue(equivalent(data, merged))
+        return parts
+
+    def test_split(self):
+        names = catalog.action_names()
+        statements = [
+            statement(list(names[i : i + 20]), ["arn:aws:s3:::bucket%d/*" % i])
+            for i in range(0, 2000, 20)
+        ]
+        data = {"Version": "2012-10-17", "Statement": statements}
+        parts = self.check(data, MANAGED_POLICY_LIMIT)
+        total = Policy.from_dict(data).serialized_size()
+        self.assertLessEqual(len(parts), total // MANAGED_POLICY_LIMIT + 2)
+        # The statements keep their order
+        first = parts[0].to_dict()["Statement"]
+        self.assertEqual(first, sorted(first, key=statements.index))
+
+        with self.assertRaises(ValueError):
+            split(data, MANAGED_POLICY_LIMIT, max_parts=2)
+
+    def test_fits(self):
+        policy = Policy.from_dict({"Statement": [statement("s3:GetObject")]})
+        self.assertEqual(split(policy, 100), [policy])
+        self.assertIs(split(policy, 100)[0], policy)
+
+    def test_split_statement(self):
+        names = catalog.action_names()
+        resources = ["arn:aws:s3:::bucket/%d" % i for i in range(100)]
+        data = {
+            "Version": "2012-10-17",
+            "Statement": [statement(list(names[:300]), resources, Sid="Large")],
+        }
+        parts = self.check(data, USER_POLICY_LIMIT)
+        sids = [s.Sid for p in parts for s in p.Statement]
+        self.assertEqual(len(sids), len(set(sids)))
+        self.assertTrue(all(s.startswith("Large") for s in sids))
+
+        with self.assertRaises(ValueError):
+            split(data, 100)
+
+    def test_split_statement_resource_chunks(self):
+        names = catalog.action_names()
+        resources = ["arn:aws:s3:::bucket/%d" % i for i in range(300)]
+        data = {
+            "Version": "2012-10-17",
+            "Statement": [statement(list(names[:900]), resources)],
+        }
+        # Tenths of the room for the resources made 30 parts, and three
+        # resource chunks of 100 make 27
+        parts = split(data, 6144)
+        self.assertLessEqual(len(parts), 27)
+        pairs = set()
+        for part in parts:
+            self.assertLessEqual(part.serialized_size(), 6144)
+            (s,) = part.to_dict()["Statement"]
+            pairs.update((a, r) for a in s["Action"] for r in s["Resource"])
+        self.assertEqual(len(pairs), 900 * 300)
@@ -0,0 +1,21 @@
+import unittest
+
+import awacs
+from awacs import s3
+from awacs.aws import Action
+
+
+class TestLazyServices(unittest.TestCase):
+    def test_package_attribute(self):
+        self.assertIs(awacs.sts, __import__("awacs.sts").sts)
+        with self.assertRaises(AttributeError):
+            awacs.not_a_service
+
+    def test_action_on_access(self):
+        action = s3.GetObject
+        self.assertIsInstance(action, Action)
+        self.assertEqual(action.JSONrepr(), "s3:GetObject")
+        self.assertIs(s3.GetObject, action)
+        self.assertIn("PutObject", dir(s3))
+        with self.assertRaises(AttributeError):
+            s3.NotAnAction
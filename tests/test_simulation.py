@@ -0,0 +1,91 @@
+import io
+import unittest
+
+from awacs import catalog, ec2, s3
+from awacs.actionset import ActionSet
+from awacs.aws import Policy
+from awacs.evaluation import Allowed, evaluate
+from awacs.simulation import (
+    dump_matrix,
+    numpy,
+    row_size,
+    simulate,
+    to_numpy,
+)
+
+READ = Policy.from_dict(
+    {
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Action": ["s3:Get*", "s3:List*"],
+                "Resource": "arn:aws:s3:::bucket/*",
+            },
+            {"Effect": "Deny", "Action": "s3:GetObjectAcl", "Resource": "*"},
+        ]
+    }
+)
+
+EC2 = Policy.from_dict(
+    {"Statement": {"Effect": "Allow", "NotAction": "s3:*", "Resource": "*"}}
+)
+
+CONDITIONAL = Policy.from_dict(
+    {
+        "Statement": {
+            "Effect": "Allow",
+            "Action": "s3:PutObject",
+            "Resource": "*",
+            "Condition": {"Bool": {"aws:SecureTransport": "true"}},
+        }
+    }
+)
+
+
+class TestSimulate(unittest.TestCase):
+    def test_simulate(self):
+        roles = {"reader": [READ, CONDITIONAL], "ops": [EC2], "none": []}
+        rows = dict(simulate(roles, "arn:aws:s3:::bucket/key"))
+
+        reader = rows["reader"].names()
+        self.assertIn("s3:GetObject", reader)
+        self.assertIn("s3:ListBucket", reader)
+        self.assertNotIn("s3:GetObjectAcl", reader)
+        self.assertNotIn("s3:PutObject", reader)
+        self.assertNotIn("ec2:RunInstances", reader)
+
+        ops = rows["ops"].names()
+        self.assertIn("ec2:RunInstances", ops)
+        self.assertFalse(any(a.startswith("s3:") for a in ops))
+        self.assertEqual(ActionSet(), rows["none"])
+
+        rows = dict(
+            simulate(roles, "arn:aws:s3:::other", context={"aws:SecureTransport": True})
+        )
+        self.assertEqual(["s3:PutObject"], rows["reader"].names())
+
+    def test_matches_evaluate(self):
+        resource = "arn:aws:s3:::bucket/key"
+        ((_, actions),) = simulate([("role", [READ, EC2])], resource)
+        for name in catalog.action_names():
+            if not name.startswith(("s3:", "ec2:")):
+                continue
+            allowed = evaluate([READ, EC2], name, resource) == Allowed
+            self.assertEqual(allowed, name in actions, name)
+
+    def test_dump_matrix(self):
+        rows = [ActionSet.all(), ("role", ActionSet([ec2.RunInstances]))]
+        fp = io.BytesIO()
+        self.assertEqual(2, dump_matrix(rows, fp))
+        data = fp.getvalue()
+        self.assertEqual(2 * row_size(), len(data))
+        second = int.from_bytes(data[row_size() :], "little")
+        self.assertEqual(["ec2:RunInstances"], ActionSet.from_bits(second).names())
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy(self):
+        rows = list(simulate({"a": [READ], "b": [EC2]}, "arn:aws:s3:::bucket/k"))
+        matrix = to_numpy(rows)
+        self.assertEqual((2, len(catalog.action_names())), matrix.shape)
+        self.assertTrue(matrix[0, catalog.action_index(s3.GetObject)])
+        self.assertFalse(matrix[1, catalog.action_index(s3.GetObject)])